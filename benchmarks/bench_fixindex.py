@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+"""Benchmark of fixindex.step_through_and_fix against the original byte by byte loop,
+   on the test_data records and on a synthetic worst case.
+
+   USAGE: bench_fixindex.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import fixindex
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'test_data')
+
+
+def step_through_and_fix_linear(index, data):
+    """The original index repair: increase each length by one until it ends on a separator."""
+    separator = 0x1e
+    calculated_offset = 0
+    for i,tag in enumerate(index):
+        tag[2] = ('%05d' % calculated_offset).encode('utf-8')
+        assert data[calculated_offset] == separator
+        while data[calculated_offset + int(tag[1])] != separator:
+            tag[1] = ('%04d' % (int(tag[1]) + 1)).encode('utf-8')
+        calculated_offset += int(tag[1])
+    return index
+
+
+def worst_case(fields=500, field_len=2000):
+    """Returns a raw MARC record whose index gives every field a length of 1."""
+    data = [b'a' * (field_len - 1) + b'\x1e' for i in range(fields)]
+    index = [b'%03d%04d%05d' % (500 + i % 100, 1, 0) for i in range(fields)]
+    return b'00000cam a2200000 a 4500' + b''.join(index) + b'\x1e' + b''.join(data) + b'\x1d'
+
+
+def bench(name, raw, number):
+    leader, index, pos = fixindex.read_index(raw)
+    data = raw[pos:]
+    copy = lambda: [list(t) for t in index]
+    linear = min(timeit.repeat(lambda: step_through_and_fix_linear(copy(), data), number=number, repeat=3)) / number
+    bisected = min(timeit.repeat(lambda: fixindex.step_through_and_fix(copy(), data), number=number, repeat=3)) / number
+    assert step_through_and_fix_linear(copy(), data) == fixindex.step_through_and_fix(copy(), data)
+    print("  %-40s %9.3f ms %9.3f ms  %6.1fx" % (name, linear * 1000, bisected * 1000, linear / bisected))
+
+
+if __name__ == '__main__':
+    print("  %-40s %12s %12s" % ('record', 'linear', 'bisect'))
+    for name in sorted(os.listdir(DATA)):
+        if name.endswith('.mrc'):
+            with open(os.path.join(DATA, name), 'rb') as f:
+                bench(name, f.read(), 1000)
+    bench('worst case: 500 fields, all len=1', worst_case(), 3)
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+
+"""Micro-benchmark of MarcXml field lookups and IAMarcXml construction on a large record.
+
+   USAGE: bench_marcxml.py [<number of datafields>]
+"""
+
+import copy
+import os
+import sys
+import timeit
+from lxml import etree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import marcia
+
+NS = marcia.NS
+
+
+class XPathMarcXml(marcia.MarcXml):
+    """MarcXml with lookups by XPath over the whole record, as before the tag index."""
+    def get_datafield(self, tag):
+        return self.data.xpath('m:datafield[@tag="%s"]' % tag, namespaces=NS)
+
+    def get_controlfield(self, tag):
+        return self.data.xpath('m:controlfield[@tag="%s"]' % tag, namespaces=NS)
+
+
+def large_record(n):
+    """Returns a MARC XML record with <n> datafields spread over the 5xx, 6xx and 7xx tags."""
+    fields = ''.join('<datafield tag="%i" ind1=" " ind2="0"><subfield code="a">Field %i</subfield></datafield>' % (500 + i % 300, i)
+                     for i in range(n))
+    return etree.fromstring('''<record xmlns="%s">
+      <leader>00971cam a2200289 a 4500</leader>
+      <controlfield tag="008">820312s1983    alu          s00110 eng  </controlfield>
+      <datafield tag="245" ind1="1" ind2="0"><subfield code="a">Large Record</subfield></datafield>
+      %s
+    </record>''' % (marcia.MARC21_NS, fields))
+
+
+def lookups(record):
+    for tag in ['001', '003', '005', '008', '010', '020', '035', '040', '245', '300', '440', '650', '856', '999']:
+        record.get_controlfield(tag)
+        record.get_datafield(tag)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = 20
+    root = large_record(n)
+
+    indexed = marcia.MarcXml(root)
+    xpath = XPathMarcXml(root)
+    t_indexed = min(timeit.repeat(lambda: lookups(indexed), number=repeat, repeat=3)) / repeat
+    t_xpath = min(timeit.repeat(lambda: lookups(xpath), number=repeat, repeat=3)) / repeat
+    t_index_build = min(timeit.repeat(lambda: marcia.MarcXml(root), number=repeat, repeat=3)) / repeat
+    t_record = min(timeit.repeat(lambda: marcia.IAMarcXml('bench', copy.deepcopy(root)), number=repeat, repeat=3)) / repeat
+
+    print("%i datafields" % n)
+    print("  28 lookups, XPath:      %8.3f ms" % (t_xpath * 1000))
+    print("  28 lookups, tag index:  %8.3f ms  (%.0fx)" % (t_indexed * 1000, t_xpath / t_indexed))
+    print("  tag index build:        %8.3f ms" % (t_index_build * 1000))
+    print("  IAMarcXml per record:   %8.3f ms" % (t_record * 1000))
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+
+"""Peak memory benchmark of reading a large MARC XML collection, streamed or as a whole tree.
+
+   USAGE: bench_memory.py [<number of records>] [--tree]
+   Writes a synthetic collection of <number of records> (default 1,000,000) to a temporary file,
+   then reads every record from it in a fresh process, and reports peak memory (max RSS).
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from lxml import etree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import marcia
+
+RECORD = '''<record>
+  <leader>00971cam a2200289 a 4500</leader>
+  <controlfield tag="001">%i</controlfield>
+  <controlfield tag="008">820312s1983    alu          s00110 eng  </controlfield>
+  <datafield tag="245" ind1="1" ind2="0"><subfield code="a">Title %i</subfield></datafield>
+  <datafield tag="300" ind1=" " ind2=" "><subfield code="a">250 p. :</subfield><subfield code="b">ill. ;</subfield></datafield>
+</record>
+'''
+
+
+def write_collection(filename, n):
+    with open(filename, 'w') as f:
+        f.write('<collection xmlns="%s">\n' % marcia.MARC21_NS)
+        for i in range(n):
+            f.write(RECORD % (i, i))
+        f.write('</collection>\n')
+
+
+def read(filename, mode):
+    """Reads every record, returning the count."""
+    if mode == 'tree':
+        return len(etree.parse(filename).getroot())
+    return sum(1 for record in marcia.read_records(filename))
+
+
+if __name__ == '__main__':
+    if sys.argv[1] == '--read':
+        mode, filename = sys.argv[2:4]
+        start = time.perf_counter()
+        count = read(filename, mode)
+        elapsed = time.perf_counter() - start
+        print("  %-6s %9i records  %6.1f s  peak RSS %8.1f MB" % (mode, count, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 1000000
+    modes = ['stream', 'tree'] if '--tree' in sys.argv else ['stream']
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'collection.xml')
+        write_collection(filename, n)
+        print("%i record collection, %.1f MB" % (n, os.path.getsize(filename) / 1024 / 1024))
+        for mode in modes:
+            subprocess.check_call([sys.executable, __file__, '--read', mode, filename])
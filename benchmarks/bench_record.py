@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+"""Memory and throughput benchmark of the lxml (MarcXml) and compact (record.MarcRecord) record backends.
+
+   USAGE: bench_record.py [<number of records>]
+   Builds <number of records> (default 100,000) synthetic records from binary MARC with each backend,
+   held in memory together, in a fresh process, and reports memory per record (RSS growth),
+   the size each takes to pass to another process, and IAMarcXml transform throughput.
+"""
+
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from lxml import etree
+import iso2709
+import marcia
+import record
+from bench_transform import corpus
+
+BACKENDS = {
+    'lxml':    (iso2709.read_record, marcia.IAMarcXml, lambda data: etree.tostring(data)),
+    'compact': (record.from_iso2709, record.IAMarcRecord, lambda data: pickle.dumps(data, pickle.HIGHEST_PROTOCOL)),
+}
+
+
+def rss():
+    """Returns current resident set size in bytes."""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+def run(backend, n):
+    read, transform, serialize = BACKENDS[backend]
+    raw = [iso2709.write_record(etree.fromstring(xml)) for xml in corpus(n)]
+
+    before = rss()
+    start = time.perf_counter()
+    records = [read(r) for r in raw]
+    build = time.perf_counter() - start
+    memory = rss() - before
+    size = sum(len(serialize(r)) for r in records[:1000]) / min(n, 1000)
+
+    start = time.perf_counter()
+    for i, r in enumerate(records):
+        transform('bench%i' % i, r)
+    elapsed = time.perf_counter() - start
+    print("  %-8s %6.0f bytes/record  %6.0f bytes to pass  build %8.0f records/s  transform %8.0f records/s" % (
+          backend, memory / n, size, n / build, n / elapsed))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        run(sys.argv[2], int(sys.argv[3]))
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print("%i records" % n)
+    for backend in ['lxml', 'compact']:
+        subprocess.check_call([sys.executable, __file__, '--run', backend, str(n)])
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+
+"""Throughput benchmark of the IAMarcXml transform over a synthetic corpus,
+   and of compiled XPath subfield lookups against XPath strings.
+
+   USAGE: bench_transform.py [<number of records>]
+"""
+
+import os
+import random
+import sys
+import time
+from lxml import etree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import marcia
+
+NS = marcia.NS
+
+
+def synthetic_record(i, rng):
+    """Returns a MARC XML string for a plausible print monograph, varied by <rng>."""
+    subjects = ''.join('<datafield tag="650" ind1=" " ind2="0"><subfield code="a">Subject %i</subfield><subfield code="x">History.</subfield></datafield>' % j
+                       for j in range(rng.randint(1, 8)))
+    notes = ''.join('<datafield tag="500" ind1=" " ind2=" "><subfield code="a">Note %i.</subfield></datafield>' % j
+                    for j in range(rng.randint(0, 6)))
+    series = '<datafield tag="440" ind1=" " ind2="0"><subfield code="a">Series %i ;</subfield><subfield code="v">v. %i</subfield></datafield>' % (i, i % 10) if rng.random() < 0.3 else ''
+    return '''<record xmlns="%s">
+      <leader>00971cam a2200289 a 4500</leader>
+      <controlfield tag="001">%i</controlfield>
+      <controlfield tag="008">820312s19%02i    alu          s00110 eng  </controlfield>
+      <datafield tag="020" ind1=" " ind2=" "><subfield code="a">08173%05i</subfield></datafield>
+      <datafield tag="040" ind1=" " ind2=" "><subfield code="a">DLC</subfield><subfield code="c">DLC</subfield></datafield>
+      <datafield tag="050" ind1="0" ind2="0"><subfield code="a">QA%i</subfield></datafield>
+      <datafield tag="100" ind1="1" ind2=" "><subfield code="a">Author, %i.</subfield></datafield>
+      <datafield tag="245" ind1="1" ind2="0"><subfield code="a">Title %i</subfield><subfield code="h">[microform]</subfield></datafield>
+      <datafield tag="260" ind1=" " ind2=" "><subfield code="a">New York :</subfield><subfield code="b">Publisher,</subfield><subfield code="c">19%02i.</subfield></datafield>
+      <datafield tag="300" ind1=" " ind2=" ">
+        <subfield code="a">%i p. :</subfield><subfield code="b">ill., ports., col. maps ;</subfield><subfield code="c">24 cm.</subfield></datafield>
+      %s%s%s
+      <datafield tag="949" ind1=" " ind2=" "><subfield code="a">local</subfield></datafield>
+    </record>''' % (marcia.MARC21_NS, i, i % 100, i, i, i, i, i % 100, rng.randint(50, 900), series, notes, subjects)
+
+
+def corpus(n, seed=0):
+    rng = random.Random(seed)
+    return [synthetic_record(i, rng).encode('utf-8') for i in range(n)]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    records = corpus(n)
+
+    start = time.perf_counter()
+    for i, xml in enumerate(records):
+        marcia.IAMarcXml('bench%i' % i, etree.fromstring(xml))
+    transform = time.perf_counter() - start
+
+    fields = [f for xml in records for f in etree.fromstring(xml).iterchildren(marcia.DATAFIELD)]
+    start = time.perf_counter()
+    for f in fields:
+        for code in 'avz':
+            f.xpath('m:subfield[@code="%s"]' % code, namespaces=NS)
+    strings = time.perf_counter() - start
+    start = time.perf_counter()
+    for f in fields:
+        for code in 'avz':
+            marcia.XPATH['subfield'](f, code=code)
+    compiled = time.perf_counter() - start
+
+    print("%i records" % n)
+    print("  IAMarcXml transform:        %8.0f records/s" % (n / transform))
+    print("  subfield lookups, strings:  %8.0f lookups/s" % (3 * len(fields) / strings))
+    print("  subfield lookups, compiled: %8.0f lookups/s  (%.1fx)" % (3 * len(fields) / compiled, strings / compiled))
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+
+"""Synthetic binary MARC corpus generator for benchmarks.
+
+   USAGE: corpus.py [-n <number of records>] [-s <seed>] [-d <directory>]
+   Writes corpus.mrc (UTF-8), corpus_marc8.mrc (the same records in MARC-8), corpus_corrupt.mrc
+   (UTF-8 with off-by-N directory lengths, as fixindex.py repairs) and corpus_marc.xml to <directory>.
+
+   Records are plausible print monographs: long 5xx notes and contents, many 6xx subjects, 7xx added entries,
+   a 440 series in some, and 880 alternate script (Cyrillic) fields linked by $6 in others,
+   with accented Latin text throughout. The same <seed> always gives the same corpus.
+"""
+
+import argparse
+import os
+import random
+import sys
+import unicodedata
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from lxml import etree
+import iso2709
+import marc8
+
+WORDS = ['history', 'society', 'church', 'letters', 'government', 'voyage', 'poems', 'account', 'studies', 'records',
+         'république', 'über', 'España', 'São', 'Dvořák', 'naïve', 'Zürich', 'Kraków', 'Ångström', 'Ærø']
+CYRILLIC = ['история', 'общество', 'письма', 'путешествие', 'стихи', 'Москва', 'издательство', 'наука']
+SUBJECTS = ['History', 'Politics and government', 'Description and travel', 'Biography', 'Social life and customs']
+PLACES = ['France', 'Great Britain', 'Russia', 'United States', 'Spain', 'Italy']
+
+# Reverse MARC-8 tables: Unicode character -> (character set, byte). Combining diacritics are only in ANSEL here.
+MARC8 = {}
+for charset in [marc8.BASIC_LATIN, marc8.ANSEL, 0x4e]:  # Basic Latin, ANSEL, Basic Cyrillic
+    for byte, codepoint in sorted(marc8.CODEPOINTS[charset].items()):
+        MARC8.setdefault(chr(codepoint), (charset, byte))
+
+
+def encode_marc8(text):
+    """Encodes Unicode text as MARC-8, with Cyrillic in G0 after ESC ( N, and ANSEL diacritics before their base character."""
+    output = bytearray()
+    g0 = marc8.BASIC_LATIN
+    pending = []  # base character and its combining marks
+    for char in unicodedata.normalize('NFD', text) + ' ':
+        if pending and not unicodedata.combining(char):
+            base, marks = pending[0], pending[1:]
+            for c in marks:
+                output.append(MARC8[c][1] | 0x80)
+            charset, byte = MARC8.get(base, (marc8.BASIC_LATIN, ord('?')))
+            if charset == marc8.ANSEL or byte < 0x21:
+                output.append(byte | 0x80 if byte > 0x20 else byte)
+            else:
+                if charset != g0:
+                    output += bytes([marc8.ESC, 0x28, charset])
+                    g0 = charset
+                output.append(byte & 0x7f)
+            pending = []
+        pending.append(char)
+    if g0 != marc8.BASIC_LATIN:
+        output += bytes([marc8.ESC, 0x28, marc8.BASIC_LATIN])
+    return bytes(output)
+
+
+def phrase(rng, n, words=WORDS):
+    return ' '.join(rng.choice(words) for i in range(n))
+
+
+def synthetic_fields(i, rng):
+    """Returns the leader and fields of a synthetic record, in the form iso2709.read_fields() returns."""
+    year = rng.randint(1700, 1990)
+    series = rng.random() < 0.3
+    script = rng.random() < 0.2
+    fields = [
+        ('001', 'ocm%08i' % i),
+        ('003', 'OCoLC'),
+        ('005', '19%02i0312000000.0' % rng.randint(80, 99)),
+        ('008', '820312s%i    fr            000 0 fre  ' % year),
+        ('020', '  ', [('a', '%010i' % rng.randrange(10 ** 10))]),
+        ('040', '  ', [('a', 'DLC'), ('c', 'DLC'), ('d', 'OCL')]),
+        ('050', '00', [('a', 'DC%i' % rng.randint(1, 999)), ('b', '.A%i' % rng.randint(1, 99))]),
+        ('100', '1 ', [('a', '%s, %s.' % (rng.choice(WORDS).title(), rng.choice(WORDS).title())), ('d', '%i-%i.' % (year - 60, year))]),
+        ('245', '10', ([('6', '880-01')] if script else []) + [('a', phrase(rng, rng.randint(2, 8)).capitalize() + ' :'),
+                                                               ('b', phrase(rng, rng.randint(2, 10)) + ' /'), ('c', 'par %s.' % rng.choice(WORDS))]),
+        ('260', '  ', [('a', rng.choice(['Paris', 'Moskva', 'London']) + ' :'), ('b', '%s,' % rng.choice(WORDS).title()), ('c', '%i.' % year)]),
+        ('300', '  ', [('a', '%i p. :' % rng.randint(20, 900)), ('b', rng.choice(['ill. ;', 'ill., ports., maps ;', 'plates ;'])),
+                       ('c', '%i cm.' % rng.randint(15, 30))]),
+    ]
+    if series:
+        fields.append(('440', ' 0', [('a', phrase(rng, 3).title() + ' ;'), ('v', 'v. %i' % rng.randint(1, 40))]))
+    for j in range(rng.randint(1, 6)):
+        fields.append(('500', '  ', [('a', phrase(rng, rng.randint(4, 30)).capitalize() + '.')]))
+    if rng.random() < 0.5:
+        fields.append(('504', '  ', [('a', 'Includes bibliographical references (p. %i-%i).' % (rng.randint(200, 300), rng.randint(301, 400)))]))
+    if rng.random() < 0.4:
+        fields.append(('505', '0 ', [('a', ' -- '.join(phrase(rng, rng.randint(2, 6)).capitalize() for j in range(rng.randint(5, 40))))]))
+    for j in range(rng.randint(2, 12)):
+        fields.append((rng.choice(['600', '650', '651']), ' 0', [('a', rng.choice(PLACES)), ('x', rng.choice(SUBJECTS)),
+                                                                 ('y', '%ith century.' % rng.randint(16, 20))]))
+    for j in range(rng.randint(0, 4)):
+        fields.append(('700', '1 ', [('a', '%s, %s.' % (rng.choice(WORDS).title(), rng.choice(WORDS).title()))]))
+    if script:
+        fields.append(('880', '10', [('6', '245-01/(N'), ('a', phrase(rng, rng.randint(2, 8), CYRILLIC).capitalize() + ' /'),
+                                     ('c', phrase(rng, 2, CYRILLIC) + '.')]))
+        fields.append(('880', '  ', [('6', '260-02/(N'), ('a', 'Москва :'), ('b', phrase(rng, 1, CYRILLIC) + ','), ('c', '%i.' % year)]))
+    return '00000cam a2200000 a 4500', fields
+
+
+def write_raw(leader, fields, encoding='utf-8', corrupt=None):
+    """Returns a record as binary MARC, in <encoding> (utf-8 or marc8), with leader position 9 set to match.
+       With a random.Random <corrupt>, the directory lengths of some fields are too short by 1-3 bytes,
+       with later offsets following on, as in records whose lengths were counted in characters.
+    """
+    encode = encode_marc8 if encoding == 'marc8' else lambda text: text.encode('utf-8')
+    leader = leader[:9] + (' ' if encoding == 'marc8' else 'a') + leader[10:]
+    directory = []
+    data = []
+    offset = 0
+    for field in fields:
+        if len(field) == 2:
+            content = encode(field[1])
+        else:
+            tag, indicators, subfields = field
+            content = indicators.encode('utf-8') + b''.join(b'\x1f' + code.encode('utf-8') + encode(text) for code, text in subfields)
+        content += iso2709.FIELD_TERMINATOR
+        length = len(content)
+        if corrupt and len(field) == 3 and corrupt.random() < 0.3:
+            length -= corrupt.randint(1, 3)
+        directory.append(('%3s%04d%05d' % (field[0], length, offset)).encode('utf-8'))
+        data.append(content)
+        offset += length
+    base_address = iso2709.LEADER_LEN + iso2709.DIRECTORY_ENTRY_LEN * len(directory) + 1
+    record_len = base_address + sum(len(d) for d in data) + 1
+    return b''.join([iso2709.write_leader(leader, record_len, base_address)] + directory + [iso2709.FIELD_TERMINATOR] + data + [iso2709.RECORD_TERMINATOR])
+
+
+def corpus(n, seed=0):
+    """Returns a dict of <n> synthetic records in each form: utf8, marc8 and corrupt binary MARC, and marcxml."""
+    rng = random.Random(seed)
+    corrupt = random.Random(seed + 1)
+    records = {'utf8': [], 'marc8': [], 'corrupt': [], 'marcxml': []}
+    for i in range(n):
+        leader, fields = synthetic_fields(i, rng)
+        raw = write_raw(leader, fields)
+        records['utf8'].append(raw)
+        records['marc8'].append(write_raw(leader, fields, 'marc8'))
+        records['corrupt'].append(write_raw(leader, fields, corrupt=corrupt))
+        records['marcxml'].append(etree.tostring(iso2709.read_record(raw), encoding='utf-8'))
+    return records
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Write a synthetic MARC corpus for benchmarks.')
+    parser.add_argument('-n', '--records', type=int, default=10000, help='Number of records')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('-d', '--directory', default='.', help='Directory to write corpus files to')
+    args = parser.parse_args()
+
+    records = corpus(args.records, args.seed)
+    for name, filename in [('utf8', 'corpus.mrc'), ('marc8', 'corpus_marc8.mrc'), ('corrupt', 'corpus_corrupt.mrc')]:
+        with open(os.path.join(args.directory, filename), 'wb') as f:
+            f.writelines(records[name])
+    with open(os.path.join(args.directory, 'corpus_marc.xml'), 'wb') as f:
+        f.write(('<collection xmlns="%s">\n' % iso2709.MARC21_NS).encode('utf-8'))
+        f.writelines(xml + b'\n' for xml in records['marcxml'])
+        f.write(b'</collection>\n')
+    print("%i records, %.1f MB UTF-8" % (args.records, sum(len(r) for r in records['utf8']) / 1024 / 1024))
@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+
+"""Benchmark suite: times reading, the IAMarcXml transform, serialization, index repair and checking
+   over a synthetic corpus (corpus.py), per record and per MB, with results as JSON to compare across commits.
+
+   USAGE: run.py [-n <number of records>] [-r <repeats>] [-o <results.json>] [-c <baseline.json> [-t <threshold>]] [<benchmark> ...]
+   Each benchmark is timed over the whole corpus <repeats> times, and the fastest run is kept.
+   With -c, results are compared with an earlier results file, and the exit status is 1 if any
+   benchmark is slower by more than <threshold> (default 0.2, 20%).
+"""
+
+import argparse
+import collections
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from lxml import etree
+import checkmarc
+import fixindex
+import iso2709
+import marcia
+from corpus import corpus
+
+
+def parsed(records):
+    return lambda: [etree.fromstring(xml) for xml in records['marcxml']]
+
+
+def transformed(records):
+    return lambda: [marcia.IAMarcXml('bench%i' % i, etree.fromstring(xml)) for i, xml in enumerate(records['marcxml'])]
+
+
+# name: (inputs(records), returning a function which gives the inputs for one run, function, input corpus for bytes/MB)
+BENCHMARKS = collections.OrderedDict([
+    ('read_marcxml',      (lambda r: lambda: r['marcxml'], etree.fromstring, 'marcxml')),
+    ('read_marc',         (lambda r: lambda: r['utf8'], iso2709.read_record, 'utf8')),
+    ('read_marc8',        (lambda r: lambda: r['marc8'], lambda raw: iso2709.read_record(raw, 'marc8'), 'marc8')),
+    ('transform',         (parsed, lambda element: marcia.IAMarcXml('bench', element), 'marcxml')),
+    ('serialize_marc',    (transformed, lambda record: marcia.serialize(record, 'marc'), 'utf8')),
+    ('serialize_marcxml', (transformed, lambda record: marcia.serialize(record, 'marcxml'), 'marcxml')),
+    ('fix_index',         (lambda r: lambda: r['corrupt'], fixindex.fix_record, 'corrupt')),
+    ('check',             (lambda r: lambda: [xml.decode('utf-8') for xml in r['marcxml']], checkmarc.check_text, 'marcxml')),
+])
+
+
+def bench(inputs, function, repeat):
+    """Returns the fastest time of <repeat> runs of <function> over every item from inputs()."""
+    best = None
+    for i in range(repeat):
+        items = inputs()
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names, n, repeat, seed=0):
+    """Runs benchmarks <names> on an <n> record corpus. Returns the results as a dict, ready for JSON."""
+    records = corpus(n, seed)
+    results = collections.OrderedDict()
+    for name in names:
+        inputs, function, source = BENCHMARKS[name]
+        seconds = bench(inputs(records), function, repeat)
+        size = sum(len(r) for r in records[source])
+        results[name] = collections.OrderedDict([
+            ('seconds', seconds),
+            ('us_per_record', seconds / n * 1e6),
+            ('records_per_s', n / seconds),
+            ('mb_per_s', size / 1024 / 1024 / seconds),
+            ('mb', size / 1024 / 1024),
+        ])
+    return collections.OrderedDict([
+        ('commit', git_commit()),
+        ('date', datetime.datetime.now().isoformat(timespec='seconds')),
+        ('python', platform.python_version()),
+        ('lxml', etree.__version__),
+        ('machine', platform.machine()),
+        ('records', n),
+        ('repeat', repeat),
+        ('seed', seed),
+        ('results', results),
+    ])
+
+
+def compare(results, baseline, threshold):
+    """Prints each benchmark against <baseline> results. Returns the names of benchmarks slower by more than <threshold>."""
+    print("%-18s %12s %12s %8s  (baseline %s)" % ('benchmark', 'us/record', 'baseline', 'change', baseline.get('commit')))
+    regressions = []
+    for name, result in results['results'].items():
+        old = baseline['results'].get(name)
+        if not old:
+            print("%-18s %12.1f %12s" % (name, result['us_per_record'], '-'))
+            continue
+        change = result['us_per_record'] / old['us_per_record'] - 1
+        slower = change > threshold
+        if slower:
+            regressions.append(name)
+        print("%-18s %12.1f %12.1f %+7.0f%%%s" % (name, result['us_per_record'], old['us_per_record'], change * 100, '  SLOWER' if slower else ''))
+    return regressions
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Run marcia benchmarks on a synthetic corpus.')
+    parser.add_argument('benchmarks', nargs='*', metavar='benchmark', help='Benchmarks to run, default all: %s' % ', '.join(BENCHMARKS))
+    parser.add_argument('-n', '--records', type=int, default=2000, help='Number of records in the corpus')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Runs of each benchmark, the fastest is kept')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Corpus random seed')
+    parser.add_argument('-o', '--outfile', help='Write results as JSON to file')
+    parser.add_argument('-c', '--compare', help='Compare with results JSON from an earlier run')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2, help='Slowdown, as a fraction, reported as a regression')
+    args = parser.parse_args()
+    unknown = set(args.benchmarks).difference(BENCHMARKS)
+    if unknown:
+        parser.error('Unknown benchmark: %s' % ', '.join(sorted(unknown)))
+
+    results = run(args.benchmarks or list(BENCHMARKS), args.records, args.repeat, args.seed)
+    if args.outfile:
+        with open(args.outfile, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    else:
+        print("%i records, commit %s" % (results['records'], results['commit']))
+        print("%-18s %12s %12s %10s" % ('benchmark', 'us/record', 'records/s', 'MB/s'))
+        for name, result in results['results'].items():
+            print("%-18s %12.1f %12.0f %10.2f" % (name, result['us_per_record'], result['records_per_s'], result['mb_per_s']))
+    sys.exit(1 if regressions else 0)
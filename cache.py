@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+
+"""Persistent cache of results for unchanged input files, shared by checkmarc.py and marcia.py.
+
+   Results are stored in SQLite, by <kind> of result and input path, with the size, mtime and SHA-1 of the input files.
+   A result is returned while the inputs have the same size and mtime, or, if those have changed, the same content.
+   The size, mtime and SHA-1 stored with a result are those taken when get() missed, before the inputs were read
+   to produce it, so an input changed in between is not cached as unchanged.
+   All results of a kind are dropped when its version changes, e.g. when the code producing them changes.
+"""
+
+import hashlib
+import os
+import sqlite3
+
+COMMIT_EVERY = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (kind TEXT PRIMARY KEY, version TEXT);
+CREATE TABLE IF NOT EXISTS results (
+    kind TEXT, path TEXT, stat TEXT, sha1 TEXT, value BLOB,
+    PRIMARY KEY (kind, path)
+);
+"""
+
+
+def code_version(*modules):
+    """Returns a version string for the source code of <modules>, changing whenever any of their files change."""
+    h = hashlib.sha1()
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def stat(paths):
+    """Returns the size and mtime of every file in <paths> as a string. Missing files are included as '-'."""
+    stats = []
+    for path in paths:
+        try:
+            s = os.stat(path)
+            stats.append('%i:%i' % (s.st_size, s.st_mtime_ns))
+        except OSError:
+            stats.append('-')
+    return ' '.join(stats)
+
+
+def content_hash(paths):
+    """Returns the SHA-1 of the content of every file in <paths>, missing files hash as empty."""
+    h = hashlib.sha1()
+    for path in paths:
+        h.update(b'\0')
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+        except IOError:
+            h.update(b'-')
+    return h.hexdigest()
+
+
+class Cache(object):
+    """Results of one <kind>, at one <version>, in SQLite database <filename>.
+       usage:
+           with Cache('.marcia.cache', 'checkmarc', version) as cache:
+               findings = cache.get([filename])
+               if findings is None:
+                   cache.put([filename], check(filename))
+    """
+    def __init__(self, filename, kind, version):
+        self.kind = kind
+        self.db = sqlite3.connect(filename)
+        self.db.executescript(SCHEMA)
+        self.uncommitted = 0
+        self.hits = self.misses = 0
+        self.missed = {}  # first path: (stat, sha1) of the inputs when get() missed, for put()
+        row = self.db.execute('SELECT version FROM versions WHERE kind = ?', (kind,)).fetchone()
+        if row is None or row[0] != version:
+            self.db.execute('DELETE FROM results WHERE kind = ?', (kind,))
+            self.db.execute('INSERT OR REPLACE INTO versions VALUES (?, ?)', (kind, version))
+            self.db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, paths):
+        """Returns the stored result for input files <paths>, or None if there is none or the files have changed.
+           The first path is the key.
+        """
+        row = self.db.execute('SELECT stat, sha1, value FROM results WHERE kind = ? AND path = ?',
+                              (self.kind, paths[0])).fetchone()
+        current = stat(paths)
+        if row is not None and row[0] == current:
+            self.hits += 1
+            return row[2]
+        sha1 = content_hash(paths)
+        if row is not None and row[1] == sha1:
+            # touched, but not changed
+            self.db.execute('UPDATE results SET stat = ? WHERE kind = ? AND path = ?', (current, self.kind, paths[0]))
+            self._written()
+            self.hits += 1
+            return row[2]
+        self.missed[paths[0]] = (current, sha1)
+        self.misses += 1
+        return None
+
+    def put(self, paths, value):
+        """Stores <value> (str or bytes) as the result for input files <paths>, with their size, mtime and SHA-1
+           from the get() which missed, or as they are now if there was none.
+        """
+        current, sha1 = self.missed.pop(paths[0], None) or (stat(paths), content_hash(paths))
+        self.db.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                        (self.kind, paths[0], current, sha1, value))
+        self._written()
+
+    def _written(self):
+        self.uncommitted += 1
+        if self.uncommitted >= COMMIT_EVERY:
+            self.db.commit()
+            self.uncommitted = 0
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
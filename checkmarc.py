@@ -0,0 +1,183 @@
+#!/usr/bin/python3
+
+"""Checks for issues with IA MARC XML, reading each file once.
+
+   Checks each <ocaid>_marc.xml in a directory for the issues checkmarc.sh finds, and writes the itemlists
+   (bad_unicode.txt, bad_index.txt, multi_008.txt, ...) at the end. Encoding issues are found with the
+   checkmarc.sh regexes, everything else by parsing each record and checking its structure with MarcXml.check().
+"""
+
+import argparse
+import collections
+import io
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+from lxml import etree
+
+import cache
+import marcia
+
+RED = "\033[31m"
+YELLOW = "\033[33m"
+CLR = "\033[0m"
+
+MARC_FILENAME = re.compile(r'(.+?)(_archive)?_marc.xml$')
+
+# Encoding patterns from checkmarc.sh, by itemlist name.
+PATTERNS = collections.OrderedDict([
+    # common signs of MARC8 conversion issues
+    ('bad_unicode', '|'.join([
+        'Ã[0-9]{4}',            # > ©YYYY
+        'â[AeE]',               # > acute + vowel likely to be an encoding error
+        'á[AE]',                # > grave + vowel likely to be an encoding error
+        'ðc',                   # > ç
+        '¶',                    # > œ
+        r'\(B[^a-z)]{,2}<',     # unconverted non-Latin MARC8 charsets in 880 fields
+    ])),
+    # utf8 decoded as marc8, and utf8 decoded as Win1225
+    ('bad_source', '|'.join([
+        '℗♭', '£̀Đ', 'Ì§', '[¿♯]±', '©[♭·ʹþ¡ĐƯðơ]',
+        'Ã[«¦¢§³¡¼µ±¤ª£¨]',
+        '[ÅÄ]«',                # u/i macron
+    ])),
+])
+
+# One combined pattern. Each alternative is a lookahead, so every match is zero width
+# and overlapping matches from different detectors are all found in a single scan.
+DETECTORS = re.compile('|'.join('(?=(?P<%s>%s))' % (name, pattern) for name, pattern in PATTERNS.items()))
+
+ITEMLISTS = ['bad_unicode', 'bad_index', 'bad_source', 'bad_tag', 'xml_comments', 'multi_volumes', 'non_monographs', 'multi_008', 'bad_structure']
+
+
+def ocaid(filename):
+    """Returns the OCAID from an <ocaid>_marc.xml or <ocaid>_archive_marc.xml filename."""
+    return MARC_FILENAME.match(os.path.basename(filename)).group(1)
+
+
+def check_text(text, archive=True):
+    """Returns the set of itemlist names that MARC XML <text> belongs in.
+       bad_source and bad_tag are only checked in archive.org generated (<ocaid>_archive_marc.xml) records.
+    """
+    found = set(m.lastgroup for m in DETECTORS.finditer(text))
+    try:
+        for record in marcia.read_records(io.BytesIO(text.encode('utf-8'))):
+            found.update(finding.itemlist for finding in marcia.MarcXml(record).check())
+    except (etree.XMLSyntaxError, ValueError):
+        # unparsable, or no MARC 21 records
+        found.add('bad_structure')
+    if 'bad_index' in found:
+        # comments from a corrupt index are expected
+        found.discard('xml_comments')
+    if not archive:
+        found.difference_update(['bad_source', 'bad_tag'])
+    return found
+
+
+def check_file(filename):
+    """Reads and checks a single MARC XML file, returns (filename, set of itemlist names)."""
+    with open(filename, 'rb') as f:
+        text = f.read().decode('utf-8', 'replace')
+    return filename, check_text(text, filename.endswith('_archive_marc.xml'))
+
+
+def check_all(filenames, jobs=None, cache=None):
+    """Checks all <filenames> over a pool of <jobs> worker processes.
+       With a cache.Cache, only files which are not in the cache, or have changed, are checked.
+       Returns a dict of itemlist name: sorted list of OCAIDs.
+    """
+    results = dict((name, []) for name in ITEMLISTS)
+
+    def add(filename, found):
+        for name in found:
+            results[name].append(ocaid(filename))
+
+    unchecked = []
+    for filename in filenames:
+        found = cache.get([filename]) if cache else None
+        if found is None:
+            unchecked.append(filename)
+        else:
+            add(filename, found.split())
+    if unchecked:
+        with multiprocessing.Pool(jobs) as pool:
+            for filename, found in pool.imap_unordered(check_file, unchecked, chunksize=64):
+                add(filename, found)
+                if cache:
+                    cache.put([filename], ' '.join(sorted(found)))
+    for name in results:
+        results[name].sort()
+    return results
+
+
+def write_itemlist(filename, ids):
+    """Writes <ids> one per line to <filename>, or removes <filename> if there are none."""
+    if ids:
+        with open(filename, 'w') as f:
+            f.write(''.join('%s\n' % i for i in ids))
+    elif os.path.exists(filename):
+        os.remove(filename)
+
+
+def move_records(results, directory):
+    """Moves <ocaid>_archive_marc.xml records to be excluded into their own subdirectories."""
+    for destination, itemlists in marcia.BUCKETS.items():
+        os.makedirs(os.path.join(directory, destination), exist_ok=True)
+        for i in sorted(set(i for name in itemlists for i in results[name])):
+            filename = os.path.join(directory, '%s_archive_marc.xml' % i)
+            if os.path.exists(filename):
+                shutil.move(filename, os.path.join(directory, destination))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Check for issues with IA MARC XML, writing itemlists of affected items.')
+    parser.add_argument('itemlist', nargs='?', help='Itemlist of expected OCAIDs, to report items without MARC XML')
+    parser.add_argument('-d', '--directory', default='.', help='Directory containing <ocaid>_marc.xml files, and for output itemlists')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Number of worker processes, defaults to number of CPUs')
+    parser.add_argument('-c', '--cache', help='Cache results in this file, and only re-check files which have changed since')
+    parser.add_argument('-m', '--move', action='store_true', help='Move records to exclude into bad_records/, multi_volumes/ and non_monographs/')
+    args = parser.parse_args()
+
+    directory = args.directory
+    filenames = sorted(os.path.join(directory, f) for f in os.listdir(directory) if MARC_FILENAME.match(f))
+
+    # Check Ids without MARC XML if <itemlist> provided
+    if args.itemlist and os.path.exists(args.itemlist):
+        with open(args.itemlist) as f:
+            expected = set(line.strip() for line in f if line.strip())
+        missing = sorted(expected.difference(ocaid(f) for f in filenames))
+        if missing:
+            print("\n%s!!! %i items did not have MARC XML.%s" % (RED, len(missing), CLR))
+            print("     Writing list to 'no_marc.txt'")
+            write_itemlist(os.path.join(directory, 'no_marc.txt'), missing)
+    elif args.itemlist:
+        print("\n%s!!! Itemlist '%s' not found!%s" % (RED, args.itemlist, CLR))
+
+    if args.cache:
+        with cache.Cache(args.cache, 'checkmarc', cache.code_version(sys.modules[__name__], marcia)) as c:
+            results = check_all(filenames, args.jobs, c)
+        print("Checked %i files, %i unchanged since the last run." % (c.misses, c.hits))
+    else:
+        results = check_all(filenames, args.jobs)
+
+    messages = {
+        'bad_unicode':  (RED, 'MARCs have potential MARC8 -> Unicode issues'),
+        'bad_index':    (RED, 'MARCs had a corrupt source index'),
+        'bad_source':   (RED, 'MARC have likely corrupt binary MARC!'),
+        'xml_comments': (YELLOW, 'MARCs contain other XML comments, which indicates conversion problems'),
+    }
+    for name in ITEMLISTS:
+        if results[name] and name in messages:
+            colour, message = messages[name]
+            print("\n%s!!! %i %s:%s" % (colour, len(results[name]), message, CLR))
+            print("     Writing list to '%s.txt'" % name)
+        write_itemlist(os.path.join(directory, '%s.txt' % name), results[name])
+    if results['bad_unicode']:
+        print("\n%sTry re-converting from raw MARC as MARC-8 with fixmarc.sh.%s" % (YELLOW, CLR))
+
+    # Move records to exclude to their own directories
+    if args.move:
+        move_records(results, directory)
@@ -1,69 +1,202 @@
 #!/usr/bin/python3
 
+import argparse
+import bisect
+import mmap
+import os
+import re
 import sys
 
-"""Takes a single raw MARC record as input and attempts to fix its index."""
+import iso2709
+
+"""Takes raw MARC records as input and attempts to fix their indexes."""
 
 DEBUG = False
+IOV_MAX = 1024
+SEPARATOR = re.compile(iso2709.FIELD_TERMINATOR)
+
+
+def separator_positions(data, start=0, end=None):
+    """Returns the sorted positions of all field separators (0x1E) in data[start:end], relative to <start>."""
+    end = len(data) if end is None else end
+    return [m.start() - start for m in SEPARATOR.finditer(data, start, end)]
 
 
-def step_through_and_fix(index, data):
-    """Check the index represents the data, and fix if not."""
-    separator = 0x1e
+def step_through_and_fix(index, data, start=0, end=None):
+    """Check the index represents the data, and fix if not.
+       <data> may be any buffer, e.g. bytes or mmap, with the data section at data[start:end].
+       Each field is taken to end at the first separator after its start, whether the
+       index length is too short or too long.
+    """
+    separators = separator_positions(data, start, end)
     calculated_offset = 0
     for i,tag in enumerate(index):
         # Set current offset to calculated offset.
         tag[2] = ('%05d' % calculated_offset).encode('utf-8')
 
-        assert data[calculated_offset] == separator
+        s = bisect.bisect_left(separators, calculated_offset)
+        assert s < len(separators) and separators[s] == calculated_offset
+        if s + 1 == len(separators):
+            raise IndexError('No separator at end of field %s' % tag[0])
 
-        # If offset + len does not end on a separator, incr. len by one until it is found
-        while data[calculated_offset + int(tag[1])] != separator:
-            tag[1] = ('%04d' % (int(tag[1]) + 1)).encode('utf-8')
+        field_len = separators[s + 1] - calculated_offset
+        if field_len > 9999:
+            raise ValueError('Field %s too long for index, %i' % (tag[0], field_len))
+        tag[1] = ('%04d' % field_len).encode('utf-8')
 
-        calculated_offset += int(tag[1])
+        calculated_offset += field_len
     return index
 
 
 def recreate_index(index):
     """Takes as input an Array of [[tag, tag_len, offset], ... ]
        returns binary index."""
-    output = b''
-    for t in index:
-        output += t[0] + t[1] + t[2]
-    return output
+    return b''.join(t[0] + t[1] + t[2] for t in index)
 
 
-def fix_index(f):
-    f.seek(0)
-    leader = f.read(24)
-    length = leader[:5]
+def read_index(raw, start=0):
+    """Splits a raw MARC record at raw[start:] into leader, index as an Array of [[tag, tag_len, offset], ... ],
+       and the position of the data section, starting at the 0x1E byte that ends the index."""
+    leader = raw[start:start+24]
+    index = []
+    pos = start + 24
+    while raw[pos] != 0x1e:
+        index.append([raw[pos:pos+3], raw[pos+3:pos+7], raw[pos+7:pos+12]])
+        pos += 12
+    return leader, index, pos
 
-    field_len     = leader[20]
-    start_pos_len = leader[21]
 
-    index = []
-    while True:
-        tag = f.read(3)
-        if tag[0] == 0x1e:
-            break
-        tag_len = f.read(4)
-        offset  = f.read(5)
-        index.append([tag, tag_len, offset])
-
-    f.seek(-3, 1)    # back to end of index, at the 0x1E byte
-    data = f.read()  # read rest of file (data section)
+def fixed_leader(leader, index, data_len):
+    """Returns <leader> with record length and base address set for <index> and a data section of <data_len> bytes,
+       starting at the 0x1E byte that ends the index."""
+    base_address = 24 + 12 * len(index) + 1
+    return (b'%05d' % (base_address + data_len - 1)) + leader[5:12] + (b'%05d' % base_address) + leader[17:]
+
+
+def changed_fields(index, original):
+    """Returns [tag, (original len, offset), (fixed len, offset)] for each changed index entry."""
+    return [[t[0], o, (int(t[1]), int(t[2]))] for t, o in zip(index, original) if o != (int(t[1]), int(t[2]))]
+
+
+def fix_record(raw):
+    """Fixes the index of a single raw MARC record, and the record length and base address in its leader.
+       Returns the fixed record, and a list of [tag, (original len, offset), (fixed len, offset)] for each changed index entry.
+    """
+    leader, index, pos = read_index(raw)
+    data = raw[pos:]
     if DEBUG:
         print("ORIGINAL INDEX: %s" % index)
-
+    original = [(int(t[1]), int(t[2])) for t in index]
     fixed = step_through_and_fix(index, data)
-    return leader + recreate_index(fixed) + data
+    return fixed_leader(leader, fixed, len(data)) + recreate_index(fixed) + data, changed_fields(fixed, original)
+
+
+def fix_records(f, report=None):
+    """Yields each record in a file of concatenated raw MARC with its index fixed.
+       Records that can not be fixed are yielded unchanged.
+       report(n, 001 control number, changes or exception) is called for every record.
+    """
+    for n, raw in enumerate(iso2709.read_records(f)):
+        try:
+            fixed, changes = fix_record(raw)
+        except (AssertionError, IndexError, ValueError) as e:
+            fixed, changes = raw, e
+        if report:
+            leader, index, pos = read_index(fixed)
+            report(n, control_number(index, fixed, pos), changes)
+        yield fixed
+
+
+def writev_all(fd, buffers):
+    """Writes all <buffers> to file descriptor <fd> with scatter writes."""
+    buffers = [memoryview(b).cast('B') for b in buffers]
+    while buffers:
+        written = os.writev(fd, buffers[:IOV_MAX])
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers.pop(0))
+        if written:
+            buffers[0] = buffers[0][written:]
+
+
+def fix_mmap(filename, fd, report=None):
+    """Fixes the indexes of all records in binary MARC file <filename>, and writes them to file descriptor <fd>.
+       The input is memory mapped and only the leaders and indexes are rebuilt; data sections are written
+       straight from the mapped file without being copied.
+       report(n, 001 control number, changes or exception) is called for every record.
+    """
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            buffers = []
+            start = n = 0
+            while start < len(mm):
+                end = mm.find(iso2709.RECORD_TERMINATOR, start)
+                if end == -1:
+                    end = len(mm) - 1
+                    if not mm[start:].strip():  # ignore trailing whitespace
+                        break
+                try:
+                    leader, index, pos = read_index(mm, start)
+                    original = [(int(t[1]), int(t[2])) for t in index]
+                    step_through_and_fix(index, mm, pos, end + 1)
+                    buffers += [fixed_leader(leader, index, end + 1 - pos), recreate_index(index), view[pos:end+1]]
+                    changes = changed_fields(index, original)
+                except (AssertionError, IndexError, ValueError) as e:
+                    index, pos, changes = [], start, e
+                    buffers.append(view[start:end+1])
+                if report:
+                    report(n, control_number(index, mm, pos), changes)
+                n += 1
+                start = end + 1
+                if len(buffers) >= IOV_MAX:
+                    writev_all(fd, buffers)
+                    buffers = []
+            writev_all(fd, buffers)
+            del buffers
+            view.release()
 
 
-if __name__ == '__main__':
+def fix_index(f):
+    f.seek(0)
+    return b''.join(fix_records(f))
 
-    filename = sys.argv[1]  # binary MARC filename to read
 
-    with open(filename, 'rb') as f:
-        fixed_marc = fix_index(f)
-        sys.stdout.buffer.write(fixed_marc)
+def control_number(index, data, start=0):
+    """Returns the 001 from an index and data section at data[start:], for reporting, or '' if it can not be found."""
+    for tag, tag_len, offset in index:
+        if tag == b'001':
+            field_start = start + int(offset) + 1
+            return bytes(data[field_start:field_start + int(tag_len) - 1]).decode('utf-8', 'replace').strip()
+    return ''
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Fix the indexes of all records in a binary MARC file. Output to STDOUT.')
+    parser.add_argument('filename', help='binary MARC filename to read')
+    parser.add_argument('-m', '--mmap', action='store_true', help='Memory map the input and write data sections without copying them')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Report statistics for every record, not only repaired ones')
+    args = parser.parse_args()
+
+    totals = {'records': 0, 'repaired': 0, 'failed': 0}
+
+    def report(n, control_number, changes):
+        totals['records'] += 1
+        if isinstance(changes, Exception):
+            totals['failed'] += 1
+            sys.stderr.write("%i\t%s\tFAILED\t%s\n" % (n, control_number, changes))
+        elif changes or args.verbose:
+            totals['repaired'] += bool(changes)
+            sys.stderr.write("%i\t%s\t%i fields repaired\t%s\n" % (n, control_number, len(changes),
+                ' '.join('%s:%i->%i(%+i)' % (tag.decode('utf-8', 'replace'), o[0], c[0], c[0] - o[0]) for tag, o, c in changes)))
+
+    if args.mmap:
+        sys.stdout.flush()
+        fix_mmap(args.filename, sys.stdout.fileno(), report)
+    else:
+        with open(args.filename, 'rb') as f:
+            for fixed_marc in fix_records(f, report):
+                sys.stdout.buffer.write(fixed_marc)
+    sys.stderr.write("%(records)i records, %(repaired)i repaired, %(failed)i failed\n" % totals)
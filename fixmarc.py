@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+"""Fixes index and unicode issues with IA MARC records, in one process, without yaz-marcdump.
+
+   Reads <ocaid>_meta.mrc for every item in the bad_index.txt and bad_unicode.txt itemlists generated by checkmarc.sh
+   and regenerates <ocaid>_marc.xml. Binary MARC for bad_index items is replaced with a fixed index copy,
+   with the original moved to ./backup. Items from bad_unicode.txt are converted from MARC-8 to UTF-8.
+"""
+
+import argparse
+import os
+import sys
+from lxml import etree
+
+import fixindex
+import iso2709
+
+
+def read_itemlist(filename):
+    """Returns the OCAIDs in an itemlist, or an empty list if it does not exist."""
+    if not os.path.exists(filename):
+        return []
+    with open(filename) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def write_marcxml(records, filename):
+    """Writes MARC XML record elements to <filename> as a collection, each record pretty printed by lxml.
+       This is not yaz-marcdump's layout: every <record> repeats the MARC 21 namespace declaration, and the indentation differs.
+    """
+    with open(filename, 'wb') as f:
+        f.write(('<collection xmlns="%s">\n' % iso2709.MARC21_NS).encode('utf-8'))
+        for record in records:
+            f.write(etree.tostring(record, encoding='utf-8', pretty_print=True))
+        f.write(b'</collection>\n')
+
+
+def fix_item(ocaid, directory, fix_index=False, marc8=False, backup='backup'):
+    """Regenerates <ocaid>_marc.xml from <ocaid>_meta.mrc, optionally fixing the binary MARC index
+       and converting from MARC-8.
+    """
+    mrc = os.path.join(directory, '%s_meta.mrc' % ocaid)
+    with open(mrc, 'rb') as f:
+        raw = list(iso2709.read_records(f))
+    if fix_index:
+        fixed = [fixindex.fix_record(r)[0] for r in raw]
+        backup_dir = os.path.join(directory, backup)
+        os.makedirs(backup_dir, exist_ok=True)
+        os.rename(mrc, os.path.join(backup_dir, os.path.basename(mrc)))
+        with open(mrc, 'wb') as f:
+            f.write(b''.join(fixed))
+        raw = fixed
+    encoding = 'marc8' if marc8 else 'utf-8'
+    write_marcxml((iso2709.read_record(r, encoding) for r in raw), os.path.join(directory, '%s_marc.xml' % ocaid))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Fix index and unicode issues with IA MARC records, for items in checkmarc.sh itemlists.')
+    parser.add_argument('-d', '--directory', default='.', help='Directory containing itemlists and <ocaid>_meta.mrc')
+    args = parser.parse_args()
+
+    bad_index = read_itemlist(os.path.join(args.directory, 'bad_index.txt'))
+    bad_unicode = set(read_itemlist(os.path.join(args.directory, 'bad_unicode.txt')))
+
+    failed = 0
+    for ocaid in bad_index + sorted(bad_unicode.difference(bad_index)):
+        try:
+            fix_item(ocaid, args.directory, fix_index=ocaid in bad_index, marc8=ocaid in bad_unicode)
+        except (IOError, AssertionError, IndexError, ValueError) as e:
+            failed += 1
+            sys.stderr.write("%s\t%s\n" % (ocaid, e))
+    print("Fixed %i items, %i failed." % (len(bad_index) + len(bad_unicode.difference(bad_index)) - failed, failed))
@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+
+"""Reads and writes ISO 2709 (binary MARC) records."""
+
+import mmap
+import os
+import re
+from lxml import etree
+
+import marc8
+
+MARC21_NS = "http://www.loc.gov/MARC21/slim"
+
+SUBFIELD_DELIMITER = b'\x1f'
+FIELD_TERMINATOR   = b'\x1e'
+RECORD_TERMINATOR  = b'\x1d'
+
+LEADER_LEN = 24
+DIRECTORY_ENTRY_LEN = 12  # tag (3) + field length (4) + starting position (5)
+
+BLOCK_SIZE = 1 << 16
+XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+CONTROLFIELD = '{%s}controlfield' % MARC21_NS
+DATAFIELD    = '{%s}datafield' % MARC21_NS
+LEADER       = '{%s}leader' % MARC21_NS
+RECORD       = '{%s}record' % MARC21_NS
+SUBFIELD     = '{%s}subfield' % MARC21_NS
+
+
+def encode_datafield(field):
+    """Returns the binary content of a MARC XML datafield element: indicators, then delimited subfields."""
+    parts = [(field.get('ind1') or ' ') + (field.get('ind2') or ' ')]
+    for sub in field:
+        if isinstance(sub.tag, str):  # skip comments
+            parts.append('\x1f' + sub.get('code', '') + (sub.text or ''))
+    return ''.join(parts).encode('utf-8')
+
+
+def write_leader(leader, record_len, base_address):
+    """Returns the leader with record length, base address and entry map set,
+       as yaz-marcdump does on output."""
+    indicator_count = leader[10] if leader[10].isdigit() else '2'
+    subfield_code_count = leader[11] if leader[11].isdigit() else '2'
+    return ('%05d' % record_len + leader[5:10] + indicator_count + subfield_code_count +
+            '%05d' % base_address + leader[17:20] + '4500').encode('utf-8')
+
+
+def write_record(record):
+    """Takes a MARC XML record element and returns it as binary MARC."""
+    leader = ' ' * LEADER_LEN
+    directory = []
+    data = []
+    offset = 0
+    for element in record:
+        if element.tag == CONTROLFIELD:
+            content = (element.text or '').encode('utf-8')
+        elif element.tag == DATAFIELD:
+            content = encode_datafield(element)
+        elif element.tag == LEADER:
+            leader = (element.text or '').ljust(LEADER_LEN)
+            continue
+        else:
+            continue
+        content += FIELD_TERMINATOR
+        directory.append(('%3s%04d%05d' % (element.get('tag'), len(content), offset)).encode('utf-8'))
+        data.append(content)
+        offset += len(content)
+
+    base_address = LEADER_LEN + DIRECTORY_ENTRY_LEN * len(directory) + 1
+    record_len = base_address + offset + 1
+    return b''.join([write_leader(leader, record_len, base_address)] + directory + [FIELD_TERMINATOR] + data + [RECORD_TERMINATOR])
+
+
+def read_records(f):
+    """Yields raw MARC records from a file, split on the record terminator (0x1D)."""
+    buffer = b''
+    while True:
+        block = f.read(BLOCK_SIZE)
+        if not block:
+            break
+        buffer += block
+        start = 0
+        end = buffer.find(RECORD_TERMINATOR)
+        while end != -1:
+            yield buffer[start:end+1]
+            start = end + 1
+            end = buffer.find(RECORD_TERMINATOR, start)
+        buffer = buffer[start:]
+    if buffer.strip():
+        yield buffer
+
+
+def record_ranges(filename, n):
+    """Splits binary MARC file <filename> into up to <n> (start, end) byte ranges of whole records,
+       for readers working in parallel.
+    """
+    size = os.path.getsize(filename)
+    if size == 0:
+        return [(0, 0)]
+    bounds = [0]
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, n):
+            end = mm.find(RECORD_TERMINATOR, max(size * i // n, bounds[-1]))
+            if end == -1:
+                break
+            bounds.append(end + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def read_range(data, start, end):
+    """Yields (offset, raw record) for the records in byte range [start, end) of <data>, bytes or an mmap."""
+    pos = start
+    while pos < end:
+        next_ = data.find(RECORD_TERMINATOR, pos, end)
+        next_ = end if next_ == -1 else next_ + 1
+        raw = data[pos:next_]
+        if raw.strip():
+            yield pos, raw
+        pos = next_
+
+
+def decode(data, encoding):
+    """Decodes field content to a string, dropping characters not allowed in XML."""
+    if encoding == 'marc8':
+        text = marc8.decode(data)
+    else:
+        text = data.decode('utf-8', 'replace')
+    return XML_INVALID.sub('', text)
+
+
+def read_fields(raw, encoding='utf-8'):
+    """Splits a binary MARC record into its leader and a list of fields, without building XML.
+       Controlfields are (tag, text) and datafields (tag, indicators, [(code, text), ...]).
+       Fields which do not match their directory entry are preceded by (None, comment), as yaz-marcdump does,
+       e.g. (None, ' No separator at end of field length=40 ')
+       A directory entry whose length or starting position is not a number ends the directory, with a comment.
+       With encoding='marc8', MARC-8 is converted to Unicode and Leader/09 set to 'a'.
+    """
+    leader = raw[:LEADER_LEN].decode('ascii', 'replace').ljust(LEADER_LEN)
+    if encoding == 'marc8':
+        leader = leader[:9] + 'a' + leader[10:]
+    fields = []
+    directory_end = raw.find(FIELD_TERMINATOR, LEADER_LEN)
+    base_address = directory_end + 1
+    for pos in range(LEADER_LEN, directory_end - DIRECTORY_ENTRY_LEN + 1, DIRECTORY_ENTRY_LEN):
+        entry = raw[pos:pos + DIRECTORY_ENTRY_LEN]
+        tag = entry[:3].decode('ascii', 'replace')
+        if not entry[3:12].isdigit():
+            # the rest of the directory can not be trusted, yaz-marcdump stops reading it here too
+            fields.append((None, ' Directory offset %i: Bad value for data length and/or length starting (%s) '
+                                 % (pos - LEADER_LEN, entry[3:12].decode('ascii', 'replace'))))
+            break
+        length, offset = int(entry[3:7]), int(entry[7:12])
+        content = raw[base_address + offset:base_address + offset + length]
+        if content[-1:] != FIELD_TERMINATOR:
+            fields.append((None, ' No separator at end of field length=%i ' % length))
+        elif FIELD_TERMINATOR in content[:-1]:
+            fields.append((None, ' Separator but not at end of field length=%i ' % length))
+        content = content.split(FIELD_TERMINATOR)[0]
+
+        if tag.startswith('00'):
+            fields.append((tag, decode(content, encoding)))
+            continue
+        subfields = content.split(SUBFIELD_DELIMITER)
+        indicators = subfields[0].decode('ascii', 'replace').ljust(2)
+        fields.append((tag, indicators, [(sub[:1].decode('ascii', 'replace'), decode(sub[1:], encoding)) for sub in subfields[1:]]))
+    return leader, fields
+
+
+def read_record(raw, encoding='utf-8'):
+    """Takes a binary MARC record and returns it as a MARC XML record element.
+       Fields which do not match their directory entry are marked with an XML comment, as yaz-marcdump does,
+       e.g. <!-- No separator at end of field length=40 -->
+       With encoding='marc8', MARC-8 is converted to Unicode and Leader/09 set to 'a'.
+    """
+    leader, fields = read_fields(raw, encoding)
+    record = etree.Element(RECORD, nsmap={None: MARC21_NS})
+    etree.SubElement(record, LEADER).text = leader
+    for field in fields:
+        if field[0] is None:
+            record.append(etree.Comment(field[1]))
+        elif len(field) == 2:
+            etree.SubElement(record, CONTROLFIELD, tag=field[0]).text = field[1]
+        else:
+            tag, indicators, subfields = field
+            datafield = etree.SubElement(record, DATAFIELD, tag=tag, ind1=indicators[0], ind2=indicators[1])
+            for code, text in subfields:
+                etree.SubElement(datafield, SUBFIELD, code=code).text = text
+    return record
@@ -0,0 +1,265 @@
+#!/usr/bin/python3
+
+"""Decodes MARC-8 to Unicode, in process, as yaz-marcdump -f marc8 -t utf8 does.
+   see https://www.loc.gov/marc/specifications/speccharmarc8.html
+
+   Single byte character sets are expanded at import into 256 entry lookup arrays.
+   The CJK EACC set (ESC $ 1) is a table of three byte codes, generated into marc8_eacc.py.
+"""
+
+import sys
+import unicodedata
+
+import marc8_eacc
+
+ESC = 0x1b
+BASIC_LATIN = 0x42
+ANSEL = 0x45
+EACC = 0x31
+REPLACEMENT = '\ufffd'
+
+# Unicode code points for each character set, by final character of its escape sequence.
+# Tables from pymarc.marc8_mapping, after the Library of Congress MARC-8 to Unicode mappings.
+CODEPOINTS = {
+    # Basic Latin (ASCII)
+    0x42: dict((c, c) for c in range(0x20, 0x7f)),
+    # ANSEL, Extended Latin
+    0x45: {
+        0x88: 0x0098, 0x89: 0x009C, 0x8D: 0x200D, 0x8E: 0x200C, 0xA1: 0x0141, 0xA2: 0x00D8,
+        0xA3: 0x0110, 0xA4: 0x00DE, 0xA5: 0x00C6, 0xA6: 0x0152, 0xA7: 0x02B9, 0xA8: 0x00B7,
+        0xA9: 0x266D, 0xAA: 0x00AE, 0xAB: 0x00B1, 0xAC: 0x01A0, 0xAD: 0x01AF, 0xAE: 0x02BC,
+        0xB0: 0x02BB, 0xB1: 0x0142, 0xB2: 0x00F8, 0xB3: 0x0111, 0xB4: 0x00FE, 0xB5: 0x00E6,
+        0xB6: 0x0153, 0xB7: 0x02BA, 0xB8: 0x0131, 0xB9: 0x00A3, 0xBA: 0x00F0, 0xBC: 0x01A1,
+        0xBD: 0x01B0, 0xC0: 0x00B0, 0xC1: 0x2113, 0xC2: 0x2117, 0xC3: 0x00A9, 0xC4: 0x266F,
+        0xC5: 0x00BF, 0xC6: 0x00A1, 0xC7: 0x00DF, 0xC8: 0x20AC, 0xE0: 0x0309, 0xE1: 0x0300,
+        0xE2: 0x0301, 0xE3: 0x0302, 0xE4: 0x0303, 0xE5: 0x0304, 0xE6: 0x0306, 0xE7: 0x0307,
+        0xE8: 0x0308, 0xE9: 0x030C, 0xEA: 0x030A, 0xEB: 0xFE20, 0xEC: 0xFE21, 0xED: 0x0315,
+        0xEE: 0x030B, 0xEF: 0x0310, 0xF0: 0x0327, 0xF1: 0x0328, 0xF2: 0x0323, 0xF3: 0x0324,
+        0xF4: 0x0325, 0xF5: 0x0333, 0xF6: 0x0332, 0xF7: 0x0326, 0xF8: 0x031C, 0xF9: 0x032E,
+        0xFA: 0xFE22, 0xFB: 0xFE23, 0xFE: 0x0313,
+    },
+    # Greek symbols
+    0x67: {
+        0x61: 0x03B1, 0x62: 0x03B2, 0x63: 0x03B3,
+    },
+    # Subscripts
+    0x62: {
+        0x28: 0x208D, 0x29: 0x208E, 0x2B: 0x208A, 0x2D: 0x208B, 0x30: 0x2080, 0x31: 0x2081,
+        0x32: 0x2082, 0x33: 0x2083, 0x34: 0x2084, 0x35: 0x2085, 0x36: 0x2086, 0x37: 0x2087,
+        0x38: 0x2088, 0x39: 0x2089,
+    },
+    # Superscripts
+    0x70: {
+        0x28: 0x207D, 0x29: 0x207E, 0x2B: 0x207A, 0x2D: 0x207B, 0x30: 0x2070, 0x31: 0x00B9,
+        0x32: 0x00B2, 0x33: 0x00B3, 0x34: 0x2074, 0x35: 0x2075, 0x36: 0x2076, 0x37: 0x2077,
+        0x38: 0x2078, 0x39: 0x2079,
+    },
+    # Basic Hebrew
+    0x32: {
+        0x21: 0x0021, 0x22: 0x05F4, 0x23: 0x0023, 0x24: 0x0024, 0x25: 0x0025, 0x26: 0x0026,
+        0x27: 0x05F3, 0x28: 0x0028, 0x29: 0x0029, 0x2A: 0x002A, 0x2B: 0x002B, 0x2C: 0x002C,
+        0x2D: 0x05BE, 0x2E: 0x002E, 0x2F: 0x002F, 0x30: 0x0030, 0x31: 0x0031, 0x32: 0x0032,
+        0x33: 0x0033, 0x34: 0x0034, 0x35: 0x0035, 0x36: 0x0036, 0x37: 0x0037, 0x38: 0x0038,
+        0x39: 0x0039, 0x3A: 0x003A, 0x3B: 0x003B, 0x3C: 0x003C, 0x3D: 0x003D, 0x3E: 0x003E,
+        0x3F: 0x003F, 0x40: 0x05B7, 0x41: 0x05B8, 0x42: 0x05B6, 0x43: 0x05B5, 0x44: 0x05B4,
+        0x45: 0x05B9, 0x46: 0x05BB, 0x47: 0x05B0, 0x48: 0x05B2, 0x49: 0x05B3, 0x4A: 0x05B1,
+        0x4B: 0x05BC, 0x4C: 0x05BF, 0x4D: 0x05C1, 0x4E: 0xFB1E, 0x5B: 0x005B, 0x5D: 0x005D,
+        0x60: 0x05D0, 0x61: 0x05D1, 0x62: 0x05D2, 0x63: 0x05D3, 0x64: 0x05D4, 0x65: 0x05D5,
+        0x66: 0x05D6, 0x67: 0x05D7, 0x68: 0x05D8, 0x69: 0x05D9, 0x6A: 0x05DA, 0x6B: 0x05DB,
+        0x6C: 0x05DC, 0x6D: 0x05DD, 0x6E: 0x05DE, 0x6F: 0x05DF, 0x70: 0x05E0, 0x71: 0x05E1,
+        0x72: 0x05E2, 0x73: 0x05E3, 0x74: 0x05E4, 0x75: 0x05E5, 0x76: 0x05E6, 0x77: 0x05E7,
+        0x78: 0x05E8, 0x79: 0x05E9, 0x7A: 0x05EA, 0x7B: 0x05F0, 0x7C: 0x05F1, 0x7D: 0x05F2,
+    },
+    # Basic Cyrillic
+    0x4E: {
+        0x21: 0x0021, 0x22: 0x0022, 0x23: 0x0023, 0x24: 0x0024, 0x25: 0x0025, 0x26: 0x0026,
+        0x27: 0x0027, 0x28: 0x0028, 0x29: 0x0029, 0x2A: 0x002A, 0x2B: 0x002B, 0x2C: 0x002C,
+        0x2D: 0x002D, 0x2E: 0x002E, 0x2F: 0x002F, 0x30: 0x0030, 0x31: 0x0031, 0x32: 0x0032,
+        0x33: 0x0033, 0x34: 0x0034, 0x35: 0x0035, 0x36: 0x0036, 0x37: 0x0037, 0x38: 0x0038,
+        0x39: 0x0039, 0x3A: 0x003A, 0x3B: 0x003B, 0x3C: 0x003C, 0x3D: 0x003D, 0x3E: 0x003E,
+        0x3F: 0x003F, 0x40: 0x044E, 0x41: 0x0430, 0x42: 0x0431, 0x43: 0x0446, 0x44: 0x0434,
+        0x45: 0x0435, 0x46: 0x0444, 0x47: 0x0433, 0x48: 0x0445, 0x49: 0x0438, 0x4A: 0x0439,
+        0x4B: 0x043A, 0x4C: 0x043B, 0x4D: 0x043C, 0x4E: 0x043D, 0x4F: 0x043E, 0x50: 0x043F,
+        0x51: 0x044F, 0x52: 0x0440, 0x53: 0x0441, 0x54: 0x0442, 0x55: 0x0443, 0x56: 0x0436,
+        0x57: 0x0432, 0x58: 0x044C, 0x59: 0x044B, 0x5A: 0x0437, 0x5B: 0x0448, 0x5C: 0x044D,
+        0x5D: 0x0449, 0x5E: 0x0447, 0x5F: 0x044A, 0x60: 0x042E, 0x61: 0x0410, 0x62: 0x0411,
+        0x63: 0x0426, 0x64: 0x0414, 0x65: 0x0415, 0x66: 0x0424, 0x67: 0x0413, 0x68: 0x0425,
+        0x69: 0x0418, 0x6A: 0x0419, 0x6B: 0x041A, 0x6C: 0x041B, 0x6D: 0x041C, 0x6E: 0x041D,
+        0x6F: 0x041E, 0x70: 0x041F, 0x71: 0x042F, 0x72: 0x0420, 0x73: 0x0421, 0x74: 0x0422,
+        0x75: 0x0423, 0x76: 0x0416, 0x77: 0x0412, 0x78: 0x042C, 0x79: 0x042B, 0x7A: 0x0417,
+        0x7B: 0x0428, 0x7C: 0x042D, 0x7D: 0x0429, 0x7E: 0x0427,
+    },
+    # Extended Cyrillic
+    0x51: {
+        0xC0: 0x0491, 0xC1: 0x0452, 0xC2: 0x0453, 0xC3: 0x0454, 0xC4: 0x0451, 0xC5: 0x0455,
+        0xC6: 0x0456, 0xC7: 0x0457, 0xC8: 0x0458, 0xC9: 0x0459, 0xCA: 0x045A, 0xCB: 0x045B,
+        0xCC: 0x045C, 0xCD: 0x045E, 0xCE: 0x045F, 0xD0: 0x0463, 0xD1: 0x0473, 0xD2: 0x0475,
+        0xD3: 0x046B, 0xDB: 0x005B, 0xDD: 0x005D, 0xDF: 0x005F, 0xE0: 0x0490, 0xE1: 0x0402,
+        0xE2: 0x0403, 0xE3: 0x0404, 0xE4: 0x0401, 0xE5: 0x0405, 0xE6: 0x0406, 0xE7: 0x0407,
+        0xE8: 0x0408, 0xE9: 0x0409, 0xEA: 0x040A, 0xEB: 0x040B, 0xEC: 0x040C, 0xED: 0x040E,
+        0xEE: 0x040F, 0xEF: 0x042A, 0xF0: 0x0462, 0xF1: 0x0472, 0xF2: 0x0474, 0xF3: 0x046A,
+    },
+    # Basic Arabic
+    0x33: {
+        0x21: 0x0021, 0x22: 0x0022, 0x23: 0x0023, 0x24: 0x0024, 0x25: 0x066A, 0x26: 0x0026,
+        0x27: 0x0027, 0x28: 0x0028, 0x29: 0x0029, 0x2A: 0x066D, 0x2B: 0x002B, 0x2C: 0x060C,
+        0x2D: 0x002D, 0x2E: 0x002E, 0x2F: 0x002F, 0x30: 0x0660, 0x31: 0x0661, 0x32: 0x0662,
+        0x33: 0x0663, 0x34: 0x0664, 0x35: 0x0665, 0x36: 0x0666, 0x37: 0x0667, 0x38: 0x0668,
+        0x39: 0x0669, 0x3A: 0x003A, 0x3B: 0x061B, 0x3C: 0x003C, 0x3D: 0x003D, 0x3E: 0x003E,
+        0x3F: 0x061F, 0x41: 0x0621, 0x42: 0x0622, 0x43: 0x0623, 0x44: 0x0624, 0x45: 0x0625,
+        0x46: 0x0626, 0x47: 0x0627, 0x48: 0x0628, 0x49: 0x0629, 0x4A: 0x062A, 0x4B: 0x062B,
+        0x4C: 0x062C, 0x4D: 0x062D, 0x4E: 0x062E, 0x4F: 0x062F, 0x50: 0x0630, 0x51: 0x0631,
+        0x52: 0x0632, 0x53: 0x0633, 0x54: 0x0634, 0x55: 0x0635, 0x56: 0x0636, 0x57: 0x0637,
+        0x58: 0x0638, 0x59: 0x0639, 0x5A: 0x063A, 0x5B: 0x005B, 0x5D: 0x005D, 0x60: 0x0640,
+        0x61: 0x0641, 0x62: 0x0642, 0x63: 0x0643, 0x64: 0x0644, 0x65: 0x0645, 0x66: 0x0646,
+        0x67: 0x0647, 0x68: 0x0648, 0x69: 0x0649, 0x6A: 0x064A, 0x6B: 0x064B, 0x6C: 0x064C,
+        0x6D: 0x064D, 0x6E: 0x064E, 0x6F: 0x064F, 0x70: 0x0650, 0x71: 0x0651, 0x72: 0x0652,
+        0x73: 0x0671, 0x74: 0x0670, 0x78: 0x066C, 0x79: 0x201D, 0x7A: 0x201C,
+    },
+    # Extended Arabic
+    0x34: {
+        0xA1: 0x06FD, 0xA2: 0x0672, 0xA3: 0x0673, 0xA4: 0x0679, 0xA5: 0x067A, 0xA6: 0x067B,
+        0xA7: 0x067C, 0xA8: 0x067D, 0xA9: 0x067E, 0xAA: 0x067F, 0xAB: 0x0680, 0xAC: 0x0681,
+        0xAD: 0x0682, 0xAE: 0x0683, 0xAF: 0x0684, 0xB0: 0x0685, 0xB1: 0x0686, 0xB2: 0x06BF,
+        0xB3: 0x0687, 0xB4: 0x0688, 0xB5: 0x0689, 0xB6: 0x068A, 0xB7: 0x068B, 0xB8: 0x068C,
+        0xB9: 0x068D, 0xBA: 0x068E, 0xBB: 0x068F, 0xBC: 0x0690, 0xBD: 0x0691, 0xBE: 0x0692,
+        0xBF: 0x0693, 0xC0: 0x0694, 0xC1: 0x0695, 0xC2: 0x0696, 0xC3: 0x0697, 0xC4: 0x0698,
+        0xC5: 0x0699, 0xC6: 0x069A, 0xC7: 0x069B, 0xC8: 0x069C, 0xC9: 0x06FA, 0xCA: 0x069D,
+        0xCB: 0x069E, 0xCC: 0x06FB, 0xCD: 0x069F, 0xCE: 0x06A0, 0xCF: 0x06FC, 0xD0: 0x06A1,
+        0xD1: 0x06A2, 0xD2: 0x06A3, 0xD3: 0x06A4, 0xD4: 0x06A5, 0xD5: 0x06A6, 0xD6: 0x06A7,
+        0xD7: 0x06A8, 0xD8: 0x06A9, 0xD9: 0x06AA, 0xDA: 0x06AB, 0xDB: 0x06AC, 0xDC: 0x06AD,
+        0xDD: 0x06AE, 0xDE: 0x06AF, 0xDF: 0x06B0, 0xE0: 0x06B1, 0xE1: 0x06B2, 0xE2: 0x06B3,
+        0xE3: 0x06B4, 0xE4: 0x06B5, 0xE5: 0x06B6, 0xE6: 0x06B7, 0xE7: 0x06B8, 0xE8: 0x06BA,
+        0xE9: 0x06BB, 0xEA: 0x06BC, 0xEB: 0x06BD, 0xEC: 0x06B9, 0xED: 0x06BE, 0xEE: 0x06C0,
+        0xEF: 0x06C4, 0xF0: 0x06C5, 0xF1: 0x06C6, 0xF2: 0x06CA, 0xF3: 0x06CB, 0xF4: 0x06CD,
+        0xF5: 0x06CE, 0xF6: 0x06D0, 0xF7: 0x06D2, 0xF8: 0x06D3, 0xFD: 0x0306, 0xFE: 0x030C,
+    },
+    # Basic Greek
+    0x53: {
+        0x21: 0x0300, 0x22: 0x0301, 0x23: 0x0308, 0x24: 0x0342, 0x25: 0x0313, 0x26: 0x0314,
+        0x27: 0x0345, 0x30: 0x00AB, 0x31: 0x00BB, 0x32: 0x201C, 0x33: 0x201D, 0x34: 0x0374,
+        0x35: 0x0375, 0x3B: 0x0387, 0x3F: 0x037E, 0x41: 0x0391, 0x42: 0x0392, 0x44: 0x0393,
+        0x45: 0x0394, 0x46: 0x0395, 0x47: 0x03DA, 0x48: 0x03DC, 0x49: 0x0396, 0x4A: 0x0397,
+        0x4B: 0x0398, 0x4C: 0x0399, 0x4D: 0x039A, 0x4E: 0x039B, 0x4F: 0x039C, 0x50: 0x039D,
+        0x51: 0x039E, 0x52: 0x039F, 0x53: 0x03A0, 0x54: 0x03DE, 0x55: 0x03A1, 0x56: 0x03A3,
+        0x58: 0x03A4, 0x59: 0x03A5, 0x5A: 0x03A6, 0x5B: 0x03A7, 0x5C: 0x03A8, 0x5D: 0x03A9,
+        0x5E: 0x03E0, 0x61: 0x03B1, 0x62: 0x03B2, 0x63: 0x03D0, 0x64: 0x03B3, 0x65: 0x03B4,
+        0x66: 0x03B5, 0x67: 0x03DB, 0x68: 0x03DD, 0x69: 0x03B6, 0x6A: 0x03B7, 0x6B: 0x03B8,
+        0x6C: 0x03B9, 0x6D: 0x03BA, 0x6E: 0x03BB, 0x6F: 0x03BC, 0x70: 0x03BD, 0x71: 0x03BE,
+        0x72: 0x03BF, 0x73: 0x03C0, 0x74: 0x03DF, 0x75: 0x03C1, 0x76: 0x03C3, 0x77: 0x03C2,
+        0x78: 0x03C4, 0x79: 0x03C5, 0x7A: 0x03C6, 0x7B: 0x03C7, 0x7C: 0x03C8, 0x7D: 0x03C9,
+        0x7E: 0x03E1,
+    },
+}
+
+# Characters that are combining diacritics, which MARC-8 places before the base character.
+COMBINING = {
+    0x45: [0xE0, 0xE1, 0xE2, 0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA, 0xEB, 0xEC, 0xED, 0xEE, 0xEF, 0xF0, 0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8, 0xF9, 0xFA, 0xFB, 0xFE],
+    0x32: [0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49, 0x4A, 0x4B, 0x4C, 0x4D, 0x4E],
+    0x33: [0x6B, 0x6C, 0x6D, 0x6E, 0x6F, 0x70, 0x71, 0x72],
+    0x34: [0xFD, 0xFE],
+    0x53: [0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27],
+}
+
+# Escape sequence final characters for technique 1 (Greek symbols, subscripts, superscripts, and ASCII default)
+TECHNIQUE_1 = {0x67: 0x67, 0x62: 0x62, 0x70: 0x70, 0x73: BASIC_LATIN}
+
+
+def lookup_array(charset):
+    """Returns a 256 entry list of (unicode character, combining) for a single byte character set.
+       Each character is placed at both its G0 and G1 position, so the set can be designated to either."""
+    array = [None] * 256
+    combining = COMBINING.get(charset, [])
+    for byte, codepoint in CODEPOINTS[charset].items():
+        entry = (chr(codepoint), byte in combining)
+        array[byte] = entry
+        if array[byte ^ 0x80] is None:
+            array[byte ^ 0x80] = entry
+    return array
+
+
+TABLES = dict((charset, lookup_array(charset)) for charset in CODEPOINTS)
+
+
+def eacc_table():
+    """Returns {three byte EACC code: (unicode character, combining)}, from the rows in marc8_eacc.py."""
+    table = {}
+    for row, pairs in marc8_eacc.ROWS.items():
+        for i in range(0, len(pairs), 2):
+            table[row << 8 | ord(pairs[i])] = (pairs[i+1], False)
+    for code, codepoint in marc8_eacc.ODD_MAP.items():
+        table.setdefault(code, (chr(codepoint), False))
+    return table
+
+
+EACC_TABLE = eacc_table()
+
+
+def decode(data, pymarc=False):
+    """Decodes MARC-8 bytes to a Unicode string.
+       G0 starts as Basic Latin and G1 as ANSEL. Combining diacritics are moved after their base character.
+       Unknown characters are replaced with U+FFFD.
+       With <pymarc>, decodes as pymarc's marc8_to_unicode does, for output which must match it: unknown characters
+       become a space, control characters (below 0x20, and 0x81-0x9F) and trailing diacritics are dropped,
+       and the result is composed (NFC).
+    """
+    replacement = ' ' if pymarc else REPLACEMENT
+    g0, g1 = BASIC_LATIN, ANSEL
+    output = []
+    combining = []
+    i = 0
+    n = len(data)
+    while i < n:
+        byte = data[i]
+        if byte == ESC and i + 1 < n:
+            i, g0, g1 = escape(data, i, g0, g1)
+            continue
+        if pymarc and (byte < 0x20 or 0x80 < byte < 0xa0):
+            i += 1
+            continue
+        if byte <= 0x20:
+            # control characters, delimiters, and space are the same in all character sets
+            char, is_combining = chr(byte), False
+            i += 1
+        elif g0 == EACC and byte < 0x80:
+            char, is_combining = EACC_TABLE.get(int.from_bytes(data[i:i+3], 'big'), (replacement, False))
+            i += 3
+        else:
+            table = TABLES.get(g0 if byte < 0x80 else g1)
+            entry = table[byte] if table else None
+            char, is_combining = entry if entry else (replacement, False)
+            i += 1
+        if is_combining:
+            combining.append(char)
+        else:
+            output.append(char)
+            output += combining
+            combining = []
+    if pymarc:
+        return unicodedata.normalize('NFC', ''.join(output))
+    output += combining
+    return ''.join(output)
+
+
+def escape(data, i, g0, g1):
+    """Reads the escape sequence at data[i], returns the position after it and the new G0 and G1 character sets."""
+    n = len(data)
+    intermediate = data[i+1]
+    if intermediate in TECHNIQUE_1:
+        return i + 2, TECHNIQUE_1[intermediate], g1
+    if intermediate == 0x24 and i + 2 < n:  # multibyte, ESC $ F or ESC $ I F
+        if data[i+2] in (0x28, 0x2c) and i + 3 < n:
+            return i + 4, data[i+3], g1
+        if data[i+2] in (0x29, 0x2d) and i + 3 < n:
+            return i + 4, g0, data[i+3]
+        return i + 3, data[i+2], g1
+    if intermediate in (0x28, 0x2c) and i + 2 < n:
+        return i + 3, data[i+2], g1
+    if intermediate in (0x29, 0x2d) and i + 2 < n:
+        return i + 3, g0, data[i+2]
+    # not an escape sequence, pass the ESC through
+    return i + 1, g0, g1
+
+
+if __name__ == '__main__':
+    sys.stdout.write(decode(sys.stdin.buffer.read()))
@@ -0,0 +1,1388 @@
+"""MARC-8 East Asian Character Code (EACC, ESC $ 1) to Unicode. Generated by utils/generate-eacc.py, do not edit.
+   From pymarc 5.4.0 marc8_mapping CODESETS[0x31] and ODD_MAP, after the Library of Congress MARC-8 to Unicode mappings.
+
+   ROWS holds the three byte EACC codes by their first two bytes: a string of (third byte, Unicode character) pairs.
+   EACC has no combining characters.
+"""
+
+ROWS = {
+    0x2123: ' \u3000!\u3000(（)）-－',
+    0x212A: '!\ue8d0"\ue8d1#\ue8d2$\ue8d3%\ue8d4&\ue8d5(\ue8d6)\ue8d7*\ue8d8+\ue8d9,\ue8da-\ue8db.\ue8dc/\ue8dd0\ue8de2\ue8df3\ue8e04\ue8e15\ue8e26\ue8e37\ue8e48\ue8e59\ue8e6:\ue8e7'
+            ';\ue8e8<\ue8e9=\ue8ea>\ue8eb?\ue8ec@\ue8edA\ue8eeB\ue8efC\ue8f0D\ue8f1E\ue8f2F〓',
+    0x212B: '%「&」1［2］3。4．5、8，9；:：;？=！Y／',
+    0x212F: '0〇',
+    0x2130: '!一"丁#七$三%下&上\'丈)丐*不+且,丙-世.丕/丘0丢1丞2並4中5串6凡7丸8丹9主:乃'
+            ';久=之>尹?乏@乎A乍B乒C乓D乖E乘F乙G九H也I乞K乳L乾M亂P事Q二R于S井T五U互W亙'
+            'X亞Y些Z亟[亡\\亦]亥^交_亨`享a京b亭c亮d人e今f仁h仃i仄k仍l仇m介n令o付p仕q他'
+            'r仞s代t仔u仗v仙w以x仿y伉|任}伊~伕',
+    0x2131: '!休"伐#伏$仲%企&仳\'件(仰*住+位,伴-佇.佗/伺0佞2佛3何4估5佐6佑7伽8佈9但:伸'
+            ';佃<佔=似>佣?作@你A伯B低C佝D伶E依F佯G併H侍I佳J使K供L來M佬N例O侖Q侃R佻S侈'
+            'T佩U侏V佾W信X俑Y侵Z侯[便\\俞]俠^俏_侶`俚a保b促c俘d俟e俊f侮g俐h俄i係j俎k俗'
+            'l倉n倍o俯p倦q倌r倥s們t俸u倨v倔w倖x倩y倆{倒|值}倚~俺',
+    0x2132: '!倘"俱#倡$個%候&倀\'修(俳)倭*倃+俾,倪-倫.停/偏0健1假2做3偉4偃5側6偶7偎8偵'
+            '9偌:偕;倏<偷=傍>傢?傅@備A傑B傀C傖D傘E傭F傳G債H傲I僅J傾K催L傷M傯N僧O僮P僱'
+            'Q僥R僖S僭T僚U僕V偽W像X僑Y儀Z億[僻\\僵]價^儂_儍`儈a儉b儐c儘d儒e儔f優g償h儡'
+            'i儲j儷k儼l兀m元n允o充p兄q兆r光s兇t先u兌w免x兕y兔z兒{兗|兜}兢~入',
+    0x2133: '!內"全#兩$八%六&兮\'公(共)兵*其+具,典-兼.冀/冉0册1再2冒3冑4冕5最6冗7冠9冥'
+            '<冰=冶>冷@凍A凌D凜E凝G凰H凱I凳K出L凹M凸N函O刀P刁Q刃R切S分T刈U刊V刑W列Y刎'
+            'Z判[別\\删]刨^利_券`刻a刷b到c刺f剁g刹h剃i前j剌k剋l削m則n剜o剖p剛q剔r剝s剪'
+            't副u割v剴w剩x創z剽{剿|劃}劈~劇',
+    0x2134: '!劍"劉#劑$力%功&加\'劣(劫)助*劬+努,劾-勇.勃/勁0勉1勘2勒3務4動5勞6勛7勝8勢'
+            '9勤:募<勵=勸>勻@勿A包B匆C匈D匍E匐F匏G匕H化I北J匙K叵L匝M匡N匠O匣P匪Q匯R匱'
+            'S匹T匾U區V匿W十X千Y卅Z午[升\\半]卉_卒`協a卓b卑c南d博f卞g卡i卦j卯k卮l印m危'
+            'n卽o卵q卸s卻t卿u厄v厚w厝x原y厥z厭{厲|去}參~又',
+    0x2135: '!叉"友#及$反%取&叔\'受(叛)叟*曼+叢,口-司.古/叮0可1叩2右3叼4叨5另6召7叫8台'
+            '9句:叱;叭<只=史?吋@吉A吐B吏C同D吊E名F各G吃H吒J吆M吭N吝O吞P君Q呎R吾S吧T呀'
+            'U吱V呆W吼X呃Y否Z吠[吶\\吳]吵^吮_告`呈a吻b吸c吹d呂e含f吟g吩h味i呢j呵k咕l呸'
+            'm咖n呷o呻q咒r咄s呼t周u咆v咋w和x咐y命z呶{呱|咚}咎~咩',
+    0x2136: '!咪"咨#咬$哀%咳&咦\'咫(哇)哉*哄+哂-品/哎0咱1咻2咯3哈4唁5哼6唐7哪8唔9哺:哥'
+            ';哮<哲=哨>員?哩@哭A唆B唉C哦D啖E唳F商G唷H問I啞J啦K啪L啊M啄N啜O唱P啃Q唬R啡'
+            'S唾T啣U啕V唯W售X啤Y唸Z喧[喀\\啻]啼^唧_喔`喇a喜b喋c喪d喳e喊f喃g喱h單i喂j喟'
+            'k喝l喘m喚n啾o喬p喉q喲r喻s嗨t嗟u嗑v嗜w嗦x嗇y嗓z嗎{嗣|嗯}嗤~嗅',
+    0x2137: '!嗚"嗆#嗡$嘀%嘛&嗾\'嘖(嗷)嘈*嘟+嗽,嘆-嘉.嘔/嘎0嘗1嘍2嘮3嘯4噎5嘶6嘲7嘻8嘹'
+            '9噗;噓<嘿=嘴>嘷?噙@嘰A噫B噤C噩D噸E噴F噹G噥H噪I器J噱K噯L噢M噬N嚀O嚎P嚅Q嚇'
+            'R嚐S嚏T嚕U嚮V嚨W嚰X嚥Y嚷Z嚴[嚶\\囀]囁^囂_嚼`囊a囉b囈d囑e四f囚g因h回i囤k囱'
+            'l固m圃n圈o國p圍q園r圓s團t圖u土w圭x圯y地z在{圳|坑}坊',
+    0x2138: '!址"均#坍$圾%坎\'垃(坪)坩*坷+坡,坤-坦.垂/坼0垠1型2垣3垮4垢5埔6埂7城8埋9埃'
+            ':培;執<基=域>堊?堅@堂A堆B埤C埠D報E堯F堵G堪H堰I堤J場K堡L塞M塗N塘O塑P填Q塌'
+            'R塚S塭T塔U塢V塊W境X塾Y塵Z墊[塹\\墅]墓^增_墀`墳a墜b墮c墟d壇e壅f壁g墾h壕i壓'
+            'j壑k壙l壘m壟n壞o壢p壤q壩r士s壬t壯v壺w壽x夏y夔z夕{外|夙}多~夜',
+    0x2139: '!夠"夤#夥$夢%大&太\'夫(天)夭*央+失,夷.夾/奔0奉1奈2奇3奄4奕5契6奎7奏8奐9套'
+            ':奘;奚<奠=奢>奧?奩@奪A奮B女C奴D奶E妄F妃G奸H好I她J如K妁L妨M妒O妤P妣Q妓R妞'
+            'S妝T妙U妥V妊W妖X妾Y妻Z妮[姑\\妹]姆^姐_姗`妯a姒b姓c姊e始f委g姣i姿j姘k娃l姨'
+            'm姥n姪o威p姻q姦r姚s娑t娘u娣v娜w娓x姬y娠z娟{娛|娌}娩~娥',
+    0x213A: '!婆"婉#婪$娶%婊&婀\'婦(婁)娼*婢+婚,婷-媚.媒/婿0媼1媛2嫌3嫁4嫉5媾6媽7媲8嫂'
+            '9媳:嫡;嫗<嫖=嫣>嫩?嫘@嫦A嫻B嬉C嬋D嬌E嫵F嬴G嬝H嬪I嬤J嬰K嬸L孀M子N孑O孓P孔'
+            'Q孕R字S存T孝U孜W孟X季Y孤Z孩[孫\\孰]孳^孱_孵`學a孺b孽c孿e宇f守g安h宅i完j宋'
+            'k宏l宗m定n宜o官p宙q宛r宥s宣t宦u室v客w宰x宸z宵{宴|宮}容~害',
+    0x213B: '!密"寇#寅$寄%寂&宿\'富(寒)寐*寓+寡,寥-寨.寢/寤0寞1實2寧3察4寮5寬6審7寫8寵'
+            '9寶:寸;寺<封=射>尉?專@將A尊B尋C對D導E小F少G尖H尚I尤J尬K就L尷M尸N尺O尼P局'
+            'Q屁R尿S尾T屆U居V屈W屎X屋Y屍Z展[屑\\屐]屛^屠_屜`屢a層b履c屬d屯e山f屹g岐h岌'
+            'i岑j岔k岷l岸n岡o岫q岱r峙s崁t峽u峭v峻w峨x峰y島z峪{崇|崆}崛~崖',
+    0x213C: '!崎"崑#崢$崩%崔&崙\'嵌(嵐)嵩*嶄+嶇,嶝-嶼.嶽/嶺0巍1巒2巔3巖4川5州6巢7工8巨'
+            '9巧:左;巫<差=己>已?巳@巴A巷B巽C巾D市F帆I帚J帖K帕L帛M帑N帝O帥Q師R帳S帶T常'
+            'U帷V幅W帽X幀Y幌Z幛[幔\\幗]幕^幣_幢`幟a幫c平e年h幻i幼j幽k幾l序m庇n床o庚p店'
+            'q庖r府s底t庠u度v庫w座x庭y康z庸{庶|庵}廂~廁',
+    0x213D: '!庾"廊#廉$廈%廓&廖\'廢(廚)廝*廣+廟,廠-龐.廬/廳0廷2延3建4廿6弄7弈8弊9式:弒'
+            ';弓<引=弔>弘?弗@弛A弟B弦C弧D弩E弭F弱G張H強I弼J彆K彈L彌M彎N彗O彙P彝Q形R彤'
+            'S彥T彬U彩W彭X彰Y影[役\\往^彿_彼`待a很b律c徊d徇e後f徒g徑h徐i徘j得k徙l從o復'
+            'q循r徬s微t徹u德v徵w徽x心y必z忙{忘|忌}忖',
+    0x213E: '!忍"快#忠$忱%忽&忝\'念(忿)怔*怵+怪,怯-怖.思/怏0怡1怠2怨3急4性5怎6怕7怒8恙'
+            '9恣:恨;恃<恥=恐>恭?恢@恆A恍B恫C恩D恬E息F恪G恤H恰I恕J悌K悦L恿M悟N悚O悖P悄'
+            'Q悍R患S悉T悔U悠V您W悴X惦Y惋[情\\悶]惑^悵_悻`惠a惡b惜c惘d惕e悼f悲g惆h悸i惚'
+            'j惟k意l愜m想n感o惰p惻q惺r愚s愕t惹u愣v惴w愛x愎y愀z愁{惶|愉}愈~惱',
+    0x213F: '!慈"慨$愼&慌\'慍(態)愾*愧+愴,慇-慷.慶/慧0慰1慚2慝3憂4慼5慢6慮7慕8慘9慣:慟'
+            ';慫<慾=憧>憲?憑@憎A憫B憤C憬D憚E憩F憔G憊H憶I懍J應K憐L憾M懂N懇O懈P懊Q懣R懦'
+            'S懲T懷U懶V懸W懵X懺Y懾Z懿[懼\\戀]戈^戊_戎`戍a戌b成c戒d我e或f戕g戛h戚i戟j戡'
+            'k戢l截m戮n戰o戲p戴q戳r戶s房t戾u所v扁x扈y扉z手}打~扔',
+    0x2140: '!扒"扛#扣$托%抖&抗\'抒(扶)抉*承+批,技-把.扭/扼0找1扯2抄3投4抑5折6扮7扳8抓'
+            '9拉:拄;拌<抨=拜>抿?拂@抹A拒B拓C招D披E拋F拔G抽H押I拐J拈K拙L拚M抬N拇O抱P拖'
+            'Q拘R拍S抵T拎U拗V拆W按X挖Y拼Z拳[挈\\拭]持^拮_拯`拷a指b拱c拽d挑e括f拴g拿i捂'
+            'j挪k捕l挾m振n捎o捏p捐q捉s挫t挨u挺v接w捩x掠y掖z控{捲|捷}掃~捫',
+    0x2141: '!捧"掘#掛$措%捱&掩\'掌(掉)探*掙+採,授-掬.挽/排0掣1捶2掏3推4捻5捨6掄7掀8揆'
+            '9揉:揍;握<揀=揩>提?揚@揖A揭B揮C描D揣E援F換G插H揪I搞J搪K搾L搓M搏N搔O損P搭'
+            'Q搽R搖S搗T搜U搶V搬W摘X摩Y摔Z摒[摯\\摸]摹^摺_摟`摑a摧b撞c撤d撇e撈f撥g撰h撓'
+            'i撕j撒k撩l撑m撮n撲o播p撚q撫r撬s擅t擁u擘v擊w撻x擂y撼z擋{操|據}擄~擇',
+    0x2142: '!擎"擔#擒$撿%擠&擰\'擦(擬)擱*擴+擲,攆-攀.擾/擻0擺1攏2攘3攔4攙5攝6攜7攣8攤'
+            '9攫:攪;攬<支=收>改?攻@放A政B故C效D敎E敖F救G敗H敝I敘J敏K敦L敢M散N敞O啓P敬'
+            'Q敲R敵S敷T數U整V斂W斃X文Y斑Z斐\\料]斜^斟_斡`斤a斥b斧c斬d斯e新f斷g方i施j旁'
+            'k旅l旎m旋n旌o族p旗q旖r既s日u早v旬w旭x旨y旱z旺{昆|昔}昌~昀',
+    0x2143: '!明"易#昂$昏%春&昧\'是(昭)映*星+昨,晏-時.晒/晉0晃1晌2晝3晤4晨5晦6晚7景8普'
+            '9晴:暑;晰<晶=智>暗?暇@暉A暈B暖C暢D暫E暴F暮G曁H曉I曆J暹K曖L曙M曠N曝O曦P曰'
+            'Q曲R曳S更T曷U書V曹W勗X曾Y替Z會[月\\有]服^朋_朗`朕a朔b望c朝d期f朧g木i本j末'
+            'k未m朽o朱p朵q杞r村s李t杜u材v杖w束x杏y杉{杭|枋}枕~枉',
+    0x2144: '!枇"杷#枝$林%杯&東\'杳(果)杵*枚+析-松.染/柱0柿1柔2柄3枯4某5柑6柯7柩8架9柬'
+            ':查;柺<柚=栅>柞?枸@柏A柳B案C校D核E桓F框G桂H桔I栗J栽K桑L栩M桐N根P柴Q桃R桀'
+            'S株T桅U格V栓W梁X梓Y梯Z桶[械\\梧]梗^梵_梳`梢a桿b梱c條d梭e梆f梅g梨h梟i梔j梃'
+            'k棕l棺m棄n棲o棒p棣q棟r棋s森t植u椅v棧w棠x棵y棍z棗{棘|椒}棹~棚',
+    0x2145: '!椎"棉#楔$椰%楷&極\'楚(楠)楫*楊+楨,楞-業.楹/楓0榆1榨2榕3榜4榔5槁6榷7榮8榛'
+            '9構:槓;榻<榫=槌>榭?槐@槍A榴B樟C槨D樣E槪F樁G標H槽I樞J樓K模L槳M樊N樂O樅P樽'
+            'Q橘R橙S橢T橄U樹V橫W樺X樸Y橇Z橡[橋\\樵]機^檀_檔`檄a檢b檜c檸d檳e櫃f檻h檬i櫥'
+            'j櫚k櫝l櫛m櫓n欄o櫻p權q欖s次t欣v款w欺x欽y歇z歉{歌|歐}歙~歟',
+    0x2146: "!歡#正$此%步'武(歪)歲*歷+歸,歹-死.歿/殃0殆1殊2殉3殘4殖5殤6殮7殯8殲9段:殷"
+            ';殺<殼=毀>殿?毅@毆A毋B母C每D毒F比G毗H毛I毫J毯K毽L氏M民N氐O氓P氖Q氛R氟S氧'
+            'T氦U氣V氨W氤X氫Y氮Z氳[氯\\水]永^汁`汀a求b汞c汗d江e汙f池g汕h汐i汝j沛k沁m決'
+            'n汪o沌p沐q汲r汰s汨t沖v沉w沙x汾y汽z沒{沃|沱~泳',
+    0x2147: '!泣"泰#沸$泓%沫&泥\'沽(河)泄*法+波,沼-沮.油/泱0況1沾2泅3泗4治5泛6泡7沿8泊'
+            '9泌:泉;流<洋=洲>津?洱@洪A洌B洞C洗D活E洛F洶G洽H派I浪J涕K浸L浦M浙N涇O消P浬'
+            'Q涓R涉S浮T浴U浚V浩W海X淙Y淚Z淳[涼\\淤]液^淡_淒`涮a淸b淇c淋d淅e淞f涯g涵h淺'
+            'i淹j淌k混l涸m淑n深o淨p淫q淘r添s淮t淵u涎v淆w淪x淄y湔z渡{游|渲}湧~渠',
+    0x2148: '!湛"渚#湖$港%湮&湘\'渣(渤)減*渥+湊,渺-湯.渭/渴0測1渦2湍3渾4湃5渙6渝7滓8溶'
+            '9滂;溯<溢=溝?溥@溘A源B滅C滇D溼E溫F滑G滋H滄I滔J溪K準L溜M漳N滴O滬P滾Q漩R演'
+            'S漾T漬U漲V漏W漢X滿Y漣Z漸[漕\\漱]漂^漆_滯`漫a漯b漠c漿d滲e漁f漑g滌h漪i潼j澈'
+            'k澄l潑m潤n澗o潔p潺q澆r澎s潭t潛u潮v潸w潦x潰y潘z濂{澱|濃}澧~澡',
+    0x2149: '!澤"濁$激%澳&濟\'濘(濱)濠*濯+濫,濡-濤.澀1瀋2瀉3瀆4濺5瀑6濾7瀏8瀛9瀚:瀨;瀝'
+            '<瀕=瀟?瀾@灌A灑B灘C灣D灤E火F灰G灶H灼I灸J災K炕L炎M炒N炙O炊P炫Q為R炬S炳T炯'
+            'U炭V炮W炸X烊Y烤Z烘[烈\\烙]烏^烹_焉`焊a烽b焙c煮d焚e然f無g焰h焦i煎j煉k煙l煤'
+            'm煩n煜o煬p煦q照r煞s煥t煌u煽w熙x熊y熄z熟{熨|熬}熱~燙',
+    0x214A: '!熾"燉#燐$燈%燜&燒\'熹(燕)燎*燃+燄,燮-燧.營/燥0燭1燦2燬3燴4燻5爆6爍7爐8爛'
+            '9爨:爪;爭<爬=爰>爵?父@爸A爹B爺C爻D爽E爾F牆G片H版I牌J牒K牖L牘M牙N牛O牟P牝'
+            'Q牢R牡S牠T牧U物V牯W牲X牴Y特Z牽[犁\\犀]犄^犖_犒`犛a犢b犧c犬d犯e狄f狂g狙h狀'
+            'i狎j狗k狐l狡m狩n狠o狼p狹r狽s狷t猜u猛v猓w猖x猙y猶z猷{猩|猥}猴~獄',
+    0x214B: '!猿"猾#獅$獐&獗\'獨(獰)獲*獷+獸,獵-獺.獻/玀0玄1率2玉3王4玖5玟6玨7玩8玫9玻'
+            ':珊;玷<珀>玲?珍@班A珮B珠C琅D琉E球F琊G現H理I琍J琺K琵L琶M琴N琪O琳P琢Q琥S瑕'
+            'T瑟U瑚V瑁W琿X瑛Y瑞Z瑜[瑙\\璃]瑩^瑪_瑣`瑤a瑰b璋c璜d璣e璧f璩g環h璦i璽j瓊k瓏'
+            'l瓜m瓠n瓢o瓣p瓦q瓶r瓷s甄t甌u甕v甘w甚x甜y生z產{甦|甥}用~甩',
+    0x214C: '!甬"甫#甭$田%甲&由\'申(男)甸*甽+畏,界-畝.畜/畔0畚1留2畦3畢4異5略6畫7番8畸'
+            '9當:疆;疇<疊>疏?疑@疝A疙B疚C疤D疫E疥F症G病H疳I疲J疽K疾L疼M疹N痕O痔P疵Q痊'
+            'R痛S痣T痘U痞V痙W痢X瘁Y瘀Z痰[痲\\痱]痴^痿_痺`瘍a瘧b瘓c瘋e瘠f瘩g瘟h瘤i瘦j瘡'
+            'k瘴l瘸m癆n療o癌p癖q癘s癢t癥u癩v癮w癬x癱y癲z癸{發|登}白~百',
+    0x214D: '!皂"的#皇$皆&皎\'皖(皓)皚*皮+皰,皴-皺.皿/盂1盈2盆3益4盍5盎6盔7盒8盜9盛:盞'
+            ';盟<盡=監>盤?盧@盥A盪B目C盯D盲E直F眉G盹H相I省J看K盼L盾M眩N眠O眞P眨Q眷R眼'
+            'S眶T眸U眺V眾W睏X睫Y睛Z睪[睦\\睹]睞^督_睜`睬a睨b睥c睽d睱e睿f瞄g睡h瞇i瞎j瞌'
+            'k瞑l瞟m瞞n瞠o瞥p瞳q瞪r瞰s瞭t瞬u瞧v瞽w瞿x瞻z矓{矗|矚}矛~矜',
+    0x214E: '!矢"矣#知$矩%短&矮\'矯(石)矽*砂+砍,砌-斫.砰/砝0破1砸2砷3砧4砭5砥6硫7硏8硃'
+            '9硬:硝;硯<碰=碗>碎?碘@碉A碑B硼C碌D碧E碩F碟G碳H磋I確J磁K磅L碼M磕N碾O磊P磐'
+            'Q磨R磬S磚T磷U磴V磺W礁X磯Y礎Z礙[礦\\礬]礪^礫_示`祀a社b祁c祅d祉e祈f祇g祕h祠'
+            'i祐j祖k神l祝m祟n祚o祗p祥q票r祭s祺t禁u祿v福w禍x禎y禦z禧{禪|禮}禱~禹',
+    0x214F: '!禽"萬#禾$秀%私&禿\'秉(科)秋*秒+秤,秦-秣.租/秧0秩1移2稅3稍4稈5程6稀7稟9稠'
+            ':稚;稔<稱=種>稿?稼@穀A稽B稷C稻D積E穎F穌G穆H穗I穡J穢K穫L穩M穴N究O穹P空Q穿'
+            'R突S窄T窈U窒V窕W窘X窖Y窗Z窟[窠\\窪]窩^窯_窮`窺a竅b竄c竇d竊e立f站g童h竣i竭'
+            'j端k競l竹m竺n竿o竽p笆q笑r笠s第t笨u笛v笞w笙x符y筆z等{筐|策}筒~筋',
+    0x2150: '!筍"筏#答$筠%筷&筵\'管(箔)箕*箝+箋,算-箏.篇/箭0範1箱2箴3節4篆5篁6簑7篙8篛'
+            '9篤:築;篡<篩=簇>簍?篾@篷A簡B簫C簪D簧E簞F簣G簿H簾I簸J簷K簽L籃M籌N籍O籐P籠'
+            'Q籟R籤S籬T籮U籲V米W粉X粒Y粗Z粟[粥\\粤]粱^粳_粽`粹a精b糊c糖d糕e糠f糜g糟h糞'
+            'i糢j糙k糧l糯n系o糾p紀q紂r紅s紉t約u紇v紡w紋x紊y素z紜{索|紕}純~紐',
+    0x2151: '!紗"納#級$紙%紛&絆(紼)紮*紹+組,細-紳.累/絀0終1統2絞3絨4結5紫6絢7絶8絡9給'
+            ':絮;絲<經=綑>絹?綏@綁A綜B綻C綰D緊E綾F綴G綺H網I綱J綽K綵L綠M綢N維O綿P綸Q緇'
+            'R締S緯T練U緖V緘W緬X緝Y緩Z緣[編\\線]綞^緞_縑`縊a縈b縛c緻d縣e縮f績g繆h縷i縲'
+            'j繃k繁l縫m總n縱o繅p繕q織r繡s繞t繚u繫v繩w繭x繹y繪z辮{繽|纂}繼~纏',
+    0x2152: '!續"纓#纖$纜&缸\'缺(缽)罄+罐,罕-罔.罟/署0置1罩2罪3罰4罵5罷6罹7羅8羈9羊:羌'
+            ';美<羔=羞>羚?善@羨A群B義C羯D羲E羶F羸G羹H羽I羿J翅K翁L翌M習N翎O翔P翕Q翠R翡'
+            'S翟T翩U翰V翳W翼X翹Y翻Z翱[耀\\老]考^耆_者`而a耐b耍c耒d耕e耘f耙g耗h耜i耳j耶'
+            'k耿l耽m聊n聆o聖p聘q聞r聚s聱t聲u聳v聰w聯x職y聶z聾{聽|聿~肄',
+    0x2153: '!肅"肇#肉$肋%肌&肓\'肝(肘)肛*肚+肖,育-肪.肺/肥0肢1肫2肱3肯4股5肩6肴7胖8背'
+            '9胥:胚;胡<胃=胛>胄?胎@胞A胤B胰C脂D脅E胱F胴G胭H能I脆J胳K胸L脊M脈N脫O脯P脖'
+            'R脩S腕T腔U腋V腑W腐X腎Y脹Z腆[脾\\腱]腰^腸_腥`腮a腳b腫c腹d腺e腦f膀g膏h腿i膊'
+            'j膈k膝l膠m膛n膚o膜p膳q膩r膨s臆t膺u臃v臀w臂x膿y膽z臉{膾|臍}臏~臘',
+    0x2154: '!臚"臟#臣$臥%臨&自\'臬(臭)至+臺,臻-臼.臾/舀0舂1舅2與3興4舉5舊6舌7舍8舐9舒'
+            ':舔;舛<舜=舞>舟?舢@航A舫B般C舨D舷E舵F船G舶H艇I艘J艙K艦L艮M良N艱O色P艾Q芒'
+            'R芋S芍T芳U芝V芙W芽X芭Y芬Z芥[芟\\芻]花^芹`苧a茅b茉c苣d苛e苦f茄g若h茂i苜j苗'
+            'k英l茁m苓n苔o苑p苞q苟r茫s荒t荊u茸v荔w荐x草y茵z茴{茶|茱}荀~茗',
+    0x2155: '!兹"荏#茹$莎%莘&莞\'荸(莢)莖*莧+莫,莒-莊.莓/莠0莉1荷2荼3荻4萍5菠6菩8萃9菅'
+            ':菁;萋<華>菱?莽A萊B萌C菌D菜E菊F菲G萎H萄I落J蒂K萱L葵M葦N著O葉P葬Q葫R葛S葷'
+            'T萼U萵V葡W董X葩Y萸Z蒲[蒞\\蒿]蓆^蓄_蓉`蒜a蓋b蒸c蓀d蒙e蓓f蒐g蒼h蔽i蓿j蔗k蔚'
+            'l蓮m蔬n蔭o蔓q蔣r蔡s蔔t蓬u蔥v蕩w蕊x蕙y蕈z蕨{蕃|蕪}蕉~薄',
+    0x2156: '!薪"蕭#薛$薑%蕾&薔\'薜(薇)藍*薩+藏,薯-藐.藉/薰0藩1藝2藪3藤4藕5藥6藻7藹8蘑'
+            '9藺:蘆;蘋<蘇=蘊>蘭?蘗@蘚A蘸B蘿C虎D虐E虔F彪G處H虜I虛J號K虞L虧O虹P蚩Q蚪R蚊'
+            'S蚓T蚤U蚌V蚣W蛀X蛇Y蚵Z蛋[蚶\\蛄]蛆^蚱_蚯`蛟a蛙b蛭c蛔d蛛e蛤f蛻g蛹h蜇i蜃j蜈'
+            'k蜀l蛾m蜓n蜂o蜜p蜿q蜻r蜢s蜥t蜴u蜘v蝕w蝠x蝶y蝴z蝦{蝸|蝨}蝌~蝗',
+    0x2157: '!蝙"螃#螂$螢%螞&融\'螟(蟑)蟀*螫+螳,螻-蟈.蟒/螺0蟆1蟋2蟯3蟲4蟬5蟻6蠅7蠍8蟹'
+            '9蠔:蠕;蠢<蠣=蠡>蠟?蠱@蠹A蠶B蠻C血D行E衍F術G街H衙I衛J衝K衡L衢M衣N初O表P衫'
+            'Q袂R袁S衰T衷U袈V被W袒X袖Y袍Z袋[袞\\裁]裂^袱_裟`裙a裘b補c裏d裔e裝f裕g褂h裳'
+            'i裸j裹k裴l製m裨n褚o褐q褓r褒s褲t褪u褥v褫w褻x褶y褸z襄{襟|襠}襖~襤',
+    0x2158: '!襪"襯#襲$西%要&覃(見)規*覓+視,親-覦.覬/覲0覺1覽2觀3角4解5觴6觸7言8計9訂'
+            ':訃;訐<記=討>訌?訕@訊A訖B託C訓D訪E訣F訝G訥H許I設J訛K訟L註M詠N評O詞Q詁R詔'
+            'S詛T詐U詆V訴W診X詫Y該Z詳[試\\詩]詰^詣_詼`誠a誇b誅c詭d詹e詢f話g詮h詬i說j誦'
+            'k誡l語m誌n誓o誣p認q誤r誨s誥t誘u誑v誼w諄x諒y談z請{諸|課}調~諉',
+    0x2159: '!諂"誰#誕$論%諦&諺\'諫(諱)諧*諜+謀,謁-謂.諾/諷0諭1謗2謙3謎4講5謊6謡7謄8謝'
+            '9謹:謬;謨<識=譜>譎?證@譚A譁B譏C議D譬E警F譯G譴H護I譽J讀K變L讓M讖N讒O讚Q豁'
+            'R谿S豆T豈U豉V豌W豎X豐Y豔Z豚\\豢]豪^豫_豬`豺a豹b貂c貊d貉e貍f貌g貓h貝i貞j負'
+            'k貢l財m責n貫o貨p貪q貧r販s貯u費v賁w賀x貴y貼z買{貶|貽}貸~貿',
+    0x215A: '!賅"資#賊$賈%賄&貲\'賃(賂)賓*賑+賒,賠-賦/賣0賢1賤2賞3賜4質5賭6賴7賽8賺9贅'
+            ':購;贈<贋=贊>贏?贍@贓A贖B贛C赤D赧E赦F赫G赭H走I赴J赳K起L超M越N趁O趙P趕Q趣'
+            'R趟S趨T足U趴V趾W跎X距Y跛Z跋[跚\\跆]跑^跌_跡`跟a跨b跳c跺d跪e路f跼g踫h踐i踢'
+            'j踝k踏l踩m踟n蹄o踱p蹂q踴r踹s踵t蹉u蹋v蹈w蹊x蹣y蹙z蹦{蹤|蹲}蹬~蹺',
+    0x215B: '!蹶"蹼#躂$躁%躇&躉\'躅(躊)躍*躑+躡,躪-身.躬/躲0躺1軀2車3軋4軍5軌6軒7軔8軟'
+            '9軛:軻;軸<軼=較>軾?載@輊A輔B輒C輕D輓E輦F輛G輟H輝I輩J輪K輜L輻M輯N輸O轄P輾'
+            'Q轅R轂S輿T轍U轉V轔W轎X轟Y轡Z辛[辜\\辟]辣^辨_辦`辭a辯b辰c辱d農f迆g迅h迄i巡'
+            'j迎k近l返m述n迦o迢p迪q迥s迫t送u逆v迷w退z逃{追|逅}這~連',
+    0x215C: '!速"逗#逝$逐&逍\'逞(通)造*透+逢,逖-逛.途/逮0逵1週2逸3進4運6道7遂8遐9達:違'
+            ';逼<遇=遏>過?遍@遑A遁B逾C遘D遠E遜F遣G遥H遞I適J遮K遨L遭M遵N遴O選P遲Q遷R遼'
+            'S遺T避U遽V邁W還X邂Y邀Z邇[邊\\邐]邏^邑_邕`那a邢b邪c邦d邵e邱f邸g郎h郊j郡k部'
+            'l郭m郵n都o鄂p鄉q鄒r鄙s鄭t鄰u鄧v鄱w鄹x酉y酋z酊{酒|配}酌~酗',
+    0x215D: '!酣"酥#酬$酩%酪&酵\'酸(酷)醇*醉+醋,醃-醒.醣/醞0醜1醫2醬3醺4釀5釁6采7釉8釋'
+            ':重;野<量=釐>金?針@釘A釗B釜C釵D釦E釣F釧G鈣H鈍I鈕J鈉K鈔L鈞M鈐O鈷P鈸Q鈽R鈾'
+            'S鉀T鉋U鉛V鉤W鉑X鈴Y鉸Z銀[銬\\銅]銘^銖_鉻`銓a銜b鋅c銻d銳e鋪f銷g鋁h鋤i銼j鋒'
+            'k錠l錶m鋸n錳o錯p錢q鋼r錫s錚t錄u錐v錦w鍍x鎂y鍵z鍥|鍋}錨~鍰',
+    0x215E: '!鍾"錘#鍬$鍛%鎊&鎔\'鎮(鎖)鎢*鎳+鏡,鏑-鏖.鏃/鏟0鏗1鏈2鏢3鏜4鏤5鏝6鏍7鏘9鐃'
+            ':鐮;鏽<鐳=鐵>鐺?鐸@鐲B鑑C鑄D鑣E鑠F鑲G鑰H鑾I鑼J鑽K鑿L長M門N閂O閃P閉Q閔R閏'
+            'S開T閑U間V閒W閘X閡Y閨Z閩[閣\\閥]閤^閱_閭`閻a闊b闋c闌d闈e闆g闖h闐i關j闡k闢'
+            'l阜m阡n防o阱p阮q阪r陀s阿t阻u附v限w陌x陋y降z院{陣|陛}陡~陝',
+    0x215F: '!除"陪#陳$陸%陵&陲\'陶(陷)陴*陰+隊,階-隋.陽/隅0隆1隍2隘3隔4隙5隕6障7際8隧'
+            '9隨:險;隱<隴=隸>隻?雀@雇A集B雄C雁D雅E雍F雋G雉H雌I雕J雖K雜L雞M雛N雙O離P難'
+            'Q雨R雪S雯T雲U電V雷W雹X零Y需Z震[霄\\霉]霆^霑_霎`霖a霏b霍c霓d霜e霞f霪g霧h霸'
+            'i霹j露k霽l霾m靄n靂o靈p靑q靖r靛s靜t非u靠v靡x靦y靨z革{靶|靴}靼~鞅',
+    0x2160: '!鞍"鞋#鞏$鞘%鞠&鞣\'鞦(鞭)韃*韁+韆,韋-韌.韓/韜0韭1音2章3竟4韶5韻6響7頁8頂'
+            '9頃:項;順<須=預>頊?頑@頓A頒B頌C頗D領E頡F頭G頰H頸I頻J頹K頷L頤M顆N顔O額P題'
+            'Q顎R顓S類T顚U願V顧W顫X顯Y顱Z顰[風\\颯]颱^颳_颶`颺a颼b飄c飛d食e飢f飧g飩h飭'
+            'i飪j飮k飯l飼m飴n飽o飾p餃q養r餌s餉t餐u餒v餘w餓x餅y館z餞{餛|餡}餵~餾',
+    0x2161: '!餿"餽#饅$饒%饑&饜\'饞(首)香*馥+馨,馬-馮.馭/馳0馱1馴2駁3駐4駝5駕6駟7駛8駒'
+            '9駙:駑;駭<駱=騁>駿?駢@騎A騙B騖C騫D騰E騷F驃G驅H驀I騾J驕K驚L驛M驗N驟O驢P驥'
+            'Q驪R骨S骯T骰U骷V骸W骼X髏Y髓Z體[髒\\高]髥_髮`髻a髭b鬃c鬆d鬍e鬚f鬢g鬥h鬧j鬱'
+            'k鬲l鬼m魁n魂o魅p魄q魏r魔s魘t魚u魷v魯w鮑x鮫y鮮z鮪{鯊|鯉}鯨~鯧',
+    0x2162: '!鰓"鰍#鯽$鰭%鰥&鰱\'鰾(鰻)鱔*鱗+鱖,鱉-鱷.鱸/鳥0鳩1鳶2鳴3鳳4鴆5鴉6鴕7鴣8鴨'
+            '9鴦:鴛;鴒<鴻=鴿>鵡?鵑@鵠A鵝B鶉C鵲D鵪E鵬F鶴G鶯H鷂I鷓J鷗K鷥L鷹M鷺N鸚O鸞P鹹'
+            'Q鹽R鹼S鹿T麂U麋V麗W麒X麓Y麝Z麟[麥\\麩]麴^麵_麻`麼a麾b黃c黍d黎e黏f黑g墨h默'
+            'i黔j點k黜l黛m黝n黠o黨p黯q黴r黷s鼇t鼎u鼓v鼕w鼙x鼠y鼬z鼴{鼻|鼾}齊~齋',
+    0x2163: '!齒"齟#齣$齡%齦&齜\'齬(齪)齷*齲+龍,龔-龜0芈',
+    0x2164: '$丏%冇)丨.丱1丶3丿4乂7玍<乜?氹F亅P亠Q亢R亳U亶X亹Z亼^仉a仈b从c仨k仡r伈s伎'
+            'u伃|伢',
+    0x2165: "'仵(伇*伀,伋2伻6佘7佢9佤:佉?伾@佦D佧M佨N佚O佟V侂W佼Z侘[侒\\佽`侀a佴b佶d侢"
+            'f侑g侕l佌m侗n侔p佹q侚r侁s佸v侜w侐{佺|俍',
+    0x2166: '"俤&侷\'俅)俉*俥,俧3俜5俔7俁;俛>俆C侹F倞H倿I倅L倇M倓N倢R俵Y俴[倷^倮a俶b倜'
+            'f倬i倐y倽',
+    0x2167: '"偯#偐%偰)偓*偪,偖1偭8偝9偈;偘<偲A偁F倕H偺J偬K偟M偫N傔P傞R傛S傚W傣Z傌\\傈'
+            'b傎d傕g傦j傒l傜q僇u僉{僊|傴',
+    0x2168: '"僂,傺.働2僔4僯5僦:僴;僎<僝A僳B僨D僰F僙U僬[儎_儅a僼e儆f儇g儏h僾i儋j僽m儁'
+            'q儕r儓x儚y鞗~儦',
+    0x2169: ')儤+儩0儱>儵@儳D儺G儹H儻Q兙R兛U兝V兞X兟Y兡\\兣g冂i冄n冏p冔q冓u冖{冡|冣',
+    0x216A: '"冪#冫&冱5冼C凊F凇N凑O凐T凓c凙f凟h凢s兠x凵y凷',
+    0x216B: '$刓&刖*刜3刱6刵7刲9刳>剄C剉G剠K剚L剒M剞P剟S剕[剮^剨_箚k剸t劂u劁y劌z劊|劐',
+    0x216C: "!劓'劖)劘+劚,劙.劦1劭3劮7劻8劼<勊=勍@勐A勑F勔H勖L勣N勡P嗧S勩X勰Z勱^勷a勹"
+            'b勺d勼i匇j匃k匆n匊o匋w匑{朆',
+    0x216D: '#匚$匜%匟.匭3匰6匵:匸>匽A卌B卍K卝L卣N卥S卬W卲X卺]厀d厎f厓g厔m厙t虒z厤{厫',
+    0x216E: ',厵.厹>叐H叚W叻X卟a吔h吆l呌m呅o吚p吲v吡x吰y呔}吽',
+    0x216F: "!呏$吪&吢'吣.呟/咜5咈7呿9咂:呭;咑B咔C呫I咍J呣K呴R呦S呤U咤X咡Z咭[咺\\哏^咾"
+            '`咥c咧d咵f咢g呲h呰i咼j咷k哞l哖m咮q咿t哆{唚|哢}唇',
+    0x2170: "#唗$哽%哧'哳*哤+唊-哿.唘0唄2哯4唈8哶9哷>唎D唣F唏G唑K啵M啳N啌O啶P啍Q啚S唼"
+            'U啐W唹X啈Y唭Z啑]唪`啢a唶d啉h唰j啀k唵p啅y唿{啁}啥',
+    0x2171: "#喑%啷&喨'喭*嘅-喓/喆4喈6喴C嗢D喁E喎G喵I喏K啙P喤Q喒R喙V嗴X嗌Y嗐Z嗛[嗍\\嗞"
+            ']嗙^嗃_嗉a嗊b嗝d嗔e嗄i嗩o嗏p嗒u嗥w嗖x嗁y嗲~嘧',
+    0x2172: "$嗻%嘒'嗸(嘏+嗹.嘞1嘌4嘜5嘐6嘁8嘓9嗶<嘂B嘝D嗿G噂H噌K噋R噀U嘵W噉X噁\\噘]嘠"
+            '^噔`嘪a嘽d嘬g嘸i噍k嘫l噏n噰o噟p噼r噠x噶z噦{噳|噭~噲',
+    0x2173: '%嚓(嚌2嚺4嚆5嚄6嚑7嚊>嚞A嚜B嚚E嚙K嚭L嚦N嚬S嚲Z嚳[囃`囅b囏g囍j囔k囗m囝o囡'
+            'p囟u囫v囮w囧y囻~囷',
+    0x2174: "!囹$囿'圅(圄)圂,圊-圉.圇0圌1圕2圔5圚6圛7圜9圝:圞A圤B圮C圩H圸L圪c坉e坅h坋"
+            'i坌j圿p坨u垊w坭y坴z坧',
+    0x2175: '&坰(坱*坮-坶.垉0坿1坵2坻3垈5坳8垟9垐:垓?垞@垵C垚E垔G垤H垙I垌K垗N垝R垜T垧'
+            'W垡Y〓[垕_垸`埇j堉l垾q埛s埕w埒~埆',
+    0x2176: '"埄\'烾)埣*埻+堃,埶-埦1埭3堀5埬6堇9堎;堏=埴>堐@堍C埯H堁I堒M埽N埸P堌Q堓R埰'
+            'V堋X埳Y堄Z埏[埝_塇g堛i堙j堳l堞m堿q堧v堨x堮z堝}塄',
+    0x2177: '!塈#堘&埵)堭+堠0塎3塝5塙7塋=塥@塬B塒E塤G塓H塏I堽M塍N塖U墚X墒Z墎\\墉_塀`墛'
+            'a塼c墈e墐h墘k塽o塿p墁{墩~墡',
+    0x2178: '$墱+墭.墠0墣2墦:壈A墼I墿K壆L墺P壖T壒V壎Z壠^壚l壼p夂s夆t攵z夐|虁',
+    0x2179: '(夬+夯0夼3奀8奍C奓K奜O奡T奬U奭e奼i妧k妘o妚q妠|妗',
+    0x217A: '!妐$姅%妵(姏*妺,妸5妲:妷>姁C姹D姸O姮P姱Q娀R姞V姽]姶^姝_姺a姤n娪u娖x娉~娒',
+    0x217B: ',婠1婧:娸;婞<婭=娵>婕A娬H婐I婥R婤e媊i嫏j婺q媟u媠',
+    0x217C: '!媦"媌$媧%媞&媢\'媜(婼)媖0媓1媬4媮5媕6媯9嫈>媵A嫄E媷I嫑J媐O媸P媺R媪Y嫓[媱'
+            '`嫜m嫥n嫠r嫪{嫚|嫫',
+    0x217D: '&嫿*嫽+嬈.嬍8嬃=嬗>嬖@嬙G嬛H嬡R嬬Y嬲c嬿n孅t孌v孋|孖',
+    0x217E: "!孛#孢$孥%孧'屘(孬*孮0孻1孼2宀4宄5宂@宕C宓I宬R宧U宷Y寁[㝡`寉h寔j寃n寖u寗"
+            'y寠~寪',
+    0x2222: '$寰%寯3尀5屗<尕F尢H尥K尪R尯[尲c尻e屄g屉y屙{屝|屟',
+    0x2223: '#屣)屧+屨0屭1屮7屴9屳;屷<屺@屼F岏I岈K岍M岙U岦W岠\\岢`岵a岧f岨g岬k岣l岶m峁'
+            'o岭p峕x峓y岍',
+    0x2224: '&峠(峒)峝+峋0峇1峜4崀;峿<峫A峴F峱I崞J崒P崚R崌S崠T崡W崧X崍Z崦]崮i崤q崶r崾'
+            't嵋v嵗w崴',
+    0x2225: "%崿&嵒'崽(嵎,嵙-嵇/崲1嵂4嵴9嵯:嵫?嵵D嵊I嵬J嵢M嶂P嵹Q嶎Z嶁`嵾f嶒h嶙i嶗j嶢"
+            's嶡u嶓w嶠{嶔~嶬',
+    0x2226: '&嶧*嶰.嶴/嶮0嶶2嶸4嶿6嶷>巃D巇F巉G巋N巘P巛R巜V巤b帀d凧r帔s帗v帙w帒x帟z帣'
+            '{帡',
+    0x2227: '"帢$帨5幄6幃9幂?幎G幘H幈W幞X幡]幨_幬`幪c幮d幭e幰m幵w庀~庋',
+    0x2228: '/庤5庥6庯B庹K庳L廄Q廌U廋W廍Z廒[廑\\廕_廔`廙a廎h廡m廧q廨|廭',
+    0x2229: '!廱#廴5弇:弋J弨K弢L弣M弤Q弳R弰X弸\\彀_彄b彍h彐i彔j彖l彘p彠q彡r彣s肜t彧x彲'
+            'y彳|彴',
+    0x222A: "#徂'徉+徔4〓9徜=徚F徯P徼W忉_忑a忒c忐g忎h忭r忮s忸x忡{忤",
+    0x222B: '$忪*怦,怩-怫0怙1怈6怊7怌8怛<怗=怳E怍F怐K怹P怓S恔W恝Z恇^恉_恓h恧o恌q恁r恷'
+            't恂v恟z恡',
+    0x222C: '$悊+悒,悝-悁/悞0悃2悗4悧:悕>惇B悰F悾G惓H惔N惎Q惏S惙T悳V惝]惄`悱b惣f惢g惥'
+            'i惛n惩p愔s愃u愙|惽}愍',
+    0x222D: '*愊,愐2愒4惲7愥;惸?愡A惼C愆H慉J慊N愫P愩Q慐V厯X愰[慁^愷a慆f慞g慵h慴k憃p慱'
+            't慪w慳y慤{慓',
+    0x222E: '#憋,慯-慥/慜2憝3憦=憢@憨B憜C憯E憖F憗G憭L憒R憮U憍Z懋\\懌]懆h憺j憸q懠w懥}懜'
+            '~懟',
+    0x222F: ')懳=戁A戄C戇D戉G戔V戣[戥]戤a戩g戭i韯n戹o戺p戽u扃w扆x扅y扊z扐|扞',
+    0x2230: '&扨(扠+扚,扢-扦1抆2抎A抣C抂F抅K抝V抦W拑a拤i抶j拃r挍',
+    0x2231: '%拵1挌2捠7拶:挱B捅D捃E挵G捓H捤I挶J捄T挹X捗Z挼[捘\\捋_捔h捽j掶k掂l捬n掟r掞'
+            's捿y掁{掗}掫',
+    0x2232: "%掇&捺'掎*掆/捵0掯7掱8掰9掮:捼;掐=掭A捭C揞D揥G揓O掽P揃R揵X揦[揠\\揕]揶^揲"
+            '_揸f揅j揹p掾r揫s揝v揑y揄z揜{揗~搒',
+    0x2233: '"搐$搴)搛+搠,搤/搦1搌6搕7搘8搎9〓;搢=搡D搰E摁H搵L搉Q搊S摀Y搇[搻]搿h摛j摏'
+            'l摫o摶v摴x摽{摳',
+    0x2234: "#摎$摤'撂(摞,摻.摜<撝?撙B撏M撖N撢T撐[撶a撘b撟e撧f撳j擗l擓t撾u擐",
+    0x2235: '*擯-擡.擥1擫3擢6擭8擤B擷F攄K擽O攈S攉Y攚[攖a攛i攧m攢o攩r攥w攮|敁',
+    0x2236: ',攸4敂6敉>敔?敕E敧G敡O敭T敺d斅n斌p斒q斕u斛w斝z斠',
+    0x2237: '"斨#斦\'斮*斶,斸/斿1旆2旃3旄4旂;旐<旒D旛E旜G旝H旟J旡N旤T旴U旰Z昉[旻\\旼^昊'
+            'd昃j昑k昕m昄n昱r昡u昬w昵|昞}昺',
+    0x2238: "'昳(昫+昴,昤1晅2晟=晥>晜?晡H晛I晙J晧L晞M晗P晾Q晬Z晸`晳f晭h晷p暄q暌r暓u暋"
+            'v暐y暔z暊|暘}暍',
+    0x2239: '$稥*暠0尡2暝:暲@暵A暪C暬G暱N曈O暾T曀U曇Z暻\\曄`曏q曚r曛s曢v曡x曨|曩',
+    0x223A: '(朅0朏1朐3朒4朓8朙9朘G朣L朾N朿X杗[杅\\杇`杝a杕f杌g杙h杈k杣n杓q杊u枓x杼z枟'
+            '|枅',
+    0x223B: '!杻"枒#杶%枑&枙(枤.枏0杲1枘2杪9枬;枠?枡D柹H枍I枌L柼N栐Q柈T柌X柅\\枻_枰`栃'
+            'a柸c柘d枷m栂o柤p柙q柛r枵t柟u柷w枳x栆y枮z柶|柮}檯~枲',
+    0x223C: '!枹#柂$柣&柊(柎)柢*柲+柃-柝/柧0桉1栾6栔7桋8栞;栳@栱A栲B栵C栻D桎G栫H栭J桍'
+            'O桄U桝V桞X栴Y栒e桚h桫i桬k桹n梲q梛r桾t梶v梂z梐',
+    0x223D: '!桲"梜%桭.梩0梘2梋3梠4桯9梣;桴<桵?桷@梏C桻D梎K梴P椬Q椗S椌V椋X棓Y椄[椊\\椉'
+            ']椩b棬c椪d棪e栟f琹j椐n棖o棫s棱x棽y棼{棳|椓',
+    0x223E: '!椇#椚$椙*棞+椛-棻3棡7棑8棐9椈>棨?棰@棃D椑F棔G棯I棆K棇S楴U椸X楢]楘_楗`椿'
+            'a楱d楅e楝f椲i楮j楣k楈n椹p楪s椷z楬{楎}榀~椳',
+    0x223F: '!楒%楛-榅2椽5楸7楻:椴;楩=楄>楯D榊E榠F榱P槎Q槊Y榍Z榑\\榪`榼a榧e榞h槙j榎m槖'
+            'u榥w榾x槑z槶~槕',
+    0x2240: "'榿-榣.榤4槔8槃=樒>樑A樀F槦K樋L槥M槩P槼T樗V槧W槫[槱^樫_槿`樠d槭g樛h樭n樘"
+            'r樝u樌v樏|槮',
+    0x2241: '#槰$槲(樔)橣7橧9橃:樳;樲<橚?樨@橈A橐B橒C橲E樾F橷G橛J橞K橜O橑Q橖S樶V橺X樿'
+            'l槹m橤s檍u檨w檥y檖~橽',
+    0x2242: '"橿#檉$檑&檟*檒+檣4檙5檝6橾7檛B檠G檐I檞J檇K檎Q檫U櫈W檮]檿d櫊h檴y櫦~櫭',
+    0x2243: '%櫌(櫑3櫟4櫍5櫞7櫬9櫳:櫧?櫫@櫪D櫱E櫨H櫵N櫽P櫺R欁X欃Y櫸_欍`欉a欎g欑m欙n欗'
+            'r欞~欬',
+    0x2244: '*欵,欷-欻2欹5欿7歆8歁:歀;歂<歃>歈?歊F歎J歗L歔N歕Q歜S歞T歠[歫]歬_歮a歱k歾'
+            'q殂s殄y殍{殕',
+    0x2245: '%殙)殛5殣6殢8殪9殫;殭=殰?殳G殽M榖T毈[毖`毚b毜c毝e毟o毧p毪q毨',
+    0x2246: '*毶,毳3毸7毺8毹B毿D氆H氄J氅L氈Q氌R氍Y氕Z氘[氙\\氚^氝`氠b氡d氪f氭g氰h氬i氱'
+            'p氻t氿x汆z汒{汢|汊',
+    0x2247: "$汜&汛'汍+汋,汔-汣0汸1汴2沆3汶8汬9汧;沄>沔@沏B汥G汯I沝J汩K沚L汭M沓Q沇R汮"
+            'V沕Z沂\\沠b泫c泮d泀f泯g沬n沭p沯r泵z沺{畓}泂',
+    0x2248: '$泘&泆(泎)泩-泲/泠0泑2泒3沴7洝;洨D洹M洦N洧O洏P洊Q洿Z洇[洄\\泚`洮a洵b洺d洙'
+            'g洎j洫k洑l洀m洤o洳s浣w涥}涒',
+    0x2249: '%浭&浯(浡)涑,涁.涊/洴4浹5淯9浿;涅<浥>浞@浧C涔F浠H涘K浼L浰O涖Y涫Z涴\\涪`淬'
+            'j涬k涷l淢m淕n淩q淶y渏{涿',
+    0x224A: '*淟-淓2淼5淝6淜9淛=涤D渒F淰J淦L渟P渧U湉X渼`溊b湋f湢j湑k湄m湣q湳t湏w湎',
+    0x224B: '"渨$湜&渱(湞,溄.渮0渶1湝2湲3渰4湓6渹7湱8湩9湫;溋>湶@渪A湌B渢C滎E溛F溟H滈'
+            'I滘J溏M溓O溠Q溱W溨Y溒Z溧^溎`滙a溽c滁i溻j滉l溳m溷u溤y滏|滊}滕',
+    0x224C: '!滃$溴&溲)溵.滸0漷4滽5漉<漻=潣>漒?漦A漚B滶C漙D漀K漤Q漘W漟Z漊^漶`滹a滮b潁'
+            'd澕e漭g漴k潉m漰v滺w滫x漈y漎{漵',
+    0x224D: "#潾$澝'澇+潯/潚0潠5澐7澍9澒:澉<澌=潢D漋K潬M澋X溈Z潕_潲b潗c潟h潝s澶t澟y澦"
+            '|濆}澼',
+    0x224E: '!澪%澿&濇-濉.潞/濈0澠2濊5澴7澯<澨@澥A澰B澮C濙D濚P濔V濩W濸]濞^濮b濰f瀅g瀌'
+            'j瀍r瀦',
+    0x224F: '$瀠&瀧+瀞/瀮1瀭5瀡9瀘:瀣A瀼D瀵Q瀴S瀹T瀺]灃a灄g灇i灉k灕q灒s灜x灙{灞|灡}灝',
+    0x2250: "!鸂%灦'灥(灨)灔9灴;灺@炓B炆H炖I炄J炁V炈W炘Y炌\\炷b炡c炣h畑o炧p秌q炵r炿s炩"
+            'x烪{烥|烜}烓',
+    0x2251: '"烝#烡&烣(烠+烔.烑8烋:烐;烇<烚=烆?烺B烷D焄H烳J焐L焃P烴U焑V焒\\焌`烶f焓g烯'
+            'h焀l焞m焴n焠o焿t焱u焭',
+    0x2252: "'焹(焵,焻.焜2焽5焯;焩C焮H煷Q煆R煒T煏U煝V煁W煠Y煵Z煳\\煃]煚^煶`煋b煇e煨f煱"
+            'g煟i煐k煓p煄v煲x煸{熇|煻',
+    0x2253: '#熒+熀,熉2熅3熖6煼9熘<熗>熵?熩B熥F熞G熲J熛N熯Q熤R熠U熚W熳Y熴g燑i燇j熷m燊'
+            'o燏p燖r熺u燂w燅z熿|熸',
+    0x2254: '!燝"燀$燁&燔)燋*燞2燫6燨:燵=燳?燡G燠K爌O燼V燹[爎\\夑^爊`爗a爇f爕i爓n爘q爋'
+            'y爚}爟',
+    0x2255: '!爝)爥*爦A爿C牁D牂O牐Q牏R牓S牕V牚Y牣a牳c牮f牶h牷k牾m牼q牿t犉|犋',
+    0x2256: '"犍(犏H犨L犫N犰O犴Q狆R犵V犼X狃[狁`狖d狒g狉l狌n狛o狍s狨v狫y狥~狺',
+    0x2257: '$狴%狾)猂,狻-猁.狳1猝5猋6猗;猇>猘B猞F猱I猸J猢L猲M猬N猧O猫R猯U猨Z獇[獈\\獉'
+            '_猻b猺e獀h獍k獒r獞t獝y獠{獘~獢',
+    0x2258: '!獋%獧)獬+獫/獯6獼8獾;玁?玈B玎F玕G玒H玗L玓M玔Q玞R玦]玥b玢c玠g玶h珏j珂k珐'
+            'o玿p珈}珌',
+    0x2259: "!珓'珪(珥*珙+珯/珔0珛2珖5玼6珧8珣:珞<珦?珩E珶G珺J珸T珵Z珽\\琇^琒c琼f琮g琯"
+            'i琔j琬l琰n琫p珷q琚x琖z琦',
+    0x225A: '!琨#琩(琠*琛+琤,琲-琭0琕2琻6瑄@瑇C瑘E瑂G瑋J瑊O瑒U瑗V瑑Z瑝[瑔]瑀`瑭a瑢b瑳'
+            'h瑴i瑮j瑱k瑨x瑠y瑲z璄{璇~璈',
+    0x225B: '!璉"瑼\'璂(瑾*璊-璆0瑺8璀<璁>瑽?璅@璗C璘E璚M璤T璟U璝V璍W璞Y璠]璡`璲a璱f璴'
+            'g璫i璪j璐l璥n璨v璸z瓀',
+    0x225C: '%璿(璵)璺0瓈1瓅2瓌8瓖:瓔=瓘@瓚A瓛G瓞P瓤R瓧T瓩X瓱Z瓰\\瓮a瓴c瓸f瓻g瓿q甅w甃'
+            '}甇',
+    0x225D: '%甎(甍,甑-甏2甒3甓9甗B甡D甤I甯M町O甿Q畀R甾U畊W畎X畇Y畋Z畈_畟`畛b畤g畣i畯'
+            'k畬m畹n畺q畷u畱y畽~畿',
+    0x225E: '%疃,疐-疒.疔1疕5疘7疢;疣>疺C疰D痃F疿G疴J痂N痁P疱Q痄X痍\\痏^痌_痐c痧f痡g痦'
+            'q痤r痠s痗z瘂~瘃',
+    0x225F: '!痹"痼)瘖,瘈-瘕.瘌/瘏;瘐<瘊>瘥?瘚@瘛G瘙H瘞L瘝P瘢Q瘯T瘭\\瘳^瘻_瘰`瘼b瘵g癈'
+            'h癎i癇j癃n癍o癉u癔z癜{癗',
+    0x2260: '"癤$癙+癟2癧5癪7癭8癯:癰@癶A癷H皀J皋R皕U敫Y皙]皜_皝e皤f皥g皦j皪m皭t皸w皽',
+    0x2261: '#盋&盌;盦<盩@盬D盭H盱K眄O眈P眇S盷T眊Y盻^眫`眎b眛c眤l眢m眚o眡t着u眹v眯w眱',
+    0x2262: '"眥%眵&眴-睇1睅2睍3睊5睃7睎:睟=睠>睒B睘D睖E睚O睢R瞀V睯]睾_瞅`睺f瞋j瞍r瞘'
+            's瞖u瞢v瞙z瞵}瞷',
+    0x2263: '#瞶)瞾+瞹,瞼5矍:矑E矞F矟O矧R矦U矬Y矰Z矱\\矴`矼g矸h矻p砉q砆s砙t砑x砒',
+    0x2264: "$砛&砬'砣(砫*砩-砢1砵2砳3砮5砠8砽;砟=砱D硍H硈I硓J硔K硅L硒N硐O硘P砦R硇V硌"
+            'Z硨[硭`硤a硜d硶f硪i碆k碚l硿m碇p碔v碏~碙',
+    0x2265: ')碓,碒-碖/碲1碡2碶9碷;碤>碴@碭A碣C碞D碨H碫N碻U磌V磉X磑Z磘^磈`磔h磟j磧n磛'
+            'o磡s磠v磮w磣y磲~礅',
+    0x2266: '!磹"磽\'磾)磻+礄.礒2礌4礓5礑C礞F礢L礤M礧P礩U礱]礴`礶e礽g祂h礿j祊k祍u祆w祘'
+            'y祛z祜{祏|祓}祓',
+    0x2267: '!祑#祔*祧-祫0祲>祼J禘K禊M禙N禕O禋P禖T禔U禓\\禚_禡`禛a禣d禝n禩p禫q禨u禰z禳'
+            '{禴',
+    0x2268: '"禸#禺%禼(秆*秈-秔.秕2秖=秬>秫B秡D秝E秭H秸O稂P稊T稉\\稃a稌k稑l稘o稙q稞v稗'
+            '~稭',
+    0x2269: '"稬9穈=穋>穇?穄@穜M穟O穠W穮_穰f穵i穸k窀p窅u窆x窊z窔~梥',
+    0x226A: '(窣+窞,窧.窨1窬6窳:窽<窶=窸>窵?窻C窿I竍K竏O竑Q竓R竔T竕U竚Z竡^竦f竫k竰v竵'
+            '|竾',
+    0x226B: "'笹-笏.笈3笊5笵6笥9笸;笻?笤@笳B笪D笘G笱J笫K笷M笟R筊S筙T笄U筇Y筘[筬`筈a筅"
+            'b筌c筎h筦l筤n筩p筭t筢u筮v筴y筲z筸{筯|筧~筥',
+    0x226C: "&筱'筰)筳-箜3箒4箑5箐8箣:箍A箅C箎D箘F箆H箙R箲X篋Y箸Z篏\\篐`箾o篌",
+    0x226D: '"篝$篥)篨.篹/篔2篟5篘7篪;簆>篰A簏F簋G簀K簌O篴T篳Z簉[簃\\篼_簜a簦b簨c簠f簟'
+            'h簯u簰',
+    0x226E: "'簵*籀0簹4簻5簴;籂F籎T籝V籜W籚X籛Y籙[籞\\籧^籣a籨b籥o籯u籵y籾z籸}籽",
+    0x226F: '!粁(粎)粑*粃,粍:粙;粘>粜@粕B粧C粢E粞F粩H粨I粡J粬L粦T粲X粻Y粿^粺_粼d糂f糎'
+            'h糈i糅m糌o糉q糒u糗w糡{糨',
+    0x2270: '"糝(糭.糰0糲5糴9糶B紆D紃E紈I紏J紓P紘Q紞R紝Y紵Z紽a紺b紲e紱h絅j紿l紩o絁q紾'
+            'z絜|絓~絚',
+    0x2271: '"絰)絧+絪,絫0絳4絎7綋9綈;綅=綎B絿D綆H綍K綛M綃O絽T絻X絺Y綖Z絛[綌a綣b綮g緋'
+            'i綪j緎k緉n緅o綦t緄x綬}綹',
+    0x2272: '"綟)緡*緙+緤1緗6緹:縆<緲>緦F緜G緱H緶I緥K緵P縗Q縞R縡S縋U縒V縢[縠]縝^縉_縟'
+            'e縕i縐j縏m縻q縴r縭s縯u縶w縺y縹}繄',
+    0x2273: '!縵&縿(繇-繒/繑3繐4繧7繖H繨I繮N繰Q繯R繳X繻Y繾[纁]纊^纇`纈d纆j纑k纕m纔p纛'
+            'q纚s纙t纘',
+    0x2274: "%罃'罆(罅+罋.罌/罍1罎2罏>罠?罡C罝E罛G罣P罥Q罦S罭T罫U罧W罨^罱`罳c罶j罿k罾"
+            'l罽r羆z羑~羖',
+    0x2275: '#羗$羕,羢3羧;羰<羭?羱@羴B羵J羼L羾Q翃W翊g翛h翣l翦o翥r翬s翫w翯z翮',
+    0x2276: ')翽*翾,翿.耄1耈3耋4耎5耑6耏7耔9耖;耟=耞>耝K耥L耦M耪N耩O耨[耰]耱`耵i耹k聁'
+            'p聃{聒~聢',
+    0x2277: '(聣2聬9聵>聻?聹G肊I肎N肟\\朊`肧a肰h肸i肵j肦s胠u朑{胟}胂',
+    0x2278: "'胙*胝-胏/胍0胗3胲4胺8胾<脃@胹A胯B胔I脝K脘P脰T脤U脛`脪a脞d脡f脗i脺j腚m腈"
+            'w腌|腓}腁',
+    0x2279: '%腍.朠2腠;腩<腼A腡F腶G腴H腧K腯M膂Q膋R膆Y膃j膟k膣p膘u膕w膗|膪}膦~朥',
+    0x227A: ',膵.膰/膴3膷7膻8臁9臌:臊;臄@臑A臎C臐K臛O臝S臞V臠W臢[臧`臯e臲h臶p舁r舁t舃'
+            'u舄w舋',
+    0x227B: "'舝)舠.舭/舯2舸4舺5舳6舴:舲B艈C艉E艄G艀H艁J艅K艋P艏S艎V艖W艗^艚b艟g艢k艨"
+            'o艭w艸}艿',
+    0x227C: "$芎%芑'芏(芄-芃.芊1芯4芧8芫:芰<芤?芚B芣D芷E芮F芩I芼L芨N芴P芡S芪U苙W苾Z苠"
+            '[苐\\茀_苪`苷b苯c茺d苤e苕g茇h苺i苴j苢m苒n茔q苫r苘s苡u苶{茐|苳',
+    0x227D: '!茌"苻$苽&茳)茨+荄.荑5茛;荖?茢@茬H茼J荍M荃R茯S荈T茒V茖X茚_荇b莨g莭m荳r莰'
+            'v茝z莏|莕~荵',
+    0x227E: '!荿"莙#莦%莇&莹+莩/莛3莪7莜8莟A菏C菹E萡Q萣R菪S萓V菼W菶Y萐Z菡`菆a萇c菫j莿'
+            'k菢m萁q菘r菥t萘y菎{菓}菖',
+    0x2322: '#菽%萞)菉*菟,萟.萏0萑6莚<菳C菑H葓J蒎L萹M葶N葹\\葑_葽b葚f葙i葳n萾q葭x葺{蒄'
+            '|葸',
+    0x2323: '$萲)葜-萪.萩2葱5葟6葠7葮:葆<葒?葊E葎I蒗P蒡S蒟V蒺X蒹\\蒴^蓁_蒻h蓍p蒱q蒝r蓐'
+            'u蒔y蓇z蒽|蓂',
+    0x2324: "!蒕'蒯)蒭2蒨3蓖5蓚:蒓?蓏A蓊F蔆G蔋M蔀Y蔟\\蔻_蓪f蓴j蔌r蔯u蔕w蓷z蓼|蓫}蓽",
+    0x2325: '$蔞*蔘-蔦.蔇/蓧4蓰5蓯6蕖F蕁K蕘M蕓N蕡O蕀Z蕆\\蕤]蕞^蕳_蕑d蕢k蕣l蒍m蕂q蕎t蕕'
+            'v蕝w薌',
+    0x2326: '%薀(薏-蕹2蕿3蕷4蕸5薘6蕻=薤B蕺D薗E蕗I薨N薆P薙Q薊R薢T薐V薅W薈Z薸]藁a薺h藎'
+            'j藂k薷l薹n薳o薽p藄r薿u薾~薶',
+    0x2327: '$蘤(藷,藦.藔1藭9藚C藟E藘L藜N藵R蘢T蘐W藼[藿^藾`蘀h蘄q蘅u蘫',
+    0x2328: '"蘧&蘩2蘷8蘶>蘼?虀@蘺L虅Y虍Z虓^虙f虡i虢j虣q虩x虬{虲|虯~虻',
+    0x2329: "%虺&虳'虼.蚖/蚨6蚑7蚜9蚘<蚍=蚋@蚦B蚝F蚠H蚧K蚿X蚺Y蚰`蚳b蛉c蚴g蛘n蛣o蛩q蛬"
+            't蛕w蛐z蛑~蛞',
+    0x232A: '%蜋/蛺3蛸4蜆6蜎8蜉:蜊>蜍B蝊C蜣D蜷E蜨I蝀K蜮L蜽N蜞S蝃U蝄W蜾Y蜩Z蜹_蜚d蜱e蜑'
+            'f蜒k蝏l蝱m蝣q蝤s蝥t蝽y蝘{蝻',
+    0x232B: "!蝡$蝪'蝎(蝟-蝯.蝝0蝮3蝍5蝓:螣=螓E螙H螈L螘S螅T螋U螄X螩]螉`螭f螾n蟄o螯r螬"
+            'x螮~螿',
+    0x232C: '$螽,蟮0蟳1蟰4蟪6蟛7蟢9蟫:蟖?蟵G蟠H蟓I蟜L蟣M蠁O蠃P蠊U蟶W蟷\\蠋]蠆_蟾a蠐c蠙'
+            'd蠑f蠘j蠓k蠖r蠴s蠜z蠛',
+    0x232D: '#蠨*蠲.蠮2蠭<蠼A衁B䘐D衄K衇Q衊S衎V衒W衐Y衖Z衕^衜_衚i衩m衭n衺q衵u衲y衽|衹'
+            '}衿~衾',
+    0x232E: '(袢*袤/袪4袚:袐;袌=袠@袙E袗H裉I袿J袺O裀Q袲T袼W袷Y袽Z裄^裋`裌b裛d裎h裒q裱'
+            'r裾u裲x褀z裰',
+    0x232F: '!裼#裯$褃-褉/褘5褆6褌7褙=褊C褕E褯G褰N褡O褧Q褟S褱T褞V褦W褢Z褵]襁`褳f襔o襏'
+            'r襇z襌{襆',
+    0x2330: '!襍#襢$襚%襞)襛,襜-襝1襦7襭:襫;襮<襬A襶B襴I襻J襼S覄U覅b覑d覗f覘k覜o覡v覥'
+            'y覩}覯',
+    0x2331: '*覸+覷,覶/覼2覿:觖;觕?觚C觥E觜G觡L觩M觫S觭X觱\\觳^觵`觶d觷k觿l訆m訇n訄p訏'
+            'q訑r訒s訍z訧}訩',
+    0x2332: "%訢'詑(詊*詎0詖7詗9詈;詘<詒@訽B詅O詿P誆V詡X訾Y誂]誄^詵i誏o誖q誚~誶",
+    0x2333: "!誾%諏'諆,諑-諓1誯3諔6諍8誹;諛?諐@諗D諳E諢I譌L諝N諶O諴P諵S諟V謃W諤Y謔]諼"
+            'b諞c諡d謇k謌o謜s謖v謟x謋y謆z謅|謏}謐',
+    0x2334: '"謫*謷-謦0謳8謾:謩B譈D譔H譓I譊J譆M譖O謿Y譙_譍h譫k譭p譸s譅x讅y讁{譾',
+    0x2335: '#讋&讇-讕.讔7讜:讟=谺D豀E豂K豇M豋P豏R豕T豗U豜V豝\\蛃c豨e豭m豳o豴q豵s豷t豶'
+            '{豸}豻',
+    0x2336: '*貆-貅.貈9貔A貛C貟D貤N貰Q貺R貵S貹W賍^賘_賕g賨h賩j賡o賫p賚r賝t賙v賮{賱|賵'
+            '~賻',
+    0x2337: '!賷%贄&賾+贇-贉2贌9贑:贐;贒=贔>贘H赬R赸\\赺a趄q趔u趍',
+    0x2338: '"趖/趡3趦R趫Y趯Z趰f趲n趼o趺p趹q跂r跁s趿',
+    0x2339: '!跏"跖\'跐+跅/跤4跬5跫6跴8跩:跦;跣=跧>跲?踉A跽D跿F踅I踁N踄P踆R踪T踣W踮X踡'
+            '\\踞d踖f踦g踧h踔i踘o蹁w蹀y踶~踽',
+    0x233A: '!踰$蹇&蹆.蹌0蹐2蹏4蹜5蹢6蹠:蹔;蹧>蹚?蹞@蹕A蹡C蹝D蹵E蹴F躕H蹭K蹩R躃S躄W躋'
+            ']躔^躚_躒`躓b躐c躘d躞k躥o躧q躩r躙x躳z躼}躶',
+    0x233B: '.軉/軏1軎3軕?軺B軹K軨O軫Q軿V輀Y輅Z輈[輇c輧d輬k輞m輥n輠u輗x輶y輮z輳}輭',
+    0x233C: "&輹'輴-轀0轆1轊3轇=轒H轖I轗K轕L轘M轜N轞S轝W轢Y轣Z轤e辤f辥l辵m辷n辻p込t辿"
+            'u迒w迋z迊{迓}迍',
+    0x233D: '!迚"迕/迤0迮5迹<迻?逄@逈D逑E逋H逌I逡J逭N逬V逷W逴X逯Y逶[遆]遒g遉j遄t遢u遝'
+            'x遛{遫',
+    0x233E: '!遰%遯&遹(遶*遻,邅4邃7邈:邋?邙@邗C邛D邜H邡Q邨T邠X邯Y邳[邶]邰_邭a邲h郉j邽'
+            'o郕r邾u郇x郈y郃',
+    0x233F: '"郝#郟&郢\'郘(郛*郜,郗-郤.郯/郪2郰3郴4郲>郫?郳F郼G郾I鄄J郿L鄆N鄀P鄇W鄏X鄑'
+            'Z鄖\\鄔`鄋b鄣c鄘d鄜f鄠g鄢j鄞q鄤r鄚t鄥w鄯y鄫',
+    0x2340: '!鄲$鄦+鄴,鄶1鄺2鄻;酃>酆?酅@酈A酇B酐C酎H酙I酜M酖P酘R酚S酡V酤a酯b酮f酺h酲'
+            'i酹j酶k酴l酳m醅o醂p醊q醆r醌s醁{醑}醐~醎',
+    0x2341: '$醍%醓+醝,醚0醢4醛7醨=醪A醯B醱G醭H醮K醴L醲M醵V醿W醽Z釂[釄\\釃a釔b釓c釕d釙'
+            'h釢i釭j釷k釺o釲q釨r釶s釮t釴w釱y釩z釸',
+    0x2342: '!釹"釤#鈄%鈁&鈫\'鈊(鈥*銒,鈨.鈇/鈃1鈀2鈘3釾6鈈7鈦8鈜;鈤C鈒H釿J鈖K鈑N鈆O銢'
+            'Q鈰R鉉T鉍U鉈X鈺\\鈮_鈳a鉦d鉞h鈵k鉐l鉫m鈹o鉭p鉬q鉏t鈿w鉠~鈶',
+    0x2343: "#鉎&鉌'鉖+鉚.鉁/銃1銥3銂5銨7鉼8銤>鉶?銍@鋮B銈C鉺E銎F銠G鉷I銪P銦T鉾U銚X銫"
+            '[銑]銛b鉿d銣f鋈j鋃o鋐q鋱r鋟u鋦v銶w鋀y銾z鋙~鋕',
+    0x2344: "!鋆%鋴'鋏*銲,鋧-鋇.鋰/鋛0鋜1鋘3鋩5鋝9鋑:鋊<鋂>鋌@鋯A鋨C鋫E鋵H鋲L錃M錇N錞"
+            'O鍄S錝T鋺X錟Z錱[錆]鋹_錏b錂d錤f錒i錸j錣l錡q鍀r錁t錕v錩x錮y錪{錿|錺~錵',
+    0x2345: '"錔(鋾/鍂1鍁2錙5鍌A鍹D鎆G鍪H鍜L鍏M鍇Q鍺S鍖T鍱V鍼\\鍷]鍉^鍘_鍚`鎾b鍟d鍶f鍕'
+            'g鍔j鍈k鍴n鍑o鍤q鍫r鍭s鍠w鍮y鎏z鎬{鎕~鎋',
+    0x2346: '!鎵"鎌#鎈%鎹\'鎡(鎰)鎣*鎷+鎛-鎘<鎉=鎤@鎼B鎧D鎽G鎦H鎚J鎪M鎞O鎗Q鎻S鏱V鏞W鏮'
+            'Z鏇[鏲]鏔_鏥b鏹c鏊d鏄f鏨g鏧r鏚s鏐t鏯u鏛|鏌',
+    0x2347: ',鏓/鎩0鏦2鐋4鐓;鐏<鐠=鏻I鏺M鐙N鐍P鐦Q鐧U鐉X鐔Y鐄\\鐢]鐆`鐐b鐣g鏵i鏷j鐇o鐎'
+            'q鐑t鐿y鐩|鐽',
+    0x2348: "'鏴(鐶+鐻-鐤0鐷2鑀5鐫6鐭7鑁8鐱=鑧>鑌@鑅B鑐J鑊S鑦W鑤X鑢\\鑥]鑕^鑞b鑪h鑫i鑭"
+            'l鑯m鑱q鑷{钂|钁',
+    0x2349: '.閅0閈1閌4閗6閎8閟:閠B閬D閫H閼I閾J闍M閹N閺O閶P閿R閽Y闉]闎`闕b闒c闓d闑e闃'
+            'f闚i闞j闠o闥r闤v闧z阞{阤|阢',
+    0x234A: '!阧/陂0阽2阼<陑B陠D陜F陘J陟K陖Q陬]陻^陿b陾c隄e隈l隉m隂n隃y隖z隗',
+    0x234B: '/隤5隩7隮;隰<隲>隳H隹I隼R雎S雊W雒d雟f雘g雝q雩t雱v雰w雴x雺z雵',
+    0x234C: '"雿\'霂)霈*霅8霛=霝>霙G霣I霢J霤N霨P霦R霱X霰\\霶j靁k靇l靆n靉u靘v靚x靝{靟}靤',
+    0x234D: '%靧,靫0靮1靷2靸5靳7鞃8靺:鞀<鞁@鞄C靿I鞉T鞔Y鞛Z鞟\\鞚b鞜j鞬p鞮q鞨t鞫x鞥z鞲'
+            '|鞴',
+    0x234E: '$鞳&鞵)鞹-鞸5鞾8韀;韅C韉K韎L韍N韐Q韔S韘T韙Y韝\\韞^韠`韡l韵s韺y頇{頏~頍',
+    0x234F: '#頎&頖,頦-頞4頫7頠8頟=頳@頮D頯E頲K顇N顄`顒b顋f頿j顜k顙o顗r顖w顢~顨',
+    0x2350: '!顥"顦)顬0顳1顴9颭@颴H颸J颿M颻N飀S飆_飡`飣a飤c飥h飱l飫',
+    0x2351: '$餇(餂/餖0餔1餗2餑8餕:餤;餟@餜C餩E餧G餚O餮P餬Q餪S餳T饂U餲V餫X餱\\餻`餺a饁'
+            'd饀f餼j饈l饇m饉p饃q饍r饌s饎t饐z饘{饔~饕',
+    0x2352: '"饗)饝+饟/馗0馘;馣<馡>馦A馩B馪I馵M馿N馼O駃S馹T馽a駓c駔e駉i駘t駬z駰{駣|駪',
+    0x2353: '$騂)駸*駴0駻1駽=騏>騋?騉D騄E騑G騅H騐L騤M騢O騠R騧Y騯Z騸`騭a騵d騲i騶j騮p驁'
+            't騻y驂z驄}驈~驌',
+    0x2354: '"驍$驒\'驊*驘,驖3驤4驦:驫?骭A骫C骱E骳I骶L骻P骺T骽W髁Y髀Z髂]髈f髐j髑m髖r髜'
+            't髟v髠w髢',
+    0x2355: "!髧'髫(髲*髯2髹5髽6鬁8鬂;鬀<鬈>鬄A鬅C鬋G鬎N鬑O鬐T鬘V鬝^鬟f鬣l鬩s鬭t鬮v鬯"
+            '}鬴',
+    0x2356: '"鬵#鬷6魃:魈<魎>魍A魋G魑]魴c魨r鮀s鮌z鮕{魽',
+    0x2357: '!鮃)鮎+鮐.鮓/鮗1鮒2鮘6鮟9鮝<鮭=鮚?鮨B鮞C鮙I鮆N鮠V鯇Y鯒]鯆^鮿_鯁f鮹k鮻l鯓'
+            'n鯀r鯈w鯗z鯖|鯫',
+    0x2358: "#鯕'鯤+鯱,鯡-鯛/鯢1鯰4鯔>鯿C鰆D鰕I鰊K鰈L鰔M鰄R鰂T鰐Y鰒\\鰉f鰜i鰯n鰣p鰮q鰨"
+            'x鰡y鰤~鱆',
+    0x2359: '%鰲&鱄(鱈)鰹*鰳0鱇2鰵4鰷8鱒;鱘E鱑I鱣O鱧U鱟V鱠X鱭[鱨\\鱯^鱮k鱺s鳧t鳰w鳲',
+    0x235A: '!鴂"鴃#鳷$鴄(鴇,鳸/鴪0鴥?鴞D鴝H鴟O鵁S鴶c鴾e鴰h鵂i鵀k鴽p鵜u鵓{鵙',
+    0x235B: '&鵚*鵒,鵷.鶊/鵺5鶇?鵸B鵾G鵩M鵻O鶃R鵯Y鶩^鶒`鶘f鶤g鶪j鶡k鶚p鶖t鶱v鶶w鶼y鷀'
+            'z鷁{鶸|鶺~鷏',
+    0x235C: '"鷇\'鷃(鶻2鶹4鶬6鶲:鷟>鷙E鷖F鷞O鷩W鷲[鷸\\鷼_鷫e鷯j鷭l鷦m鷮q鸇~鷽',
+    0x235D: "'鸎+鸑6鸕7鸘9鸜:鸛;鸝<鹵B鹺C鹻G麀H麃I麄K麈O麇U麐X麌Z麕\\麑]麛f麞w麭y麯z麰",
+    0x235E: '0黁5黆7黈B黌J黐L黓S黚U黟W黣Y黥\\黧`黮f黰o黶t黹v黻w黼z黽{黾|黿}鼂',
+    0x235F: '/鼏1鼐2鼒3鼖4鼗7鼚E鼢H鼫I鼦S鼯^鼹_鼷d鼽i齁m齅o齆q齈s齉y齎{齏|齔~齕',
+    0x2360: '#齗(齠?齮@齯G齶[龎a龓b龕k龠q龥r龤',
+    0x2730: '2并L干M乱X亚',
+    0x2731: '8布<占L来O仑]侠i系l仓s们y俩',
+    0x2732: '$个&伥-伦.仃3伟5侧8侦>家@备A杰C伧D伞F传G债I仅J倾L伤Q侥U仆V伪W象X侨Y仪Z亿'
+            ']价^侬`侩a俭b傧c尽e俦f优g偿i储j俪k俨s凶z儿{兖',
+    0x2733: '#两@冻H凯k克m则p刚v剀x创|划~剧',
+    0x2734: '!剑"刘#剂/劲3务4动5劳6勋7胜8势<励=劝Q汇R匮U区_卆`协z厌{厉}参',
+    0x2735: '+丛',
+    0x2736: '>员H问I哑c丧h单m唤o乔q哟x啬z吗',
+    0x2737: '!呜"呛\'啧,叹.呕0尝1喽2唠3啸=咀@叽D吨E喷F当G哝K嗳N咛Q吓T噜U向V咙Z严[嘤\\啭'
+            ']嗫^嚣a罗b呓d嘱o囯p围q园r圆s团t图',
+    0x2738: ';执>垩D报E尧J场M涂U坞V块Y尘Z垫[堑`坟a坠b堕d坛g垦i压k圹l垒m垄n坏o坜q坝t壮'
+            'v壶w寿',
+    0x2739: '#伙$梦.夹?奁@夺A奋S妆',
+    0x273A: "'妇(娄6妈;妪A娴C婵D娇E妩H嫔J婴K婶[孙_孚`学c孪",
+    0x273B: '.寝1实2宁5宽6审7写8宠9宝?专@将B寻C对D导L尴`屡a层c属n冈t峡y岛',
+    0x273C: '(岚*崭+岖-屿.岳1峦2巅3岩O帅Q师R帐S带X帧\\帼^币`帜a帮g干k几v库w坐~厕',
+    0x273D: "'废*广+庙,厂-庞.庐/厅G张K弹L弥M弯O汇e后g径l从o复t彻v征",
+    0x273E: 'W忰\\闷^怅a恶l惬p恻w爱~恼',
+    0x273F: '(态)忾+怆.庆1惭3忧6虑8惨9惯:恸;怂<欲>宪?凭A悯B愤D惮E憇G惫H忆J应K怜N恳T怀'
+            'U懒V悬X忏Y慑[惧\\恋n战o戏',
+    0x2740: 'l挟{卷}扫~扪',
+    0x2741: '#挂6抡<拣?扬B挥O损S捣U抢Z屏[挚_搂`掴e捞f拨h挠n扑q抚t拥v击w挞z挡|据}掳~择',
+    0x2742: '"担$捡%挤&拧(拟)搁*扩+掷,撵.扰/擞0摆1拢3拦4搀5摄7挛8摊:搅;揽G败O启R敌T数'
+            'V敛W毙c斩f断',
+    0x2743: '-时2昼@晖A晕C畅D暂H晓I历K暧M旷U书Z会f胧',
+    0x2744: '&东c条h枭i栀m弃n栖q栋v栈z枣|茭',
+    0x2745: '&极*杨+桢-业/枫7荣9构@枪D样F桩G标I枢J楼L桨N乐O枞S椭U树W桦X朴[桥]机_档a检'
+            'b桧c柠d槟e柜f槛j榈k椟l栉m橹n栏o樱p权q榄x钦z欠|欧~欤',
+    0x2746: '!欢)岁*历+归3残5殇6殓7殡8歼;杀<壳@殴U气X氢',
+    0x2747: 'N泾Y泪h浅t渊w沦}涌',
+    0x2748: '-汤0测1涡3浑=沟A沅B灭D湿H沧K准O沪T渍U涨W汉X满Y涟Z渐_滞c浆d渗e渔l泼m润n涧'
+            'o洁q浇x溃{淀|浓',
+    0x2749: '!泽"浊&济\'泞(滨+滥-涛.涩1沈2泻3渎4溅6滤7浏:濑;沥<濒=潇?澜A洒B滩C湾D滦J灾'
+            'Q为]乌f无j炼m烦o炀u扇}热~烫',
+    0x274A: '!炽"炖$灯%焖&烧.营0烛1灿3烩6烁7炉8烂B爷E尔F墙L牍S它Z牵^荦a犊b牺h状p狭r狈'
+            'y犹~狱',
+    0x274B: '"狯#狮\'独(狞)获*犷+兽,猎-獭.献/猡G现W珲^玛_琐d玑g环h瑷i玺k珑t瓯z产',
+    0x274C: '-亩1畄3毕4异6画9当;畴<迭V痉`疡a疟b痪c疯j疮m痨n疗q疠s痒u癞v瘾w癣x瘫y癫{发',
+    0x274D: ')皑-皱:盏<尽=监>盘?卢V众W困]睐s了|瞩',
+    0x274E: "'矫;砚>砕E硕I确L码S砖X矶Y础Z碍[矿\\矾]砺^砾o只w祸x祯{禅|礼}祷",
+    0x274F: '"万%厶6希<称=种@谷D积F稣I穑J秽K获L稳\\洼]窝_穷`窥a窍b窜c窦d窃k竞p巴y笔',
+    0x2750: '!笋#荅*钳+笺0范3节8箬9笃:筑<筛>篓A简B箫E箪F篑H帘K签L篮M筹P笼Q籁R签S篱T箩'
+            'U吁`粋b胡h粪k粮o纠p纪q纣r红s纫t约u纥v纺w纹z纭|纰}纯~纽',
+    0x2751: '!纱"纳#级$纸%纷&绊(绋)扎*绍+组,细-绅/绌0终1统2绞3绒4结6绚7绝8络9给;丝<经'
+            '=捆>绢?绥@绑A综B绽C绾D紧E绫F缀H网I纲J绰L绿M绸N维O绵P纶Q缁R缔S纬T练U绪V缄'
+            'W缅X缉Y缓Z缘[编\\线]缍^缎_缣`缢a萦b缚c致d县e缩f绩g缪h缕i缧l缝m总n纵o缫p缮'
+            'q织r绣s绕t缭u系v绳w茧x绎y绘z辫{缤}继~缠',
+    0x2752: '!续"缨#纤$缆3罚4骂5罢7罗8羁B义M习Q翆X翘o圣q闻t声u耸v聪w联x职y聂z聋{听',
+    0x2753: '!肃D胁J肐M脉X肾Y胀^肠b肿e脑l胶n肤q腻x脓y胆z脸{脍|脐}膑~腊',
+    0x2754: '!胪"脏%临+台2与3兴4举5旧J舱K舰N艰X巴\\刍',
+    0x2755: '(荚)茎*苋-庄<华A莱M苇O叶Q胡S荤U莴]席c荪d苎g苍h芘l莲n荫q蒋s卜v荡|芜',
+    0x2756: '"萧$姜&蔷)蓝*萨.借1艺2薮5药7蔼9蔺:芦;苹<苏=蕴>兰@藓B萝D乇G处H虏J号L亏Z旦'
+            'v蚀y胡z虾',
+    0x2757: '$萤%蚂,蝼2蛲3虫4蝉5蚁6蝇<蛎>蜡?蛊A蚕B蛮F朮G亍I卫J冲b补c里e装l制q褴s裤w亵'
+            'y褛|裆}袄',
+    0x2758: '!袜"衬#袭(见)规*觅+视,亲-觎.觊/觐0觉1览2观5觞8计9订:讣;讦<记=讨>讧?讪@讯'
+            'A讫C训D访E诀F讶G讷H许I设J讹K讼L注N评O词Q诂R诏S诅T诈U诋V诉W诊X诧Y该Z详[试'
+            '\\诗]诘^诣_诙`诚a夸b诛c诡e询f话g诠h诟i说j诵k诫l语m志o诬p认q误r诲s诰t诱u诳'
+            'v谊w谆x谅y谈z请{诸|课}调~诿',
+    0x2759: '!谄"谁#诞$论%谛&谚\'谏(讳)谐*谍+谋,谒-谓.诺/讽0谕1谤2谦3谜4讲5谎6谣7誊8谢'
+            '9谨:谬;谟<识=谱>谲?证@谭B讥C议F译G谴H护I誉J读K变L让M谶N谗T岂W竖X丰^予f皃'
+            'h贝i贞j负k贡l财m责n贯o货p贪q贫r贩u费v贲w贺x贵y贴z买{贬|贻}贷~贸',
+    0x275A: '!赅"资#贼$贾%贿&赀\'赁(赂)宾*赈+赊,赔-赋/卖0贤1贱2赏3赐4质5赌6赖7赛8赚9赘'
+            ':购;赠<赝=赞>赢?赡@赃A赎B赣O赵P赶S趋h践q踊x蹒~跷',
+    0x275B: '&趸(踌)跃*踯+蹑,躏1躯2车3轧4军5轨6轩7轫8软9轭:轲;轴<轶=较>轼?载@轾A辅B辄'
+            'C轻E辇F辆G辍H辉I辈J轮K辎L辐M辑N输O辖P辗Q辕R毂S舆T辙U转V辚W轿X轰Y辔_办`辞'
+            'a辩d农m述}这~连',
+    0x275C: '3进4运9达:违<迂>过D远E逊H递I适O选P迟Q迁R辽S遗V迈W还Z迩[边\\逦]逻k卩m邮p乡'
+            'q邹s郑t邻u邓',
+    0x275D: '*酔/酝0丑1医2酱4酿5衅8释=厘?针@钉A钊C钗E钓F钏G钙H钝I钮J钠K钞L钧M钤O钴P钹'
+            'Q钸R铀S钾U铅V钩W铂X铃Y铰Z银[铐\\铜]铭^铢_铬`铨a衔b锌c锑d锐e铺f销g铝h锄i锉'
+            'j锋k锭m锯n锰o错p钱q钢r锡s铮t录u锥v锦w镀x镁y键z锲|锅}锚~锾',
+    0x275E: '!钟"锤#锹$锻%镑\'镇(锁)钨*镍+镜,镝.镞/铲0铿1链2镖3镗4镂5镘6镙7锵9铙:镰;锈'
+            '<镭=铁>铛?铎@镯C铸D镳E铄F镶G钥H銮I锣J钻K凿L长M门N闩O闪P闭Q闵R闰S开T闲U间'
+            'W闸X阂Y闺Z闽[阁\\阀]合^阅_闾`阎a阔b阕c阑d闱e板g闯h阗i关j阐k辟{阵',
+    0x275F: '#陈$陆*阴+队,阶.阳7际9随:险;隐<陇=隶>只J虽K杂L鸡M雏N双O离P难T云U电g雾k霁'
+            'm霭n雳o灵y靥',
+    0x2760: '#巩)鞑,韦-韧.韩/韬0艽6响7页8顶9顷:项;顺<须=预>顼?顽@顿A颁B颂C颇D领E颉F头'
+            'G颊H颈I频J颓K颔L颐M颗N颜O额P题Q颚R颛S类T颠U愿V顾W颤X显Y颅Z颦[风\\飒]台^刮'
+            '_飓a飕b飘c飞e饥g饨h饬i饪j饮k饭l饲m饴n饱o饰p饺q养r饵s饷u馁v余w饿x饼y馆z饯'
+            '{馄|馅~馏',
+    0x2761: "!馊#馒$饶&餍'馋,马-冯.驭/驰0驮1驯2驳3驻4驼5驾6驷7驶8驹9驸:驽;骇<骆=骋>骏"
+            '?骈@骑A骗B骛C骞D腾E骚F骠G驱H蓦I骡J骄K惊L驿M验N骤O驴P骥Q骊S肮X髅Z体[脏_发'
+            'c松d胡e须f鬓g斗h闹j郁s魇t鱼u鱿v鲁w鲍x鲛y鲜z鲔{鲨|鲤}鲸~鲳',
+    0x2762: '!鳃"鳅#鲫$鳍%鳏&鲢\'鳔(鳗)鳝*鳞+鳜,鳖.鲈/鸟0鸠1鸢2鸣3凤4鸩5鸦6鸵7鸪8鸭9鸯'
+            ':鸳<鸿=鸽>鹉?鹃@鹄A鹅B鹑C鹊D鹌E鹏F鹤G莺H鹞I鹧J鸥K鸶L鹰M鹭N鹦O鸾P咸Q盐R硷'
+            'V丽[麦\\麸^面`么j点o党r黩v冬}齐~斎',
+    0x2763: '!齿"龃$龄%龈&龇\'龉(龊)龌*龋+龙,龚-龟',
+    0x2766: 'I伜',
+    0x2767: 'u佥|伛',
+    0x2768: '"偻B偾q侪',
+    0x2769: 'D傩H傥',
+    0x276B: '>刭[剐_札y刿z刽',
+    0x276D: '.匦m厍',
+    0x276E: '*厣',
+    0x276F: 'i呙',
+    0x2770: '0呗',
+    0x2771: 'i唢',
+    0x2772: '4唛9哔U哓X恶g呒r哒z哕~哙',
+    0x2773: '(哜E啮L呖Z喾`冁',
+    0x2774: '.囵',
+    0x2776: '8垭z埚',
+    0x2777: 'B埘E埙H垲',
+    0x2778: 'Z垅^垆',
+    0x2779: 'T奖',
+    0x277B: '<娅',
+    0x277C: '$娲6妫',
+    0x277D: '+娆@嫱H嫒t娈',
+    0x2823: '+屦',
+    0x2824: 'A岘X崃',
+    0x2825: 'Z嵝i崂w峤',
+    0x2826: '&峄2嵘G岿Y巯',
+    0x2827: '6帏G帻_帱',
+    0x2828: 'h庑',
+    0x2829: 'Q弪',
+    0x282D: '4恽^恺t怄w悭y悫',
+    0x282E: 'L愦R怃\\怿y恹~怼',
+    0x282F: 'C戆G戋f戗',
+    0x2833: 'o抟{抠',
+    0x2834: ',掺.掼W掸b挢f揿',
+    0x2835: '*摈B撷F摅[撄a撺m攒',
+    0x2836: 'q斓',
+    0x2839: 'U昙\\晔',
+    0x283B: '"丫}台',
+    0x283D: '0枧n枨',
+    0x283F: '0楦\\杩',
+    0x2840: "'桤V椠^柽",
+    0x2841: '@桡',
+    0x2842: '+樯W梼',
+    0x2843: '3栎5橼7榇9栊:槠@枥E栌P棂Y榉f椤',
+    0x2845: '9殚',
+    0x2846: 'B毵L毡Q氇h氩',
+    0x2849: '4浃q涞',
+    0x284B: '(浈C荥',
+    0x284C: '.浒A沤b颍',
+    0x284D: "'涝+浔I涠X沩Y滗",
+    0x284E: '0渑>泶A潋B浍b潍f滢',
+    0x284F: '&泷9泸]沣a滠k漓}灏',
+    0x2850: ')滟',
+    0x2851: 'P烃',
+    0x2852: 'R炜',
+    0x2853: '#荧<炝',
+    0x2854: '$烨O烬',
+    0x2857: '^犸_狲',
+    0x2858: '+猃6猕',
+    0x285A: 'G玮',
+    0x285B: '!琏',
+    0x285C: ':璎@瓒',
+    0x285D: 'k畲',
+    0x285E: 'z痖',
+    0x285F: 'H瘗^瘘o瘅',
+    0x2860: '+瘪2疬7瘿:痈',
+    0x2862: '"眦r眍',
+    0x2863: ',睑',
+    0x2864: 'Z砗`硖',
+    0x2865: '@砀j碛w碜',
+    0x2866: '"硗U砻',
+    0x286A: '<窭',
+    0x286B: '|笕',
+    0x286C: 'X箧',
+    0x286D: 'G箦T筚',
+    0x286E: 'V箨h笾i簖',
+    0x2870: '"糁.团0粝5籴B纡E纨J纾a绀b绁e绂j绐',
+    0x2871: '0绛4绗9绨D绠M绡a绻g绯t绲x绶}绺',
+    0x2872: ')缗*缂1缃6缇<缈>缌G缑H缏Q缟S缒]缜^缙_缛i绉q纤r缡u絷y缥',
+    0x2873: '!缦-缯I缰N缲Q缳R缴Y缱]纩`缬m才t缵',
+    0x2874: '.罂1坛r罴',
+    0x2875: '1羟',
+    0x2876: 'U耧',
+    0x2877: '9聩?聍',
+    0x2878: 'U胫n胨',
+    0x2879: 'A脶',
+    0x287A: 'V脔',
+    0x287E: 'a苌',
+    0x2923: '<荭=荮u莳',
+    0x2924: '3芘:莼}荜',
+    0x2925: '$蒌-茑5苁F荨K荛Z蒇d蒉g荬q荞t莸w芗',
+    0x2926: '3蓣Q蓟W荟X莶a荠h荩',
+    0x2927: 'R茏e苈h蕲',
+    0x2928: '*蔹@蓠',
+    0x292A: '/蛱4蚬',
+    0x292B: 'U蛳n蛰',
+    0x292C: 'L虮U蛏]虿a蛴d蝾',
+    0x292D: 'Q蔑',
+    0x292F: '`裢r裥',
+    0x2930: '-裣2祢f觇o觋}觏',
+    0x2931: '+觑2觌`觯',
+    0x2932: '*讵;诎<诒O诖P诓V诩]诔^诜q诮~谇',
+    0x2933: '%诹,诼6诤8诽;谀@谂D谙E诨N谌W谔Y谑]谖b谝s谡z诌}谧',
+    0x2934: '0讴8谩M谮Y谯h谵',
+    0x2935: '-谰7谠9谳',
+    0x2936: 'N贳Q贶_赇j赓k赕p赉~赙',
+    0x2937: '%贽&赜:赆',
+    0x2938: 'f趱',
+    0x293A: '.跄@跸F蹰W跻^跹_跞`踬k蹿p躜',
+    0x293B: '>轱?轺B轵G轷O轸Y辂[辁k辋m辊z辏',
+    0x293C: '0辘W轹Z轳',
+    0x293D: 'N迸',
+    0x293F: '#郏L郓Z郧\\邬',
+    0x2940: '!郸+邺,郐1邝@郦',
+    0x2941: '\\酾]酽a钇b钆c钌d钋j钍k钎y钒',
+    0x2942: '!钕"钐#钭$钪%钫(钬1钯7钛K钣Q铈R铉T铋U铊X钰\\铌_钶`钷a钲d钺m铍o钽t钿',
+    0x2943: '+铆/铳1铱5铵@铖C铒F铑I铕O铞P铟U铫X铯Y铥[铣b铪d铷j锒l锍q铽r锓u锔}铘',
+    0x2944: "'铗+锃-钡.锂5锊>铤@锆A锇M锫W锩X锬[锖f锕i铼m锛q锝r锞t锟u钔x锢",
+    0x2945: '1锨2锱M锴N镅Q锗^铡d锶g锷h锘o锸z镐',
+    0x2946: '!镓(镒)蓥-镉B铠G镏J锼V镛Z镟b镪f錾|镆',
+    0x2947: '/铩2铴4镦<镨>铹M镫P锎Q锏X镡^镢`镣g铧i镤t镱',
+    0x2948: '>镔?镲J镬\\镥i镧o镩q镊',
+    0x2949: '6闳B阆D阃H阏I阈M阉O阊P阌R阍Z阒`阙i阚o闼',
+    0x294A: 'D陕F陉',
+    0x294C: 'v靓',
+    0x294E: 'C鞯T韪\\韫y顸{颃',
+    0x294F: '#颀,颏k颡w颟',
+    0x2950: '!颢)颥0颞1颧S飙l饫',
+    0x2951: '2饽S饧f饩j馐m馑p馍r馔u馓',
+    0x2952: '"飨c驵i骀',
+    0x2953: '=骐@骒G骓Z骟`骘i驺j骝p骜y骖z骢',
+    0x2954: '!骣"骁\'骅3骧m髋',
+    0x2955: 'l阋t阄',
+    0x2956: '<魉]鲂',
+    0x2957: '!鲆)鲇+鲐1鲋9鲞<鲑=鲒B鲕V鲩_鲠n鲧z鲭|鲰',
+    0x2958: '"鲮%鲺\'鲲(鲴,鲱-鲷/鲵1鲶4鲻>鳊K鲽T鳄Y鳆\\鳇j鳋n鲥q鳎',
+    0x2959: '!鳙%鳌(鳕)鲣*鳓2鳘8鳟:鲅;鲟@鲼O鳢U鲎X鲚k鲡',
+    0x295A: '(鸨D鸲H鸱Y鸸e鸹h鸺p鹈u鹁',
+    0x295B: '*鹆5鸫R鹎Y鹜\\鹛`鹕k鹗l鹋w鹣y鹚',
+    0x295C: '(鹘>鸷G鹨I鹇W鹫[鹬e鹩l鹪',
+    0x295D: ')鹱6鸬:鹳;鹂<卤B鹾',
+    0x295E: 'j黪z黾|鼋',
+    0x295F: '+鼍{齑|龀',
+    0x2960: '(龆+龅b龛',
+    0x2D30: '!弌-丗2竝E乗Q弍S丼X亜[亾a亰l讎',
+    0x2D31: '2仏:抻@伲G倂L倈_侣d竢e㒞w幸',
+    0x2D32: '$箇Q儌S僣_傻a倹c侭r灮y兎',
+    0x2D33: '$捌*丌2冐O刂V刑_劵f刴k尅r剥w賸',
+    0x2D34: '!劔(刦.艴6勳<劢=勧S疋W拾X仟[昇]卉d愽j夘n即s却',
+    0x2D35: '9勾<止C仝G喫V獃\\吴j訶q呪',
+    0x2D36: '"諮*閧2詻B欸D啗a憙',
+    0x2D37: '0甞H譟I噐X咽e肆h囬o圀|阬',
+    0x2D38: '!阯0圻?坚J塲R冢T墖n壊v壷w夀',
+    0x2D39: '!够)殀/犇1柰2竒D儞M妬T玅V姙n侄p婣t孃{娱',
+    0x2D3A: '&娿/壻A嫺G嫋`斈',
+    0x2D3B: "'冨*庽3詧?専@将R溺T届n崗w峩x峯y嶋{崈",
+    0x2D3C: '!埼"崐&崘6巣8鉅I菷_橦a幇e秊j凼m芘n牀p坫|菴}厢~厠',
+    0x2D3D: ')厮+庿-厖/厛4廾H彊N篲P彜^髴g逕l従u惪v徴',
+    0x2D3E: '+恠<耻@恒`恵',
+    0x2D3F: "$昚'愠*媿1慙:憅T懐g戞n戦o戯v碥",
+    0x2D40: ')刔1撦9柆?払I枴L抃O抔f揎g拏',
+    0x2D41: '"撅2搯A掲G扱P搨R摇S擣T捜n攴q拊v撃',
+    0x2D42: '(儗I叙O啟r旣w旮',
+    0x2D43: "'昰)暎.曬;晢>晻C昶H暁I暦_朖b朢d朞p朶",
+    0x2D44: '%桮-枀7柾:楂@栢D槅K桒P茈a杆f楳k椶r棊t植}桌',
+    0x2D45: '9搆:杠C椁N楽P墫b栝d梹i櫉t忻',
+    0x2D46: '!懽,歺G毘m决t冲|沲',
+    0x2D47: ')洩0况5汎8濼F汹V澔[凉_凄h浅',
+    0x2D48: ')减/渇D濕E温P滚S瀁\\潄k澂n澗t潜',
+    0x2D49: ':瀬G竈T烱V炰k烟q炤',
+    0x2D4A: '&焼(讌4熏;争E尒F墻X羝[犂`氂',
+    0x2D4B: '"獪5珉?珎C瑯E毬[碯q缾r甆',
+    0x2D4C: ',堺-畮5畧<叠>疎]癡~佰',
+    0x2D4D: '!皁4盇8盗O真_睁e叡m瞒q眙',
+    0x2D4E: '$榘3碪[鑛y御',
+    0x2D4F: ')龝7禀>稾A乩E頴H穂^窰k竸|筞',
+    0x2D50: '+椾-筝6蓑O籘o糺',
+    0x2D51: '$帋)紥J淖M紬j綳y繢}継',
+    0x2D52: '(鉢+鑵2辠3罸8覊@羡A羣J翄Y飜]攷e秐g秏k炅l躭{聴',
+    0x2D53: '!粛#宍,毓@脬D脇K胷^膓a脚~臈',
+    0x2D54: '!髗$卧4擧@桁F舩G艊a茆h楙o菀v茘',
+    0x2D55: ')茎-荘.苺G荽P塟T蕚Z莆[莅a盖s菔',
+    0x2D56: '.耤5葯<蘓?檗d鼄u鼅{蜗',
+    0x2D57: '+螗-蝈0蟇;惷I衞X褎[衮`帬c裡s絝',
+    0x2D58: '1覧3甪6触M咏V愬',
+    0x2D59: "'諌,謁=諩A嘩L譲O讃W竪Y艷_猪`犲c貘e狸",
+    0x2D5A: '4貭=賛H赱N趂_蹟c跥~蹻',
+    0x2D5B: '/躱B輙C軽]辢^辧i廵z迯',
+    0x2D5C: '/迨?徧@徨H逓Z迩[邉t隣',
+    0x2D5D: '#酧/醖V鈎e舖h耡',
+    0x2D5E: '!鐘$煅&熔(鏁;銹C鋳J鑚P閇a濶',
+    0x2D5F: '(陥,堦-陏.昜5磒;隠C鳫F隽K雑L鷄c蜺s靚',
+    0x2D60: '!鞌-靭0韮V頋x餠y舘',
+    0x2D61: '2駮4駞G駈Y髄Z軆b騌j欝',
+    0x2D62: '"鰌)鱓,鼈5鵶A鵞Q塩R碱_菻`庅b黄u皷~斋',
+    0x2D63: '+尨-亀',
+    0x2D6B: '3刱_剳',
+    0x2D6F: '}脣',
+    0x2D71: 'C嗢d嗔',
+    0x2D73: 'E囓',
+    0x2D75: ':陔R垛',
+    0x2D7A: 'D妍',
+    0x2D7E: 'j冤',
+    0x2E25: '{崟',
+    0x2E28: 'L廏',
+    0x2E29: 'h彑',
+    0x2E2B: '[恚t悛',
+    0x2E2D: 'y愨',
+    0x2E2F: 'z朸|捍',
+    0x2E30: '(搋',
+    0x2E31: ':挲D攟r剡',
+    0x2E33: '(攨{挎',
+    0x2E36: '?勅E槣T敿',
+    0x2E37: ')斵',
+    0x2E38: 'p煊',
+    0x2E39: '6曍',
+    0x2E3A: '&昝3肭',
+    0x2E3B: '"椏',
+    0x2E3D: 'b桊s稜',
+    0x2E3E: '?箠',
+    0x2E3F: '-榲',
+    0x2E40: '=櫁',
+    0x2E41: 't檩',
+    0x2E46: 'p泐',
+    0x2E47: '1汳9汧G浤',
+    0x2E48: 's澣',
+    0x2E49: '/泙;湼',
+    0x2E4A: 'k溦',
+    0x2E4C: '5淥{溆',
+    0x2E4D: '=洸',
+    0x2E4E: 'A瀲V頀]淠r潴',
+    0x2E50: 'm炱',
+    0x2E52: ']煛',
+    0x2E54: 'R燾',
+    0x2E5A: '@玳x璢',
+    0x2E5F: 'o疸',
+    0x2E60: 'J皐`皡',
+    0x2E62: 'O眭_矁',
+    0x2E68: 'N耠o稙',
+    0x2E6B: 'T笄',
+    0x2E6C: "&篠'笮>筙F篦",
+    0x2E6F: '5泔C餈',
+    0x2E70: 'b絏',
+    0x2E71: 'Z縧|絣',
+    0x2E73: '(徭]絖t纉',
+    0x2E74: '.甖1罈P羂Q罘',
+    0x2E76: '_耷',
+    0x2E7C: '.茜',
+    0x2E7D: '$菰',
+    0x2F25: '-樢.蔇',
+    0x2F2A: 'Z蚋d螵s蟊',
+    0x2F2D: 'y袵',
+    0x2F2F: ']繈',
+    0x2F31: '+覻C觵}詾',
+    0x2F33: 'c謚',
+    0x2F36: '9豼',
+    0x2F38: '3趑o跗',
+    0x2F3A: '^蹮',
+    0x2F3B: 'c帲',
+    0x2F3C: '-輼',
+    0x2F3D: ']逎',
+    0x2F40: 'S酏',
+    0x2F42: '1耙',
+    0x2F44: '_鐚',
+    0x2F4A: '.邴J徏',
+    0x2F51: 'X糇',
+    0x2F54: 'v髡',
+    0x2F57: '_骾',
+    0x2F58: '\\鱑p鰛',
+    0x2F59: 's鳬',
+    0x2F5A: 'H鵄',
+    0x2F5D: '<滷I麤\\猊',
+    0x2F5E: 'B黉f鬒}晁',
+    0x2F5F: 'E蚡',
+    0x3330: '!壹:迺L乹Q貳`亯f忈l讐x彷',
+    0x3331: 'L徠',
+    0x3332: '@俻Q徺]価z児',
+    0x3333: '#両*亓0冊<氷D凛N凾w剰{勦',
+    0x3334: '!釼#剤(刼u阨}叁',
+    0x3335: ')叜N悋V騃\\呉d吕s虖',
+    0x3336: '#齩*鬨B誒Z吅',
+    0x3337: 'h迴',
+    0x3338: 'n坯',
+    0x3339: '/逩D嬭c姉',
+    0x333C: '!碕R賬',
+    0x333D: '(厨*広/庁B絃H强L瀰T份u徳',
+    0x333E: '}癒',
+    0x333F: '"慨$眘?凴U嬾X懴[愳',
+    0x3340: 'E抛P拕',
+    0x3341: '1搥~択',
+    0x3342: '*拡=収C効D教V歛`觔w旯',
+    0x3343: '/晋>闇B煖W朂i夲',
+    0x3344: '%盃I慄',
+    0x3345: "'椘P罇m艪",
+    0x3346: '!讙3残<殻e污t盅z没',
+    0x3347: ')渫0湟@洚J洟U濬^澹_悽o浄p婬{遊',
+    0x3348: ';泝^柒',
+    0x3349: '.澁J烖h焳j鍊',
+    0x334A: '(醼X觝',
+    0x334C: ',畍6画7蹯>踈{発',
+    0x334E: '7硎s禥',
+    0x334F: '7廩:穉Y窓^窑q咲',
+    0x3350: '*鉗+牋e穅',
+    0x3351: '.纍<経G绮L緑\\綫k緐m捴r綉',
+    0x3352: '#纎(钵0置4駡8覉?譱Y繙[燿v聡',
+    0x3353: '3肻G臙}髕',
+    0x3354: 'E柁F舡a泖',
+    0x3355: 'a葢h萆w蘂',
+    0x3356: '5薬R蟁|虱',
+    0x3357: '.蠎8蠏`裠r襃s袴',
+    0x3358: '!韈0斍4觧',
+    0x3359: 'A哗X豊',
+    0x335A: '{踨',
+    0x335B: 'p廸',
+    0x335D: '#詶;埜',
+    0x335E: '!鈡/剗=鉄B鑒',
+    0x335F: '4郄=隷C鴈I鵰s静',
+    0x3360: 'T顛X顕b飃',
+    0x3361: 'Z躰b騣y鱻',
+    0x3362: '^麪_蔴u皼}斉',
+    0x3363: '!歯+竜',
+    0x336B: '3剏',
+    0x336C: 'k怱',
+    0x3373: 'E齧',
+    0x3424: 'S岽',
+    0x3438: 'u忞',
+    0x343A: '[圬',
+    0x343E: '8篚',
+    0x3441: '8耢w艤',
+    0x3449: '/洴',
+    0x3451: 'u煢',
+    0x3454: 'R焘',
+    0x345D: 'k畭',
+    0x345E: ';肬G痾',
+    0x3461: '&椀',
+    0x3466: '"墝',
+    0x3468: '*籼',
+    0x3471: 'Z縚',
+    0x3474: '1壜',
+    0x3478: '*郅',
+    0x347D: '$菇',
+    0x3534: 'M譛{謭',
+    0x3541: 'V醾',
+    0x3550: 'S飈',
+    0x3557: '9鱶',
+    0x355D: '\\貎',
+    0x355E: 'v芾',
+    0x3930: '-卋:廼L亁R於T伍x髣',
+    0x3932: 'F伝',
+    0x3934: '(刧9懃[陞`恊',
+    0x3935: 's嘑w龢',
+    0x3936: 'Z諠^喞',
+    0x3937: 'p囲',
+    0x3939: 'D妳',
+    0x393B: '9寳n岗x峄',
+    0x393C: 'R账',
+    0x393D: 'o複',
+    0x393E: 'G賉L慂a悪}瘉',
+    0x3940: '"摃B摭',
+    0x3941: '|拠',
+    0x3942: 'C俲O啔',
+    0x3943: '0晄',
+    0x3944: 'D覈}櫂',
+    0x3945: 'm艫',
+    0x3946: '4殖',
+    0x3947: '5氾o净',
+    0x3948: ';遡',
+    0x3949: '(浜D欒V礮',
+    0x394A: '`髦',
+    0x394C: '-畆',
+    0x3950: 'P篭[鬻c餹',
+    0x3951: 'y絵',
+    0x3952: '0寘[曜k炔',
+    0x3954: 'w薦',
+    0x3955: '<崋d朦h菝w蕋',
+    0x3956: '<囌C乕R螡',
+    0x3957: 's綯',
+    0x3958: '!韤)槻',
+    0x3959: '?証',
+    0x395A: '/売6頼',
+    0x395D: '#醻',
+    0x395E: '/剷=銕B鉴o穽q坂',
+    0x395F: 'I彫h覇',
+    0x3960: 't喰',
+    0x3961: 'g鬪y尠',
+    0x3962: '#鯽',
+    0x396B: '/刟3剙',
+    0x396C: 'k悤',
+    0x3A28: 'L厩',
+    0x3A2F: '|擀',
+    0x3A3B: '}枱',
+    0x3A40: '4桕',
+    0x3A6A: '|篪',
+    0x3A78: '}胼',
+    0x3A79: 'p臕',
+    0x3B2D: 'D衂',
+    0x3B39: '"趵',
+    0x3F30: 'L幹x倣',
+    0x3F34: '}蓡',
+    0x3F35: 's謼',
+    0x3F37: '{硎',
+    0x3F3D: 'o覆',
+    0x3F3E: 'G卹',
+    0x3F3F: '$慎',
+    0x3F40: 'O掊',
+    0x3F42: 'O启',
+    0x3F44: 'r碁',
+    0x3F45: 'm艣',
+    0x3F46: '!驩)亗+帰',
+    0x3F47: 'o凈',
+    0x3F49: '&済V砲',
+    0x3F4A: '(鷰`牦',
+    0x3F4C: '<疂',
+    0x3F51: 'm搃',
+    0x3F55: 'd懞',
+    0x3F56: '1兿',
+    0x3F59: 'Y艶',
+    0x3F5E: '`閆',
+    0x3F5F: '4隙5殞I琱',
+    0x3F61: 'L駅y尟',
+    0x4530: 'L榦Q贰',
+    0x4533: '6宂',
+    0x4534: '!剱',
+    0x4536: 'f嫐',
+    0x4537: 'U嚮h廻',
+    0x453D: 'S彦',
+    0x453F: 'm勠',
+    0x4541: 'F換',
+    0x4545: 'm樐',
+    0x4546: '+皈[氯',
+    0x4547: '8泺t渕',
+    0x454B: 'z産',
+    0x454C: '<疉',
+    0x454E: 'C碌u禄',
+    0x454F: 'E颖',
+    0x4551: '"納d县',
+    0x4555: 'd濛',
+    0x4556: 'K虞',
+    0x4557: 'F术',
+    0x4558: '7讠G訥',
+    0x455D: '>钅',
+    0x455E: '!锺`闫',
+    0x455F: '5陨',
+    0x4560: '6響N顏d饣k飰v馀',
+    0x4562: '`幺',
+    0x4563: '$齡',
+    0x4628: 'L廐',
+    0x4660: 't皲',
+    0x472C: 'M蠁',
+    0x4734: '"谪{谫',
+    0x4735: '9讞',
+    0x4736: 'o赍',
+    0x4742: '6钚p钼',
+    0x4749: '1闶',
+    0x474E: '\\韞',
+    0x4752: '"饗',
+    0x4757: 'z鯖',
+    0x4759: 'N鰺',
+    0x4B30: '!壱P亊Q弐R扵W亙l雠n令r仭',
+    0x4B31: '-伫0侫D伶L徕j爼x倩|値',
+    0x4B32: '1仮H傲N僧_傻',
+    0x4B33: '!内"全$捌>冷Q刄T苅U刋[别',
+    0x4B34: '!剣5労6勲k巵t卿',
+    0x4B35: 'j嗬{哌',
+    0x4B36: '"谘B诶f娚h単',
+    0x4B37: ',嘆/尜I器L噢X嚥Z厳h囘o国r円s団t図',
+    0x4B38: '.埀P塡S塭^増d壇i圧l塁p壌q垻}夛',
+    0x4B39: '8奂:弉>奥?匳t嬢{娯',
+    0x4B3A: '/聟G裊I嬷',
+    0x4B3B: '"冦1実7冩C対R脲a層g歧y嶌~崕',
+    0x4B3C: '!嵜#峥+柃/嶺2巓3巌8钜S帯^幤',
+    0x4B3D: "$厦'廃*廣,厰/廰K弾L弥\\徃g径",
+    0x4B3E: '*怵@恆[情~悩',
+    0x4B3F: '@憎J応K怜P懊Q懑S懲t戻',
+    0x4B40: '=拝F抜I拐S扺f拴',
+    0x4B41: '*挣5捨F换G挿',
+    0x4B42: '5摂6携:撹',
+    0x4B43: '9晴G暨M昿R曵X曽',
+    0x4B44: '-枩D覈V栓v桟',
+    0x4B45: '4榔7栄D様E概S楕V横Y鞒a検i橱l櫛m舻o桜p権',
+    0x4B46: '!歓*歴.殁8殱U気Z氲v沉',
+    0x4B47: 'A冽Y涙a清g涵l凅',
+    0x4B48: '5涣F磆J渓K凖L澑W漢X満_滞f溉t濳',
+    0x4B49: '!沢%澳+濫.渋1渖7嚠@潅G竃j錬k菸s焕u搧w熈',
+    0x4B4A: '.営8燗>爵E尓b犠t猜x狰',
+    0x4B4B: '+獣,猟>玲c璜q缾w什',
+    0x4B4C: '6畵<畳Q痊[痳g瘟y癲',
+    0x4B4D: 'A蘯E直V衆Y睛s暸{矗',
+    0x4B4E: '!笶7研9峺V磺[砿g秘{禅',
+    0x4B4F: ')穐<称C稲L穏{筺',
+    0x4B50: '6簔;簒D簧R籖a精l粫',
+    0x4B51: ';糸T練Z縁d県j绷m総n縦v縄y缋~纒',
+    0x4B52: "!続#繊'欠+缶8羇>羚G羮N翎Z翺[曜\\耂n聆w聨|肀",
+    0x4B53: ';楜a角e脳}髌',
+    0x4B54: '"臓(臭4挙7舎m苓',
+    0x4B55: '!茲,莒:菁?莽B萠d矇',
+    0x4B56: ')藍+蔵1芸2籔:芦?檘G処j蜈q蜻',
+    0x4B57: '$蛍6蝿@蠧F術l刾o褐s绔~繿',
+    0x4B58: '$襾&覃0覚2観a侉q誤z請',
+    0x4B59: '6謠F訳J読K変Y艳c獏d狢s贮',
+    0x4B5A: '#戝1賎;贈h践~屩',
+    0x4B5B: ')躍F輌R轂U転X軣^弁',
+    0x4B5C: '2逸9逹G遙P遅T辟[辺^阝r鄙w鄹',
+    0x4B5D: '+酢4醸6釆8釈B釡X鈴e舗p銭',
+    0x4B5E: "'鎭=鐡?鈬]闔i関l阝",
+    0x4B5F: '0隆5殒:険I凋L鶏P難X零b癨o霊p青q靖r靛s靜',
+    0x4B60: '-靱D領H頚S類o餝',
+    0x4B61: '"饋0駄?騈E騒G駆M験Y膸_髪g闘h閙',
+    0x4B62: ';鴒G鴬O鵉X梺\\麸`麽f黒h黙x鼡',
+    0x4B63: '$齢',
+    0x4B64: 'U亶',
+    0x4B66: '7俣',
+    0x4B68: '.仂',
+    0x4B6A: '"羃&沍',
+    0x4B74: '!囹',
+    0x4B75: 'w埓',
+    0x4B76: '=埴',
+    0x4B78: 't夊',
+    0x4B79: 'T奨',
+    0x4B7E: 'j寃',
+    0x4C23: '0屓?屶',
+    0x4C25: '2嵛9嵳',
+    0x4C28: 'L厩g廛',
+    0x4C29: 'b彍',
+    0x4C2F: 'a戬',
+    0x4C34: 't挝',
+    0x4C35: 'J撸',
+    0x4C37: 'D旙',
+    0x4C3A: '3肭U杁[桙',
+    0x4C3B: '"桠1枘`杤',
+    0x4C3F: 'h槇z椢',
+    0x4C41: 'F蔸w舣',
+    0x4C43: '3檪9槞?橥E枦Y欅',
+    0x4C44: 'F歎',
+    0x4C47: 'n沭',
+    0x4C4C: '5渌',
+    0x4C4D: '=潢c澙',
+    0x4C4F: '$潆&滝+瀞',
+    0x4C51: 'u茕',
+    0x4C52: ':煺',
+    0x4C54: 'G燠',
+    0x4C55: 'A丬',
+    0x4C56: '8犟',
+    0x4C5C: ':珱a瓴',
+    0x4C5F: 'X癀i痫',
+    0x4C60: '"疖t皹',
+    0x4C62: 'f瞋',
+    0x4C63: 'v砹',
+    0x4C65: 'd磙e碹',
+    0x4C67: 'u祢',
+    0x4C68: '>秫',
+    0x4C69: '\\稆_穣',
+    0x4C6B: 'b筌',
+    0x4C6C: 'F箟',
+    0x4C6E: 'B簱',
+    0x4C6F: 'C糍{糨',
+    0x4C71: 'Z绦',
+    0x4C72: ']稹e緼',
+    0x4C73: '(徭]絋',
+    0x4C79: 'N肷Y腽k腟',
+    0x4C7C: 'E芮',
+    0x4C7D: 'M荃j茣',
+    0x4D22: '*莵',
+    0x4D29: '%蝰b蛉',
+    0x4D2C: '<蟥',
+    0x4D2D: 'u衲',
+    0x4D2F: ']襁s繝z褝',
+    0x4D30: '2袮',
+    0x4D33: 'Y嚯c谥',
+    0x4D38: 'o呋',
+    0x4D3C: 'l辶',
+    0x4D41: '4醛v釛',
+    0x4D44: '[錆k镎',
+    0x4D47: ',锪T镄{鐾',
+    0x4D48: '2锿5镌b鈩',
+    0x4D4A: 'l陧',
+    0x4D4D: 'a绱',
+    0x4D4F: '9颌',
+    0x4D50: ':飑S飚',
+    0x4D51: 'T饂',
+    0x4D55: 't鬮',
+    0x4D58: 'X鯣u鳐',
+    0x4D59: '4鲦N鯵s凫',
+    0x4D5A: 'l鵆',
+    0x4D5B: '5鶫~鷆',
+    0x4D5C: 'k鵐',
+    0x4D5D: 'I麁',
+    0x4D5F: 'p齄{韲',
+    0x4D60: 'G腭',
+    0x5130: 'Q貮W亘',
+    0x5134: '!釖',
+    0x5135: 'j诃',
+    0x5138: 'M凃',
+    0x513A: 'G袅',
+    0x513B: 'R氽',
+    0x513D: 'g迳',
+    0x5145: 'm舮',
+    0x5149: 'k蔫',
+    0x514E: '[鉱',
+    0x5151: ';纟',
+    0x5156: '?蘖',
+    0x515E: ']阖',
+    0x5161: '"馈',
+    0x516A: '&冴',
+    0x5179: 'T獎',
+    0x5273: ']纊',
+    0x6921: '&・9々<ーR〈S〉T《U》',
+    0x6924: '!ぁ"あ#ぃ$い%ぅ&う\'ぇ(え)ぉ*お+か,が-き.ぎ/く0ぐ1け2げ3こ4ご5さ6ざ7し8じ'
+            '9す:ず;せ<ぜ=そ>ぞ?た@だAちBぢCっDつEづFてGでHとIどJなKにLぬMねNのOはPば'
+            'QぱRひSびTぴUふVぶWぷXへYべZぺ[ほ\\ぼ]ぽ^ま_み`むaめbもcゃdやeゅfゆgょhよ'
+            'iらjりkるlれmろnゎoわpゐqゑrをsん',
+    0x6925: '!ァ"ア#ィ$イ%ゥ&ウ\'ェ(エ)ォ*オ+カ,ガ-キ.ギ/ク0グ1ケ2ゲ3コ4ゴ5サ6ザ7シ8ジ'
+            '9ス:ズ;セ<ゼ=ソ>ゾ?タ@ダAチBヂCッDツEヅFテGデHトIドJナKニLヌMネNノOハPバ'
+            'QパRヒSビTピUフVブWプXヘYベZペ[ホ\\ボ]ポ^マ_ミ`ムaメbモcャdヤeュfユgョhヨ'
+            'iラjリkルlレmロnヮoワpヰqヱrヲsンtヴuヵvヶw゛x゜',
+    0x6937: ')粂',
+    0x693C: '2鴫6雫',
+    0x6946: 'd凪w匂',
+    0x6948: '#硲+畠8噺',
+    0x694B: '{麿',
+    0x694C: ']杢h匁z鑓',
+    0x6951: '0儖^凩',
+    0x6952: ']叺',
+    0x6953: '&哘;啝u囎',
+    0x6954: ')圦*圷8垳:垪;垰B埖K塰Q墹W墸\\壗_壥',
+    0x6955: 'N嬶',
+    0x6956: '&乢,妛.岻0岼2峅3岾N嵶W嶐',
+    0x6957: '7弖;彁j怺',
+    0x6959: 'K挧^掵',
+    0x695A: '1擶s暃~暼',
+    0x695B: '7朷{椦',
+    0x695C: ')椥-椨0椣1椡9楾C榁O槝S樮q橸',
+    0x695D: '6欟',
+    0x695E: 'c溂',
+    0x695F: 'p熕',
+    0x6961: '&瓲6甼:畉>畩',
+    0x6962: 'm硴s碵',
+    0x6963: '%礇N穃s笂',
+    0x6964: 'I簓L簗N篶d粐f粭q糀t糘',
+    0x6965: 'O縅m纃n緕v纐',
+    0x6967: '3膤\\艝',
+    0x6968: 'M萢h蓙',
+    0x6969: 'F蘰[蚫b蛯',
+    0x696A: ',蟐^袰a裃m褄',
+    0x696B: "'襷\\諚",
+    0x696D: '?躾@軅A軈Z轌z逧',
+    0x696E: '(遖\\釟',
+    0x696F: "'錻[閊]閖",
+    0x6970: '#陦X靹]鞆`鞐',
+    0x6971: '$颪R駲t髞}髱~髷',
+    0x6972: ';鮖@鮴E鯏F鯑N鯲`鰰e鱚~鵈',
+    0x6973: '#鵤',
+    0x6F24: 'WㄱXㄴYㄷZㄹ[ㅁ\\ㅂ]ㅅ^ㅇ_ㅈ`ㅊaㅋbㅌcㅍdㅎeㄲiㄸnㅃpㅆqㅉrㅏsㅐtㅑvㅓwㅔ'
+            'xㅕzㅗ{ㅘ~ㅛ',
+    0x6F25: "!ㅜ%ㅠ&ㅡ'ㅢ(ㅣ",
+    0x6F48: '_가`각a갂b간c갇d갈e갉f감g갑h값i갓j갔k강l갖m갗n같o갚p갛q개r객s갠u갤v갬w갭'
+            'x갯y갰z갱{갸|갹}걀~걔',
+    0x6F49: '!거"걱$건%걷&걸\'걹)검*겁+것,겄-겅.겆0겉1겊2겋3게4겐5겔6겜7겟8겠9겡:겨;격'
+            '<겪=견>겯?결@겸A겹C겼D경E곁G계I곗J고K곡L곤M곧N골O곪P곬Q곯R곰S곱T곳U공V곶'
+            'W곺X과Y곽Z관[괄\\괌]괍^괏_광`괘a괙b괜c괠d괨e괩f괭g괴h괸i괼j굄l굉m교n구o국'
+            'p군q굳r굴s굵t굶u굼v굽w굿x궁y궂z궈{권|궐~궤',
+    0x6F4A: '"귀#귄$귈%귐&귑\'귓(규)균*귤+귬,그-극.근/귿0글1긁2금3급4긋5긍6기7긱8긴9긷'
+            ':길;김<깁=깃>깄?깅@깊C까D깍E깎F깐G깔H깜I깝J깠K깡L깢M깥N깨O깩P깬Q깰R깸S깹'
+            'T깻U깼V깽W꺄X꺅Y꺼Z꺽[꺾\\껀]껄^껌_껍`껏a껐b껑c께d껜e껴f꼍g꼬h꼭i꼰j꼴k꼼'
+            'l꼽m꼿n꽁o꽂p꽃q꽈r꽉s꽌t꽘u꽜v꽝w꽤x꽥y꽹z꾀{꾄|꾈}꾐~꾕',
+    0x6F4B: '!꾜"꾸#꾹$꾼%꿀&꿇\'꿈(꿉)꿋*꿍+꿎,꿔-꿘.꿩/꿰0뀀2뀌3뀍4뀐5뀔6뀜7뀝8뀨9끄'
+            ':끅;끈<끊=끌>끓?끔@끕A끗B끙C끝D끼E끽F낀G낄H낌I낍J낏K낐L낑O나P낙Q낚R난S낟'
+            'T날U낡V남W납X낫Y났Z낭[낮\\낯]낱^낳_내`낵a낸b낻c낼d냄e냅f냇g냈h냉i냐j냑k냠'
+            'l냥m냬n너o넉q넋r넌s넏t널u넓v넘w넙x넛y넜z넝{넞|넣}네~넥',
+    0x6F4C: '!넨"넬#넴$넵%넷&녀\'녁(년)념*녑+녓,녔-녕.녘/녜0노1녹2녺3논4놀5놈6놉7놋8농'
+            '9높:놓;놔<놨=뇌>뇐?뇔@뇜A뇨B뇽C누D눅E눈F눋G눌H눓I눔J눕K눗L눠M눳N눴O뉘P뉜'
+            'Q뉠R뉨S뉩T뉴U늄V늉W느X늑Y는Z늘[늙\\늠]늡^능_늦`늪a늬b니c닉d닌e닐f님g닙h닛'
+            'i닝j닢m다n닥o닦p단q닫r달s닭t닮u닳v담w답x닷y당z닺{닻|닿}대~댁',
+    0x6F4D: '!댄"댈#댐$댑%댓&댔\'댕(더)덕*던+덛,덜-덟.덤/덥0덧1덨2덩3덪4덫5덮6데7덱8덴'
+            '9델:뎀;뎃<뎅=뎌>도?독@돈A돋B돌C돐D돔E돕F돗G동H돛I돼J됀K됐L되M된N될O됨P됩'
+            'Q됫R됬S두T둑U둔V둘W둠X둡Y둣Z둥[둬\\뒀]뒈^뒤_뒷`듀a듐b드c득d든e듣f들g듬h듭'
+            'i듯j등k디l딕m딘n딛o딜p딤q딥r딧s딨t딩u딪x따y딱z딲{딴|딷}딸',
+    0x6F4E: '!땀"땁#땃$땄%땅&땋\'때(땍)땐*땔+땜,땝-땟.땠/땡0떠1떡2떤3떨4떫5떰6떱7떳8떴'
+            '9떵:떻;떼<뗀=뗄>뗌?뗏@뗑A또B똑C똔D똘E똥F뙤G뚜H뚝I뚤J뚫K뚬L뚱M뛰N뛴O뛸P뜀'
+            'Q뜁R뜨S뜩T뜬U뜯V뜰W뜸X뜹Y뜻Z띄[띈\\띠]띤^띨_띰`띱a띵d라e락f란g랄h람i랍j랏'
+            'k랐l랑m랗n래o랙p랜q랠r램s랩t랫u랬v랭w랴x략y량z러{럭|런}럴~럼',
+    0x6F4F: '!럽"럿#렀$렁%렇&레\'렉(렌)렐*렘+렙,렛-렝.려/력0련1렬2렴3렵4렷5렸6령7례8로'
+            '9록:론;롤<롬=롭>롯?롱@뢰A료B룡C루D룩E룬F룰G룸H룹I룻J룽K뤄L뤼M류N륙O륜P률'
+            'Q륨R륭S르T륵U른V를W름X릅Y릇Z릉[릎\\리]릭^린_릴`림a립b릿c링f마g막h만i많j맏'
+            'k말l맑m맘n맙o맛p망q맞r맡s맣t매u맥v맨w맬x맴y맵z맷{맸|맹}맺~먀',
+    0x6F50: '!머"먹#먼$멀%멈&멉\'멋(멍)멎*멓+메,멕-멘.멜/멤0멥1멧2며3멱4면5멸6몃7몄8명'
+            '9몇:모;목<몫=몬>몰?몸@몹A못B몽C뫃D뫼E묏F묘G무H묵I묶J문K묻L물M묽N뭄O뭇P뭉'
+            'Q뭍R뭏S뭐T뭔U뭘V뭡W뭣X뮈Y뮌Z뮤[므\\믄]믈^믐_미`믹a민b믿c밀d밈e밉f밋h밍i및'
+            'j밑k뮴m바n박o밖p반q받r발s밝t밟u밤v밥w밧x방y밭z배{백|밴}밷~밸',
+    0x6F51: '!뱀"뱁#뱃$뱄%뱅&버\'벅(번)벋*벌+범,법-벗.벘/벙0벚1베2벡3벤4벧5벨6벰7벱8벳'
+            '9벵:벼;벽<변=별>볌?볍@볏A볐B병C볒D볕E보F복G볶H본I볼J봄K봅L봇M봉N봐O봔P봤'
+            'Q뵈R뵉S뵌T뵐U뵘V뵙W뵤X부Y북Z분[붇\\불]붉^붐_붑`붓a붕b붙c붜d뷔e뷰f브g븍h븐'
+            'i블j븜k븝l븟m비n빅o빈p빋q빌r빎s빔t빕u빗v빙w빚x빛{빠|빡}빤~빨',
+    0x6F52: '!빰"빱#빳$빴%빵&빻\'빼(빽)뺀*뺄+뺌,뺏-뺐.뺑/뺘0뺨1뻐2뻑3뻔4뻗5뻘6뻠7뻣8뻤'
+            '9뻥:뻬;뼈<뼉=뼘>뼝?뽀@뽁A뽄B뽈C뽐D뽑E뽕F뾰G뿀H뿅I뿌J뿍K뿐L뿔M뿜N뿝O뿡P쁘'
+            'Q쁙R쁜S쁠T쁨U쁩V삐W삑X삔Y삘Z삠[삣\\삥_사`삭a삮b삯c산d삳e살f삵g삶h삼i삽j삿'
+            'k샀l상m샅n새o색p샌q샏r샐s샘t샙u샛v샜w생x샤y샥z샨{샬|샴}샷~샹',
+    0x6F53: '!서"석#섞$선%섣&설\'섥(섦)섧*섪+섬,섭-섯.섰/성0섶1세2섹3센4셀5셈6셉7셋8셍'
+            '9셑:셔;션<셧=셨>셰?소@속A솎B손C솔D솜E솝F솟G송H솥I솨J솩K솰L쇄M쇈N쇗O쇠P쇤'
+            'Q쇨R쇰S쇱T쇳U쇼V쇽W숀X숄Y숍[수\\숙]순^숟_술`숨a숩b숫c숭d숯e숱f숲g숴h쉐i쉘'
+            'j쉬k쉰l쉴m쉼n쉽o쉿p슁q슈r슉s슐t슘u슛v슝w스x슥y슨z슬{슭}슴~습',
+    0x6F54: '!슷"승#시$식%신&싣\'실(싫)심*십+싯,싱-싶0싸1싹2싼3쌀4쌈5쌉6쌋7쌌8쌍9쌓:쌔'
+            ';쌕<쌘=쌜>쌤?쌧@쌨A쌩B쌰C썃D썅E써F썩G썬H썰I썲J썸K썹L썼M썽N쎄O쎈P쎙Q쏘R쏙'
+            'S쏜T쏟U쏠V쏨W쏭X쏴Y쏵Z쐐[쐬\\쐰]쐴^쐼_쐿`쑤a쑥b쑨c쑬d쑴e쑹f쒀g쒔h쓔i쓕j쓰'
+            'k쓱l쓴m쓸n씀o씁p씌q씐r씨s씩t씬u씰v씸w씹x씻y씽|아}악~안',
+    0x6F55: '!앉"않#알$앎%앓&암\'압(앗)았*앙+앞,앟-애.액/앤0앨1앰2앱3앳4앴5앵6야7약8얀'
+            '9얄:얇;얌<얍=얏>얐?양@얕A얗B얘C얜D어E억F얶G언H얹I얺J얻K얼L얽M엄N업O없P엇'
+            'Q었R엉S엊T엌U엎V에W엑X엔Y엘Z엠[엡\\엣]엥^여_역`엮a연b열c엶d엷e염f엽g엾h엿'
+            'i였j영k옆l옇m예n옌o옐p옛q오r옥s온t올u옭v옮w옳x옴y옵z옷{옹|옺}옻~와',
+    0x6F56: '!왁"완#왈$왐%왑&왓\'왔)왜*왝+왠,왱-외.왹/왼0욀1욈2욋3욍4요5욕6욘7욥8욧9용'
+            ':우;욱<운=욷>울?욹@욺A움B웁C웃D웅E워F웍G원H월I웜J웝K웟L웠M웡N웨O웩P웬Q웰'
+            'R웸S위T윅U윈V윌W윔X윗Y윙Z유[육\\윤]율^윰_융`윷a으b윽c은d을e읊f음g읍h응i의'
+            'j이k익l인m일n읽o잃p임q입r잇s있t잉u잊v잎w왕y자z작{잔|잖}잘~잠',
+    0x6F57: '!잡"잣#잤$장%잦&잧\'재(잭)잰*잴+잼,잽-잿.쟀/쟁0쟈1쟉2쟌3쟘4저5적6전7절8젊'
+            '9점:접;젓<젔=정>젖?제@젝A젠B젤C젬D젭E젯F져G젼H졌I조J족K존L졸M졺N좀O좁P종'
+            'Q좆R좇S좋T좌U좍V좐W좔X좜Y좝Z좟[좠]좨^좬_좰`좸a죄b죈c죌d죔e죕f죗g죠h죤i죰'
+            'j죱k죵l주m죽n준o줄p줆q줌r줍s줏t중u줘v줬w쥐y쥔z쥘{쥠|쥡}쥬~쥰',
+    0x6F58: '!쥴"즈#즉$즌%즐&즘\'즙(증)지*직+진,짇-질.짊/짐0집1짓2징3짖4짙5짚8짜9짝:짠'
+            ';짢<짤>짧?짬@짭A짯B짰C짱D째E짹F짼G쨀H쨈I쨉J쨋K쨌L쨍M쨘N쩌O쩍P쩐Q쩔R쩜S쩝'
+            'T쩡U쪄V쪘W쪼X쪽Y쫀Z쫄[쫌\\쫍]쫑^쫒_쫓`쫘a쫙b쬐c쬔d쬘e쬠f쬡g쭁h쭈i쭉j쭐k쭘'
+            'l쭙m쭝n쭤o쮸p쯔q쯤r쯧s찌t찍u찐v찔w찜x찝y찡z찢{찧~차',
+    0x6F59: '!착"찬#찮$찯%찰&참\'찹(찻)찼*창+찾,찿-채.책/챈0챌1챔2챕3챘4챙5챠6챤7챰8챱'
+            '9처:척;천<철=첨>첩?첫@청A체B첵C첸D첼E쳇F쳐G쳤H초I촉J촌K촐L촘M촙N촛O총P촬'
+            'Q최R쵸S추T축U춘V출W춤X춥Y춧Z충[춰\\췄]췌^취_츄`츠a측b츰c층d치e칙f친g칠h칡'
+            'i침j칩k칫l칭o카p칵q칸r칼s캄t캅u캇v캉w캐x캑y캔z캘{캠|캡}캣',
+    0x6F5A: '!캥"캬#캭$커&컨\'컬(컴)컵*컷,컹.케/켁0켄1켈2켐3켑4켓5켕6켜7켠8켤9켬:켭;켯'
+            '<켰=코>콕?콘@콜A콤B콥C콧D콩E콰F콱G콴H콸I쾀J쾅K쾌L쾍M쾡O쾰P쿄Q쿠R쿡S쿤T쿨'
+            'U쿰V쿳W쿵X쿼Z퀘[퀭\\퀴]퀵^퀸_큐`크a큰b클c큼d큽e킁f키g킥h킨i킬j킴k킵l킷m킹'
+            'p타q탁r탄s탈t탉u탐v탑w탓x탔y탕z태{택|탠}탤~탬',
+    0x6F5B: '!탭"탯#탰$탱%터&턱\'턴(털)텀*텁+텃,텄-텅.테/텍0텐1텔2템3텝4텟5텠6텡7텨8토'
+            '9톡:톤;톨<톰=톱>톳?통@퇘A퇴C투D툭E툰F툴G툼H툽I툿J퉁K퉤L퉷M튀N튄O튈P튐Q튑'
+            'R튓S튕T튜W튬Y트Z특[튼\\튿]틀^틈_틉`틋a틔b퇸c티d틱e틴f틸g팀h팁i팅l파m팍n팎'
+            'o판p팔q팜r팝s팟t팠u팡v팥w패x팩y팬z팰{팸|팹}팻~팼',
+    0x6F5C: "!팽#퍼$퍽%펀&펄'펌(펍)펏*펐+펑,페-펙.펜/펠0펨1펩2펫3펭4펴5펵6편7펼8폄9폅"
+            ':폈;평<폐=포>폭?폰@폴A폼B폽C폿D퐁E푀F푄G표H푯I푸J푹K푼L풀M품N풉O풋P풍Q퓌'
+            'R퓨S프U픈V플W픔X픕Y피Z픽[핀\\필]핌^핍_핏`핑c하d학e한f할g핥h함i합j핫k핬l항'
+            'm핱n해o핵p핸q핼r햄s햅t햇u했v행w햐x향y허z헉{헌|헐}헒~험',
+    0x6F5D: '!헙"헛#헝$헤%헥&헨\'헬(헴)헵*헷+헹,혀-혁.현/혈0혐1협2혓3혔4형5혜6호7혹8혼'
+            '9홀:홈;홉<홋=홍?화@확A환B활D홧E황F홰G홱H횃J회K획L횟M횡N효O후P훅Q훈R훌S훑'
+            'T훔U훗V훠W훤X훨Y훰Z훼\\휀]휑^휘_휙`휜a휠b휨c휩e휭f휴g휼h흄i흉j흐k흑l흔m흗'
+            'n흘o흙p흠q흡r흣s흥t흩u희v흰w흴x히y힉z힌{힐|힘}힙~힛',
+    0x6F5E: '!힝',
+    0x6F76: '!ㆁ"ㆆ#ㅿ$\ue8b0%\ue8b1@\ue8b2A\ue8b3B\ue8b4C\ue8b5D\ue8b6E\ue8b7F\ue8b8G\ue8b9H\ue8baI\ue8bbJ\ue8bcK\ue8bdL\ue8beM\ue8bfN\ue8c0O\ue8c1P\ue8c2Q\ue8c3R\ue8c4'
+            'S\ue8c5T\ue8c6U\ue8c7V\ue8c8W\ue8c9',
+    0x6F77: '!괵"굻#\ue8ca$궉%궝&궹\'귕(긇)긎*긏+긑,긔-깟.껭/꼉0꽐1꾿2끠3맄4앍5앏6앒7얫8얱'
+            '9옜:옝;웽<\ue8cb=윳>쭌',
+    0x704C: '*酞',
+    0x7058: 'o仫',
+    0x705B: 'q垴',
+    0x705C: 'C苊P苄',
+    0x705D: 'F萜\\蒈',
+    0x705F: '0甙9吖P咝Q哐T咴[咣a哚',
+    0x7060: '-喹:嗪L嗵T嘣X嘭g噻',
+    0x7061: '1岜',
+    0x7062: '*猹G馇N馕',
+    0x7063: '@憷',
+    0x7066: '@胬',
+    0x706B: 'B肼D肽L胩[脎_脒j腙',
+    0x706C: 'B炻C烀',
+    0x706D: ';砘?砜E砼',
+    0x7072: '}螨',
+    0x7073: '`筻n箢',
+    0x7074: '8舾',
+    0x7075: '#酰]踺',
+    0x7077: ']鬏q黢',
+}
+
+# Codes pymarc maps outside the EACC rows, used where no EACC code matches
+ODD_MAP = {
+    0x21203D: 0x2026,
+    0x212040: 0x201C,
+    0x7F2014: 0x2014,
+    0x7F2019: 0x2019,
+    0x7F2020: 0x201D,
+    0x7F2122: 0x2122,
+}
@@ -1,41 +1,239 @@
 #!/usr/bin/python
 
 import argparse
+import bisect
 import collections
+import concurrent.futures
+import functools
+import hashlib
+import json
 import os
 import re
-import subprocess
 import sys
+import time
+import zlib
 from lxml import etree
 
+import cache
+import fixindex
+import iso2709
+
 MARC21_NS = "http://www.loc.gov/MARC21/slim"
 NS = {'m': MARC21_NS}
 DEBUG = False
 UNICODE_CHECK = False
 
+CONTROLFIELD = '{%s}controlfield' % MARC21_NS
+DATAFIELD    = '{%s}datafield' % MARC21_NS
+LEADER       = '{%s}leader' % MARC21_NS
+RECORD       = '{%s}record' % MARC21_NS
+
+# Compiled XPath expressions, parameterized with XPath variables.
+#   usage: XPATH['subfield'](field, code='a')
+XPATH = {
+    'comments':     etree.XPath('.//comment()'),
+    'controlfield': etree.XPath('m:controlfield[@tag=$tag]', namespaces=NS),
+    'subfield':     etree.XPath('m:subfield[@code=$code]', namespaces=NS),
+    'subfields':    etree.XPath('m:subfield', namespaces=NS),
+}
+
+# IA metadata fields used by IAMarcXml, and their keyword argument names
+METADATA_FIELDS = collections.OrderedDict([
+    ('openlibrary',         'old_olid'),
+    ('openlibrary_edition', 'olid'),
+    ('city',                'city'),
+    ('publisher',           'publisher'),
+    ('date',                'date'),
+    ('volume',              'volume'),
+])
+
+MARC_FILENAME        = re.compile(r'([^/]+?)((_archive)?_marc.xml|_meta.mrc)$')
+TRAILING_PUNCTUATION = re.compile(r'[ :;]*$')
+PAGES                = re.compile(r'p\.')
+PAGE_COUNT           = re.compile(r'([0-9]+)page')
+
+# Errors reading input files and metadata, reported per file or record by read_all()
+READ_ERRORS = (IOError, ValueError, etree.XMLSyntaxError)
+
+# Fields left out of output fingerprints, which change on every conversion, not with the record
+VOLATILE_FIELDS = [b'005']
+VOLATILE_XML    = re.compile(rb'<(?:\w+:)?controlfield tag="005">[^<]*</(?:\w+:)?controlfield>')
+OUTPUT_001      = re.compile(rb'<(?:\w+:)?controlfield tag="001">([^<]*)<')
+OUTPUT_RECORD   = re.compile(rb'.*?</(?:\w+:)?record>\s*', re.DOTALL)
+
+# The IA transform rules. Rule sets for other collections are JSON objects with any of these keys,
+# replacing the IA rules for those keys, see load_rules(). Rules are compiled once by Rules().
+RULES = {
+    'org_code': 'CaSfIA',
+    # Local or obsolete fields to remove. Datafields with non-digit tags are always removed.
+    'strip_controlfields': ['004'],
+    'strip_datafields': ['011', '014', '019', '029', '035', '037', '039', '044', '049', '051', '059', '069', '079', '089',
+                         '333', '349', '659'],
+    # Custom fields (9xx, 09x) to remove, by tag prefix
+    'strip_prefixes': ['9', '09'],
+    # Subfields to remove, by tag and code, and by tag, code and value
+    'strip_subfields': {'245': ['h']},
+    'strip_subfield_values': {'040': {'e': ['ETHICS-ISBD']}},
+    # Subfield codes to change, by tag, in records which were not already online resources: original ids become $z
+    'recode_subfields': {'010': {'a': 'z'}, '020': {'a': 'z'}},
+    # Second indicators to change, by tag: '0 - Assigned by LC' to '4 - Assigned by agency other than LC'
+    'ind2': {'050': {'0': '4'}, '082': {'0': '4'}},
+    # Abbreviations to expand at the end of 300, for English language cataloging: [regular expression, expansion]
+    'abbreviations': [[r'ill\.|illus\.', 'illustrations'], [r'col[\.,]', 'color'], [r'ports\.', 'portraits'],
+                      [r'fold\.', 'folded'], [r'diagrs\.', 'diagrams']],
+    # 856 Electronic Locations, found by $z text. An existing location has $u <replace>d, and ind2 set if <set_ind2>.
+    # Otherwise one is added, if the url can be formatted: {ocaid} and {olid} are available.
+    'locations': [
+        {'text': 'Free eBook from the Internet Archive', 'url': 'https://archive.org/details/{ocaid}',
+         'ind1': '4', 'ind2': '0', 'set_ind2': True, 'replace': ['http://archive', 'https://archive']},
+        {'text': 'Additional information and access via Open Library', 'url': 'https://openlibrary.org/books/{olid}',
+         'ind1': '4', 'ind2': '2', 'set_ind2': False, 'replace': ['http://www.openlibrary', 'https://openlibrary']},
+    ],
+}
+
+# Structural checks, see MarcXml.check()
+#   A finding names the checkmarc itemlist the record belongs in, the tag or element it was found in, and a message.
+Finding = collections.namedtuple('Finding', ['itemlist', 'tag', 'message'])
+CORRUPT_INDEX   = re.compile(r'at end of field length=40|No separator at|Bad value for data length')
+VOLUME          = re.compile(r'\(v(?:ol)?\. [0-9]')
+VOLUME_SUBFIELDS = {'020': 'acqz', '245': 'c'}
+NON_REPEATABLE  = ['001', '003', '005', '008']
+FIELD_LENGTHS   = {'005': 16, '008': 40}
+# Directories checkmarc moves records to, by itemlist, as checkmarc.sh does.
+BUCKETS = collections.OrderedDict([
+    ('bad_records',    ['bad_index', 'bad_source', 'bad_unicode', 'multi_008', 'bad_structure']),
+    ('multi_volumes',  ['multi_volumes']),
+    ('non_monographs', ['non_monographs']),
+])
+
+# Compiled rules for one datafield tag: ind2 {from: to}, recode {from: to}, codes to strip, {code: values to strip}
+FieldRule = collections.namedtuple('FieldRule', ['ind2', 'recode', 'strip_codes', 'strip_values'])
+
+
+class Rules(object):
+    """A rule set compiled for IAMarcXml: field-level rules as one FieldRule per tag, for a single pass over the
+       datafields, and the abbreviations as one regular expression. Picklable, to send to worker processes.
+    """
+    def __init__(self, rules=RULES):
+        self.org_code = rules['org_code']
+        self.strip_controlfields = list(rules['strip_controlfields'])
+        self.strip_datafields = set(rules['strip_datafields'])
+        self.strip_prefixes = tuple(rules['strip_prefixes'])
+        self.locations = rules['locations']
+        tags = set(rules['strip_subfields']).union(rules['strip_subfield_values'], rules['recode_subfields'], rules['ind2'])
+        self.fields = dict((tag, FieldRule(rules['ind2'].get(tag, {}), rules['recode_subfields'].get(tag, {}),
+                                           set(rules['strip_subfields'].get(tag, [])),
+                                           dict((code, set(values)) for code, values in rules['strip_subfield_values'].get(tag, {}).items())))
+                           for tag in tags)
+        self.expansions = [expansion for pattern, expansion in rules['abbreviations']]
+        self.abbreviations = None
+        if self.expansions:
+            self.abbreviations = re.compile('|'.join('(%s)' % pattern for pattern, expansion in rules['abbreviations']))
+        if self.abbreviations and self.abbreviations.groups != len(self.expansions):
+            raise ValueError('abbreviations must not contain capturing groups')
+
+    def expand(self, text):
+        """Expands all abbreviations in <text>, in one pass."""
+        if self.abbreviations is None:
+            return text
+        return self.abbreviations.sub(lambda m: self.expansions[m.lastindex - 1], text)
+
+
+def load_rules(filename):
+    """Returns Rules from a JSON rule set file. Keys not in the file are taken from the IA RULES."""
+    with open(filename) as f:
+        config = json.load(f)
+    unknown = set(config).difference(RULES)
+    if unknown:
+        raise ValueError('Unknown rules in %s: %s' % (filename, ', '.join(sorted(unknown))))
+    return Rules(dict(RULES, **config))
+
+
+def is_sorted(tags):
+    return all(a <= b for a, b in zip(tags, tags[1:]))
+
+
 class MarcXml(object):
     def __init__(self, xml):
         self.data = xml
+        self.reindex()
+
+    def reindex(self):
+        """Builds the tag index of control and datafields. Needed if self.data is modified directly."""
+        self._leader = None
+        self._leader_pos = None
+        self._fields = collections.defaultdict(list)  # tag -> fields, in record order
+        self._controlfields = []
+        self._control_tags = []
+        self._datafields = []
+        self._data_tags = []
+        for i, element in enumerate(self.data):
+            if element.tag == CONTROLFIELD:
+                self._controlfields.append(element)
+                self._control_tags.append(element.get('tag', ''))
+            elif element.tag == DATAFIELD:
+                self._datafields.append(element)
+                self._data_tags.append(element.get('tag', ''))
+            elif element.tag == LEADER:
+                self._leader = element
+                self._leader_pos = i + 1
+                continue
+            else:
+                continue
+            self._fields[(element.tag, element.get('tag', ''))].append(element)
+        # whether the control and datafield tags are in order, so insert() can bisect them
+        self._sorted = {CONTROLFIELD: is_sorted(self._control_tags), DATAFIELD: is_sorted(self._data_tags)}
+
+    @staticmethod
+    def _kind(field):
+        return CONTROLFIELD if field.tag == CONTROLFIELD else DATAFIELD
+
+    def _field_lists(self, field):
+        """Returns the indexed fields and tags lists matching the kind (control or data) of <field>."""
+        if field.tag == CONTROLFIELD:
+            return self._controlfields, self._control_tags
+        return self._datafields, self._data_tags
+
+    # ----- Element access, overridden by other record backends, see record.MarcRecord
+    def subfields(self, field, code=None):
+        """Returns a list of the subfields of datafield <field>, only those with <code> if given."""
+        if code is None:
+            return XPATH['subfields'](field)
+        return XPATH['subfield'](field, code=code)
+
+    def new_controlfield(self, tag, text):
+        field = etree.Element(CONTROLFIELD, {'tag': tag}, nsmap={None: MARC21_NS})
+        field.text = text
+        return field
+
+    def new_datafield(self, tag, ind1=' ', ind2=' '):
+        return etree.Element(DATAFIELD, {'ind1': ind1, 'ind2': ind2, 'tag': tag}, nsmap={None: MARC21_NS})
+
+    def new_subfield(self, code, text):
+        sub = etree.Element('{%s}subfield' % MARC21_NS, {'code': code})
+        sub.text = text
+        return sub
+
+    def tostring(self, element):
+        return etree.tostring(element, encoding='unicode')
 
     def add_modifying_agency(self, orgcode):
         """Appends a modifying agency, subfield d, to 040, if it is not already last in the list."""
         if self.get_datafield('040') == []:
             self.set_datafield('040')
         cataloging_sources = self.get_datafield('040')[0]
-        modifiers = cataloging_sources.xpath('m:subfield[@code="d"]', namespaces=NS)
+        modifiers = self.subfields(cataloging_sources, 'd')
         if modifiers == [] or modifiers[-1].text != orgcode:
-            sub = etree.Element('{%s}subfield' % MARC21_NS, {'code': 'd'})
-            sub.text = orgcode
-            cataloging_sources.append(sub)
+            cataloging_sources.append(self.new_subfield('d', orgcode))
 
     def catalog_language(self):
-        lang = self.data.xpath('m:datafield[@tag="040"]/m:subfield[@code="b"]', namespaces=NS)
+        lang = self.get_subfields('040', 'b')
         if lang != []:
             return lang[0].text.lower()
         return 'eng'
 
     def comments(self):
-        return self.data.xpath('//comment()')
+        return XPATH['comments'](self.data)
 
     def convert_440(self):
         """Perform conversion of formerly valid 440 - Series Statement/Added Entry-Title
@@ -47,7 +245,7 @@ class MarcXml(object):
             """Concatenates the text of <subfields> into one string."""
             output = ""
             for s in subfields:
-                subfield = field.xpath('m:subfield[@code="%s"]' % s, namespaces=NS)
+                subfield = self.subfields(field, s)
                 if subfield:
                     output += subfield[0].text
             return output
@@ -59,84 +257,153 @@ class MarcXml(object):
             a = concatenate_subfields(statement, ['a', 'n', 'p'])
             data = {'a': a}
             for s in ['v', 'x', '6', '8']:
-                subfield = statement.xpath('m:subfield[@code="%s"]' % s, namespaces=NS)
+                subfield = self.subfields(statement, s)
                 if subfield:
                     data[s] = subfield[0].text
             self.set_datafield('490', ind1='1', ind2=' ', subfields=data)
             # convert original 440 to 830
-            statement.set('tag', '830')
+            self.retag(statement, '830')
         # If there was a 440$6, we need to convert the corrensponding 880$6 to point to the new 830
         #    see https://www.loc.gov/marc/bibliographic/ecbdcntf.html for $6 Linkage details
-        for reference in self.data.xpath('m:datafield[@tag="880"]/m:subfield[@code="6"]', namespaces=NS):
+        for reference in self.get_subfields('880', '6'):
             if '440' in reference.text:
                 reference.text = reference.text.replace('440', '830')
 
+    def check(self):
+        """Checks the structure of the record in a single walk over its elements.
+           Returns a list of Findings, empty if no problems were found.
+             * leader length, and Leader/07 Bibliographic level (non_monographs if not 'm')
+             * counts and lengths of non-repeatable controlfields (multi_008, bad_structure)
+             * yaz-marcdump comments from a corrupt index (bad_index), and any other comments (xml_comments)
+             * empty tags (bad_tag)
+             * volume designations in 020 and 245$c (multi_volumes)
+        """
+        findings = []
+        leaders = 0
+        controlfields = collections.Counter()
+        for element in self.data:
+            if element.tag is etree.Comment:
+                text = element.text or ''
+                if CORRUPT_INDEX.search(text):
+                    findings.append(Finding('bad_index', None, text.strip()))
+                else:
+                    findings.append(Finding('xml_comments', None, text.strip()))
+                continue
+            if element.tag == LEADER:
+                leaders += 1
+                leader = element.text or ''
+                if len(leader) != 24:
+                    findings.append(Finding('bad_structure', 'leader', 'Leader has %i characters, expecting 24' % len(leader)))
+                if leader[7:8] != 'm':
+                    findings.append(Finding('non_monographs', 'leader', "Bibliographic level '%s'" % leader[7:8]))
+                continue
+            tag = element.get('tag')
+            if tag == '':
+                findings.append(Finding('bad_tag', tag, 'Empty tag'))
+            if element.tag == CONTROLFIELD:
+                controlfields[tag] += 1
+                length = len(element.text or '')
+                if tag in FIELD_LENGTHS and length != FIELD_LENGTHS[tag]:
+                    findings.append(Finding('bad_structure', tag, 'Controlfield %s has %i characters, expecting %i' % (tag, length, FIELD_LENGTHS[tag])))
+            elif element.tag == DATAFIELD and tag in VOLUME_SUBFIELDS:
+                for sub in self.subfields(element):
+                    if sub.get('code') in VOLUME_SUBFIELDS[tag] and VOLUME.search(sub.text or ''):
+                        findings.append(Finding('multi_volumes', tag, sub.text))
+        if leaders != 1:
+            findings.append(Finding('bad_structure', 'leader', 'Expecting one leader, got %i' % leaders))
+        for tag in NON_REPEATABLE:
+            if controlfields[tag] > 1:
+                itemlist = 'multi_008' if tag == '008' else 'bad_structure'
+                findings.append(Finding(itemlist, tag, 'Expecting at most one %s controlfield, got %i' % (tag, controlfields[tag])))
+        return findings
+
     def clear_controlfield(self, tag):
         """Completely clears all controlfields with a specific tag."""
         for e in self.get_controlfield(tag):
-            self.data.remove(e)
+            self.remove(e)
 
     def clear_datafield(self, tag):
         """Completely clears all datafields with a specific tag."""
         for e in self.get_datafield(tag):
-            self.data.remove(e)
+            self.remove(e)
 
     def clear_subfield(self, tag, subfield_code):
         """Clears all subfields of <subfield_code> on all tags of <tag>."""
         field = self.get_datafield(tag)
         for f in field:
-            target = f.xpath('m:subfield[@code="%s"]' % subfield_code, namespaces=NS)
+            target = self.subfields(f, subfield_code)
             for t in target:
                 f.remove(t)
 
     def controlfields(self):
         """Returns ALL controlfields, and data offset."""
-        offset = self.leader_pos() # leader
-        return (self.data.xpath('m:controlfield', namespaces=NS), offset)
+        return (self._controlfields, self._leader_pos)
 
     def datafields(self):
         """Returns ALL datafields, and data offset."""
-        controlfields = self.controlfields()
-        offset = len(controlfields[0]) + controlfields[1] 
-        return (self.data.xpath('m:datafield', namespaces=NS), offset)
+        return (self._datafields, self._leader_pos + len(self._controlfields))
 
     def is_online_resource(self):
         """Returns True if record is an online resource."""
         field = self.get_controlfield('008')
         return field and field[0].text[23] == 'o'
 
-    def insert(self, field, fields):
+    def insert(self, field, fields=None):
         """Inserts a field (control or data) in tag order."""
+        if fields is None:
+            fields = self.datafields() if field.tag == DATAFIELD else self.controlfields()
         field_offset = fields[1]
-        tag = field.get('tag')
-        for i,f in enumerate(fields[0]):
-            if int(f.get('tag')) > int(tag): 
-                # Insert before current field
-                self.data.insert(i + field_offset, field)
-                break
-            elif i == (len(fields[0]) - 1):
-                # Insert after last field
-                self.data.insert(len(fields[0]) + field_offset, field)
+        tag = field.get('tag', '')
+        elements, tags = self._field_lists(field)
+        if self._sorted[self._kind(field)]:
+            i = bisect.bisect_right(tags, tag)
+        else:
+            # before the first greater tag, as records out of tag order are left as they are
+            i = next((n for n, t in enumerate(tags) if t > tag), len(tags))
+        self.data.insert(i + field_offset, field)
+        elements.insert(i, field)
+        tags.insert(i, tag)
+        self._fields[(field.tag, tag)].append(field)
+
+    def remove(self, field):
+        """Removes a control or datafield from the record."""
+        elements, tags = self._field_lists(field)
+        i = elements.index(field)
+        del elements[i]
+        del tags[i]
+        self._fields[(field.tag, field.get('tag', ''))].remove(field)
+        self.data.remove(field)
+
+    def retag(self, field, tag):
+        """Changes the tag of a field, in place."""
+        elements, tags = self._field_lists(field)
+        i = elements.index(field)
+        tags[i] = tag
+        if (i and tags[i - 1] > tag) or (i + 1 < len(tags) and tag > tags[i + 1]):
+            self._sorted[self._kind(field)] = False
+        self._fields[(field.tag, field.get('tag', ''))].remove(field)
+        field.set('tag', tag)
+        self._fields[(field.tag, tag)].append(field)
+        self._fields[(field.tag, tag)].sort(key=elements.index)
 
     def get_datafield(self, tag):
         """Returns a list of <tag> datafields."""
-        return self.data.xpath('m:datafield[@tag="%s"]' % tag, namespaces=NS)
-        
+        return list(self._fields.get((DATAFIELD, tag), ()))
+
+    def get_subfields(self, tag, code):
+        """Returns a list of all <code> subfields in <tag> datafields."""
+        return [sub for field in self._fields.get((DATAFIELD, tag), ()) for sub in self.subfields(field, code)]
+
     def get_controlfield(self, tag):
         """Returns a list of <tag> controlfields."""
-        return self.data.xpath('m:controlfield[@tag="%s"]' % tag, namespaces=NS)
+        return list(self._fields.get((CONTROLFIELD, tag), ()))
 
     def leader_pos(self):
         """Return the offset of the leader. Normally 1, unless there are XML comments."""
-        leader = self.get_leader()
-        for i in range(0, len(self.data)):
-            if self.data[i] == leader:
-                return i+1
+        return self._leader_pos
 
     def get_leader(self):
-        leader = self.data.xpath("m:leader", namespaces=NS)
-        if len(leader) == 1:
-            return leader[0]
+        return self._leader
 
     def set_leader(self, pos, char):
         """Set the Leader character at <pos> to <char>."""
@@ -157,9 +424,7 @@ class MarcXml(object):
                set_controlfield('006', 'abcd')
         """
         self.clear_controlfield(tag)
-        field = etree.Element('{%s}controlfield' % MARC21_NS, {'tag': tag}, nsmap={None: MARC21_NS})
-        field.text = value
-        self.insert(field, self.controlfields())
+        self.insert(self.new_controlfield(tag, value), self.controlfields())
 
     def add_data(self, tag, **kwargs):
         """Adds a datafield without overwriting any existing content."""
@@ -172,19 +437,68 @@ class MarcXml(object):
         """
         ind1 = kwargs.get('ind1', ' ')
         ind2 = kwargs.get('ind2', ' ')
-        field = etree.Element('{%s}datafield' % MARC21_NS, {'ind1': ind1, 'ind2': ind2, 'tag': tag}, nsmap={None: MARC21_NS})
+        field = self.new_datafield(tag, ind1, ind2)
         for code,v in kwargs.get('subfields', {}).items():
-            sub = etree.Element('{%s}subfield' % MARC21_NS, {'code': code})
-            sub.text = v
-            field.append(sub)
+            field.append(self.new_subfield(code, v))
         self.insert(field, self.datafields())
 
+class TransformStats(object):
+    """Per step profile of IAMarcXml transforms: calls, cumulative time, and the number of records each step changed.
+       usage: stats = TransformStats(); IAMarcXml(ocaid, xml, stats=stats); stats.report(sys.stderr)
+       Stats from worker processes are combined with add().
+    """
+    def __init__(self):
+        self.records = 0
+        self.steps = collections.OrderedDict()  # step name: [calls, seconds, records changed]
+
+    def run(self, record):
+        """Runs the transform steps of IAMarcXml <record>, timing each, and comparing the record before and after."""
+        self.records += 1
+        for name in record.STEPS:
+            step = self.steps.setdefault(name, [0, 0.0, 0])
+            before = record.tostring(record.data)
+            start = time.perf_counter()
+            try:
+                getattr(record, 'step_' + name)()
+            finally:
+                step[0] += 1
+                step[1] += time.perf_counter() - start
+            step[2] += record.tostring(record.data) != before
+
+    def add(self, other):
+        self.records += other.records
+        for name, (calls, seconds, changed) in other.steps.items():
+            step = self.steps.setdefault(name, [0, 0.0, 0])
+            step[0] += calls
+            step[1] += seconds
+            step[2] += changed
+
+    def report(self, out):
+        """Writes the profile to <out>, one line per step."""
+        total = sum(seconds for calls, seconds, changed in self.steps.values()) or 1
+        out.write("%-28s %8s %10s %6s %10s %8s\n" % ('step', 'calls', 'seconds', '%', 'us/call', 'changed'))
+        for name, (calls, seconds, changed) in self.steps.items():
+            out.write("%-28s %8i %10.3f %6.1f %10.1f %8i\n" % (name, calls, seconds, 100 * seconds / total,
+                                                               1e6 * seconds / calls if calls else 0, changed))
+        out.write("%i records\n" % self.records)
+
+
 class IAMarcXml(MarcXml):
-    ORG_CODE = 'CaSfIA'
+    ORG_CODE = RULES['org_code']
     MODIFIED = '20180220154542.0'
-    def __init__(self, ocaid, xml, **kwargs):
+    RULES = Rules()
+    # The transform, in order: each name is a step_<name> method. Subclasses can add, remove or reorder steps.
+    STEPS = ['leader', 'control_number', 'field_rules', 'transaction_date', 'material_characteristics',
+             'physical_description_fixed', 'fixed_length', 'cataloging_source', 'publisher', 'physical_description',
+             'series', 'locations', 'validate']
+
+    def __init__(self, ocaid, xml, stats=None, rules=None, **kwargs):
+        """Transforms MARC XML record element <xml> to an IA online resource record, with Rules <rules>, by default the IA RULES.
+           With a TransformStats <stats>, each step is timed and counted.
+        """
         super(IAMarcXml, self).__init__(xml)
         self.ocaid = ocaid
+        self.rules = rules or self.RULES
 
         # check for corrupt index
         if self.has_corrupt_index():
@@ -196,38 +510,77 @@ class IAMarcXml(MarcXml):
         self.publisher = kwargs.get('publisher', None)
         self.date      = kwargs.get('date', None)
 
-        originally_ebook = self.is_online_resource()
+        self.originally_ebook = self.is_online_resource()
+
+        if stats is None:
+            for name in self.STEPS:
+                getattr(self, 'step_' + name)()
+        else:
+            stats.run(self)
 
-        # ----- Leader
+    # ----- Leader
+    def step_leader(self):
         # Fix invalid characters in pos 18, Descriptive cataloging form
         leader = self.get_leader()
         if leader.text[18] == '1':
             replacement = 'i' # i - ISBD punctuation included
             self.set_leader(18, replacement)
 
-        self.set_controlfield('001', ocaid)
-        self.set_controlfield('003', self.ORG_CODE)
-
-        # ----- Strip Local or Obsolete Fields
-        self.clear_controlfield('004')
-        strip_fields = ['011', '014', '019', '029', '037', '039', '044', '049', '051', '059', '069', '079', '089', '333', '349', '659']
-        # strip non digit datafields early
-        strip_fields += [ field.get('tag') for field in self.data.xpath("m:datafield[translate(@tag, '0123456789', '') != '']", namespaces=NS) ]
-        for f in strip_fields:
-            self.clear_datafield(f)
-
-        # ----- 005 Date and Time of Latest Transaction
+    # ----- 001, 003 Control Number and Identifier
+    def step_control_number(self):
+        self.set_controlfield('001', self.ocaid)
+        self.set_controlfield('003', self.rules.org_code)
+
+    # ----- Field-level rules, in one pass over the datafields:
+    #   strip local, obsolete and custom (9xx, 09x) fields, and non digit datafields
+    #   010, 020: convert subfield 'a' > 'z' if not originally an e-book
+    #   035: remove old OCLC System Control Number. WARNING: Once OCLC's are properly re-assigned, this needs to be removed!
+    #   040: remove invalid ETHICS_ISBD from 040$e (Description conventions)
+    #   050, 082: change the second indicator, source of call number/classification number, to assigned by agency other than LC
+    #   245: delete $h. Use of $h [electronic resource] is old coding and is no longer used.
+    def step_field_rules(self):
+        rules = self.rules
+        for tag in rules.strip_controlfields:
+            self.clear_controlfield(tag)
+        removed = []
+        for field, tag in zip(self._datafields, self._data_tags):
+            if tag in rules.strip_datafields or (tag and not tag.isdigit()) or tag.startswith(rules.strip_prefixes):
+                removed.append(field)
+                continue
+            rule = rules.fields.get(tag)
+            if rule is None:
+                continue
+            if rule.ind2 and field.get('ind2') in rule.ind2:
+                field.set('ind2', rule.ind2[field.get('ind2')])
+            recode = rule.recode if not self.originally_ebook else {}
+            if recode or rule.strip_codes or rule.strip_values:
+                for sub in self.subfields(field):
+                    code = sub.get('code')
+                    if code in rule.strip_codes or sub.text in rule.strip_values.get(code, ()):
+                        field.remove(sub)
+                    elif code in recode:
+                        sub.set('code', recode[code])
+        if removed:
+            for field in removed:
+                self.data.remove(field)
+            self.reindex()
+
+    # ----- 005 Date and Time of Latest Transaction
+    def step_transaction_date(self):
         self.transaction_update(self.MODIFIED)
 
-        # ----- 006 Fixed-Length Data Elements-Additional Material Characteristics 
+    # ----- 006 Fixed-Length Data Elements-Additional Material Characteristics 
+    def step_material_characteristics(self):
         material_characteristics = 'm     o  d'
         self.set_controlfield('006', material_characteristics)
 
-        # ----- 007 - Physical Description Fixed Field-General Information
+    # ----- 007 - Physical Description Fixed Field-General Information
+    def step_physical_description_fixed(self):
         electronic_resource = 'cr||||||||||||'
         self.set_controlfield('007', electronic_resource)
 
-        # ----- 008 Fixed Length Control Field
+    # ----- 008 Fixed Length Control Field
+    def step_fixed_length(self):
         # Critical: Set resource type to Online Resource
         self.set_online_resource()
 
@@ -245,7 +598,7 @@ class IAMarcXml(MarcXml):
                     # 's', Single known date/probable date
                     correction = 's'
                 elif int(date2) > int(date1):
-                    pub_date = self.data.xpath('m:datafield[@tag="260"]/m:subfield[@code="c"]', namespaces=NS)
+                    pub_date = self.get_subfields('260', 'c')
                     if pub_date and '[' in pub_date[0].text:
                         # questionable dates
                         correction = 'q'
@@ -259,45 +612,13 @@ class IAMarcXml(MarcXml):
                     correction = 't'
                 fixed_length.text = fixed_length.text[:6] + correction + fixed_length.text[7:]
 
-        # ----- 010 Library of Congress Control Number
-        # ----- 020 ISBN
-        # Convert subfield 'a' > 'z' if not originally an e-book
-        if not originally_ebook:
-            lccns = self.get_datafield('010')
-            isbns = self.get_datafield('020')
-            for item in lccns + isbns:
-                original_id = item.xpath('m:subfield[@code="a"]', namespaces=NS)
-                for original in original_id:
-                    original.set('code', 'z')
-
-        # ----- 035 System Control Number
-        # Remove old OCLC System Control Number
-        # WARNING: Once OCLC's are properly re-assigned, this needs to be removed!
-        self.clear_datafield('035')
-
-        # ----- 040 - Cataloging Source, add IA as modifying agency
-        self.add_modifying_agency(self.ORG_CODE)
-        # remove invalid ETHICS_ISBD from 040$e (Description conventions)
-        for code in self.data.xpath('m:datafield[@tag="040"]/m:subfield[@code="e"]', namespaces=NS):
-            if code.text == 'ETHICS-ISBD':
-                code.getparent().remove(code)
-
-        # ----- 050 - Library of Congress Call Number
-        # ----- 082 - Dewey Decimal Classification Number
-        # Change Second Indicator - Source of call number/Source of classification number
-        #  from '0 - Assigned by LC' to '4 - Assigned by agency other than LC'
-        lccns = self.get_datafield('050')
-        deweys = self.get_datafield('082')
-        for item in lccns + deweys:
-            if item.get('ind2') == '0':
-                item.set('ind2', '4')
-
-        # ----- 245 Title Statement 
-        # Delete the 245 subfield h.  Use of $h [electronic resource] is old coding and is no longer used.
-        self.clear_subfield('245', 'h')
-
-        # ----- 260 / 264 "Publisher details" if not present, create 260 from metadata ------
-        if self.data.xpath('m:datafield[@tag="260" or @tag="264"]/m:subfield[@code="a"]', namespaces=NS) == []:
+    # ----- 040 - Cataloging Source, add IA as modifying agency
+    def step_cataloging_source(self):
+        self.add_modifying_agency(self.rules.org_code)
+
+    # ----- 260 / 264 "Publisher details" if not present, create 260 from metadata ------
+    def step_publisher(self):
+        if self.get_subfields('260', 'a') + self.get_subfields('264', 'a') == []:
             subfields = collections.OrderedDict()
             if self.city:
                 subfields['a'] = self.city + (' :' if self.publisher else ' ,')
@@ -308,115 +629,102 @@ class IAMarcXml(MarcXml):
             if subfields != {}:
                 self.set_datafield('260', subfields=subfields);
 
-        # ----- 300 Physical Characteristics
+    # ----- 300 Physical Characteristics
+    def step_physical_description(self):
         # Critical: Add "1 online resource" at the beginning of every 300 field in subfield a.
         # TODO: check parenthesis use, add test cases, check abbreviations
         physical_description = self.get_datafield('300')
 
         if len(physical_description) == 0:
             self.set_datafield('300', subfields={'a': '1 online resource'})
-        elif 'online resource' not in physical_description[0].text:
+        else:
             try:
                 self.fix_physical_description(physical_description[0])
             except IndexError as e:
-                raise Exception("Problem with 300 Physical Description in %s. Corrupt MARC?\n%s" % (ocaid, etree.tostring(physical_description[0])))
+                raise Exception("Problem with 300 Physical Description in %s. Corrupt MARC?\n%s" % (self.ocaid, self.tostring(physical_description[0])))
 
-        # ----- 440, Series Statement/Added Entry-Title, convert to 490, Series Statement + 830, Series Added Entry-Uniform Title
-        # see http://www.loc.gov/marc/bibliographic/bd440.html : "CONVERSION TO CURRENT FIELDS"
+    # ----- 440, Series Statement/Added Entry-Title, convert to 490, Series Statement + 830, Series Added Entry-Uniform Title
+    # see http://www.loc.gov/marc/bibliographic/bd440.html : "CONVERSION TO CURRENT FIELDS"
+    def step_series(self):
         self.convert_440()
 
-        # ----- 856, Electronic Location and Access
-        if originally_ebook:
+    # ----- 856, Electronic Location and Access
+    def step_locations(self):
+        if self.originally_ebook:
             self.clear_datafield('856')
         self.fix_locations()
 
-        # ----- 9xx Custom Fields
-        self.strip_custom_fields()
-
-        # Finally, check everything is OK:
+    # Finally, check everything is OK:
+    def step_validate(self):
         self.validate()
 
     def get_location_by_text(self, text):
         """Finds and returns an 856 Electronic Location and Access field by $z (public note)."""
         for loc in self.get_datafield('856'):
-            desc = loc.xpath('m:subfield[@code="z"]', namespaces=NS)
+            desc = self.subfields(loc, 'z')
             if desc and desc[0].text == text:
                 return loc
 
     def fix_locations(self):
-        """Make corrections to any existing 856 Electronic Location and Access fields.
+        """Make corrections to any existing 856 Electronic Location and Access fields, or add them, by the rules' locations.
            1) ind2 = 0 for IA resource URI
            2) prefer https rather than http
            3) avoid / reduce redirects
            
         """
-        IA_TEXT = "Free eBook from the Internet Archive"
-        OL_TEXT = "Additional information and access via Open Library"
-
-        locations = self.get_datafield('856')
-        ia_location = self.get_location_by_text(IA_TEXT)
-        ol_location = self.get_location_by_text(OL_TEXT)
-
-        if ia_location is not None:
-            #self.data.remove(ia_location) # remove or replace?
-            ia_location.set('ind2', '0')
-            uri = ia_location.xpath('m:subfield[@code="u"]', namespaces=NS)[0]
-            uri.text = uri.text.replace('http://archive', 'https://archive')
-        else:
-            subfields = {'u': "https://archive.org/details/%s" % self.ocaid,
-                         'z': IA_TEXT}
+        values = dict((name, value) for name, value in [('ocaid', self.ocaid), ('olid', self.olid)] if value)
+        for rule in self.rules.locations:
+            location = self.get_location_by_text(rule['text'])
+            if location is not None:
+                if rule.get('set_ind2'):
+                    location.set('ind2', rule['ind2'])
+                uri = self.subfields(location, 'u')[0]
+                if rule.get('replace'):
+                    uri.text = uri.text.replace(*rule['replace'])
+                continue
+            try:
+                url = rule['url'].format(**values)
+            except KeyError:
+                continue  # no value to link to, e.g. no Open Library edition
             #Add $3 Materials Specified, e.g. cu31924088466184
             #if self.volume:
             #    subfields['3'] = "Volume %s" % self.volume
-            self.add_data('856', ind1='4', ind2='0',
-                          subfields = subfields)
-        if ol_location is not None:
-            uri = ol_location.xpath('m:subfield[@code="u"]', namespaces=NS)[0]
-            uri.text = uri.text.replace('http://www.openlibrary', 'https://openlibrary')
-        elif self.olid:
-            self.add_data('856', ind1='4', ind2='2',
-                          subfields = {'u': "https://openlibrary.org/books/%s" % self.olid,
-                                       'z': OL_TEXT})
+            self.add_data('856', ind1=rule.get('ind1', ' '), ind2=rule.get('ind2', ' '),
+                          subfields=collections.OrderedDict([('u', url), ('z', rule['text'])]))
 
     def fix_physical_description(self, physical_description):
         """Removes physical dimensions from electronic resources.
            Adds '1 online resource' to 300$a.
            Expands some abbreviations in line with current cataloging practice."""
         # remove physical dimensions
-        dimensions = physical_description.xpath('m:subfield[@code="c"]', namespaces=NS)
+        dimensions = self.subfields(physical_description, 'c')
         for d in dimensions:
             physical_description.remove(d)
 
         # add online resource count, if not already present
-        a = physical_description.xpath('m:subfield[@code="a"]', namespaces=NS)
+        a = self.subfields(physical_description, 'a')
         if a == []: # a subfield does not exist, create it
-            sub = etree.Element('{%s}subfield' % MARC21_NS, {'code': 'a'})
-            sub.text = ''
-            physical_description.insert(0, sub)
-            a = physical_description.xpath('m:subfield[@code="a"]', namespaces=NS)
+            physical_description.insert(0, self.new_subfield('a', ''))
+            a = self.subfields(physical_description, 'a')
 
         a = a[0]
         if not a.text: # rare case where empty subfield exists
             a.text = ''
-        last = physical_description.xpath('m:subfield', namespaces=NS)[-1]
+        last = self.subfields(physical_description)[-1]
         if 'online resource' not in a.text:
             a.text = "1 online resource (%s" % a.text
             # add closing parenthesis to last subfield
-            last.text = re.sub(r'[ :;]*$', '', last.text) + ')'
+            last.text = TRAILING_PUNCTUATION.sub('', last.text) + ')'
 
         # expand various abbreviations
         if self.catalog_language() == 'eng':
-            a.text = re.sub(r'p\.', 'pages', a.text)
-            a.text = re.sub(r'([0-9]+)page', r'\1 page', a.text)
+            a.text = PAGES.sub('pages', a.text)
+            a.text = PAGE_COUNT.sub(r'\1 page', a.text)
         last.text = self.expand_abbreviations(last.text, self.catalog_language())
 
     def expand_abbreviations(self, text, language):
         if language == 'eng':
-            text = re.sub(r'ill\.|illus\.', 'illustrations', text)
-            text = re.sub(r'col[\.,]', 'color', text)
-            text = re.sub(r'ports\.', 'portraits', text)
-            text = re.sub(r'fold\.', 'folded', text)
-            text = re.sub(r'diagrs\.', 'diagrams', text)
+            text = self.rules.expand(text)
         return text
 
     def has_corrupt_index(self):
@@ -436,21 +744,15 @@ class IAMarcXml(MarcXml):
         if fixed_len:
             fixed_len[0].text = fixed_len[0].text[:23] + 'o' + fixed_len[0].text[24:]
 
-    def strip_custom_fields(self):
-        """Removes all 9xx and 09X datafields."""
-        remove = self.data.xpath('m:datafield[starts-with(@tag,"9")]', namespaces=NS)
-        remove += self.data.xpath('m:datafield[starts-with(@tag,"09")]', namespaces=NS)
-        for r in remove:
-            self.data.remove(r)
-
     def validate(self):
         """Performs validation on the IA MARC record."""
         controlfields = ['001', '003', '005', '006', '007', '008']
         for field in controlfields:
             count = len(self.get_controlfield(field))
             assert count == 1, "Expecting exactly one %s controlfield in %s, got %i\n" % (field, self.ocaid, count)
-        assert self.get_controlfield('003')[0].text == self.ORG_CODE
-        assert self.get_controlfield('004') == []
+        assert self.get_controlfield('003')[0].text == self.rules.org_code
+        for tag in self.rules.strip_controlfields:
+            assert self.get_controlfield(tag) == []
         fixed_len = self.get_controlfield('008')[0]
         assert fixed_len.text[23] == 'o'
         assert len(fixed_len.text) == 40, "Expecting controlfield 008 to have 40 characters, has %i\n" % len(fixed_len.text)
@@ -458,72 +760,483 @@ class IAMarcXml(MarcXml):
         #assert self.data.xpath('m:datafield[@tag="260" or @tag="264"]', namespaces=NS) != [], "Records needs to have publisher data to avoid being flagged as 'sparse'"
 
         title_statement = self.get_datafield('245')[0]
-        assert not title_statement.xpath('m:subfield[@code="h"]', namespaces=NS)
+        rule = self.rules.fields.get('245')
+        for code in rule.strip_codes if rule else []:
+            assert not self.subfields(title_statement, code)
 
         assert self.get_datafield('440') == []
         # Unicode check
         if UNICODE_CHECK:
             assert(self.get_leader().text[9] == 'a') # 'a'=Unicode, ' '=MARC8
 
-if __name__ == '__main__':
+def bucket(itemlists):
+    """Returns the directory checkmarc moves a record found in <itemlists> to, or None if it is kept."""
+    for destination, names in BUCKETS.items():
+        if any(name in itemlists for name in names):
+            return destination
 
-    parser = argparse.ArgumentParser(description='Convert MARC XML to Internet Archive online resource MARC.')
-    parser.add_argument('filename', help='MARC XML to process, <ociad>_marc.xml')
-    parser.add_argument('-o', '--output', default='marc', choices=['marc', 'marcxml'], help='Output format, marc or marcxml')
-    parser.add_argument('-n', '--suppress_output', action='store_true', help='Suppress output, only show errors and warnings')
-    #parser.add_argument('-d', '--debug', action='store_true', help='Debug output')
-    #parser.add_argument('-u', '--unicode', action='store_true', help='Perform unicode check on input MARC')
 
-    args = parser.parse_args()
-    filename = args.filename
-    ocaid = re.search(r'([^//]+?)(_archive)?_marc.xml', filename).group(1)
+def ocaid_from_filename(filename):
+    """Returns the OCAID from an <ocaid>_marc.xml, <ocaid>_archive_marc.xml or <ocaid>_meta.mrc filename, or None."""
+    match = MARC_FILENAME.search(filename)
+    if match:
+        return match.group(1)
 
-    try:
-        doc = etree.parse(filename)
-    except IOError as e:
-        raise Exception("Unable to open MARC XML: %s\n" % filename)
 
-    # Look for IA metadata to populate openlibrary url
-    metadata_filename = os.path.join(os.path.dirname(filename), "%s_meta.xml" % (ocaid))
+def record_ocaid(record):
+    """Returns the 001 Control Number of a MARC XML record element, used as the OCAID of records in collections."""
+    control_number = XPATH['controlfield'](record, tag='001')
+    if control_number and control_number[0].text:
+        return control_number[0].text.strip()
+
+
+def metadata_fields(root):
+    """Returns the IA metadata fields used by IAMarcXml from a parsed <metadata> element, in one pass over its children.
+       Only the first of any repeated field is used.
+    """
     meta = {}
+    for element in root:
+        if isinstance(element.tag, str):
+            key = METADATA_FIELDS.get(etree.QName(element).localname)
+            if key and key not in meta:
+                meta[key] = element.text
+    if DEBUG and 'old_olid' in meta:
+        print("DEBUG old_olid: %s" % meta['old_olid'])
+    return meta
+
+
+def read_metadata(filename):
+    """Reads the IA metadata fields used by IAMarcXml from an <ocaid>_meta.xml file.
+       Returns an empty dict if the file is not found.
+    """
     try:
-        metadata = etree.parse(metadata_filename)
-        if metadata.xpath("openlibrary") != []:
-            meta['old_olid'] = metadata.xpath("openlibrary")[0].text
-            if DEBUG:
-                print("DEBUG old_olid: %s" % meta['old_olid'])
-        if metadata.xpath("openlibrary_edition") != []:
-            meta['olid'] = metadata.xpath("openlibrary_edition")[0].text
-        fields = ['city', 'publisher', 'date', 'volume']
-        for f in fields:
-            if metadata.xpath(f) != []:
-                meta[f] = metadata.xpath(f)[0].text
+        metadata = etree.parse(filename)
     except IOError as e:
         #TODO: Metadata should be optional? Use it if it is there, still produce a good MARC if not. Log a warning just in case?
-        #print("METADATA %s NOT FOUND" % metadata_filename)
-        pass
-        #raise Exception("Unable to open metadata %s\n" % metadata_filename)
+        return {}
+    return metadata_fields(metadata.getroot())
+
+
+def read_records(filename):
+    """Yields every MARC XML record element in <filename>, which may contain a single <record> or a <collection>.
+       The file is parsed incrementally. Each record is cleared, and removed from the collection along with
+       anything before it, when the next one is requested, so memory use does not grow with file size:
+       records are single-pass, and must be used (converted, serialized) before the next is requested.
+       Raises ValueError if the file has no MARC 21 <record>, e.g. one without the MARC 21 namespace.
+    """
+    found = False
+    for event, record in etree.iterparse(filename, events=('end',), tag=RECORD):
+        found = True
+        yield record
+        record.clear()
+        parent = record.getparent()
+        if parent is not None:
+            while record.getprevious() is not None:
+                del parent[0]
+    if not found:
+        raise ValueError('No MARC 21 records (<record xmlns="%s">) in %s' % (MARC21_NS, filename))
+
+
+def read_binary_records(filename, fix_index=False):
+    """Yields every record in binary MARC file <filename> as a MARC XML record element.
+       With <fix_index>, records whose directory does not match their fields are repaired with fixindex first.
+    """
+    with open(filename, 'rb') as f:
+        for raw in iso2709.read_records(f):
+            record = iso2709.read_record(raw)
+            if fix_index and XPATH['comments'](record):
+                try:
+                    record = iso2709.read_record(fixindex.fix_record(raw)[0])
+                except (AssertionError, IndexError, ValueError):
+                    pass  # reported as a corrupt index by IAMarcXml
+            yield record
+
+
+def find_inputs(paths, manifest=None, binary=False):
+    """Yields MARC XML filenames to process from:
+         * MARC XML files (single records or collections)
+         * directories, all <ocaid>_marc.xml files within
+         * a manifest of OCAIDs, one per line, with MARC XML in the same directory as the manifest
+       With <binary>, directories and manifests give <ocaid>_meta.mrc binary MARC files instead.
+    """
+    suffix = '_meta.mrc' if binary else '_marc.xml'
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(suffix):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+    if manifest:
+        directory = os.path.dirname(manifest)
+        with open(manifest) as f:
+            for line in f:
+                ocaid = line.strip()
+                if not ocaid:
+                    continue
+                if binary:
+                    yield os.path.join(directory, "%s_meta.mrc" % ocaid)
+                    continue
+                filename = os.path.join(directory, "%s_marc.xml" % ocaid)
+                archive_filename = os.path.join(directory, "%s_archive_marc.xml" % ocaid)
+                yield archive_filename if os.path.exists(archive_filename) else filename
+
+
+def read_all(filenames, report, reader=read_records, metadata=None):
+    """Yields (filename, ocaid, record element, metadata) for every record from every file in <filenames>, in order.
+       Files are read by reader(filename), read_records for MARC XML or read_binary_records for binary MARC.
+       Metadata is looked up by metadata(ocaid, directory), by default from <ocaid>_meta.xml in the same directory.
+       Records from <ocaid>_marc.xml and <ocaid>_meta.mrc files take their OCAID from the filename, other records from their 001.
+       Unreadable files, records and metadata (e.g. a malformed <ocaid>_meta.xml) are passed to report(filename, ocaid, exception).
+       Record elements from read_records are cleared when the next is requested, see read_records().
+    """
+    if metadata is None:
+        metadata = lambda ocaid, directory: read_metadata(os.path.join(directory, "%s_meta.xml" % ocaid))
+    for filename in filenames:
+        file_ocaid = ocaid_from_filename(filename)
+        directory = os.path.dirname(filename)
+        ocaid = file_ocaid
+        try:
+            meta = metadata(file_ocaid, directory) if file_ocaid else {}
+            for root in reader(filename):
+                ocaid = file_ocaid
+                if not file_ocaid:
+                    ocaid = record_ocaid(root)
+                    if not ocaid:
+                        report(filename, ocaid, Exception('No OCAID in filename or 001'))
+                        continue
+                    try:
+                        meta = metadata(ocaid, directory)
+                    except READ_ERRORS as e:
+                        report(filename, ocaid, e)
+                        continue
+                yield filename, ocaid, root, meta
+        except READ_ERRORS as e:
+            report(filename, ocaid, e)
+
+
+def convert_all(filenames, report, reader=read_records, metadata=None, stats=None, rules=None):
+    """Converts every record from every file in <filenames> to IAMarcXml, with Rules <rules> (default the IA RULES), in order.
+       Failures are passed to report(filename, ocaid, exception) and processing continues with the next record.
+       With a TransformStats <stats>, every transform is profiled.
+       Records are single-pass, as read_records() gives them: use each before requesting the next.
+    """
+    for filename, ocaid, root, meta in read_all(filenames, report, reader, metadata):
+        try:
+            yield IAMarcXml(ocaid, root, stats, rules, **meta)
+        except Exception as e:
+            report(filename, ocaid, e)
+
+
+def serialize(record, output):
+    """Returns an IAMarcXml record as bytes, in <output> format, marc or marcxml."""
+    if output == 'marcxml':
+        return etree.tostring(record.data, encoding='utf-8') + b'\n'
+    return iso2709.write_record(record.data)
+
+
+def convert_chunk(chunk, output, profile=False, rules=None):
+    """Converts and serializes a list of (filename, ocaid, MARC XML bytes, metadata) in a worker process.
+       Returns a list of (filename, ocaid, output bytes, error message), one per record,
+       and the TransformStats of the chunk with <profile>, otherwise None.
+    """
+    results = []
+    stats = TransformStats() if profile else None
+    for filename, ocaid, xml, meta in chunk:
+        try:
+            record = IAMarcXml(ocaid, etree.fromstring(xml), stats, rules, **meta)
+            results.append((filename, ocaid, serialize(record, output), None))
+        except Exception as e:
+            results.append((filename, ocaid, None, ' '.join(str(e).split())))
+    return results, stats
+
+
+def convert_parallel(filenames, report, output, jobs, chunksize=32, reader=read_records, metadata=None, stats=None, rules=None):
+    """Converts and serializes every record from every file in <filenames> over <jobs> worker processes.
+       Yields output bytes in input order as each chunk completes. At most 2 chunks per worker are
+       in flight, so reading stops while the consumer falls behind.
+    """
+    for filename, data in convert_files(filenames, report, output, jobs, chunksize, reader, metadata, stats, rules):
+        yield data
+
+
+def convert_files(filenames, report, output, jobs=1, chunksize=32, reader=read_records, metadata=None, stats=None, rules=None):
+    """As convert_parallel(), but yields (filename, output bytes) for every converted record.
+       With jobs=1 records are converted in this process. Worker profiles are added to TransformStats <stats>.
+    """
+    if jobs == 1:
+        for filename, ocaid, root, meta in read_all(filenames, report, reader, metadata):
+            try:
+                yield filename, serialize(IAMarcXml(ocaid, root, stats, rules, **meta), output)
+            except Exception as e:
+                report(filename, ocaid, e)
+        return
+
+    def chunks():
+        chunk = []
+        for filename, ocaid, root, meta in read_all(filenames, report, reader, metadata):
+            chunk.append((filename, ocaid, etree.tostring(root, encoding='utf-8'), meta))
+            if len(chunk) == chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def results(future):
+        chunk_results, chunk_stats = future.result()
+        if chunk_stats:
+            stats.add(chunk_stats)
+        for filename, ocaid, data, error in chunk_results:
+            if error is None:
+                yield filename, data
+            else:
+                report(filename, ocaid, error)
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+        pending = collections.deque()
+        for chunk in chunks():
+            if len(pending) >= 2 * jobs:
+                yield from results(pending.popleft())
+            pending.append(pool.submit(convert_chunk, chunk, output, stats is not None, rules))
+        while pending:
+            yield from results(pending.popleft())
+
+
+def cache_inputs(filename):
+    """Returns the input files a conversion of <filename> depends on: the MARC XML, and the <ocaid>_meta.xml if any."""
+    ocaid = ocaid_from_filename(filename)
+    if ocaid:
+        return [filename, os.path.join(os.path.dirname(filename), "%s_meta.xml" % ocaid)]
+    return [filename]
+
+
+def convert_cached(filenames, report, output, cache, jobs=1, reader=read_records, metadata=None, stats=None, rules=None):
+    """Converts and serializes every record from every file in <filenames>, in order, re-using the output and errors
+       stored in <cache> (a cache.Cache) for files which have not changed since they were last converted.
+       Only changed files are read and converted, over <jobs> worker processes.
+    """
+    files = collections.deque()  # [filename, output bytes, errors, cached], in input order, awaiting output
+
+    def changed():
+        for filename in filenames:
+            value = cache.get(cache_inputs(filename))
+            if value is None:
+                files.append([filename, [], [], False])
+                yield filename
+            else:
+                errors, data = value.split(b'\0', 1)
+                files.append([filename, [zlib.decompress(data)], errors.decode('utf-8').splitlines(), True])
+
+    def capture(filename, ocaid, e):
+        for f in reversed(files):
+            if f[0] == filename:
+                f[2].append("%s\t%s" % (ocaid, ' '.join(str(e).split())))
+                break
 
-    root = doc.getroot()
+    def finished():
+        filename, data, errors, cached = files.popleft()
+        for e in errors:
+            ocaid, message = e.split('\t', 1)
+            report(filename, ocaid, message)
+        if not cached:
+            data = [b''.join(data)]
+            cache.put(cache_inputs(filename), '\n'.join(errors).encode('utf-8') + b'\0' + zlib.compress(data[0]))
+        return data[0] if data else b''
+
+    for filename, data in convert_files(changed(), capture, output, jobs, reader=reader, metadata=metadata, stats=stats, rules=rules):
+        while files[0][0] != filename:
+            yield finished()
+        files[0][1].append(data)
+    while files:
+        yield finished()
+
+
+def write_output(data, out, output):
+    """Writes serialized records to <out>, wrapped in a collection for marcxml output."""
+    if output == 'marcxml':
+        out.write(('<collection xmlns="%s">\n' % MARC21_NS).encode('utf-8'))
+    for d in data:
+        out.write(d)
+    if output == 'marcxml':
+        out.write(b'</collection>\n')
+    out.flush()
+
+
+def split_output(data, output):
+    """Splits serialized output, one or more records in <output> format, into single records."""
+    if output == 'marcxml':
+        return OUTPUT_RECORD.findall(data)
+    return [r + iso2709.RECORD_TERMINATOR for r in data.split(iso2709.RECORD_TERMINATOR)[:-1]]
+
+
+def output_ocaid(record, output):
+    """Returns the 001, the OCAID, of a serialized record."""
+    if output == 'marcxml':
+        m = OUTPUT_001.search(record)
+        return m.group(1).decode('utf-8') if m else ''
+    leader, index, pos = fixindex.read_index(record)
+    return fixindex.control_number(index, record, pos)
+
+
+def fingerprint(record, output):
+    """Returns the SHA-1 of a serialized record without its VOLATILE_FIELDS, the 005 timestamp,
+       so a record converted again without changes has the same fingerprint.
+    """
+    h = hashlib.sha1()
+    if output == 'marcxml':
+        h.update(VOLATILE_XML.sub(b'', record.strip()))
+        return h.hexdigest()
+    base = int(record[12:17])
+    # not the record length and base address, which change with the volatile fields
+    h.update(record[5:12] + record[17:24])
+    for pos in range(24, base - 1, iso2709.DIRECTORY_ENTRY_LEN):
+        tag = record[pos:pos+3]
+        if tag not in VOLATILE_FIELDS:
+            length, offset = int(record[pos+3:pos+7]), int(record[pos+7:pos+12])
+            h.update(tag + record[base+offset:base+offset+length])
+    return h.hexdigest()
+
+
+class Fingerprints(object):
+    """Manifest of the fingerprint of every record output, by OCAID, in .tsv <filename>, for delta output.
+       Records after the first with the same OCAID, as in collections, are kept as <ocaid>#<n>, n from 2.
+       New fingerprints are only written by save(), so an interrupted run changes nothing.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.fingerprints = {}
+        self.changed = []  # OCAIDs of new or changed records
+        self.records = self.unchanged = 0
+        if os.path.exists(filename):
+            with open(filename) as f:
+                for line in f:
+                    ocaid, fp = line.rstrip('\n').split('\t')
+                    self.fingerprints[ocaid] = fp
+
+    def delta(self, data, output):
+        """Yields only the records in serialized output <data> which are new or changed since the manifest was saved."""
+        seen = collections.Counter()
+        changed = set(self.changed)
+        for d in data:
+            for record in split_output(d, output):
+                ocaid = output_ocaid(record, output)
+                seen[ocaid] += 1
+                self.records += 1
+                key = ocaid if seen[ocaid] == 1 else '%s#%i' % (ocaid, seen[ocaid])
+                fp = fingerprint(record, output)
+                if self.fingerprints.get(key) == fp:
+                    self.unchanged += 1
+                    continue
+                self.fingerprints[key] = fp
+                if ocaid not in changed:
+                    changed.add(ocaid)
+                    self.changed.append(ocaid)
+                yield record
+
+    def save(self):
+        with open(self.filename + '.tmp', 'w') as f:
+            for ocaid, fp in sorted(self.fingerprints.items()):
+                f.write('%s\t%s\n' % (ocaid, fp))
+        os.replace(self.filename + '.tmp', self.filename)
 
-    # If MARC XML is a collection rather than a record, select the first(hopefully only!) record
-    if root.tag == "{%s}collection" % MARC21_NS:
-        doc = root[0]
-        root = doc
 
-    try:
-        record = IAMarcXml(ocaid, root, **meta)
-    except Exception as e:
-        e.args += (filename,)
-        raise
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Convert MARC XML to Internet Archive online resource MARC.')
+    parser.add_argument('filenames', nargs='*', metavar='filename', help='MARC XML to process, <ociad>_marc.xml, a MARC XML collection, or a directory of <ocaid>_marc.xml')
+    parser.add_argument('-m', '--manifest', help='Itemlist of OCAIDs to process, <ocaid>_marc.xml in the same directory as the itemlist')
+    parser.add_argument('-i', '--input', default='marcxml', choices=['marcxml', 'marc'], help='Input format, marcxml or binary marc (<ocaid>_meta.mrc in directories and manifests)')
+    parser.add_argument('-x', '--fix_index', action='store_true', help='Fix the index of binary marc input records where it does not match their fields')
+    parser.add_argument('-M', '--metadata', help='Metadata index built by metaindex.py, rather than reading <ocaid>_meta.xml for every record')
+    parser.add_argument('-o', '--output', default='marc', choices=['marc', 'marcxml'], help='Output format, marc or marcxml')
+    parser.add_argument('-f', '--outfile', help='Write output to file, rather than STDOUT')
+    parser.add_argument('-e', '--errors', help='Write per record error report to file, rather than STDERR')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of worker processes')
+    parser.add_argument('-c', '--cache', help='Cache output in this file, and only re-convert input which has changed since')
+    parser.add_argument('-n', '--suppress_output', action='store_true', help='Suppress output, only show errors and warnings')
+    parser.add_argument('-r', '--rules', help='JSON rule set to convert with, rather than the IA rules (see RULES)')
+    parser.add_argument('-p', '--profile', action='store_true', help='Write the time taken, and records changed, by each transform step to STDERR')
+    parser.add_argument('-D', '--delta', help='Fingerprint manifest: only output records which are new or changed since the last run with it (not updated with -n)')
+    parser.add_argument('-U', '--changed', help='With -D, write the OCAIDs of new or changed records to this itemlist, e.g. for transfer.py upload')
+    #parser.add_argument('-d', '--debug', action='store_true', help='Debug output')
+    #parser.add_argument('-u', '--unicode', action='store_true', help='Perform unicode check on input MARC')
 
-    if DEBUG:
-        print(record.get_leader())
-        print("TITLE STATEMENT: %s" % etree.tostring(record.get_datafield('245')[0]))
+    args = parser.parse_args()
+    if not args.filenames and not args.manifest:
+        parser.error('No MARC XML input given')
+    if args.fix_index and args.input != 'marc':
+        parser.error('-x/--fix_index is only for binary marc input')
+    if args.changed and not args.delta:
+        parser.error('-U/--changed needs a -D/--delta manifest')
+
+    error_log = open(args.errors, 'w') if args.errors else sys.stderr
+    failures = []
+
+    def report(filename, ocaid, e):
+        failures.append(filename)
+        error_log.write("%s\t%s\t%s\n" % (filename, ocaid, ' '.join(str(e).split())))
+
+    filenames = find_inputs(args.filenames, args.manifest, binary=args.input == 'marc')
+    reader = read_records
+    if args.input == 'marc':
+        reader = functools.partial(read_binary_records, fix_index=args.fix_index)
+    metadata = None
+    if args.metadata:
+        import metaindex
+        metadata = metaindex.MetadataIndex(args.metadata)
+    stats = TransformStats() if args.profile else None
+    rules = load_rules(args.rules) if args.rules else None
+    if args.cache:
+        version = '%s %s %s fix_index=%s' % (IAMarcXml.MODIFIED, cache.code_version(sys.modules[__name__], iso2709, fixindex), args.input, args.fix_index)
+        if args.metadata:
+            # any change to the index invalidates the cache
+            version += ' metadata=%s' % cache.stat([args.metadata])
+        if args.rules:
+            version += ' rules=%s' % cache.content_hash([args.rules])
+        output_cache = cache.Cache(args.cache, 'marcia-%s' % args.output, version)
+        data = convert_cached(filenames, report, args.output, output_cache, args.jobs, reader, metadata, stats, rules)
+    elif args.jobs > 1:
+        data = convert_parallel(filenames, report, args.output, args.jobs, reader=reader, metadata=metadata, stats=stats, rules=rules)
+    else:
+        def serialize_all(records):
+            for record in records:
+                if DEBUG:
+                    print(record.get_leader())
+                    print("TITLE STATEMENT: %s" % etree.tostring(record.get_datafield('245')[0]))
+                yield serialize(record, args.output)
+        data = serialize_all(convert_all(filenames, report, reader, metadata, stats, rules))
+
+    fingerprints = None
+    if args.delta:
+        fingerprints = Fingerprints(args.delta)
+        data = fingerprints.delta(data, args.output)
 
     # ---- Write output
-    # Use yaz-marcdump to convert modified XML to marc
-    if not args.suppress_output:
-        p = subprocess.Popen(["yaz-marcdump", "-imarcxml", "-o%s" % args.output, "/proc/self/fd/0"], stdin=subprocess.PIPE)
-        result = p.communicate(etree.tostring(record.data))
-
+    if args.suppress_output:
+        for d in data:
+            pass
+    else:
+        out = open(args.outfile, 'wb') if args.outfile else sys.stdout.buffer
+        write_output(data, out, args.output)
+        if args.outfile:
+            out.close()
+
+    if fingerprints:
+        # with -n nothing was written, so the records are still to be output (and uploaded) by the next run
+        if not args.suppress_output:
+            fingerprints.save()
+            if args.changed:
+                with open(args.changed, 'w') as f:
+                    f.writelines('%s\n' % ocaid for ocaid in fingerprints.changed)
+        sys.stderr.write("%i records new or changed, %i unchanged\n" % (fingerprints.records - fingerprints.unchanged, fingerprints.unchanged))
+    if args.profile:
+        stats.report(sys.stderr)
+    if args.cache:
+        output_cache.close()
+    if args.metadata:
+        if metadata.misses:
+            sys.stderr.write("%i records without metadata in %s\n" % (metadata.misses, args.metadata))
+        metadata.close()
+    if args.errors:
+        error_log.close()
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+
+"""Builds a metadata index for batch runs of marcia.py, so records are converted without reading <ocaid>_meta.xml files.
+
+   Extracts the IA metadata fields IAMarcXml uses (openlibrary, openlibrary_edition, city, publisher, date, volume)
+   from every <ocaid>_meta.xml in directories, or from a bulk IA metadata dump in JSONL, into one SQLite file.
+   Items without metadata, or without all of the fields in COMPLETE, are counted and reported.
+
+   usage:
+       metaindex.py -o metadata.db <directory> ...
+       metaindex.py -o metadata.db -J metadata.jsonl -m itemlist.txt
+       marcia.py -M metadata.db <directory>
+"""
+
+import argparse
+import collections
+import json
+import os
+import sqlite3
+from lxml import etree
+
+import marcia
+
+FIELDS = list(marcia.METADATA_FIELDS.values())
+# Fields needed for a complete record: the Open Library link (856) and publisher details (260)
+COMPLETE = ['olid', 'city', 'publisher', 'date']
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS metadata (ocaid TEXT PRIMARY KEY, %s) WITHOUT ROWID" % ', '.join('%s TEXT' % f for f in FIELDS)
+
+
+class MetadataIndex(object):
+    """Metadata by OCAID, in SQLite database <filename>.
+       Can be passed to marcia.read_all() and the marcia.convert_* functions as metadata(ocaid, directory).
+    """
+    def __init__(self, filename):
+        # not only the creating thread: pipeline.py looks up metadata in a stage thread
+        self.db = sqlite3.connect(filename, check_same_thread=False)
+        self.db.execute(SCHEMA)
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __call__(self, ocaid, directory=None):
+        """Returns the metadata for <ocaid> as keyword arguments for IAMarcXml, or {} if there is none."""
+        meta = self.get(ocaid)
+        if meta is None:
+            self.misses += 1
+            return {}
+        return meta
+
+    def get(self, ocaid):
+        """Returns the metadata for <ocaid>, or None if it is not in the index."""
+        row = self.db.execute('SELECT %s FROM metadata WHERE ocaid = ?' % ', '.join(FIELDS), (ocaid,)).fetchone()
+        if row is None:
+            return None
+        return dict((f, v) for f, v in zip(FIELDS, row) if v is not None)
+
+    def add(self, items):
+        """Adds (ocaid, metadata dict) <items> to the index, replacing any already there."""
+        self.db.executemany('INSERT OR REPLACE INTO metadata VALUES (?, %s)' % ', '.join('?' * len(FIELDS)),
+                            ([ocaid] + [meta.get(f) for f in FIELDS] for ocaid, meta in items))
+        self.db.commit()
+
+    def ocaids(self):
+        return set(row[0] for row in self.db.execute('SELECT ocaid FROM metadata'))
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+def read_directory(directory):
+    """Yields (ocaid, metadata) for every <ocaid>_meta.xml in <directory>.
+       Unparsable files are yielded with empty metadata.
+    """
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('_meta.xml'):
+            try:
+                meta = marcia.metadata_fields(etree.parse(os.path.join(directory, name)).getroot())
+            except etree.XMLSyntaxError:
+                meta = {}
+            yield name[:-len('_meta.xml')], meta
+
+
+def read_jsonl(filename):
+    """Yields (ocaid, metadata) for every item in a JSONL dump of IA metadata, one item per line,
+       either as the metadata API returns it, {"metadata": {"identifier": ..., ...}}, or the metadata object alone.
+       Repeated fields, as lists, use their first value.
+    """
+    with open(filename) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            item = item.get('metadata', item)
+            meta = {}
+            for name, key in marcia.METADATA_FIELDS.items():
+                value = item.get(name)
+                if isinstance(value, list):
+                    value = value[0] if value else None
+                if value is not None:
+                    meta[key] = value
+            yield item['identifier'], meta
+
+
+def marc_ocaids(directory):
+    """Returns the OCAIDs of all MARC files in <directory>, the items which need metadata."""
+    return set(filter(None, (marcia.ocaid_from_filename(name) for name in os.listdir(directory))))
+
+
+def counted(items, c):
+    """Yields metadata <items>, counting them in Counter <c>: 'indexed', 'incomplete', and 'no <field>' for each missing field."""
+    for ocaid, meta in items:
+        missing_fields = [f for f in COMPLETE if not meta.get(f)]
+        c['indexed'] += 1
+        c['incomplete'] += bool(missing_fields)
+        c.update('no %s' % f for f in missing_fields)
+        yield ocaid, meta
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Index IA metadata used by marcia.py, from <ocaid>_meta.xml files or a JSONL metadata dump.')
+    parser.add_argument('directories', nargs='*', metavar='directory', help='Directory of <ocaid>_meta.xml files to index')
+    parser.add_argument('-o', '--outfile', required=True, help='Metadata index file to create or update')
+    parser.add_argument('-J', '--jsonl', help='JSONL dump of IA metadata to index')
+    parser.add_argument('-m', '--manifest', help='Itemlist of OCAIDs expected to have metadata')
+    args = parser.parse_args()
+    if not args.directories and not args.jsonl:
+        parser.error('No metadata input given')
+
+    expected = set()
+    if args.manifest:
+        with open(args.manifest) as f:
+            expected.update(line.strip() for line in f if line.strip())
+    c = collections.Counter()
+    with MetadataIndex(args.outfile) as index:
+        for directory in args.directories:
+            expected.update(marc_ocaids(directory))
+            index.add(counted(read_directory(directory), c))
+        if args.jsonl:
+            index.add(counted(read_jsonl(args.jsonl), c))
+        c['missing'] = len(expected.difference(index.ocaids()))
+
+    print("Indexed metadata for %i items." % c['indexed'])
+    print("%i items without metadata, %i with incomplete metadata%s" % (c['missing'], c['incomplete'], ':' if c['incomplete'] else '.'))
+    for f in COMPLETE:
+        if c['no %s' % f]:
+            print("  %6i no %s" % (c['no %s' % f], f))
@@ -0,0 +1,342 @@
+#!/usr/bin/python3
+
+"""Checks, fixes and converts a directory of IA MARC items in one command, as streaming stages.
+
+   Each item passes through the stages in order: check (checkmarc), repair (fixindex, on <ocaid>_meta.mrc),
+   transcode (binary MARC, and MARC-8, to MARC XML), metadata, and convert (IAMarcXml transform and serialization).
+   Stages are connected by bounded queues and run concurrently, I/O stages in a thread and CPU stages over
+   a pool of worker processes, so one item can be converting while the next is being checked.
+   Items checkmarc.sh would move out of the way (bad_records, multi_volumes, non_monographs) and can not
+   be fixed here are skipped. Per-stage throughput and queue depth statistics are written to STDERR.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import io
+import os
+import queue
+import sys
+import threading
+import time
+from lxml import etree
+
+import checkmarc
+import fixindex
+import iso2709
+import marcia
+
+QUEUE_SIZE = 64
+STOP = None
+# Itemlists of problems the repair and transcode stages fix
+FIXABLE = ['bad_index', 'bad_unicode']
+
+
+class Stats(object):
+    """Counts for one stage: items, skipped and failed items, time spent in the stage function, and input queue depth."""
+    def __init__(self):
+        self.items = self.skipped = self.errors = 0
+        self.busy = 0.0
+        self.start = self.end = None
+        self.depth_max = self.depth_total = self.gets = 0
+
+    def got(self, depth):
+        if self.start is None:
+            self.start = time.perf_counter()
+        self.gets += 1
+        self.depth_total += depth
+        self.depth_max = max(self.depth_max, depth)
+
+    def put(self, item, busy):
+        self.end = time.perf_counter()
+        self.items += 1
+        self.busy += busy
+        self.skipped += 'skipped' in item
+        self.errors += 'error' in item
+
+    def rate(self):
+        elapsed = (self.end or 0) - (self.start or 0)
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+
+def timed(function, items):
+    """Runs function(item) on each of <items>, in this process or a worker. Returns a list of (item, time taken),
+       with any exception as item['error'].
+    """
+    results = []
+    for item in items:
+        start = time.perf_counter()
+        try:
+            item = function(item)
+        except Exception as e:
+            item['error'] = ' '.join(str(e).split()) or e.__class__.__name__
+        results.append((item, time.perf_counter() - start))
+    return results
+
+
+class Stage(object):
+    """Runs function(item) on every item put on its input queue, in order, and puts the results on <output>.
+       With <processes> the function runs over a pool of that many worker processes, on chunks of up to <chunksize>
+       items, otherwise in the stage thread. A chunk is sent as soon as the input queue is empty, so items are never held back.
+       Items which have failed (item['error']) or are skipped (item['skipped']) in an earlier stage are passed on unchanged.
+       If the stage itself fails, e.g. with a broken process pool, the exception is kept as <error>, the rest of the input
+       is discarded, and STOP is still passed on, so the pipeline ends.
+    """
+    def __init__(self, name, function, processes=0, chunksize=16, maxsize=QUEUE_SIZE):
+        self.name = name
+        self.function = function
+        self.processes = processes
+        self.chunksize = chunksize
+        self.input = queue.Queue(maxsize)
+        self.stats = Stats()
+        self.error = None
+        self.stopped = False
+
+    def get(self):
+        depth = self.input.qsize()
+        item = self.input.get()
+        if item is STOP:
+            self.stopped = True
+        else:
+            self.stats.got(depth)
+        return item
+
+    def emit(self, output, results):
+        for item, busy in results:
+            self.stats.put(item, busy)
+            output.put(item)
+
+    def run(self, output):
+        try:
+            if self.processes:
+                self.run_pool(output)
+            else:
+                self.run_thread(output)
+        except Exception as e:
+            self.error = e
+            # keep taking input, so earlier stages are not blocked on a full queue
+            while not self.stopped:
+                self.get()
+        finally:
+            output.put(STOP)
+
+    def run_thread(self, output):
+        while True:
+            item = self.get()
+            if item is STOP:
+                break
+            if 'error' in item or 'skipped' in item:
+                self.emit(output, [(item, 0.0)])
+            else:
+                self.emit(output, timed(self.function, [item]))
+
+    def run_pool(self, output):
+        # pending chunks, in order: futures, or lists of (item, 0) for items passed on unchanged
+        pending = collections.deque()
+        chunk = []
+        with concurrent.futures.ProcessPoolExecutor(self.processes) as pool:
+            while True:
+                item = self.get()
+                if item is not STOP:
+                    if 'error' in item or 'skipped' in item:
+                        if chunk:
+                            pending.append(pool.submit(timed, self.function, chunk))
+                            chunk = []
+                        pending.append([(item, 0.0)])
+                    else:
+                        chunk.append(item)
+                if chunk and (item is STOP or len(chunk) >= self.chunksize or self.input.empty()):
+                    pending.append(pool.submit(timed, self.function, chunk))
+                    chunk = []
+                while pending and (item is STOP or len(pending) > 2 * self.processes or isinstance(pending[0], list)
+                                   or pending[0].done()):
+                    next_ = pending.popleft()
+                    self.emit(output, next_ if isinstance(next_, list) else next_.result())
+                if item is STOP:
+                    break
+
+
+class Pipeline(object):
+    """Stages connected by bounded queues, each stage running in its own thread."""
+    def __init__(self, stages, maxsize=QUEUE_SIZE):
+        self.stages = stages
+        self.output = queue.Queue(maxsize)
+
+    def run(self, items):
+        """Feeds <items> through every stage, and yields them, in order, as they come out of the last stage.
+           An exception raised by <items>, or by a stage itself rather than its function, is raised here
+           once every stage has stopped.
+        """
+        threads = []
+        errors = []
+        for stage, next_stage in zip(self.stages, self.stages[1:] + [None]):
+            output = next_stage.input if next_stage else self.output
+            threads.append(threading.Thread(target=stage.run, args=(output,), daemon=True))
+
+        def feed():
+            try:
+                for item in items:
+                    self.stages[0].input.put(item)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                self.stages[0].input.put(STOP)
+        threads.append(threading.Thread(target=feed, daemon=True))
+
+        for thread in threads:
+            thread.start()
+        while True:
+            item = self.output.get()
+            if item is STOP:
+                break
+            yield item
+        for thread in threads:
+            thread.join()
+        errors += [stage.error for stage in self.stages if stage.error]
+        if errors:
+            raise errors[0]
+
+    def report(self, out):
+        """Writes per-stage statistics to <out>."""
+        out.write("%-10s %9s %8s %8s %8s %8s %10s %9s %10s\n" % (
+                  'stage', 'processes', 'items', 'skipped', 'errors', 'busy s', 'items/s', 'queue max', 'queue mean'))
+        for stage in self.stages:
+            s = stage.stats
+            out.write("%-10s %9s %8i %8i %8i %8.1f %10.1f %9i %10.1f\n" % (
+                      stage.name, stage.processes or 'thread', s.items, s.skipped, s.errors, s.busy, s.rate(),
+                      s.depth_max, s.depth_total / s.gets if s.gets else 0))
+
+
+# ----- IA MARC stages. Items are dicts, which are passed between processes.
+
+def check_item(item):
+    """Checks the item's MARC XML, skipping items which would be moved out of the way, unless the problems can be fixed."""
+    with open(item['filename'], 'rb') as f:
+        item['xml'] = f.read()
+    itemlists = checkmarc.check_text(item['xml'].decode('utf-8', 'replace'), item['filename'].endswith('_archive_marc.xml'))
+    item['fix'] = [name for name in FIXABLE if name in itemlists]
+    remaining = set(itemlists).difference(FIXABLE)
+    if 'bad_index' in item['fix']:
+        remaining.discard('bad_structure')  # a corrupt index also breaks the structure of the MARC XML
+    if marcia.bucket(remaining):
+        item['skipped'] = marcia.bucket(remaining)
+    return item
+
+
+def repair_item(item):
+    """Reads <ocaid>_meta.mrc for items to fix, and fixes its index if needed."""
+    if item['fix']:
+        with open(os.path.join(item['directory'], '%s_meta.mrc' % item['ocaid']), 'rb') as f:
+            raw = next(iso2709.read_records(f))
+        if 'bad_index' in item['fix']:
+            raw = fixindex.fix_record(raw)[0]
+        item['raw'] = raw
+    return item
+
+
+def transcode_item(item):
+    """Converts the fixed binary MARC of items to fix to MARC XML, from MARC-8 if needed."""
+    if 'raw' in item:
+        encoding = 'marc8' if 'bad_unicode' in item['fix'] else 'utf-8'
+        item['xml'] = etree.tostring(iso2709.read_record(item.pop('raw'), encoding), encoding='utf-8')
+    return item
+
+
+def metadata_item(item, metadata=None):
+    """Looks up IA metadata for the item, from <metadata>(ocaid, directory) or <ocaid>_meta.xml."""
+    if metadata:
+        item['meta'] = metadata(item['ocaid'], item['directory'])
+    else:
+        item['meta'] = marcia.read_metadata(os.path.join(item['directory'], '%s_meta.xml' % item['ocaid']))
+    return item
+
+
+def convert_item(item, output='marc'):
+    """Runs the IAMarcXml transform on every record of the item, a single <record> or a <collection>,
+       and serializes the results.
+    """
+    records = marcia.read_records(io.BytesIO(item.pop('xml')))
+    item['output'] = b''.join(marcia.serialize(marcia.IAMarcXml(item['ocaid'], root, **item['meta']), output) for root in records)
+    return item
+
+
+class Convert(object):
+    """convert_item for an output format, picklable to send to worker processes."""
+    def __init__(self, output):
+        self.output = output
+
+    def __call__(self, item):
+        return convert_item(item, self.output)
+
+
+def ia_pipeline(jobs=1, output='marc', metadata=None):
+    """Returns the check, repair, transcode, metadata and convert Pipeline, with CPU stages over <jobs> processes."""
+    return Pipeline([
+        Stage('check',     check_item,     processes=jobs),
+        Stage('repair',    repair_item),
+        Stage('transcode', transcode_item, processes=jobs),
+        Stage('metadata',  lambda item: metadata_item(item, metadata)),
+        Stage('convert',   Convert(output), processes=jobs),
+    ])
+
+
+def read_items(directory, manifest=None):
+    """Yields an item for every <ocaid>_archive_marc.xml or <ocaid>_marc.xml in <directory>,
+       or only those in itemlist <manifest>.
+    """
+    filenames = sorted(os.path.join(directory, f) for f in os.listdir(directory) if checkmarc.MARC_FILENAME.match(f))
+    if manifest:
+        with open(manifest) as f:
+            ocaids = set(line.strip() for line in f if line.strip())
+        filenames = [f for f in filenames if checkmarc.ocaid(f) in ocaids]
+    for filename in filenames:
+        yield {'ocaid': checkmarc.ocaid(filename), 'directory': directory, 'filename': filename}
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Check, fix and convert a directory of IA MARC items to Internet Archive online resource MARC.')
+    parser.add_argument('-d', '--directory', default='.', help='Directory containing <ocaid>_marc.xml, <ocaid>_meta.mrc and <ocaid>_meta.xml')
+    parser.add_argument('-m', '--manifest', help='Itemlist of OCAIDs to process, rather than every item in the directory')
+    parser.add_argument('-o', '--output', default='marc', choices=['marc', 'marcxml'], help='Output format, marc or marcxml')
+    parser.add_argument('-f', '--outfile', help='Write output to file, rather than STDOUT')
+    parser.add_argument('-e', '--errors', help='Write per item error and skipped report to file, rather than STDERR')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='Number of worker processes for each CPU stage')
+    parser.add_argument('-M', '--metadata', help='Metadata index built by metaindex.py, rather than reading <ocaid>_meta.xml')
+    args = parser.parse_args()
+
+    metadata = None
+    if args.metadata:
+        import metaindex
+        metadata = metaindex.MetadataIndex(args.metadata)
+
+    error_log = open(args.errors, 'w') if args.errors else sys.stderr
+    out = open(args.outfile, 'wb') if args.outfile else sys.stdout.buffer
+    pipeline = ia_pipeline(args.jobs, args.output, metadata)
+    skipped = collections.Counter()
+    failures = 0
+
+    def data():
+        global failures
+        for item in pipeline.run(read_items(args.directory, args.manifest)):
+            if 'error' in item:
+                failures += 1
+                error_log.write("%s\t%s\t%s\n" % (item['filename'], item['ocaid'], item['error']))
+            elif 'skipped' in item:
+                skipped[item['skipped']] += 1
+                error_log.write("%s\t%s\tskipped, %s\n" % (item['filename'], item['ocaid'], item['skipped']))
+            else:
+                yield item['output']
+
+    start = time.perf_counter()
+    marcia.write_output(data(), out, args.output)
+    if args.outfile:
+        out.close()
+    pipeline.report(sys.stderr)
+    sys.stderr.write("%.1f s, %i failed, skipped: %s\n" % (time.perf_counter() - start, failures,
+                     ', '.join('%i %s' % (n, name) for name, n in sorted(skipped.items())) or 'none'))
+    if metadata and metadata.misses:
+        sys.stderr.write("%i items not found in metadata index %s\n" % (metadata.misses, args.metadata))
+    if args.errors:
+        error_log.close()
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,192 @@
+#!/usr/bin/python3
+
+"""A compact in-memory MARC record model, an alternative to lxml element trees.
+
+   Records are made of small __slots__ objects, with no namespace or C tree overhead, which pickle
+   cheaply between processes. They support the part of the lxml element API that marcia uses
+   (tag, text, get(), set(), iteration, append(), insert() and remove()), so the MarcXml methods
+   and the IAMarcXml transform run on them unchanged, as MarcRecord and IAMarcRecord.
+
+   usage:
+       record = IAMarcRecord(ocaid, from_iso2709(raw), **meta)
+       binary_marc = to_iso2709(record.data)
+"""
+
+from lxml import etree
+
+import iso2709
+import marcia
+from marcia import CONTROLFIELD, DATAFIELD, LEADER, MARC21_NS, RECORD
+
+SUBFIELD = '{%s}subfield' % MARC21_NS
+
+
+class Element(object):
+    """Base of the record model classes. XML attributes are stored in slots, named by ATTRIBUTES."""
+    __slots__ = ()
+    ATTRIBUTES = {}
+
+    def get(self, name, default=None):
+        slot = self.ATTRIBUTES.get(name)
+        value = getattr(self, slot) if slot else None
+        return default if value is None else value
+
+    def set(self, name, value):
+        setattr(self, self.ATTRIBUTES[name], value)
+
+
+class Parent(Element):
+    """An Element with a list of children."""
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self.children)
+
+    def __len__(self):
+        return len(self.children)
+
+    def __getitem__(self, i):
+        return self.children[i]
+
+    def append(self, child):
+        self.children.append(child)
+
+    def insert(self, i, child):
+        self.children.insert(i, child)
+
+    def remove(self, child):
+        self.children.remove(child)
+
+
+class Leader(Element):
+    __slots__ = ('text',)
+    tag = LEADER
+
+    def __init__(self, text):
+        self.text = text
+
+
+class Comment(Element):
+    __slots__ = ('text',)
+    tag = staticmethod(etree.Comment)  # as lxml comments, not a method
+
+    def __init__(self, text):
+        self.text = text
+
+
+class ControlField(Element):
+    __slots__ = ('marc_tag', 'text')
+    tag = CONTROLFIELD
+    ATTRIBUTES = {'tag': 'marc_tag'}
+
+    def __init__(self, tag, text):
+        self.marc_tag = tag
+        self.text = text
+
+
+class Subfield(Element):
+    __slots__ = ('code', 'text')
+    tag = SUBFIELD
+    ATTRIBUTES = {'code': 'code'}
+
+    def __init__(self, code, text):
+        self.code = code
+        self.text = text
+
+
+class DataField(Parent):
+    __slots__ = ('marc_tag', 'ind1', 'ind2', 'children')
+    tag = DATAFIELD
+    ATTRIBUTES = {'tag': 'marc_tag', 'ind1': 'ind1', 'ind2': 'ind2'}
+
+    def __init__(self, tag, ind1=' ', ind2=' ', subfields=None):
+        self.marc_tag = tag
+        self.ind1 = ind1
+        self.ind2 = ind2
+        self.children = subfields or []
+
+
+class Record(Parent):
+    __slots__ = ('children',)
+    tag = RECORD
+
+    def __init__(self, fields=None):
+        self.children = fields or []
+
+
+class MarcRecord(marcia.MarcXml):
+    """MarcXml on a record.Record rather than an lxml element tree."""
+
+    def comments(self):
+        return [e for e in self.data if e.tag is etree.Comment]
+
+    def subfields(self, field, code=None):
+        if code is None:
+            return list(field.children)
+        return [sub for sub in field.children if sub.code == code]
+
+    def new_controlfield(self, tag, text):
+        return ControlField(tag, text)
+
+    def new_datafield(self, tag, ind1=' ', ind2=' '):
+        return DataField(tag, ind1, ind2)
+
+    def new_subfield(self, code, text):
+        return Subfield(code, text)
+
+    def tostring(self, element):
+        return etree.tostring(to_element(element), encoding='unicode')
+
+
+class IAMarcRecord(marcia.IAMarcXml, MarcRecord):
+    """The IAMarcXml transform, on a record.Record."""
+
+
+def from_element(element):
+    """Returns a Record from a MARC XML record element. Comments within datafields are dropped."""
+    fields = []
+    for e in element:
+        if e.tag == CONTROLFIELD:
+            fields.append(ControlField(e.get('tag', ''), e.text))
+        elif e.tag == DATAFIELD:
+            fields.append(DataField(e.get('tag', ''), e.get('ind1'), e.get('ind2'),
+                                    [Subfield(s.get('code', ''), s.text) for s in e if s.tag == SUBFIELD]))
+        elif e.tag == LEADER:
+            fields.append(Leader(e.text))
+        elif e.tag is etree.Comment:
+            fields.append(Comment(e.text))
+    return Record(fields)
+
+
+def to_element(record):
+    """Returns a Record, or any of its fields, as MARC XML elements."""
+    if record.tag is etree.Comment:
+        return etree.Comment(record.text)
+    attributes = dict((name, record.get(name)) for name in record.ATTRIBUTES if record.get(name) is not None)
+    element = etree.Element(record.tag, attributes, nsmap={None: MARC21_NS})
+    if isinstance(record, Parent):
+        for child in record:
+            element.append(to_element(child))
+    else:
+        element.text = record.text
+    return element
+
+
+def from_iso2709(raw, encoding='utf-8'):
+    """Returns a Record from binary MARC, without building XML. See iso2709.read_fields()."""
+    leader, fields = iso2709.read_fields(raw, encoding)
+    record = Record([Leader(leader)])
+    for field in fields:
+        if field[0] is None:
+            record.append(Comment(field[1]))
+        elif len(field) == 2:
+            record.append(ControlField(*field))
+        else:
+            tag, indicators, subfields = field
+            record.append(DataField(tag, indicators[0], indicators[1], [Subfield(code, text) for code, text in subfields]))
+    return record
+
+
+def to_iso2709(record):
+    """Returns a Record as binary MARC."""
+    return iso2709.write_record(record)
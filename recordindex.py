@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+
+"""Random access to records in large binary MARC files, through an offset index sidecar, <file.mrc>.idx.
+
+   The sidecar holds the byte offset, length and 001 control number of every record, as flat arrays
+   in native byte order which are memory mapped, not loaded: records are fetched by ordinal directly,
+   and by 001 with a binary search over the ordinals sorted by control number.
+   Record-aligned byte ranges of even size, for parallel workers, come from the offsets without scanning the file.
+
+   usage:
+       recordindex.py <file.mrc>                          build (or rebuild) the index
+       recordindex.py <file.mrc> -i <001> [-i <001> ...]  write records by control number to STDOUT
+       recordindex.py <file.mrc> -n <ordinal> ...         write records by ordinal (from 0) to STDOUT
+       recordindex.py <file.mrc> -r <n>                   print <n> record-aligned byte ranges
+"""
+
+import argparse
+import array
+import bisect
+import mmap
+import os
+import struct
+import sys
+
+import fixindex
+import iso2709
+
+MAGIC = b'MARCIDX1'
+# magic, byte order check (1), records, .mrc size, .mrc mtime (ns), control number bytes
+HEADER = struct.Struct('=8sQQQQQ')
+
+
+def sidecar(filename):
+    return filename + '.idx'
+
+
+def aligned(size):
+    return size + -size % 8
+
+
+def read_control_numbers(mm):
+    """Yields (offset, length, 001 bytes) for every record in mapped binary MARC <mm>.
+       The 001 is b'' if it can not be found, as in records with a broken directory.
+    """
+    for pos, raw in iso2709.read_range(mm, 0, len(mm)):
+        try:
+            leader, index, start = fixindex.read_index(raw)
+            number = fixindex.control_number(index, raw, start).encode('utf-8')
+        except (IndexError, ValueError):
+            number = b''
+        yield pos, len(raw), number
+
+
+def build(filename, index=None):
+    """Writes the offset index of binary MARC file <filename> to <index>, default <filename>.idx.
+       Returns the number of records indexed.
+    """
+    offsets = array.array('Q')
+    lengths = array.array('I')
+    id_offsets = array.array('Q', [0])
+    ids = []
+    stat = os.stat(filename)
+    if stat.st_size:
+        with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset, length, number in read_control_numbers(mm):
+                offsets.append(offset)
+                lengths.append(length)
+                ids.append(number)
+                id_offsets.append(id_offsets[-1] + len(number))
+    # stable sort: duplicate control numbers stay in file order
+    by_id = array.array('I', sorted(range(len(ids)), key=ids.__getitem__))
+    ids = b''.join(ids)
+    tmp = (index or sidecar(filename)) + '.tmp'
+    with open(tmp, 'wb') as out:
+        out.write(HEADER.pack(MAGIC, 1, len(offsets), stat.st_size, stat.st_mtime_ns, len(ids)))
+        for section in [offsets, lengths, id_offsets, by_id, ids]:
+            data = section.tobytes() if isinstance(section, array.array) else section
+            out.write(data + b'\0' * (aligned(len(data)) - len(data)))
+    os.replace(tmp, index or sidecar(filename))
+    return len(offsets)
+
+
+class RecordIndex(object):
+    """Records of binary MARC file <filename> by ordinal and by 001, through its offset index sidecar.
+       The index is built if it is missing, or older than the file.
+    """
+    def __init__(self, filename, index=None):
+        self.filename = filename
+        index = index or sidecar(filename)
+        if not self.current(index):
+            build(filename, index)
+        self._file = open(filename, 'rb')
+        self._index_file = open(index, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, order, n, size, mtime, ids_len = HEADER.unpack_from(self.index)
+        if magic != MAGIC or order != 1:
+            raise ValueError('%s is not an offset index for this machine' % index)
+        self._view = memoryview(self.index)
+        pos = HEADER.size
+        sections = []
+        for fmt, count in [('Q', n), ('I', n), ('Q', n + 1), ('I', n)]:
+            length = struct.calcsize(fmt) * count
+            sections.append(self._view[pos:pos+length].cast(fmt))
+            pos += aligned(length)
+        self.offsets, self.lengths, self.id_offsets, self.by_id = sections
+        self.ids = self._view[pos:pos+ids_len]
+
+    def current(self, index):
+        """Returns True if <index> exists and was built from the file as it is now."""
+        if not os.path.exists(index):
+            return False
+        with open(index, 'rb') as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return False
+        magic, order, n, size, mtime, ids_len = HEADER.unpack(header)
+        stat = os.stat(self.filename)
+        return magic == MAGIC and order == 1 and (size, mtime) == (stat.st_size, stat.st_mtime_ns)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, n):
+        """Returns record <n>, by ordinal from 0, as raw bytes."""
+        offset = self.offsets[n]
+        return self.mm[offset:offset+self.lengths[n]]
+
+    def control_number(self, n):
+        """Returns the 001 of record <n>, or '' if it has none."""
+        return bytes(self.ids[self.id_offsets[n]:self.id_offsets[n+1]]).decode('utf-8')
+
+    def _id(self, i):
+        n = self.by_id[i]
+        return bytes(self.ids[self.id_offsets[n]:self.id_offsets[n+1]])
+
+    def find(self, control_number):
+        """Returns the ordinals of the records with 001 <control_number>, in file order."""
+        key = control_number.strip().encode('utf-8')
+        lo, hi = 0, len(self.by_id)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        found = []
+        while lo < len(self.by_id) and self._id(lo) == key:
+            found.append(self.by_id[lo])
+            lo += 1
+        return found
+
+    def get(self, control_number):
+        """Returns the first record with 001 <control_number> as raw bytes, or None."""
+        found = self.find(control_number)
+        return self[found[0]] if found else None
+
+    def ranges(self, n):
+        """Returns up to <n> (start, end) byte ranges of whole records, of about even size, covering the file."""
+        if not len(self):
+            return [(0, self.size)] if self.size else [(0, 0)]
+        bounds = [0]
+        for i in range(1, n):
+            lo = bisect.bisect_left(self.offsets, self.size * i // n)
+            if lo < len(self.offsets) and self.offsets[lo] > bounds[-1]:
+                bounds.append(self.offsets[lo])
+        bounds.append(self.size)
+        return list(zip(bounds, bounds[1:]))
+
+    def close(self):
+        for view in [self.offsets, self.lengths, self.id_offsets, self.by_id, self.ids, self._view]:
+            view.release()
+        self.index.close()
+        if self.size:
+            self.mm.close()
+        self._index_file.close()
+        self._file.close()
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Index a binary MARC file for random access, and fetch records by 001 or ordinal.')
+    parser.add_argument('filename', help='binary MARC filename')
+    parser.add_argument('-i', '--id', action='append', default=[], help='Write the records with this 001 to STDOUT')
+    parser.add_argument('-n', '--ordinal', type=int, action='append', default=[], help='Write record number <n>, from 0, to STDOUT')
+    parser.add_argument('-r', '--ranges', type=int, help='Print <n> record-aligned byte ranges')
+    parser.add_argument('-x', '--index', help='Index filename, default <filename>.idx')
+    args = parser.parse_args()
+
+    if not (args.id or args.ordinal or args.ranges):
+        count = build(args.filename, args.index)
+        sys.stderr.write('%i records indexed in %s\n' % (count, args.index or sidecar(args.filename)))
+        sys.exit(0)
+
+    with RecordIndex(args.filename, args.index) as index:
+        missing = 0
+        for control_number in args.id:
+            found = index.find(control_number)
+            if not found:
+                missing += 1
+                sys.stderr.write('No record with 001 %s\n' % control_number)
+            for n in found:
+                sys.stdout.buffer.write(index[n])
+        for n in args.ordinal:
+            sys.stdout.buffer.write(index[n])
+        if args.ranges:
+            for start, end in index.ranges(args.ranges):
+                print('%i\t%i' % (start, end))
+    sys.exit(1 if missing else 0)
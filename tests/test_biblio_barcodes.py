@@ -0,0 +1,88 @@
+import collections
+import importlib.util
+import os
+import subprocess
+import sys
+import pytest
+
+UTILS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'utils')
+spec = importlib.util.spec_from_file_location('biblio_barcodes', os.path.join(UTILS, 'biblio-barcodes.py'))
+biblio_barcodes = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(biblio_barcodes)
+
+LEADER = b'00000cam  2200000 a 4500'
+BARCODES = {'b1': ['39001', '39002'], 'b3': ['39003']}
+
+
+def record(fields, marc8=False):
+    leader = LEADER[:9] + (b' ' if marc8 else b'a') + LEADER[10:]
+    return biblio_barcodes.write(leader, [[tag, content] for tag, content in fields])
+
+
+RECORDS = [
+    # ASCII MARC-8, no barcodes
+    record([(b'001', b'b0'), (b'245', b'10\x1faPlain title')], marc8=True),
+    # UTF-8, with barcodes
+    record([(b'001', b'b1'), (b'245', '10\x1faCaf\u00e9'.encode('utf-8'))]),
+    # holdings
+    record([(b'001', b'h2'), (b'004', b'b1'), (b'876', b'  \x1fp39001')]),
+    # MARC-8 with diacritics and Cyrillic, with a barcode
+    record([(b'001', b'b3'), (b'008', b'820312s1983'), (b'245', b'10\x1faCaf\xe2e :\x1fb\x1b(NMIR\x1b(B.\x1fcM\xe8uller'),
+            (b'500', b' \x1fa\x1f\x1fbx\xfcy')], marc8=True),
+]
+
+
+def lookup(id_):
+    return BARCODES.get(id_, [])
+
+
+def test_add_barcodes():
+    c = collections.Counter()
+    ascii_record = biblio_barcodes.add_barcodes(RECORDS[0], lookup, c)
+    assert ascii_record == RECORDS[0][:9] + b'a' + RECORDS[0][10:]
+    with_barcodes = biblio_barcodes.add_barcodes(RECORDS[1], lookup, c)
+    leader, fields = biblio_barcodes.fields(with_barcodes)
+    assert fields[-2:] == [[b'976', b'  \x1fa39001'], [b'976', b'  \x1fa39002']]
+    assert int(leader[:5]) == len(with_barcodes) and with_barcodes[int(leader[12:17]) - 1:int(leader[12:17])] == b'\x1e'
+    assert biblio_barcodes.add_barcodes(RECORDS[2], lookup, c) is None
+    converted = biblio_barcodes.add_barcodes(RECORDS[3], lookup, c)
+    leader, fields = biblio_barcodes.fields(converted)
+    assert leader[9:10] == b'a'
+    assert fields[2] == [b'245', '10\x1faCaf\u00e9 :\x1fb\u043c\u0438\u0440.\x1fcM\u00fcller'.encode('utf-8')]
+    # indicators padded to two, empty subfields dropped, 0xFC (not in ANSEL) a space, as pymarc does
+    assert fields[3] == [b'500', b'  \x1fa\x1fbx y']
+    assert fields[-1] == [b'976', b'  \x1fa39003']
+    assert c == {'holdings': 1, 'barcodes': 3, 'with barcodes': 2, 'marc8': 1}
+
+
+def pymarc_output(biblio):
+    """The output of the pymarc version of biblio-barcodes.py."""
+    pymarc = pytest.importorskip('pymarc')
+    output = []
+    with open(biblio, 'rb') as f:
+        for rec in pymarc.MARCReader(f, to_unicode=True, hide_utf8_warnings=True):
+            if rec.get('876'):
+                continue
+            for b in BARCODES.get(rec['001'].value().strip(), []):
+                rec.add_field(pymarc.Field(tag='976', indicators=[' ', ' '], subfields=[pymarc.Subfield('a', b)]))
+            rec.leader = rec.leader[:9] + 'a' + rec.leader[10:]
+            output.append(rec.as_marc())
+    return b''.join(output)
+
+
+def test_merge(tmpdir):
+    biblio = str(tmpdir.join('biblio.mrc'))
+    with open(biblio, 'wb') as f:
+        f.write(b''.join(RECORDS * 10))
+    tsv = tmpdir.join('barcodes.tsv')
+    tsv.write(''.join('%s\t%s\n' % (id_, b) for id_, barcodes in BARCODES.items() for b in barcodes))
+    outputs = []
+    for jobs in ['1', '3']:
+        out = str(tmpdir.join('out%s.mrc' % jobs))
+        subprocess.check_call([sys.executable, os.path.join(UTILS, 'biblio-barcodes.py'), '-o', out, '-j', jobs, biblio, str(tsv)],
+                              stdout=subprocess.DEVNULL)
+        with open(out, 'rb') as f:
+            outputs.append(f.read())
+    assert outputs[0] == outputs[1]
+    assert outputs[0].count(b'\x1d') == 30
+    assert outputs[0] == pymarc_output(biblio)
@@ -0,0 +1,58 @@
+import os
+import cache
+
+def test_get_put(tmpdir):
+    marc = tmpdir.join('item_marc.xml')
+    marc.write('<record/>')
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '1') as c:
+        assert c.get([str(marc)]) is None
+        c.put([str(marc)], 'bad_index')
+        assert c.get([str(marc)]) == 'bad_index'
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '1') as c:
+        assert c.get([str(marc)]) == 'bad_index'
+        assert (c.hits, c.misses) == (1, 0)
+
+def test_changed_file(tmpdir):
+    marc = tmpdir.join('item_marc.xml')
+    marc.write('<record/>')
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '1') as c:
+        c.put([str(marc)], 'found')
+        # touched, same content
+        os.utime(str(marc), ns=(0, 0))
+        assert c.get([str(marc)]) == 'found'
+        marc.write('<record></record>')
+        assert c.get([str(marc)]) is None
+
+def test_changed_while_producing(tmpdir):
+    """A file changed after get() missed, while its result was produced from the old content, is not cached as unchanged."""
+    marc = tmpdir.join('item_marc.xml')
+    marc.write('<record/>')
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '1') as c:
+        assert c.get([str(marc)]) is None
+        marc.write('<record></record>')
+        c.put([str(marc)], 'from <record/>')
+        assert c.get([str(marc)]) is None
+        c.put([str(marc)], 'from <record></record>')
+        assert c.get([str(marc)]) == 'from <record></record>'
+
+def test_dependencies(tmpdir):
+    marc, meta = tmpdir.join('item_marc.xml'), tmpdir.join('item_meta.xml')
+    marc.write('<record/>')
+    paths = [str(marc), str(meta)]
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '1') as c:
+        c.put(paths, b'output')
+        assert c.get(paths) == b'output'
+        meta.write('<metadata/>')
+        assert c.get(paths) is None
+
+def test_version_change(tmpdir):
+    marc = tmpdir.join('item_marc.xml')
+    marc.write('<record/>')
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '1') as c:
+        c.put([str(marc)], 'found')
+    with cache.Cache(str(tmpdir.join('cache.db')), 'other', '1') as c:
+        c.put([str(marc)], 'other')
+    with cache.Cache(str(tmpdir.join('cache.db')), 'test', '2') as c:
+        assert c.get([str(marc)]) is None
+    with cache.Cache(str(tmpdir.join('cache.db')), 'other', '1') as c:
+        assert c.get([str(marc)]) == 'other'
@@ -0,0 +1,52 @@
+import checkmarc
+
+def marc(content='', leader='00971cam a2200289 a 4500'):
+    return '''<record xmlns="http://www.loc.gov/MARC21/slim">
+  <leader>%s</leader>
+  <controlfield tag="008">820312s1983    alu          s00110 eng  </controlfield>
+  %s
+</record>''' % (leader, content)
+
+def test_check_text_clean():
+    assert checkmarc.check_text(marc('<datafield tag="245" ind1="1" ind2="0"><subfield code="a">Café</subfield></datafield>')) == set()
+
+def test_check_text_all_detectors():
+    """Every detector is found in a single scan, even when matches overlap."""
+    content = '''<!-- No separator at end of field length=40 -->
+  <datafield tag="020" ind1=" " ind2=" "><subfield code="a">0817307885 (v. 1)</subfield></datafield>
+  <datafield tag="" ind1=" " ind2=" "><subfield code="a">Renâe ℗♭1988</subfield></datafield>
+  <controlfield tag="008">820312s1983    alu          s00110 eng  </controlfield>'''
+    assert checkmarc.check_text(marc(content, leader='00971cas a2200289 a 4500')) == set(
+        ['bad_index', 'multi_volumes', 'bad_tag', 'bad_unicode', 'bad_source', 'non_monographs', 'multi_008'])
+
+def test_check_text_other_comments():
+    assert checkmarc.check_text(marc('<!-- Separator but not at end of field length=12 -->')) == set(['xml_comments'])
+    assert checkmarc.check_text(marc('<!-- Separator but not at end of field length=40 -->')) == set(['bad_index'])
+
+def test_check_text_source_only_for_archive_marc():
+    text = marc('<datafield tag=""/>')
+    assert checkmarc.check_text(text, archive=True) == set(['bad_tag'])
+    assert checkmarc.check_text(text, archive=False) == set()
+
+def test_check_text_no_records():
+    assert checkmarc.check_text(marc().replace(' xmlns="http://www.loc.gov/MARC21/slim"', '')) == set(['bad_structure'])
+
+def test_check_all(tmpdir):
+    tmpdir.join('good_archive_marc.xml').write(marc())
+    tmpdir.join('serial_archive_marc.xml').write(marc(leader='00971cas a2200289 a 4500'))
+    tmpdir.join('bad_marc.xml').write(marc('<!-- No separator at end of field length=40 -->'))
+    results = checkmarc.check_all(sorted(str(f) for f in tmpdir.listdir()), jobs=2)
+    assert results['non_monographs'] == ['serial']
+    assert results['bad_index'] == ['bad']
+    assert results['multi_008'] == []
+
+def test_check_all_cache(tmpdir):
+    import cache
+    serial = tmpdir.join('serial_archive_marc.xml')
+    serial.write(marc(leader='00971cas a2200289 a 4500'))
+    with cache.Cache(str(tmpdir.join('cache.db')), 'checkmarc', '1') as c:
+        assert checkmarc.check_all([str(serial)], jobs=1, cache=c)['non_monographs'] == ['serial']
+        assert checkmarc.check_all([str(serial)], jobs=1, cache=c)['non_monographs'] == ['serial']
+        serial.write(marc())
+        assert checkmarc.check_all([str(serial)], jobs=1, cache=c)['non_monographs'] == []
+        assert (c.hits, c.misses) == (1, 2)
@@ -1,3 +1,4 @@
+import io
 import fixindex
 import os
 from subprocess import Popen, PIPE
@@ -37,3 +38,42 @@ def test_fixindex_bad_marc():
         print(yaz_output)
         assert b"No separator at end of field" not in yaz_output
         assert b"Separator but not at end of field" not in yaz_output
+
+def test_fix_records_multiple():
+    """Every record in a concatenated file is fixed, as it would be on its own."""
+    records = []
+    for name in [moderate_bad_marc, good_marc, bad_marc]:
+        with open(os.path.join(DATA, name), 'rb') as f:
+            records.append(f.read())
+    reports = []
+    fixed = list(fixindex.fix_records(io.BytesIO(b''.join(records)), lambda n, raw, changes: reports.append(changes)))
+    assert len(fixed) == 3
+    assert fixed[1] == records[1]
+    for raw, output in zip(records, fixed):
+        assert fixindex.fix_index(io.BytesIO(raw)) == output
+    assert [len(r) for r in reports] == [19, 0, 20]
+
+def test_fix_mmap(tmpdir):
+    """Memory mapped repair gives the same output as streamed repair."""
+    records = b''
+    for name in [moderate_bad_marc, good_marc, bad_marc]:
+        with open(os.path.join(DATA, name), 'rb') as f:
+            records += f.read()
+    source = tmpdir.join('source.mrc')
+    source.write_binary(records * 5)
+    with open(str(tmpdir.join('fixed.mrc')), 'wb') as out:
+        fixindex.fix_mmap(str(source), out.fileno())
+    assert tmpdir.join('fixed.mrc').read_binary() == fixindex.fix_index(io.BytesIO(records * 5))
+
+def test_fix_record_overshoot():
+    """Index lengths that run past the end of a field are shortened."""
+    with open(os.path.join(DATA, good_marc), 'rb') as f:
+        raw = f.read()
+    leader, index, pos = fixindex.read_index(raw)
+    corrupt = bytearray(raw)
+    for i, (tag, tag_len, offset) in enumerate(index):
+        if tag in [b'245', b'300']:
+            corrupt[24 + 12 * i + 3:24 + 12 * i + 7] = b'%04d' % (int(tag_len) + 20)
+    fixed, changes = fixindex.fix_record(bytes(corrupt))
+    assert fixed == raw
+    assert [(tag, c[0] - o[0]) for tag, o, c in changes] == [(b'245', -20), (b'300', -20)]
@@ -0,0 +1,27 @@
+import fixmarc
+import os
+import shutil
+from lxml import etree
+
+DATA = os.path.join(os.path.dirname(__file__), 'test_data')
+NS = {'m': "http://www.loc.gov/MARC21/slim"}
+
+def test_fix_item_bad_index(tmpdir):
+    """Fixing an item with a bad index backs up the binary MARC, and regenerates MARC XML without conversion comments."""
+    shutil.copy(os.path.join(DATA, 'bad_marc_adolphethiers00rena.mrc'), str(tmpdir.join('adolphethiers00rena_meta.mrc')))
+    tmpdir.join('bad_index.txt').write('adolphethiers00rena\n')
+    fixmarc.fix_item('adolphethiers00rena', str(tmpdir), fix_index=True)
+    assert tmpdir.join('backup', 'adolphethiers00rena_meta.mrc').check()
+    collection = etree.parse(str(tmpdir.join('adolphethiers00rena_marc.xml'))).getroot()
+    assert len(collection) == 1
+    assert collection.xpath('//comment()') == []
+    assert collection.xpath('m:record/m:datafield[@tag="100"]/m:subfield[@code="a"]', namespaces=NS)[0].text == 'Albrecht-Carrié, René,'
+
+def test_fix_item_eacc(tmpdir):
+    """MARC-8 CJK is converted from the EACC table in marc8.py."""
+    field = b'1 \x1fa\x1b$1!0d\x1b(B\x1e'
+    raw = b'%05dnam  2200037 a 4500' % (37 + len(field) + 1) + b'245%04d00000' % len(field) + b'\x1e' + field + b'\x1d'
+    tmpdir.join('cjk_meta.mrc').write_binary(raw)
+    fixmarc.fix_item('cjk', str(tmpdir), marc8=True)
+    collection = etree.parse(str(tmpdir.join('cjk_marc.xml'))).getroot()
+    assert collection.xpath('m:record/m:datafield[@tag="245"]/m:subfield[@code="a"]', namespaces=NS)[0].text == '\u4eba'
@@ -0,0 +1,65 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import pytest
+
+UTILS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'utils')
+spec = importlib.util.spec_from_file_location('holdings_extract', os.path.join(UTILS, 'holdings-extract.py'))
+holdings_extract = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(holdings_extract)
+
+
+def record(fields, marc8=False):
+    """Returns a raw holdings record from a list of (tag, content bytes)."""
+    directory = b''
+    data = b''
+    for tag, content in fields:
+        directory += tag + b'%04d%05d' % (len(content) + 1, len(data))
+        data += content + b'\x1e'
+    base_address = 24 + len(directory) + 1
+    leader = b'%05dnx  %s22%05d   4500' % (base_address + len(data) + 1, b' ' if marc8 else b'a', base_address)
+    return leader + directory + b'\x1e' + data + b'\x1d'
+
+
+RECORDS = [
+    record([(b'001', b'h1'), (b'004', b'1001'), (b'876', b'  \x1fa1\x1fp39001\x1fp39002'), (b'876', b'  \x1fp39003')]),
+    record([(b'001', b'h2'), (b'004', b'1002'), (b'852', b'0 \x1fbMAIN\x1fp876')]),
+    record([(b'001', b'h3'), (b'004', b'1003'), (b'876', b'  \x1fpCaf\xe2e\x1fpx\xfcy\x1b(Nabv\x1b(B')], marc8=True),
+    record([(b'001', b'h4'), (b'004', b'10\xe904'), (b'876', b'  \x1fa1')], marc8=True),
+    record([(b'001', b'h5'), (b'004', '1005é'.encode('utf-8')), (b'876', '  \x1fp3900é'.encode('utf-8'))]),
+]
+
+
+def pymarc_tsv(filename):
+    """The .tsv as the pymarc version of holdings-extract.py writes it."""
+    pymarc = pytest.importorskip('pymarc')
+    lines = []
+    with open(filename, 'rb') as f:
+        for rec in pymarc.MARCReader(f, to_unicode=True, permissive=True, hide_utf8_warnings=True):
+            holdings = rec.get_fields('876')
+            if holdings:
+                bibid = rec['004'].value()
+                lines += ['%s\t%s\n' % (bibid, code_value[1]) for code_value in holdings[0] if code_value[0] == 'p']
+    return ''.join(lines)
+
+
+def test_barcodes():
+    assert holdings_extract.barcodes(RECORDS[0]) == ['1001\t39001\n', '1001\t39002\n']
+    assert holdings_extract.barcodes(RECORDS[1]) == []
+    # composed, and 0xFC, not in ANSEL, a space
+    assert holdings_extract.barcodes(RECORDS[2]) == ['1003\tCaf\u00e9\n', '1003\tx y\u0410\u0411\u0416\n']
+    assert holdings_extract.barcodes(RECORDS[3]) == []
+    assert holdings_extract.barcodes(RECORDS[4]) == ['1005\u00e9\t3900\u00e9\n']
+
+
+def test_matches_pymarc(tmpdir):
+    filename = str(tmpdir.join('holdings.mrc'))
+    with open(filename, 'wb') as f:
+        f.write(b''.join(RECORDS * 20))
+    expected = pymarc_tsv(filename)
+    assert 'Caf\u00e9' in expected and '\u0301' not in expected
+    assert holdings_extract.extract((filename, 0, os.path.getsize(filename))) == expected
+    for jobs in ['1', '3']:
+        output = subprocess.check_output([sys.executable, os.path.join(UTILS, 'holdings-extract.py'), '-j', jobs, filename])
+        assert output.decode('utf-8') == expected
@@ -0,0 +1,74 @@
+import fixindex
+import iso2709
+import os
+from lxml import etree
+
+DATA = os.path.join(os.path.dirname(__file__), 'test_data')
+MARC21_NS = "http://www.loc.gov/MARC21/slim"
+
+good_marc         = 'good_marc_00amyl.mrc'
+moderate_bad_marc = 'moderate_bad_marc_00book1220882465.mrc'
+
+def test_write_record_round_trip():
+    """Writing a record read from binary MARC reproduces the original bytes."""
+    with open(os.path.join(DATA, good_marc), 'rb') as f:
+        raw = f.read()
+    assert iso2709.write_record(iso2709.read_record(raw)) == raw
+
+def test_write_record_fixed_index():
+    with open(os.path.join(DATA, moderate_bad_marc), 'rb') as f:
+        raw = fixindex.fix_index(f)
+    assert iso2709.write_record(iso2709.read_record(raw)) == raw
+
+def test_write_record_lengths():
+    record = etree.fromstring('''<record xmlns="%s">
+      <leader>00000nam a2200000 a 4500</leader>
+      <!-- comments are ignored -->
+      <controlfield tag="001">ocaid</controlfield>
+      <datafield tag="245" ind1="1" ind2="0"><subfield code="a">Café</subfield></datafield>
+    </record>''' % MARC21_NS)
+    raw = iso2709.write_record(record)
+    assert raw == (b'00066nam a2200049 a 4500'
+                   b'001000600000'
+                   b'245001000006'
+                   b'\x1eocaid\x1e10\x1faCaf\xc3\xa9\x1e\x1d')
+
+def test_read_record_corrupt_index():
+    """Fields which do not end where the index says are marked with comments, as yaz-marcdump does."""
+    with open(os.path.join(DATA, moderate_bad_marc), 'rb') as f:
+        record = iso2709.read_record(f.read())
+    comments = [c.text for c in record.iter(etree.Comment)]
+    assert ' No separator at end of field length=40 ' in comments
+
+def test_read_record_bad_directory():
+    """A directory entry which is not a number ends the directory with a comment, rather than an exception."""
+    with open(os.path.join(DATA, good_marc), 'rb') as f:
+        raw = f.read()
+    raw = raw[:24 + 12 + 3] + b'00x4' + raw[24 + 12 + 7:]
+    record = iso2709.read_record(raw)
+    assert [c.text for c in record.iter(etree.Comment)] == [
+        ' Directory offset 12: Bad value for data length and/or length starting (00x4%s) ' % raw[43:48].decode()]
+    assert len(record) == 3 and record[1].get('tag') == raw[24:27].decode()
+
+def test_read_record_marc8():
+    """MARC-8 records are converted to Unicode, and marked as such in Leader/09."""
+    field = b'1 \x1faAlbrecht-Carri\xe2e, Ren\xe2e\x1e'
+    raw = b'00071nam  2200037 a 4500' + b'100%04d00000' % len(field) + b'\x1e' + field + b'\x1d'
+    record = iso2709.read_record(raw, 'marc8')
+    assert record[0].text[9] == 'a'
+    assert record[1].get('tag') == '100'
+    assert record[1][0].text == 'Albrecht-Carrie\u0301, Rene\u0301'  # decomposed, as yaz-marcdump -t utf8
+
+def test_record_ranges(tmpdir):
+    with open(os.path.join(DATA, good_marc), 'rb') as f:
+        raw = f.read()
+    filename = tmpdir.join('records.mrc')
+    filename.write_binary(raw * 5 + b'\n')
+    ranges = iso2709.record_ranges(str(filename), 3)
+    assert len(ranges) == 3 and ranges[0][0] == 0 and ranges[-1][1] == len(raw) * 5 + 1
+    assert all(start % len(raw) == 0 for start, end in ranges)
+    data = filename.read_binary()
+    records = [r for start, end in ranges for r in iso2709.read_range(data, start, end)]
+    assert records == [(i * len(raw), raw) for i in range(5)]
+    ranges = iso2709.record_ranges(str(filename), 20)
+    assert [r for start, end in ranges for r in iso2709.read_range(data, start, end)] == records
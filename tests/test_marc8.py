@@ -0,0 +1,44 @@
+import marc8
+import pytest
+
+def test_basic_latin():
+    assert marc8.decode(b'Plain ASCII text.') == 'Plain ASCII text.'
+
+def test_combining_diacritics_follow_base():
+    """MARC-8 diacritics precede the base character, Unicode combining characters follow it."""
+    assert marc8.decode(b'Albrecht-Carri\xe2e, Ren\xe2e') == 'Albrecht-Carrie\u0301, Rene\u0301'
+    assert marc8.decode(b'\xe8\xe5u') == 'u\u0308\u0304'
+
+def test_extended_latin():
+    assert marc8.decode(b'\xa1\xf2d\xc3') == '\u0141d\u0323\xa9'
+
+def test_escape_sequences():
+    # technique 1: subscripts, then back to ASCII
+    assert marc8.decode(b'H\x1bb2\x1bsO') == 'H₂O'
+    # technique 2: basic Cyrillic to G0, then ASCII
+    assert marc8.decode(b'\x1b(NMIR\x1b(B ok') == 'мир ok'
+
+def test_eacc():
+    assert marc8.decode(b'\x1b$1!0d\x1b(B ok') == '人 ok'
+
+def test_eacc_table():
+    """The generated EACC table is pymarc's, see utils/generate-eacc.py."""
+    mapping = pytest.importorskip('pymarc.marc8_mapping')
+    expected = dict((code, (chr(codepoint), bool(combining))) for code, (codepoint, combining) in mapping.CODESETS[marc8.EACC].items())
+    expected.update((code, (chr(codepoint), False)) for code, codepoint in mapping.ODD_MAP.items() if code not in expected)
+    assert marc8.EACC_TABLE == expected
+
+def test_unknown_character():
+    assert marc8.decode(b'\xaf') == marc8.REPLACEMENT
+
+def test_pymarc_compatible():
+    """pymarc=True decodes as pymarc's marc8_to_unicode: composed, unknown characters as spaces,
+       controls and trailing diacritics dropped."""
+    assert marc8.decode(b'Caf\xe2e') == 'Cafe\u0301'
+    assert marc8.decode(b'Caf\xe2e\x01\xaf\x88x\xe2', pymarc=True) == 'Caf\u00e9 x'
+    try:
+        from pymarc.marc8 import marc8_to_unicode
+    except ImportError:
+        return
+    for data in [b'Caf\xe2e\x01\xaf\x88x\xe2', b'\x1b(NMIR\x1b(B ok', b'H\x1bb2\x1bsO', b'\xa1\xf2d\xc3']:
+        assert marc8.decode(data, pymarc=True) == marc8_to_unicode(data, True)
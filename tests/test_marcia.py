@@ -1,3 +1,10 @@
+import io
+import json
+import os
+import pytest
+import subprocess
+import sys
+import iso2709
 import marcia as m
 from lxml import etree
 
@@ -61,3 +68,309 @@ def test_strip_nonword_tags():
     root = etree.fromstring(data)
     ia_marc = m.IAMarcXml('strip', root)
     assert ia_marc.get_datafield('.880') == []
+
+def test_convert_all_collection(tmpdir):
+    """Every record in a collection is converted, using 001 as OCAID, and bad records are reported."""
+    good = marc().replace('<leader>', '<controlfield tag="001">good_ocaid</controlfield><leader>', 1)
+    bad = marc('<!-- No separator at end of field length=40 -->').replace('<leader>', '<controlfield tag="001">bad_ocaid</controlfield><leader>', 1)
+    collection = tmpdir.join('partner.xml')
+    collection.write('<collection xmlns="%s">%s%s%s</collection>' % (MARC21_NS, good, bad, good))
+    errors = []
+    # records are single-pass: serialize each before the next is read
+    records = [(r.ocaid, m.serialize(r, 'marc')) for r in m.convert_all([str(collection)], lambda *e: errors.append(e))]
+    assert [ocaid for ocaid, data in records] == ['good_ocaid', 'good_ocaid']
+    assert records[0][1] == records[1][1] and b'good_ocaid' in records[0][1]
+    assert [e[1] for e in errors] == ['bad_ocaid']
+
+def test_no_records(tmpdir):
+    """A file without MARC 21 records is reported, not converted to nothing."""
+    tmpdir.join('plain_marc.xml').write(marc().replace(' xmlns="http://www.loc.gov/MARC21/slim"', ''))
+    tmpdir.join('empty_marc.xml').write('<collection xmlns="%s"></collection>' % MARC21_NS)
+    errors = []
+    assert list(m.convert_all(sorted(m.find_inputs([str(tmpdir)])), lambda *e: errors.append(e))) == []
+    assert [e[1] for e in errors] == ['empty', 'plain'] and 'No MARC 21 records' in str(errors[0][2])
+
+def test_bad_metadata(tmpdir):
+    """A malformed <ocaid>_meta.xml is reported for its item, and the batch continues."""
+    tmpdir.join('a_marc.xml').write(marc())
+    tmpdir.join('a_meta.xml').write('<metadata><city>Paris</metadata>')
+    tmpdir.join('b_marc.xml').write(marc())
+    collection = tmpdir.join('partner.xml')
+    record = marc().replace('<leader>', '<controlfield tag="001">%s</controlfield><leader>', 1)
+    collection.write('<collection xmlns="%s">%s%s</collection>' % (MARC21_NS, record % 'a', record % 'b'))
+    errors = []
+    ocaids = [r.ocaid for r in m.convert_all(sorted(m.find_inputs([str(tmpdir)])) + [str(collection)], lambda *e: errors.append(e))]
+    assert ocaids == ['b', 'b']
+    assert [e[:2] for e in errors] == [(str(tmpdir.join('a_marc.xml')), 'a'), (str(collection), 'a')]
+
+def test_find_inputs(tmpdir):
+    tmpdir.join('a_marc.xml').write(marc())
+    tmpdir.join('b_archive_marc.xml').write(marc())
+    tmpdir.join('b_meta.xml').write('<metadata/>')
+    manifest = tmpdir.join('itemlist.txt')
+    manifest.write('b\n\na\n')
+    assert [os.path.basename(f) for f in m.find_inputs([str(tmpdir)])] == ['a_marc.xml', 'b_archive_marc.xml']
+    assert [os.path.basename(f) for f in m.find_inputs([], str(manifest))] == ['b_archive_marc.xml', 'a_marc.xml']
+
+def test_write_marcxml_collection():
+    records = [m.IAMarcXml('ocaid%i' % i, etree.fromstring(marc())) for i in range(3)]
+    out = io.BytesIO()
+    m.write_output((m.serialize(r, 'marcxml') for r in records), out, 'marcxml')
+    collection = etree.fromstring(out.getvalue())
+    assert [r.xpath('m:controlfield[@tag="001"]', namespaces=NS)[0].text for r in collection] == ['ocaid0', 'ocaid1', 'ocaid2']
+
+def test_convert_parallel_ordered(tmpdir):
+    """Parallel conversion returns the same output, in the same order, as single process conversion."""
+    records = []
+    for i in range(50):
+        content = '<!-- No separator at end of field length=40 -->' if i % 7 == 0 else ''
+        records.append(marc(content).replace('<leader>', '<controlfield tag="001">ocaid%i</controlfield><leader>' % i, 1))
+    collection = tmpdir.join('partner.xml')
+    collection.write('<collection xmlns="%s">%s</collection>' % (MARC21_NS, ''.join(records)))
+    serial_errors, parallel_errors = [], []
+    serial = [m.serialize(r, 'marc') for r in m.convert_all([str(collection)], lambda *e: serial_errors.append(e[1]))]
+    parallel = list(m.convert_parallel([str(collection)], lambda *e: parallel_errors.append(e[1]), 'marc', jobs=3, chunksize=4))
+    assert len(serial) == 42
+    assert parallel == serial
+    assert parallel_errors == serial_errors
+
+def test_transform_stats(tmpdir):
+    """Profiling gives the same records, and counts each step, serially and over worker processes."""
+    stats = m.TransformStats()
+    profiled = m.IAMarcXml('test', etree.fromstring(marc()), stats)
+    assert etree.tostring(profiled.data) == etree.tostring(m.IAMarcXml('test', etree.fromstring(marc())).data)
+    assert list(stats.steps) == m.IAMarcXml.STEPS
+    assert stats.steps['control_number'][:1] + stats.steps['control_number'][2:] == [1, 1]
+    assert stats.steps['validate'][2] == 0
+
+    records = [marc().replace('<leader>', '<controlfield tag="001">ocaid%i</controlfield><leader>' % i, 1) for i in range(10)]
+    collection = tmpdir.join('partner.xml')
+    collection.write('<collection xmlns="%s">%s</collection>' % (MARC21_NS, ''.join(records)))
+    parallel = m.TransformStats()
+    list(m.convert_parallel([str(collection)], lambda *e: None, 'marc', jobs=2, chunksize=3, stats=parallel))
+    assert parallel.records == 10
+    assert all(calls == 10 for calls, seconds, changed in parallel.steps.values())
+    out = io.StringIO()
+    parallel.report(out)
+    assert len(out.getvalue().splitlines()) == len(m.IAMarcXml.STEPS) + 2
+
+def test_rules(tmpdir):
+    """A JSON rule set replaces the IA rules it names, and keeps the rest."""
+    rules_file = tmpdir.join('rules.json')
+    rules_file.write(json.dumps({
+        'org_code': 'XxTest',
+        'strip_datafields': ['500'],
+        'ind2': {},
+        'abbreviations': [[r'maps?\.', 'maps']],
+        'locations': [{'text': 'Partner copy', 'url': 'https://example.org/{ocaid}', 'ind1': '4', 'ind2': '1'}],
+    }))
+    rules = m.load_rules(str(rules_file))
+    xml = ("<datafield tag='500'><subfield code='a'>Note</subfield></datafield>"
+           "<datafield tag='050' ind1='0' ind2='0'><subfield code='a'>QA1</subfield></datafield>"
+           "<datafield tag='300'><subfield code='a'>20 p. :</subfield><subfield code='b'>ill., maps.</subfield></datafield>"
+           "<datafield tag='949'><subfield code='a'>local</subfield></datafield>")
+    ia_marc = m.IAMarcXml('rules', etree.fromstring(marc(xml)), rules=rules, olid='OL1M')
+    assert ia_marc.get_controlfield('003')[0].text == 'XxTest'
+    assert ia_marc.get_subfields('040', 'd')[-1].text == 'XxTest'
+    assert ia_marc.get_datafield('500') == [] and ia_marc.get_datafield('949') == []
+    assert ia_marc.get_datafield('050')[0].get('ind2') == '0'
+    assert ia_marc.get_subfields('300', 'b')[0].text == 'ill., maps)'
+    assert [f.get('ind2') for f in ia_marc.get_datafield('856')] == ['1']
+    assert ia_marc.get_subfields('856', 'u')[0].text == 'https://example.org/rules'
+
+    ia_marc = m.IAMarcXml('rules', etree.fromstring(marc(xml)), olid='OL1M')
+    assert ia_marc.get_subfields('300', 'b')[0].text == 'illustrations, maps.)'
+    assert [f.get('ind2') for f in ia_marc.get_datafield('856')] == ['0', '2']
+
+    rules_file.write(json.dumps({'strip_fields': ['500']}))
+    with pytest.raises(ValueError):
+        m.load_rules(str(rules_file))
+
+def test_rules_parallel(tmpdir):
+    """Rules are passed to worker processes."""
+    rules = m.Rules(dict(m.RULES, org_code='XxTest'))
+    records = [marc().replace('<leader>', '<controlfield tag="001">ocaid%i</controlfield><leader>' % i, 1) for i in range(6)]
+    collection = tmpdir.join('partner.xml')
+    collection.write('<collection xmlns="%s">%s</collection>' % (MARC21_NS, ''.join(records)))
+    serial = [m.serialize(r, 'marc') for r in m.convert_all([str(collection)], lambda *e: None, rules=rules)]
+    parallel = list(m.convert_parallel([str(collection)], lambda *e: None, 'marc', jobs=2, chunksize=2, rules=rules))
+    assert parallel == serial
+    assert all(b'XxTest' in r for r in serial)
+
+def test_read_metadata(tmpdir):
+    meta = tmpdir.join('item_meta.xml')
+    meta.write('<metadata><identifier>item</identifier><openlibrary_edition>OL1M</openlibrary_edition><city>Paris</city></metadata>')
+    assert m.read_metadata(str(meta)) == {'olid': 'OL1M', 'city': 'Paris'}
+    assert m.read_metadata(str(tmpdir.join('missing_meta.xml'))) == {}
+
+def test_read_records_streaming(tmpdir):
+    """Records are released from memory as the reader moves on to the next one."""
+    collection = tmpdir.join('partner.xml')
+    collection.write('<collection xmlns="%s">%s</collection>' % (MARC21_NS, marc() * 3))
+    seen = []
+    for record in m.read_records(str(collection)):
+        assert len(record) == 3
+        assert record.getprevious() is None or len(record.getprevious()) == 0
+        seen.append(record)
+    assert [len(r) for r in seen] == [0, 0, 0]
+
+def test_check_clean():
+    assert m.MarcXml(etree.fromstring(marc())).check() == []
+
+def test_check_findings():
+    content = '''<!-- No separator at end of field length=40 -->
+     <controlfield tag="008">820312s1983</controlfield>
+     <datafield tag="020" ind1=" " ind2=" "><subfield code="a">0817307885</subfield><subfield code="q">(v. 1)</subfield></datafield>
+     <datafield tag="" ind1=" " ind2=" "><subfield code="a">(v. 2)</subfield></datafield>'''
+    findings = m.MarcXml(etree.fromstring(marc(content).replace('cam', 'cas'))).check()
+    assert [(f.itemlist, f.tag) for f in findings] == [
+        ('non_monographs', 'leader'), ('bad_index', None), ('bad_structure', '008'),
+        ('multi_volumes', '020'), ('bad_tag', ''), ('multi_008', '008')]
+    assert m.bucket([f.itemlist for f in findings]) == 'bad_records'
+
+def test_bucket():
+    assert m.bucket(['multi_volumes', 'non_monographs']) == 'multi_volumes'
+    assert m.bucket(['xml_comments']) is None
+
+def test_tag_index():
+    """insert, remove and retag keep the tag index in step with the record, and insert keeps tag order."""
+    def tags(record):
+        fields = [e for e in record.data if e.tag in (m.CONTROLFIELD, m.DATAFIELD)]
+        assert fields == record.controlfields()[0] + record.datafields()[0]
+        return [e.get('tag') for e in fields]
+
+    record = m.MarcXml(etree.fromstring(marc('<datafield tag="500" ind1=" " ind2=" "/>')))
+    record.set_datafield('100')
+    record.set_datafield('300')
+    record.set_datafield('300', ind1='1')
+    record.set_controlfield('001', 'x')
+    assert tags(record) == ['001', '008', '100', '245', '300', '300', '500']
+    assert [f.get('ind1') for f in record.get_datafield('300')] == [' ', '1']
+    record.remove(record.get_datafield('245')[0])
+    assert record.get_datafield('245') == [] and tags(record) == ['001', '008', '100', '300', '300', '500']
+    # retagged out of order: inserted before the first greater tag
+    record.retag(record.get_datafield('100')[0], '900')
+    record.set_datafield('400')
+    assert tags(record) == ['001', '008', '400', '900', '300', '300', '500']
+    assert len(record.get_datafield('900')) == 1 and record.get_datafield('100') == []
+    record.data.append(record.new_datafield('050'))
+    record.reindex()
+    assert len(record.get_datafield('050')) == 1 and tags(record)[-1] == '050'
+
+def test_insert_unsorted():
+    """Records out of tag order are not bisected: fields go before the first greater tag, as they always have."""
+    content = ''.join('<datafield tag="%s" ind1=" " ind2=" "/>' % tag for tag in ['500', '100', '200'])
+    record = m.MarcXml(etree.fromstring(marc(content)))
+    record.set_datafield('300')
+    assert [f.get('tag') for f in record.datafields()[0]] == ['245', '300', '500', '100', '200']
+    assert [f.get('tag') for f in record.data if f.tag == m.DATAFIELD] == ['245', '300', '500', '100', '200']
+
+def test_convert_cached(tmpdir):
+    """Cached conversion gives the same output and errors as converting, and only re-converts changed files."""
+    import cache
+    for i in range(6):
+        content = '<!-- No separator at end of field length=40 -->' if i == 2 else ''
+        tmpdir.join('item%i_marc.xml' % i).write(marc(content))
+    tmpdir.join('item4_meta.xml').write('<metadata><city>Paris</city></metadata>')
+    filenames = sorted(m.find_inputs([str(tmpdir)]))
+    errors = []
+    expected = b''.join(m.serialize(r, 'marc') for r in m.convert_all(filenames, lambda *e: errors.append(e[:2])))
+    assert len(errors) == 1
+
+    for jobs in [1, 2]:
+        with cache.Cache(str(tmpdir.join('cache%i.db' % jobs)), 'marcia-marc', '1') as c:
+            for run in range(2):
+                cached_errors = []
+                output = list(m.convert_cached(filenames, lambda *e: cached_errors.append(e[:2]), 'marc', c, jobs))
+                assert len(output) == 6
+                assert b''.join(output) == expected
+                assert cached_errors == errors
+            assert (c.hits, c.misses) == (6, 6)
+            tmpdir.join('item4_meta.xml').write('<metadata><city>London</city></metadata>')
+            output = list(m.convert_cached(filenames, lambda *e: None, 'marc', c, jobs))
+            assert b'London' in output[4] and output[:4] == list(expected_parts(filenames))[:4]
+            assert c.misses == 7
+            tmpdir.join('item4_meta.xml').write('<metadata><city>Paris</city></metadata>')
+
+def test_fingerprints(tmpdir, monkeypatch):
+    """Delta output is only the records changed since the last run, ignoring the 005 timestamp."""
+    note = '<datafield tag="500" ind1=" " ind2=" "><subfield code="a">Note</subfield></datafield>'
+    for output in ['marc', 'marcxml']:
+        for i in range(3):
+            tmpdir.join('item%i_marc.xml' % i).write(marc())
+        filenames = sorted(m.find_inputs([str(tmpdir)]))
+        manifest = tmpdir.join('fingerprints_%s.tsv' % output)
+
+        def run():
+            fingerprints = m.Fingerprints(str(manifest))
+            records = list(fingerprints.delta((data for filename, data in m.convert_files(filenames, None, output)), output))
+            fingerprints.save()
+            return records, fingerprints.changed
+
+        records, changed = run()
+        assert len(records) == 3 and changed == ['item0', 'item1', 'item2']
+        assert run() == ([], [])
+        monkeypatch.setattr(m.IAMarcXml, 'MODIFIED', '20240101000000.0')
+        assert run() == ([], [])
+        monkeypatch.undo()
+        tmpdir.join('item1_marc.xml').write(marc(note))
+        records, changed = run()
+        assert changed == ['item1'] and records == [m.serialize(next(m.convert_all(filenames[1:2], None)), output)]
+        assert len(manifest.readlines()) == 3
+
+def test_delta_suppress_output(tmpdir):
+    """With -n the manifest is not updated, so the next run still outputs and lists the records."""
+    tmpdir.join('good_marc.xml').write(marc())
+    manifest, changed, out = [str(tmpdir.join(f)) for f in ['fingerprints.tsv', 'changed.txt', 'out.mrc']]
+    marcia = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'marcia.py')
+    subprocess.check_call([sys.executable, marcia, '-D', manifest, '-U', changed, '-n', str(tmpdir)], stderr=subprocess.DEVNULL)
+    assert not os.path.exists(manifest) and not os.path.exists(changed)
+    subprocess.check_call([sys.executable, marcia, '-D', manifest, '-U', changed, '-f', out, str(tmpdir)], stderr=subprocess.DEVNULL)
+    assert tmpdir.join('changed.txt').read() == 'good\n' and tmpdir.join('out.mrc').size() > 0
+
+def test_fingerprint_collection(tmpdir):
+    """Records with the same OCAID, from a collection, are fingerprinted separately."""
+    records = [m.IAMarcXml('coll', etree.fromstring(marc(content))) for content in ['', '<controlfield tag="005">19990101000000.0</controlfield>', '']]
+    data = b''.join(m.serialize(r, 'marc') for r in records)
+    assert [m.output_ocaid(r, 'marc') for r in m.split_output(data, 'marc')] == ['coll'] * 3
+    fingerprints = m.Fingerprints(str(tmpdir.join('fingerprints.tsv')))
+    assert len(list(fingerprints.delta([data], 'marc'))) == 3
+    assert fingerprints.changed == ['coll'] and sorted(fingerprints.fingerprints) == ['coll', 'coll#2', 'coll#3']
+    assert fingerprints.fingerprints['coll'] == fingerprints.fingerprints['coll#2'] == fingerprints.fingerprints['coll#3']
+
+def expected_parts(filenames):
+    for filename in filenames:
+        yield b''.join(m.serialize(r, 'marc') for r in m.convert_all([filename], lambda *e: None))
+
+def test_binary_input(tmpdir):
+    """Binary MARC converts directly, with the index fixed on the fly if asked."""
+    import functools
+    import shutil
+    data = os.path.join(os.path.dirname(__file__), 'test_data')
+    shutil.copy(os.path.join(data, 'good_marc_00amyl.mrc'), str(tmpdir.join('00amyl_meta.mrc')))
+    shutil.copy(os.path.join(data, 'moderate_bad_marc_00book1220882465.mrc'), str(tmpdir.join('00book_meta.mrc')))
+    filenames = list(m.find_inputs([str(tmpdir)], binary=True))
+    assert [os.path.basename(f) for f in filenames] == ['00amyl_meta.mrc', '00book_meta.mrc']
+
+    errors = []
+    records = list(m.convert_all(filenames, lambda *e: errors.append(e[1]), m.read_binary_records))
+    assert [r.ocaid for r in records] == ['00amyl']
+    assert errors == ['00book']
+
+    errors = []
+    reader = functools.partial(m.read_binary_records, fix_index=True)
+    records = list(m.convert_all(filenames, lambda *e: errors.append(e[1]), reader))
+    assert [r.ocaid for r in records] == ['00amyl', '00book']
+    assert errors == []
+
+def test_binary_corrupt_directory(tmpdir):
+    """A record with a corrupt directory is reported, and the records after it are still converted."""
+    with open(os.path.join(os.path.dirname(__file__), 'test_data', 'good_marc_00amyl.mrc'), 'rb') as f:
+        raw = f.read()
+    corrupt = raw[:24 + 3] + b'x' + raw[24 + 4:]
+    tmpdir.join('00amyl_meta.mrc').write_binary(raw + corrupt + raw)
+    errors = []
+    records = list(m.convert_all([str(tmpdir.join('00amyl_meta.mrc'))], lambda *e: errors.append(e), m.read_binary_records))
+    assert len(records) == 2
+    assert [ocaid for filename, ocaid, e in errors] == ['00amyl']
+    assert m.MarcXml(iso2709.read_record(corrupt)).check()[0].itemlist == 'bad_index'
@@ -0,0 +1,36 @@
+import collections
+import json
+import metaindex
+import marcia
+
+META = '<metadata><identifier>%s</identifier><openlibrary_edition>OL1M</openlibrary_edition><city>Paris</city><publisher>Pub</publisher><date>1983</date></metadata>'
+
+def test_read_directory(tmpdir):
+    tmpdir.join('a_meta.xml').write(META % 'a')
+    tmpdir.join('b_meta.xml').write('<metadata><identifier>b</identifier><city>London</city><city>Paris</city></metadata>')
+    tmpdir.join('c_marc.xml').write('<record/>')
+    assert list(metaindex.read_directory(str(tmpdir))) == [
+        ('a', {'olid': 'OL1M', 'city': 'Paris', 'publisher': 'Pub', 'date': '1983'}),
+        ('b', {'city': 'London'})]
+    assert metaindex.marc_ocaids(str(tmpdir)) == set(['c'])
+
+def test_read_jsonl(tmpdir):
+    dump = tmpdir.join('dump.jsonl')
+    dump.write('\n'.join([
+        json.dumps({'metadata': {'identifier': 'a', 'openlibrary_edition': 'OL1M', 'city': ['Paris', 'London']}}),
+        json.dumps({'identifier': 'b', 'date': '1983'}),
+    ]))
+    assert list(metaindex.read_jsonl(str(dump))) == [('a', {'olid': 'OL1M', 'city': 'Paris'}), ('b', {'date': '1983'})]
+
+def test_index(tmpdir):
+    tmpdir.join('a_meta.xml').write(META % 'a')
+    tmpdir.join('b_meta.xml').write('<metadata><identifier>b</identifier><city>London</city></metadata>')
+    c = collections.Counter()
+    with metaindex.MetadataIndex(str(tmpdir.join('meta.db'))) as index:
+        index.add(metaindex.counted(metaindex.read_directory(str(tmpdir)), c))
+    assert c['indexed'] == 2 and c['incomplete'] == 1 and c['no olid'] == 1
+    with metaindex.MetadataIndex(str(tmpdir.join('meta.db'))) as index:
+        assert index('a') == marcia.read_metadata(str(tmpdir.join('a_meta.xml')))
+        assert index.get('missing') is None
+        assert index('missing') == {}
+        assert index.misses == 1
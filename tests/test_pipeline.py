@@ -0,0 +1,86 @@
+import io
+import os
+import pytest
+from lxml import etree
+import fixmarc
+import iso2709
+import marcia
+import pipeline
+
+DATA = os.path.join(os.path.dirname(__file__), 'test_data')
+
+def double(item):
+    if item['n'] == 3:
+        raise ValueError('three')
+    item['n'] *= 2
+    return item
+
+def skip_odd(item):
+    if item['n'] % 2:
+        item['skipped'] = 'odd'
+    return item
+
+def test_stages():
+    p = pipeline.Pipeline([pipeline.Stage('skip', skip_odd), pipeline.Stage('double', double, processes=2, maxsize=2)])
+    items = list(p.run({'n': n} for n in range(20)))
+    assert [item['n'] for item in items] == [n * 2 if n % 2 == 0 else n for n in range(20)]
+    assert all(item['skipped'] == 'odd' for item in items if 'skipped' in item)
+    assert p.stages[0].stats.items == 20 and p.stages[0].stats.skipped == 10
+    assert p.stages[1].stats.skipped == 10
+    report = io.StringIO()
+    p.report(report)
+    assert len(report.getvalue().splitlines()) == 3
+
+def test_errors():
+    p = pipeline.Pipeline([pipeline.Stage('double', double), pipeline.Stage('again', double)])
+    items = list(p.run({'n': n} for n in range(1, 5)))
+    assert items[2] == {'n': 3, 'error': 'three'}
+    assert [item['n'] for item in items] == [4, 8, 3, 16]
+    assert p.stages[0].stats.errors == 1 and p.stages[1].stats.errors == 1
+
+def test_ia_pipeline(tmpdir):
+    with open(os.path.join(DATA, 'good_marc_00amyl.mrc'), 'rb') as f:
+        good = f.read()
+    with open(os.path.join(DATA, 'bad_marc_adolphethiers00rena.mrc'), 'rb') as f:
+        bad = f.read()
+    tmpdir.join('good_marc.xml').write_binary(etree.tostring(iso2709.read_record(good)))
+    tmpdir.join('bad_marc.xml').write_binary(etree.tostring(iso2709.read_record(bad)))
+    tmpdir.join('bad_meta.mrc').write_binary(bad)
+    record = iso2709.read_record(good)
+    isbn = etree.SubElement(record, '{%s}datafield' % marcia.MARC21_NS, tag='020', ind1=' ', ind2=' ')
+    etree.SubElement(isbn, '{%s}subfield' % marcia.MARC21_NS, code='a').text = '0123456789 (v. 1)'
+    tmpdir.join('volumes_marc.xml').write_binary(etree.tostring(record))
+
+    items = list(pipeline.ia_pipeline(jobs=2).run(pipeline.read_items(str(tmpdir))))
+    assert [item['ocaid'] for item in items] == ['bad', 'good', 'volumes']
+    assert items[0]['fix'] == ['bad_index'] and 'error' not in items[0]
+    assert items[1]['output'] == marcia.serialize(marcia.IAMarcXml('good', iso2709.read_record(good)), 'marc')
+    assert items[2]['skipped'] == 'multi_volumes'
+    assert [item['ocaid'] for item in pipeline.read_items(str(tmpdir), None)] == ['bad', 'good', 'volumes']
+
+def test_convert_collection(tmpdir):
+    """Items wrapped in a <collection>, as yaz-marcdump and fixmarc.py write them, convert every record."""
+    with open(os.path.join(DATA, 'good_marc_00amyl.mrc'), 'rb') as f:
+        good = f.read()
+    fixmarc.write_marcxml([iso2709.read_record(good)] * 2, str(tmpdir.join('good_marc.xml')))
+    item = pipeline.convert_item({'ocaid': 'good', 'xml': tmpdir.join('good_marc.xml').read_binary(), 'meta': {}})
+    assert item['output'] == marcia.serialize(marcia.IAMarcXml('good', iso2709.read_record(good)), 'marc') * 2
+
+def numbers(n):
+    for i in range(n):
+        yield {'n': i}
+    raise IOError('no more')
+
+def test_feed_error():
+    """An exception from the items is raised once the stages have stopped, rather than hanging."""
+    p = pipeline.Pipeline([pipeline.Stage('double', double, maxsize=2)])
+    with pytest.raises(IOError):
+        list(p.run(numbers(3)))
+
+def test_stage_error():
+    """A stage which fails itself, here on a function which can not be sent to a worker, ends the pipeline."""
+    p = pipeline.Pipeline([pipeline.Stage('unpicklable', lambda item: item, processes=1, maxsize=2),
+                           pipeline.Stage('double', double, maxsize=2)], maxsize=2)
+    with pytest.raises(Exception):
+        list(p.run({'n': n} for n in range(50)))
+    assert p.stages[0].error is not None
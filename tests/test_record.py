@@ -0,0 +1,59 @@
+import os
+import pickle
+import iso2709
+import marcia
+import record
+from lxml import etree
+
+DATA = os.path.join(os.path.dirname(__file__), 'test_data')
+
+def marc(content=''):
+    return '''<record xmlns="http://www.loc.gov/MARC21/slim">
+     <leader>00971cam a2200289 a 4500</leader>
+     <controlfield tag="008">820312s1983    alu          s00110 eng  </controlfield>
+     <datafield tag="040" ind1=" " ind2=" "><subfield code="a">DLC</subfield><subfield code="e">ETHICS-ISBD</subfield></datafield>
+     <datafield tag="245" ind1="1" ind2="0"><subfield code="a">Test Record</subfield><subfield code="h">[microform]</subfield></datafield>
+     <datafield tag="300" ind1=" " ind2=" "><subfield code="a">viii, 250 p. :</subfield><subfield code="b">ill. ;</subfield><subfield code="c">24 cm.</subfield></datafield>
+     %s
+   </record>''' % content
+
+def test_element_round_trip():
+    root = etree.fromstring(marc('<!-- a comment -->'), etree.XMLParser(remove_blank_text=True))
+    assert etree.tostring(record.to_element(record.from_element(root))) == etree.tostring(root)
+
+def test_iso2709_round_trip():
+    with open(os.path.join(DATA, 'good_marc_00amyl.mrc'), 'rb') as f:
+        raw = f.read()
+    assert record.to_iso2709(record.from_iso2709(raw)) == raw
+    assert etree.tostring(record.to_element(record.from_iso2709(raw))) == etree.tostring(iso2709.read_record(raw))
+
+def test_transform_same_on_both_backends():
+    meta = {'olid': 'OL1M', 'city': 'Paris', 'publisher': 'Pub', 'date': '1983'}
+    xml = marcia.IAMarcXml('test', etree.fromstring(marc()), **meta)
+    compact = record.IAMarcRecord('test', record.from_element(etree.fromstring(marc())), **meta)
+    assert record.to_iso2709(compact.data) == iso2709.write_record(xml.data)
+    assert compact.get_subfields('040', 'e') == []
+    assert compact.get_subfields('300', 'a')[0].text == '1 online resource (viii, 250 pages :'
+
+def test_corrupt_index():
+    root = etree.fromstring(marc('<!-- No separator at end of field length=40 -->'))
+    try:
+        record.IAMarcRecord('test', record.from_element(root))
+        assert False, 'Expected corrupt index exception'
+    except Exception as e:
+        assert 'Corrupt index' in str(e)
+    assert [f.itemlist for f in record.MarcRecord(record.from_element(root)).check()] == ['bad_index']
+
+def test_pickle():
+    compact = record.IAMarcRecord('test', record.from_element(etree.fromstring(marc())))
+    copy = pickle.loads(pickle.dumps(compact.data))
+    assert record.to_iso2709(copy) == record.to_iso2709(compact.data)
+
+def test_api():
+    r = record.MarcRecord(record.from_element(etree.fromstring(marc())))
+    r.set_controlfield('001', 'ocaid')
+    r.set_datafield('020', subfields={'a': '0817307885'})
+    r.clear_subfield('300', 'c')
+    assert [f.get('tag') for f in r.data] == [None, '001', '008', '020', '040', '245', '300']
+    assert r.get_controlfield('001')[0].text == 'ocaid'
+    assert [s.code for s in r.subfields(r.get_datafield('300')[0])] == ['a', 'b']
@@ -0,0 +1,45 @@
+import os
+import fixindex
+import recordindex
+
+DATA = os.path.join(os.path.dirname(__file__), 'test_data')
+
+def records():
+    with open(os.path.join(DATA, 'good_marc_00amyl.mrc'), 'rb') as f:
+        good = f.read()
+    with open(os.path.join(DATA, 'moderate_bad_marc_00book1220882465.mrc'), 'rb') as f:
+        bad = f.read()
+    return [good, bad, good, b'not a record\x1d']
+
+def test_index(tmpdir):
+    recs = records()
+    filename = tmpdir.join('records.mrc')
+    filename.write_binary(b''.join(recs) + b'\n')
+    with recordindex.RecordIndex(str(filename)) as index:
+        assert tmpdir.join('records.mrc.idx').check()
+        assert len(index) == 4
+        assert [index[n] for n in range(4)] == recs
+        good_id = index.control_number(0)
+        assert good_id and index.control_number(3) == ''
+        leader, entries, pos = fixindex.read_index(recs[1])
+        assert index.control_number(1) == fixindex.control_number(entries, recs[1], pos)
+        assert index.find(good_id) == [0, 2]
+        assert index.get(index.control_number(1)) == recs[1]
+        assert index.get('missing') is None
+        ranges = index.ranges(3)
+        assert ranges[0][0] == 0 and ranges[-1][1] == index.size
+        assert all(start in index.offsets for start, end in ranges)
+        assert [end for start, end in ranges[:-1]] == [start for start, end in ranges[1:]]
+
+def test_rebuild(tmpdir):
+    recs = records()
+    filename = tmpdir.join('records.mrc')
+    filename.write_binary(recs[0])
+    with recordindex.RecordIndex(str(filename)) as index:
+        assert len(index) == 1
+    filename.write_binary(b''.join(recs))
+    with recordindex.RecordIndex(str(filename)) as index:
+        assert len(index) == 4
+    filename.write_binary(b'')
+    with recordindex.RecordIndex(str(filename)) as index:
+        assert len(index) == 0 and index.ranges(2) == [(0, 0)] and index.find('x') == []
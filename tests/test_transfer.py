@@ -0,0 +1,152 @@
+import asyncio
+import hashlib
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+transfer = pytest.importorskip('transfer')
+
+FILES = {'/download/a/a_meta.mrc': b'a' * 100000, '/download/b/b_meta.mrc': b'b' * 10}
+
+
+class IA(BaseHTTPRequestHandler):
+    """Stand in for archive.org downloads, which redirect to a datanode, and S3 uploads.
+       The first request for anything under /flaky/ fails with 503 SlowDown.
+    """
+    requests = []
+    uploads = {}
+
+    def log_message(self, *args):
+        pass
+
+    def flaky(self):
+        if self.path.startswith('/flaky/') and self.path not in [p for m, p in self.requests[:-1]]:
+            self.send_response(503, 'SlowDown')
+            self.end_headers()
+            return True
+        return False
+
+    def do_GET(self):
+        self.requests.append(('GET', self.path))
+        if self.flaky():
+            return
+        if self.path.startswith('/download/'):
+            self.send_response(302)
+            self.send_header('Location', self.path.replace('/download/', '/datanode/', 1))
+            self.end_headers()
+            return
+        data = FILES.get(self.path.replace('/datanode/', '/download/', 1))
+        if data is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_PUT(self):
+        self.requests.append(('PUT', self.path))
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        if self.flaky():
+            return
+        if self.headers['Authorization'] != 'LOW access:secret':
+            self.send_response(403)
+        elif self.headers['Content-MD5'] != hashlib.md5(body).hexdigest():
+            self.send_response(400)
+        else:
+            self.uploads[self.path] = body
+            self.send_response(200)
+        self.end_headers()
+
+
+@pytest.fixture
+def server():
+    IA.requests, IA.uploads = [], {}
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), IA)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:%i' % httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_and_resume(server, tmpdir):
+    transfers = [transfer.Transfer('download', i, i + '_meta.mrc') for i in 'abc']
+    state_file = str(tmpdir.join('state.json'))
+    results = asyncio.run(transfer.transfer_all(transfers, str(tmpdir), jobs=2, state=transfer.State(state_file),
+                                                download_url=server + '/download/{ocaid}/{filename}'))
+    assert results[transfers[0]] == 100000 and results[transfers[1]] == 10
+    assert isinstance(results[transfers[2]], transfer.TransferError)
+    assert tmpdir.join('a_meta.mrc').read_binary() == FILES['/download/a/a_meta.mrc']
+    assert not tmpdir.join('c_meta.mrc').exists()
+
+    # a resumed run only retries the failure
+    IA.requests = []
+    results = asyncio.run(transfer.transfer_all(transfers, str(tmpdir), state=transfer.State(state_file),
+                                                download_url=server + '/download/{ocaid}/{filename}'))
+    assert list(results) == [transfers[2]]
+    assert IA.requests == [('GET', '/download/c/c_meta.mrc'), ('GET', '/datanode/c/c_meta.mrc')]
+
+
+def test_upload_with_retry(server, tmpdir):
+    tmpdir.join('a_marc.xml').write('<record/>')
+    transfers = [transfer.Transfer('upload', 'a', 'a_marc.xml')]
+    results = asyncio.run(transfer.transfer_all(transfers, str(tmpdir), backoff=0.01, keys=('access', 'secret'),
+                                                upload_url=server + '/flaky/{ocaid}/{filename}'))
+    assert results[transfers[0]] == len('<record/>')
+    assert IA.uploads == {'/flaky/a/a_marc.xml': b'<record/>'}
+    assert len(IA.requests) == 2
+
+    results = asyncio.run(transfer.transfer_all(transfers, str(tmpdir), keys=('access', 'wrong'),
+                                                upload_url=server + '/{ocaid}/{filename}'))
+    assert results[transfers[0]].args[0] == 403
+
+
+def test_upload_large(server, tmpdir):
+    """Files larger than a read block are hashed in blocks and streamed whole."""
+    data = bytes(range(256)) * 12289
+    tmpdir.join('a_marc.xml').write_binary(data)
+    transfers = [transfer.Transfer('upload', 'a', 'a_marc.xml')]
+    results = asyncio.run(transfer.transfer_all(transfers, str(tmpdir), keys=('access', 'secret'),
+                                                upload_url=server + '/{ocaid}/{filename}'))
+    assert results[transfers[0]] == len(data)
+    assert IA.uploads == {'/a/a_marc.xml': data}
+
+
+def test_upload_resume_changed(server, tmpdir):
+    tmpdir.join('a_marc.xml').write('<record/>')
+    transfers = [transfer.Transfer('upload', 'a', 'a_marc.xml')]
+    state_file = str(tmpdir.join('state.json'))
+
+    def run():
+        IA.requests = []
+        return asyncio.run(transfer.transfer_all(transfers, str(tmpdir), state=transfer.State(state_file),
+                                                 keys=('access', 'secret'), upload_url=server + '/{ocaid}/{filename}'))
+
+    assert run() == {transfers[0]: len('<record/>')}
+    # unchanged: skipped
+    assert run() == {} and IA.requests == []
+    # changed since: uploaded again
+    tmpdir.join('a_marc.xml').write('<record>changed</record>')
+    assert run() == {transfers[0]: len('<record>changed</record>')}
+    assert IA.uploads == {'/a/a_marc.xml': b'<record>changed</record>'}
+    assert run() == {}
+
+
+def test_read_transfers(tmpdir):
+    tmpdir.join('bad_index.txt').write('a\nb\n')
+    tmpdir.join('bad_unicode.txt').write('b\nc\n')
+    transfers = transfer.read_transfers('upload', [str(tmpdir.join('bad_index.txt')), str(tmpdir.join('bad_unicode.txt'))], ['_meta.mrc'])
+    assert [t.ocaid for t in transfers] == ['a', 'b', 'c']
+
+
+def test_s3_keys(tmpdir, monkeypatch):
+    monkeypatch.delenv('IA_ACCESS_KEY', raising=False)
+    monkeypatch.delenv('IA_SECRET_KEY', raising=False)
+    config = tmpdir.join('ia.ini')
+    config.write('[s3]\naccess = A\nsecret = S\n')
+    assert transfer.s3_keys([str(config)]) == ('A', 'S')
+    monkeypatch.setenv('IA_ACCESS_KEY', 'envA')
+    monkeypatch.setenv('IA_SECRET_KEY', 'envS')
+    assert transfer.s3_keys([str(config)]) == ('envA', 'envS')
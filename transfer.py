@@ -0,0 +1,236 @@
+#!/usr/bin/python3
+
+"""Downloads and uploads IA item files concurrently, over one pooled HTTP session.
+
+   Replaces one `ia download` / `ia upload` process per item: at most <jobs> transfers run at once,
+   failed requests (connection errors, timeouts, 429 and 5xx responses) are retried with exponential backoff,
+   and completed transfers are recorded in a JSON state file, so an interrupted run can be resumed.
+   Uploads are recorded with the size and modification time of the local file, so files changed since are uploaded again.
+
+   usage:
+       transfer.py download -f _meta.mrc bad_unicode.txt bad_index.txt
+       transfer.py upload -f _meta.mrc -f _marc.xml bad_index.txt
+
+   Uploads use IA S3 keys from $IA_ACCESS_KEY and $IA_SECRET_KEY, or the ia-client config file (`ia configure`).
+"""
+
+import argparse
+import asyncio
+import collections
+import configparser
+import hashlib
+import json
+import os
+import random
+import sys
+
+import aiohttp
+
+DOWNLOAD_URL = 'https://archive.org/download/{ocaid}/{filename}'
+UPLOAD_URL   = 'https://s3.us.archive.org/{ocaid}/{filename}'
+IA_CONFIG    = ['~/.config/internetarchive/ia.ini', '~/.config/ia.ini', '~/.ia']
+
+RETRY_STATUS = set([429, 500, 502, 503, 504])
+SAVE_EVERY = 50
+
+# kind is 'download' or 'upload'. <filename> is the file name in the item, and in the local directory.
+Transfer = collections.namedtuple('Transfer', ['kind', 'ocaid', 'filename'])
+
+
+class TransferError(Exception):
+    pass
+
+
+class State(object):
+    """Completed transfers, saved as JSON to <filename> (if given) every SAVE_EVERY completions, and on save().
+       Each is recorded with a version: the size of a download, or local_version() of an upload.
+    """
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.done = {}
+        self.unsaved = 0
+        if filename and os.path.exists(filename):
+            with open(filename) as f:
+                self.done = json.load(f)
+
+    @staticmethod
+    def key(transfer):
+        return '%s %s/%s' % transfer
+
+    def is_done(self, transfer, version=None):
+        """Returns True if <transfer> is done, and if <version> is given, was done with that version."""
+        key = self.key(transfer)
+        return key in self.done and (version is None or self.done[key] == version)
+
+    def set_done(self, transfer, version):
+        self.done[self.key(transfer)] = version
+        self.unsaved += 1
+        if self.unsaved >= SAVE_EVERY:
+            self.save()
+
+    def save(self):
+        if self.filename:
+            with open(self.filename + '.tmp', 'w') as f:
+                json.dump(self.done, f, indent=0, sort_keys=True)
+            os.replace(self.filename + '.tmp', self.filename)
+        self.unsaved = 0
+
+
+def s3_keys(config_files=IA_CONFIG):
+    """Returns (access, secret) IA S3 keys from the environment or the ia-client config file, or None."""
+    if os.environ.get('IA_ACCESS_KEY') and os.environ.get('IA_SECRET_KEY'):
+        return os.environ['IA_ACCESS_KEY'], os.environ['IA_SECRET_KEY']
+    config = configparser.ConfigParser()
+    config.read([os.path.expanduser(f) for f in config_files])
+    if config.has_option('s3', 'access') and config.has_option('s3', 'secret'):
+        return config.get('s3', 'access'), config.get('s3', 'secret')
+
+
+def local_version(transfer, directory):
+    """Returns [size, mtime in ns] of the local file of an upload, or None for a download or a missing file."""
+    if transfer.kind != 'upload':
+        return None
+    try:
+        stat = os.stat(os.path.join(directory, transfer.filename))
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+async def download(session, transfer, directory, url):
+    """Downloads <transfer> to <directory>, via a .part file so incomplete downloads are never left in place.
+       Returns the size in bytes.
+    """
+    filename = os.path.join(directory, transfer.filename)
+    async with session.get(url.format(**transfer._asdict())) as response:
+        if response.status != 200:
+            raise TransferError(response.status, response.reason)
+        size = 0
+        with open(filename + '.part', 'wb') as f:
+            async for block in response.content.iter_chunked(1 << 16):
+                f.write(block)
+                size += len(block)
+    os.replace(filename + '.part', filename)
+    return size
+
+
+def file_md5(filename):
+    """Returns the MD5 hex digest of <filename>, read in blocks."""
+    h = hashlib.md5()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+async def upload(session, transfer, directory, url, keys):
+    """Uploads <transfer> from <directory> to an existing item with an IA S3 PUT. Returns the size in bytes.
+       The file is read twice, in blocks, for the Content-MD5 and then streamed as the body, so large files are never
+       held in memory.
+    """
+    filename = os.path.join(directory, transfer.filename)
+    headers = {
+        'Authorization': 'LOW %s:%s' % keys,
+        'Content-MD5': await asyncio.get_running_loop().run_in_executor(None, file_md5, filename),
+    }
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        headers['Content-Length'] = str(size)
+        async with session.put(url.format(**transfer._asdict()), data=f, headers=headers) as response:
+            if response.status != 200:
+                raise TransferError(response.status, response.reason)
+    return size
+
+
+async def transfer_all(transfers, directory='.', jobs=8, state=None, retries=5, backoff=1.0,
+                       download_url=DOWNLOAD_URL, upload_url=UPLOAD_URL, keys=None, report=None):
+    """Runs all <transfers>, at most <jobs> at once, skipping those already done in <state>,
+       and uploads whose local file is unchanged since.
+       Requests which fail with a connection error, timeout, or a 429 or 5xx response are retried up to <retries>
+       times, waiting backoff * 2^n seconds (with jitter) before retry n.
+       report(transfer, size or exception) is called as each transfer completes.
+       Returns a dict of Transfer: size or exception.
+    """
+    state = state or State()
+    semaphore = asyncio.Semaphore(jobs)
+    results = {}
+
+    async def run(session, transfer):
+        async with semaphore:
+            for attempt in range(retries + 1):
+                try:
+                    if transfer.kind == 'download':
+                        result = await download(session, transfer, directory, download_url)
+                        state.set_done(transfer, result)
+                    else:
+                        # versioned before reading, so a file changed during the upload is uploaded again
+                        version = local_version(transfer, directory)
+                        result = await upload(session, transfer, directory, upload_url, keys)
+                        state.set_done(transfer, version)
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError, TransferError) as e:
+                    result = e
+                    retry = not isinstance(e, TransferError) or e.args[0] in RETRY_STATUS
+                    if not retry or attempt == retries:
+                        break
+                    await asyncio.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+                except (IOError, OSError) as e:
+                    result = e
+                    break
+        results[transfer] = result
+        if report:
+            report(transfer, result)
+
+    connector = aiohttp.TCPConnector(limit=jobs)
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=600)) as session:
+            await asyncio.gather(*[run(session, t) for t in transfers
+                                   if not state.is_done(t, local_version(t, directory))])
+    finally:
+        state.save()
+    return results
+
+
+def read_transfers(kind, itemlists, suffixes):
+    """Returns a Transfer of every <ocaid><suffix> for every OCAID in <itemlists>, without duplicates, in order."""
+    transfers = []
+    for itemlist in itemlists:
+        with open(itemlist) as f:
+            for line in f:
+                ocaid = line.strip()
+                if ocaid:
+                    transfers.extend(Transfer(kind, ocaid, ocaid + suffix) for suffix in suffixes)
+    return list(collections.OrderedDict.fromkeys(transfers))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Download or upload IA item files for every OCAID in itemlists.')
+    parser.add_argument('kind', choices=['download', 'upload'])
+    parser.add_argument('itemlists', nargs='+', metavar='itemlist', help='Itemlist of OCAIDs')
+    parser.add_argument('-f', '--file', action='append', required=True, dest='suffixes',
+                        help='Item file to transfer, as the suffix after the OCAID, e.g. _meta.mrc. Can be repeated')
+    parser.add_argument('-d', '--directory', default='.', help='Local directory of item files')
+    parser.add_argument('-j', '--jobs', type=int, default=8, help='Maximum concurrent transfers')
+    parser.add_argument('-r', '--retries', type=int, default=5, help='Retries for each failed request')
+    parser.add_argument('-s', '--state', help='JSON file of completed transfers, to resume an interrupted run. Default transfer_<kind>.json')
+    args = parser.parse_args()
+
+    keys = None
+    if args.kind == 'upload':
+        keys = s3_keys()
+        if not keys:
+            parser.error('No IA S3 keys found. Set IA_ACCESS_KEY and IA_SECRET_KEY, or run `ia configure`')
+
+    failed = []
+
+    def report(transfer, result):
+        if isinstance(result, Exception):
+            failed.append(transfer)
+            sys.stderr.write("%s\t%s\tFAILED\t%s\n" % (transfer.ocaid, transfer.filename, result))
+
+    transfers = read_transfers(args.kind, args.itemlists, args.suffixes)
+    state = State(args.state or 'transfer_%s.json' % args.kind)
+    results = asyncio.run(transfer_all(transfers, args.directory, args.jobs, state, args.retries, keys=keys, report=report))
+    print("%i files %sed, %i already done, %i failed." % (len(results) - len(failed), args.kind, len(transfers) - len(results), len(failed)))
+    sys.exit(1 if failed else 0)
@@ -3,70 +3,207 @@
 """
 Takes a binary MARC file containing bibliographic records (possibly mixed with holdings records)
 and adds a custom / local field 976$a for local barcode importing.
+
+Barcodes are read from a .tsv of 001 control number, barcode (as written by holdings-extract.py)
+into an SQLite index on disk, <barcodes.tsv>.db, which is re-used until the .tsv changes.
+Records are streamed, and changed at the byte level: 976 fields are appended to the directory and data,
+and the record length, base address and leader/09 (character coding, 'a' Unicode) are updated.
+MARC-8 records are converted to UTF-8 field by field, as pymarc converts them; pure ASCII records only need
+leader/09 changed.
+Holdings records (with an 876) are dropped. With -j the input is split into shards of whole records,
+converted by worker processes, and the shard outputs are concatenated in order.
+
+usage:
+    biblio-barcodes.py [-o out.mrc] [-j <jobs>] <biblio.mrc> <barcodes.tsv>
 """
 
+import argparse
+import collections
+import mmap
+import multiprocessing
+import os
+import shutil
+import sqlite3
 import sys
-from pymarc import Field, MARCReader, MARCWriter
-
-
-fnbiblio = sys.argv[1]
-fnbarcode = sys.argv[2]
-
-
-# Load .tsv of 001 ids to local barcodes
-with open(fnbarcode, 'r') as bc:
-    barcodes = {}
-    for line in bc.readlines():
-        id_, barcode = (v.strip() for v in line.strip().split('\t'))
-        if id_ in barcodes:
-            barcodes[id_].append(barcode)
-        else:
-            barcodes[id_] = [barcode]
-
-
-m = 150  # max records to process (for DEBUG)
-DEBUG = False
-writer = None
-
-
-# Load bibliographic MARC records to add barcodes
-# Output written to file out.mrc
-with open(fnbiblio, 'rb') as marcdata:
-    writer = MARCWriter(open('out.mrc','wb'))
-    records = MARCReader(marcdata, to_unicode=True)
-    for i, record in enumerate(records):
-        if record is None:
-            print('Empty record')
-            #continue
-        if record['876']:
-            print('HOLDING found!')
-            continue
-        else:
-            #print('%s Biblio found' % i)
-            enc = record.leader[9]
-            #if enc != ' ':
-            #     print('%s non MARC8 record found!' % i)
-
-            id_ = record['001'].value().strip()
-            barcode = barcodes.get(id_)
-            if barcode:
-                for b in barcode:
-                    record.add_field(
-                        Field(
-                            tag = '976',
-                            indicators = [' ', ' '],
-                            subfields = [
-                                'a', b
-                            ]
-                        )
-                    )
-            record.leader = record.leader[:9] + 'a' + record.leader[10:]
-            writer.write(record)
-
-            if DEBUG and i > m:
-                break
-
-if writer:
-    print('Closing file')
-    writer.close()
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import iso2709
+import marc8
+
+BARCODE_TAG = b'976'
+HOLDINGS_TAG = b'876'
+ENTRY = iso2709.DIRECTORY_ENTRY_LEN
+
+
+def build_index(tsv, filename):
+    """Builds an SQLite index of barcodes by control number from <tsv>, unless <filename> is newer than it.
+       Returns the number of barcodes indexed, or None if the index was re-used.
+    """
+    if os.path.exists(filename) and os.path.getmtime(filename) >= os.path.getmtime(tsv):
+        return None
+    if os.path.exists(filename):
+        os.remove(filename)
+    db = sqlite3.connect(filename)
+    db.execute('CREATE TABLE barcodes (id TEXT, barcode TEXT)')
+
+    def rows():
+        with open(tsv, 'r') as bc:
+            for line in bc:
+                values = [v.strip() for v in line.strip().split('\t')]
+                if len(values) == 2:
+                    yield values
+                elif line.strip():
+                    sys.stderr.write('Skipping barcode line: %r\n' % line)
+
+    db.executemany('INSERT INTO barcodes VALUES (?, ?)', rows())
+    db.execute('CREATE INDEX barcodes_id ON barcodes (id)')
+    db.commit()
+    count = db.execute('SELECT COUNT(*) FROM barcodes').fetchone()[0]
+    db.close()
+    return count
+
+
+def is_ascii(data):
+    """Returns True if MARC-8 <data> is the same in UTF-8: ASCII, without escape sequences."""
+    return data.isascii() and b'\x1b' not in data
+
+
+def to_utf8(tag, content):
+    """Returns the content of a MARC-8 field in UTF-8, as pymarc reads and writes it: control fields as Latin-1,
+       and datafields subfield by subfield, composed (NFC), with two indicators and empty subfields dropped.
+    """
+    if tag < b'010' and tag.isdigit():
+        return content.decode('latin-1').encode('utf-8')
+    subfields = content.split(iso2709.SUBFIELD_DELIMITER)
+    parts = [(subfields[0] + b'  ')[:2]]
+    for sub in subfields[1:]:
+        if sub:
+            parts.append(sub[:1] + marc8.decode(sub[1:], pymarc=True).encode('utf-8'))
+    return iso2709.SUBFIELD_DELIMITER.join(parts)
+
+
+def fields(raw):
+    """Returns the leader and a list of [tag, content] of a raw record, content without its field terminator."""
+    base = int(raw[12:17])
+    entries = []
+    for pos in range(24, base - 1, ENTRY):
+        tag, length, offset = raw[pos:pos+3], int(raw[pos+3:pos+7]), int(raw[pos+7:pos+12])
+        entries.append([tag, raw[base+offset:base+offset+length-1]])
+    return raw[:24], entries
+
+
+def write(leader, entries):
+    """Returns a raw record from a leader and a list of [tag, content]."""
+    directory = []
+    data = []
+    offset = 0
+    for tag, content in entries:
+        directory.append(tag + b'%04d%05d' % (len(content) + 1, offset))
+        data.append(content + iso2709.FIELD_TERMINATOR)
+        offset += len(content) + 1
+    base_address = 24 + ENTRY * len(directory) + 1
+    leader = b'%05d' % (base_address + offset + 1) + leader[5:12] + b'%05d' % base_address + leader[17:]
+    return b''.join([leader] + directory + [iso2709.FIELD_TERMINATOR] + data + [iso2709.RECORD_TERMINATOR])
+
+
+def add_barcodes(raw, lookup, c):
+    """Returns <raw> with a 976$a for every barcode of its 001 from lookup(id), and leader/09 set to 'a',
+       or None for holdings records. Counts are added to Counter <c>.
+    """
+    base = int(raw[12:17])
+    directory = raw[24:base-1]
+    tags = [directory[i:i+3] for i in range(0, len(directory), ENTRY)]
+    if HOLDINGS_TAG in tags:
+        c['holdings'] += 1
+        return None
+    barcodes = []
+    if b'001' in tags:
+        i = tags.index(b'001') * ENTRY
+        offset, length = int(directory[i+7:i+12]), int(directory[i+3:i+7])
+        barcodes = lookup(raw[base+offset:base+offset+length-1].decode('utf-8', 'replace').strip())
+    marc8_coded = raw[9:10] == b' ' and not is_ascii(raw[base:])
+    if not barcodes and not marc8_coded:
+        # only leader/09 to change: MARC-8 in pure ASCII is UTF-8
+        return raw[:9] + b'a' + raw[10:]
+    if not marc8_coded:
+        # append directory entries and data, no need to split the fields
+        data_len = len(raw) - base - 1
+        added = [b'  \x1fa' + b.encode('utf-8') + iso2709.FIELD_TERMINATOR for b in barcodes]
+        entries = []
+        for field in added:
+            entries.append(BARCODE_TAG + b'%04d%05d' % (len(field), data_len))
+            data_len += len(field)
+        base_address = base + ENTRY * len(added)
+        leader = b'%05d' % (base_address + data_len + 1) + raw[5:9] + b'a' + raw[10:12] + b'%05d' % base_address + raw[17:24]
+        c['barcodes'] += len(barcodes)
+        c['with barcodes'] += 1
+        return b''.join([leader, directory] + entries + [raw[base-1:-1]] + added + [iso2709.RECORD_TERMINATOR])
+    leader, entries = fields(raw)
+    for entry in entries:
+        if not is_ascii(entry[1]):
+            entry[1] = to_utf8(entry[0], entry[1])
+    entries += [[BARCODE_TAG, b'  \x1fa' + b.encode('utf-8')] for b in barcodes]
+    c['marc8'] += 1
+    c['barcodes'] += len(barcodes)
+    c['with barcodes'] += bool(barcodes)
+    return write(leader[:9] + b'a' + leader[10:], entries)
+
+
+def merge(args):
+    """Adds barcodes to the records in byte range [start, end) of <biblio>, writing them to <outfile>. Returns a Counter."""
+    biblio, index, outfile, start, end = args
+    c = collections.Counter()
+    if end == start:
+        open(outfile, 'wb').close()
+        return c
+    db = sqlite3.connect('file:%s?mode=ro' % index, uri=True)
+    query = 'SELECT barcode FROM barcodes WHERE id = ? ORDER BY rowid'
+    lookup = lambda id_: [row[0] for row in db.execute(query, (id_,))]
+    with open(biblio, 'rb') as f, open(outfile, 'wb') as out:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for pos, raw in iso2709.read_range(mm, start, end):
+                c['records'] += 1
+                try:
+                    record = add_barcodes(raw, lookup, c)
+                except (ValueError, IndexError) as e:
+                    c['errors'] += 1
+                    sys.stderr.write('Skipping malformed record at byte %i: %s\n' % (pos, e))
+                    continue
+                if record is not None:
+                    out.write(record)
+    db.close()
+    return c
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Add 976$a local barcodes to bibliographic binary MARC records.')
+    parser.add_argument('biblio', help='Binary MARC bibliographic records')
+    parser.add_argument('barcodes', help='.tsv of 001 control number, barcode')
+    parser.add_argument('-o', '--outfile', default='out.mrc', help='Output binary MARC file, default out.mrc')
+    parser.add_argument('-i', '--index', help='Barcode index file, default <barcodes>.db')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of worker processes')
+    args = parser.parse_args()
+
+    index = args.index or args.barcodes + '.db'
+    count = build_index(args.barcodes, index)
+    if count is not None:
+        print('Indexed %i barcodes in %s' % (count, index))
+
+    ranges = iso2709.record_ranges(args.biblio, args.jobs)
+    if len(ranges) == 1:
+        c = merge((args.biblio, index, args.outfile) + ranges[0])
+    else:
+        parts = ['%s.part%i' % (args.outfile, i) for i in range(len(ranges))]
+        with multiprocessing.Pool(args.jobs) as pool:
+            counts = pool.map(merge, [(args.biblio, index, part, start, end) for part, (start, end) in zip(parts, ranges)])
+        c = sum(counts, collections.Counter())
+        with open(args.outfile, 'wb') as out:
+            for part in parts:
+                with open(part, 'rb') as f:
+                    shutil.copyfileobj(f, out, 1 << 20)
+                os.remove(part)
+
+    print('%i records, %i holdings dropped, %i MARC-8 records converted, %i errors.' % (
+          c['records'], c['holdings'], c['marc8'], c['errors']))
+    print('Added %i barcodes to %i records, written to %s' % (c['barcodes'], c['with barcodes'], args.outfile))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Generate marc8_eacc.py, the MARC-8 CJK (EACC) to Unicode table used by marc8.py, from pymarc's MARC-8 mapping.
+Only needed to regenerate the table, e.g. after a pymarc mapping fix: marc8.py itself does not need pymarc.
+
+usage:
+    generate-eacc.py [-o <output file, default marc8_eacc.py next to marc8.py>]
+"""
+
+import argparse
+import collections
+import importlib.metadata
+import os
+
+from pymarc.marc8_mapping import CODESETS, ODD_MAP
+
+EACC = 0x31
+PAIRS_PER_LINE = 24
+
+HEADER = '''"""MARC-8 East Asian Character Code (EACC, ESC $ 1) to Unicode. Generated by utils/generate-eacc.py, do not edit.
+   From pymarc %s marc8_mapping CODESETS[0x31] and ODD_MAP, after the Library of Congress MARC-8 to Unicode mappings.
+
+   ROWS holds the three byte EACC codes by their first two bytes: a string of (third byte, Unicode character) pairs.
+   EACC has no combining characters.
+"""
+
+ROWS = {
+'''
+
+
+def rows(codeset):
+    """Returns {first two bytes: [(third byte, character), ...]} for an EACC codeset."""
+    by_row = collections.defaultdict(list)
+    for code, (codepoint, combining) in sorted(codeset.items()):
+        assert not combining
+        by_row[code >> 8].append((code & 0xff, chr(codepoint)))
+    return by_row
+
+
+def module(codeset, odd_map, version):
+    lines = [HEADER % version]
+    for row, pairs in sorted(rows(codeset).items()):
+        text = [''.join(chr(byte) + char for byte, char in pairs[i:i+PAIRS_PER_LINE]) for i in range(0, len(pairs), PAIRS_PER_LINE)]
+        lines.append('    0x%04X: %s,\n' % (row, '\n            '.join(repr(t) for t in text)))
+    lines.append('}\n\n# Codes pymarc maps outside the EACC rows, used where no EACC code matches\nODD_MAP = {\n')
+    lines += ['    0x%06X: 0x%04X,\n' % (code, codepoint) for code, codepoint in sorted(odd_map.items())]
+    lines.append('}\n')
+    return ''.join(lines)
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Generate marc8_eacc.py from pymarc's MARC-8 mapping.")
+    parser.add_argument('-o', '--output', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'marc8_eacc.py'))
+    args = parser.parse_args()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(module(CODESETS[EACC], ODD_MAP, importlib.metadata.version('pymarc')))
@@ -2,20 +2,97 @@
 """
 Extract holdings local barcode id from binary holdings MARC 876$p to a .tsv
 control_number, library_barcode
+
+Records are scanned through their directory: only the 004 and the first 876 field are decoded,
+and records with no 876 directory entry are skipped. Values are decoded as pymarc's MARCReader(to_unicode=True)
+would, so the output is the same: UTF-8 (leader/09 'a'), or MARC-8 subfields (composed, as pymarc's
+marc8_to_unicode decodes them) and Latin-1 control fields.
+The file is read in chunks of whole records, each written out in one go; with -j chunks go to worker processes,
+and are written in order.
+
+usage:
+    holdings-extract.py [-j <jobs>] <holdings.mrc> > barcodes.tsv
 """
 
+import argparse
+import mmap
+import multiprocessing
+import os
 import sys
-from pymarc import MARCReader
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import iso2709
+import marc8
+
+BIBID_TAG = b'004'
+HOLDINGS_TAG = b'876'
+BARCODE_CODE = b'p'
+ENTRY = iso2709.DIRECTORY_ENTRY_LEN
+CHUNK_SIZE = 1 << 24  # bytes of records per chunk
+
+
+def find_entry(directory, tag):
+    """Returns the position of the first directory entry for <tag>, or -1."""
+    i = directory.find(tag)
+    while i != -1 and i % ENTRY:
+        i = directory.find(tag, i + 1)
+    return i
+
+
+def barcodes(raw):
+    """Returns the .tsv lines of 004 and every 876$p of the first 876 field of a raw holdings record."""
+    base = int(raw[12:17])
+    directory = raw[24:base-1]
+    i = find_entry(directory, HOLDINGS_TAG)
+    if i == -1:
+        return []
+    offset, length = int(directory[i+7:i+12]), int(directory[i+3:i+7])
+    subfields = raw[base+offset:base+offset+length-1].split(iso2709.SUBFIELD_DELIMITER)[1:]
+    values = [sub[1:] for sub in subfields if sub[:1] == BARCODE_CODE]
+    if not values:
+        return []
+    i = find_entry(directory, BIBID_TAG)
+    if i == -1:
+        raise ValueError('no 004')
+    offset, length = int(directory[i+7:i+12]), int(directory[i+3:i+7])
+    bibid = raw[base+offset:base+offset+length-1]
+    if raw[9:10] == b'a':
+        bibid = bibid.decode('utf-8', 'replace')
+        values = [v.decode('utf-8', 'replace') for v in values]
+    else:
+        bibid = bibid.decode('latin-1')
+        values = [marc8.decode(v, pymarc=True) for v in values]
+    return ['%s\t%s\n' % (bibid, v) for v in values]
+
+
+def extract(args):
+    """Returns the .tsv lines of the records in byte range [start, end) of <filename>, as one string."""
+    filename, start, end = args
+    if end == start:
+        return ''
+    lines = []
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for pos, raw in iso2709.read_range(mm, start, end):
+            try:
+                lines += barcodes(raw)
+            except (ValueError, IndexError) as e:
+                sys.stderr.write('Skipping malformed record at byte %i: %s\n' % (pos, e))
+    return ''.join(lines)
 
 
-fname = sys.argv[1]
+if __name__ == '__main__':
 
+    parser = argparse.ArgumentParser(description='Extract 004 control number and 876$p barcodes from binary MARC holdings records.')
+    parser.add_argument('holdings', help='Binary MARC holdings records')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of worker processes')
+    args = parser.parse_args()
 
-with open(fname, 'rb') as marcdata:
-    records = MARCReader(marcdata, to_unicode=True, permissive=True) 
-    for i, record in enumerate(records):
-        if record['876']:
-            bibid = record['004'].value()
-            for barcode in record['876']:
-                if barcode[0] == 'p':
-                    print('\t'.join([str(a) for a in [bibid, barcode[1]]]))
+    n = max(args.jobs, os.path.getsize(args.holdings) // CHUNK_SIZE)
+    chunks = [(args.holdings, start, end) for start, end in iso2709.record_ranges(args.holdings, n)]
+    if args.jobs > 1:
+        with multiprocessing.Pool(args.jobs) as pool:
+            for text in pool.imap(extract, chunks):
+                sys.stdout.write(text)
+    else:
+        for chunk in chunks:
+            sys.stdout.write(extract(chunk))